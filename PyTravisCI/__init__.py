@@ -42,4 +42,15 @@ License
 # pylint: disable=invalid-name
 
 from .__about__ import __version__
-from .travis_ci import TravisCI
+from ._lazy import lazy_exports
+
+# The gateways are only imported once they are accessed, so that importing the
+# package alone stays cheap.
+LAZY_EXPORTS = {
+    "TravisCI": "travis_ci",
+    "AsyncTravisCI": "async_travis_ci",
+}
+
+__all__ = ["__version__", *LAZY_EXPORTS]
+
+__getattr__, __dir__ = lazy_exports(globals(), LAZY_EXPORTS)
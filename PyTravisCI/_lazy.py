@@ -0,0 +1,91 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tools to import the exports of our modules
+lazily.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    namespace: Dict[str, Any], exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Provides the :code:`__getattr__` and :code:`__dir__` (PEP 562) of a module
+    whose exports are only imported once they are accessed.
+
+    ::
+
+        __getattr__, __dir__ = lazy_exports(globals(), {"TravisCI": "travis_ci"})
+
+    :param namespace:
+        The globals of the module. An export is stored there on first access,
+        so that :code:`__getattr__` is not called for it anymore.
+    :param exports:
+        The exported names and the (relative) module which provides them.
+    """
+
+    module_name = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        """
+        Provides the given export - imported on first access.
+
+        :raise AttributeError:
+            When the given attribute does not exist.
+        """
+
+        if name not in exports:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        # Unlike importlib, __import__ lets -X importtime see the import.
+        module = __import__(exports[name], namespace, None, [name], 1)
+        value = getattr(module, name)
+        namespace[name] = value
+
+        return value
+
+    def __dir__() -> List[str]:
+        """
+        Provides the names of all attributes - imported or not.
+        """
+
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
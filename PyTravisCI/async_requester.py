@@ -0,0 +1,368 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the asynchronous (asyncio) version of our requester.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from PyTravisCI.rate_limiter import TokenBucket
+from PyTravisCI.response_cache import ResponseCacheBase
+from PyTravisCI.requester import Requester
+from PyTravisCI.retry import RetryPolicy
+from PyTravisCI.revalidation import RevalidationCache
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncRequester(Requester):
+    """
+    The asynchronous version of our requester. The requests are sent through a
+    (pooled) :code:`aiohttp` session.
+
+    Everything above the requester - the communicators and the resource
+    types - is synchronous. Instead of duplicating them, :py:meth:`drive`
+    runs them (once) in a worker thread and each request they send is awaited
+    on the event loop. The parsing of the responses and the construction of
+    the resource types therefore never block the event loop.
+
+    Outside of :py:meth:`drive`, this requester behaves (and blocks) like
+    :class:`~PyTravisCI.requester.Requester`.
+
+    .. warning::
+        You are not expected or invited to use this class directly if you
+        don't know what it may imply!
+
+    :param retry_policy:
+        The policy to follow when a request fails because of a transient error.
+        If not given, requests are never retried.
+    :param rate_limiter:
+        The rate limiter which paces every request (retries included).
+        If not given, requests are not paced.
+    :param revalidation_cache:
+        The cache of the responses to revalidate (conditional GET).
+        If not given, responses are not cached.
+    :param response_cache:
+        The cache which let the communicators skip the requests of the
+        resources which don't change often. If not given, nothing is skipped.
+    :param connection_limit:
+        The maximum number of simultaneous connections - and of worker
+        threads.
+
+    :raise ImportError:
+        When :code:`aiohttp` is not installed.
+    """
+
+    __event_loop: contextvars.ContextVar = contextvars.ContextVar(
+        "PyTravisCI_event_loop", default=None
+    )
+
+    def __init__(
+        self,
+        *,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        revalidation_cache: Optional[RevalidationCache] = None,
+        response_cache: Optional[ResponseCacheBase] = None,
+        connection_limit: int = 100,
+    ) -> None:
+        if aiohttp is None:  # pragma: no cover
+            raise ImportError(
+                f"{self.__class__.__name__} requires aiohttp. "
+                "Please install PyTravisCI[async]."
+            )
+
+        super().__init__(
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            revalidation_cache=revalidation_cache,
+            response_cache=response_cache,
+        )
+
+        self.connection_limit = connection_limit
+        self.client_session: Optional["aiohttp.ClientSession"] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def send_with_retry(self, verb: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends the request and retries it - as long as our retry policy
+        authorizes it.
+
+        While driven (see :py:meth:`drive`), the request is sent through the
+        :code:`aiohttp` session of the event loop and the worker thread waits
+        for its response.
+
+        :param verb:
+            The HTTP verb to use.
+        :param url:
+            The URL to communicate with.
+        """
+
+        loop = self.__event_loop.get()
+
+        if loop is None:
+            return super().send_with_retry(verb, url, **kwargs)
+
+        return asyncio.run_coroutine_threadsafe(
+            self.fetch(verb, url, **kwargs), loop
+        ).result()
+
+    async def get_client_session(self) -> "aiohttp.ClientSession":
+        """
+        Provides the (pooled) session to send our requests through.
+        """
+
+        if self.client_session is None or self.client_session.closed:
+            self.client_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connection_limit),
+            )
+
+        return self.client_session
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        Provides the pool of the threads which run the driven code.
+        """
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.connection_limit, thread_name_prefix="PyTravisCI"
+            )
+
+        return self.executor
+
+    async def close(self) -> None:
+        """
+        Closes the underlying session and the pool of worker threads.
+        """
+
+        if self.client_session is not None and not self.client_session.closed:
+            await self.client_session.close()
+
+        self.client_session = None
+
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+
+        self.executor = None
+
+    @staticmethod
+    def get_client_kwargs(kwargs: dict) -> dict:
+        """
+        Converts the (:code:`requests`) arguments of a request into the ones
+        :code:`aiohttp` expects.
+
+        - :code:`timeout` - a number or a :code:`(connect, read)` tuple - is
+          converted into a :code:`aiohttp.ClientTimeout`.
+        - The :code:`None` values of :code:`params` are dropped and the other
+          ones are converted to :py:class:`str`.
+        - :code:`verify=False` is converted into :code:`ssl=False`.
+
+        :param kwargs:
+            The arguments to convert.
+        """
+
+        result = dict(kwargs)
+
+        if "timeout" in result:
+            timeout = result.pop("timeout")
+
+            if isinstance(timeout, tuple):
+                connect_timeout, read_timeout = timeout
+            else:
+                connect_timeout = read_timeout = timeout
+
+            result["timeout"] = aiohttp.ClientTimeout(
+                total=None, sock_connect=connect_timeout, sock_read=read_timeout
+            )
+
+        if isinstance(result.get("params"), (dict, list, tuple)):
+            params = result.pop("params")
+            params = params.items() if isinstance(params, dict) else params
+
+            result["params"] = [
+                (str(key), str(value))
+                for key, values in params
+                for value in (values if isinstance(values, (list, tuple)) else [values])
+                if value is not None
+            ]
+
+        if "verify" in result:
+            if result.pop("verify") is False:
+                result["ssl"] = False
+
+        return result
+
+    async def send_once(self, verb: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a single request and provides its response as a
+        :py:class:`requests.Response`, so that the synchronous code can
+        read it as if it got it by itself.
+
+        :param verb:
+            The HTTP verb to use.
+        :param url:
+            The URL to communicate with.
+
+        :raise requests.exceptions.Timeout:
+            When the request timed out.
+        :raise requests.exceptions.ConnectionError:
+            When the API could not be reached.
+        :raise requests.exceptions.RequestException:
+            When the request failed for another reason.
+        """
+
+        session = await self.get_client_session()
+
+        kwargs = self.get_client_kwargs(kwargs)
+
+        headers = dict(self.session.headers)
+        headers.update(kwargs.pop("headers", None) or {})
+
+        try:
+            async with session.request(
+                verb.upper(), url, headers=headers, **kwargs
+            ) as client_response:
+                # pylint: disable=protected-access
+                response = requests.Response()
+                response.status_code = client_response.status
+                response.reason = client_response.reason
+                response.url = str(client_response.url)
+                response.headers = CaseInsensitiveDict(client_response.headers)
+                response.encoding = client_response.charset or "utf-8"
+                response._content = await client_response.read()
+        # The same exceptions as the ones raised outside of drive().
+        except asyncio.TimeoutError as exception:
+            raise requests.exceptions.Timeout(str(exception)) from exception
+        except aiohttp.ClientConnectionError as exception:
+            raise requests.exceptions.ConnectionError(str(exception)) from exception
+        except aiohttp.ClientError as exception:
+            raise requests.exceptions.RequestException(str(exception)) from exception
+
+        return response
+
+    async def fetch(self, verb: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends the request and retries it - as long as our retry policy
+        authorizes it.
+
+        :param verb:
+            The HTTP verb to use.
+        :param url:
+            The URL to communicate with.
+
+        :raise requests.exceptions.RequestException:
+            When the last attempt could not reach the API.
+        """
+
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if self.rate_limiter is not None:
+                waited = self.rate_limiter.reserve()
+
+                if waited > 0:
+                    await asyncio.sleep(waited)
+
+                self.rate_limiter.record_wait(waited)
+
+            try:
+                response = await self.send_once(verb, url, **kwargs)
+            except requests.exceptions.RequestException as exception:
+                if not self.retry_policy.should_retry_exception(
+                    verb, exception, attempt
+                ):
+                    raise
+
+                logging.debug(
+                    "Attempt %d of %s %s failed: %r. Retrying.",
+                    attempt,
+                    verb.upper(),
+                    url,
+                    exception,
+                )
+
+                await asyncio.sleep(self.retry_policy.get_delay(attempt))
+                continue
+
+            if not self.retry_policy.should_retry_response(
+                verb, response.status_code, response.headers, attempt
+            ):
+                return response
+
+            logging.debug(
+                "Attempt %d of %s %s got status %s. Retrying.",
+                attempt,
+                verb.upper(),
+                url,
+                response.status_code,
+            )
+
+            await asyncio.sleep(self.retry_policy.get_delay(attempt, response.headers))
+
+    async def drive(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs the given synchronous function in a worker thread. The requests it
+        sends are awaited on the running event loop.
+
+        :param func:
+            The function to run.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        context = contextvars.copy_context()
+        context.run(self.__event_loop.set, loop)
+
+        return await loop.run_in_executor(
+            self.get_executor(),
+            functools.partial(context.run, func, *args, **kwargs),
+        )
@@ -0,0 +1,539 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the asynchronous (asyncio) gateway to the Travis CI API.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from io import TextIOWrapper
+from typing import Any, AsyncIterator, Callable, Optional, Union
+
+import PyTravisCI.defaults as defaults
+import PyTravisCI.resource_types._all as resource_types  # pylint: disable=unused-import
+from PyTravisCI.async_requester import AsyncRequester
+from PyTravisCI.rate_limiter import TokenBucket
+from PyTravisCI.response_cache import ResponseCacheBase
+from PyTravisCI.resource_types.base import ResourceTypesBase
+from PyTravisCI.retry import RetryPolicy
+from PyTravisCI.revalidation import RevalidationCache
+from PyTravisCI.travis_ci import TravisCI
+
+
+class AsyncTravisCI:
+    """
+    The asynchronous gateway to the interaction with the Travis CI API.
+
+    It provides the same methods as :class:`~PyTravisCI.travis_ci.TravisCI`
+    but as coroutines. The requests are sent through a pooled :code:`aiohttp`
+    session, so many of them can be in flight at the same time:
+
+    ::
+
+        import asyncio
+
+        from PyTravisCI.async_travis_ci import AsyncTravisCI
+
+
+        async def main():
+            async with AsyncTravisCI(access_token="XYZ") as travis:
+                repositories = await asyncio.gather(
+                    *(travis.get_repository(x) for x in ["foo/bar", "bar/foo"])
+                )
+
+                for repository in repositories:
+                    builds = await travis.call(repository.get_builds)
+                    builds = await travis.next_page(builds)
+
+        asyncio.run(main())
+
+    The communicators and the resource types are shared with
+    :class:`~PyTravisCI.travis_ci.TravisCI`: each call runs them in a worker
+    thread while their requests are awaited on the event loop. The methods of
+    the resource types we give back are therefore blocking - called directly,
+    they block the event loop. Give them to :py:meth:`call` in order to await
+    them instead.
+
+    :param str access_token:
+        The access token to use to authenticate ourselves.
+    :param str access_point:
+        The access point to communicate with.
+    :param retry_policy:
+        The policy to follow when a request fails because of a transient error.
+        If not given, requests are never retried.
+    :param rate_limiter:
+        The rate limiter which paces every request sent to the API.
+    :param revalidation_cache:
+        The cache of the responses to revalidate.
+    :param response_cache:
+        The cache which let us skip the requests of the resources which don't
+        change often.
+    :param connection_limit:
+        The maximum number of simultaneous connections.
+
+    :raise ImportError:
+        When :code:`aiohttp` is not installed.
+    """
+
+    # pylint: disable=too-many-public-methods
+
+    def __init__(
+        self,
+        *,
+        access_token: Optional[str] = None,
+        access_point: Optional[str] = defaults.access_points.OPEN,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        revalidation_cache: Optional[RevalidationCache] = None,
+        response_cache: Optional[ResponseCacheBase] = None,
+        connection_limit: int = 100,
+    ) -> None:
+        self.__requester = AsyncRequester(
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            revalidation_cache=revalidation_cache,
+            response_cache=response_cache,
+            connection_limit=connection_limit,
+        )
+        self.__travis = TravisCI.from_requester(self.__requester)
+
+        self.set_access_point(access_point)
+
+        if access_token:
+            self.set_access_token(access_token)
+
+    async def __aenter__(self) -> "AsyncTravisCI":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the underlying connections.
+        """
+
+        await self.__requester.close()
+
+    def set_access_token(self, value: str) -> None:
+        """
+        Sets the access token.
+        """
+
+        self.__travis.set_access_token(value)
+
+    def get_access_point(self) -> str:
+        """
+        Provides the currently set access point.
+        """
+
+        return self.__travis.get_access_point()
+
+    def set_access_point(self, value: str) -> None:
+        """
+        Sets the access point to communicate with.
+        """
+
+        self.__travis.set_access_point(value)
+
+    def set_retry_policy(self, value: RetryPolicy) -> None:
+        """
+        Sets the retry policy to follow.
+        """
+
+        self.__travis.set_retry_policy(value)
+
+    def set_rate_limiter(self, value: Optional[TokenBucket]) -> None:
+        """
+        Sets the rate limiter which paces every request sent to the API.
+        """
+
+        self.__travis.set_rate_limiter(value)
+
+    def get_rate_limiter(self) -> Optional[TokenBucket]:
+        """
+        Provides the currently set rate limiter.
+        """
+
+        return self.__travis.get_rate_limiter()
+
+    def set_revalidation_cache(self, value: Optional[RevalidationCache]) -> None:
+        """
+        Sets the cache of the responses to revalidate.
+        """
+
+        self.__travis.set_revalidation_cache(value)
+
+    def get_revalidation_cache(self) -> Optional[RevalidationCache]:
+        """
+        Provides the currently set revalidation cache.
+        """
+
+        return self.__travis.get_revalidation_cache()
+
+    def set_response_cache(self, value: Optional[ResponseCacheBase]) -> None:
+        """
+        Sets the cache which let us skip the requests of the resources which
+        don't change often.
+        """
+
+        self.__travis.set_response_cache(value)
+
+    def get_response_cache(self) -> Optional[ResponseCacheBase]:
+        """
+        Provides the currently set response cache.
+        """
+
+        return self.__travis.get_response_cache()
+
+    async def call(self, method: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Awaits the given (blocking) method of one of our resource types.
+
+        ::
+
+            build = await travis.get_build(4)
+            build = await travis.call(build.sync)
+            jobs = await travis.call(build.get_jobs, params={"limit": 5})
+
+        :param method:
+            The method to call. It should come from a resource type given by
+            this gateway.
+        """
+
+        return await self.__requester.drive(method, *args, **kwargs)
+
+    async def sync(self, resource: ResourceTypesBase) -> ResourceTypesBase:
+        """
+        Fetches the latest information of the given resource
+        (e.g. :meth:`~PyTravisCI.resource_types.build.Build.sync`).
+        """
+
+        return await self.call(resource.sync)
+
+    async def next_page(self, resource: ResourceTypesBase) -> ResourceTypesBase:
+        """
+        Provides the next page of the given resource.
+
+        :raise NextPageNotFound:
+            If the next page was not found.
+        """
+
+        return await self.call(resource.next_page)
+
+    async def previous_page(self, resource: ResourceTypesBase) -> ResourceTypesBase:
+        """
+        Provides the previous page of the given resource.
+
+        :raise PreviousPageNotFound:
+            If the previous page was not found.
+        """
+
+        return await self.call(resource.previous_page)
+
+    async def first_page(self, resource: ResourceTypesBase) -> ResourceTypesBase:
+        """
+        Provides the first page of the given resource.
+
+        :raise FirstPageNotFound:
+            If the first page was not found.
+        """
+
+        return await self.call(resource.first_page)
+
+    async def last_page(self, resource: ResourceTypesBase) -> ResourceTypesBase:
+        """
+        Provides the last page of the given resource.
+
+        :raise LastPageNotFound:
+            If the last page was not found.
+        """
+
+        return await self.call(resource.last_page)
+
+    async def get_complete(self, resource: ResourceTypesBase) -> ResourceTypesBase:
+        """
+        Provides the complete representation of the given (minimal) resource.
+
+        :raise NotIncomplete:
+            If the given resource is already complete.
+        """
+
+        return await self.call(resource.get_complete)
+
+    async def iter_all(
+        self,
+        resource: ResourceTypesBase,
+        *,
+        max_items: Optional[int] = None,
+        compact: bool = False,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterates over the items of the given collection and of all its following
+        pages (see :meth:`~PyTravisCI.resource_types.base.ResourceTypesBase.iter_all`).
+
+        ::
+
+            builds = await travis.get_builds(params={"limit": 100})
+
+            async for build in travis.iter_all(builds, max_items=1000):
+                print(build.id)
+
+        :param max_items:
+            The maximum number of items to yield. :code:`None` means all.
+        :param compact:
+            Yield the compact (slotted) version of the items.
+
+        :raise NotImplementedError:
+            When the given resource is not a collection.
+        :raise ValueError:
+            When :code:`max_items` is negative.
+        """
+
+        # Only validates the arguments, the (sync) generator is never consumed.
+        resource.iter_all(max_items=max_items)
+
+        page = resource
+        yielded = 0
+
+        while True:
+            for item in getattr(page, page.__iter_through__) or []:
+                if max_items is not None and yielded >= max_items:
+                    return
+
+                yield item.to_compact() if compact else item
+                yielded += 1
+
+            if (max_items is not None and yielded >= max_items) or (
+                not page.has_next_page()
+            ):
+                return
+
+            page = await self.next_page(page)
+
+    async def get_active_from_github_id(
+        self, github_id: Union[str, int], *, params: Optional[dict] = None
+    ) -> "resource_types.Active":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_active_from_github_id`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_active_from_github_id, github_id, params=params
+        )
+
+    async def get_active_from_login(
+        self, login: str, *, provider: str = "github", params: Optional[dict] = None
+    ) -> "resource_types.Active":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_active_from_login`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_active_from_login, login, provider=provider, params=params
+        )
+
+    async def get_broadcasts(
+        self, *, params: Optional[dict] = None
+    ) -> "resource_types.Broadcasts":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_broadcasts`.
+        """
+
+        return await self.__requester.drive(self.__travis.get_broadcasts, params=params)
+
+    async def get_build(
+        self, build_id: Union[int, str], *, params: Optional[dict] = None
+    ) -> "resource_types.Build":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_build`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_build, build_id, params=params
+        )
+
+    async def get_builds(
+        self, *, params: Optional[dict] = None
+    ) -> "resource_types.Builds":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_builds`.
+        """
+
+        return await self.__requester.drive(self.__travis.get_builds, params=params)
+
+    async def get_cron(
+        self, cron_id: Union[str, int], *, params: Optional[dict] = None
+    ) -> "resource_types.Cron":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_cron`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_cron, cron_id, params=params
+        )
+
+    async def get_job(
+        self, job_id: Union[str, int], *, params: Optional[dict] = None
+    ) -> "resource_types.Job":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_job`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_job, job_id, params=params
+        )
+
+    async def get_jobs(self, *, params: Optional[dict] = None) -> "resource_types.Jobs":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_jobs`.
+        """
+
+        return await self.__requester.drive(self.__travis.get_jobs, params=params)
+
+    async def lint(
+        self, subject: Union[TextIOWrapper, bytes, str]
+    ) -> "resource_types.Lint":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.lint`.
+        """
+
+        return await self.__requester.drive(self.__travis.lint, subject)
+
+    async def get_organization(
+        self, organization_id: Union[str, int], *, params: Optional[dict] = None
+    ) -> "resource_types.Organization":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_organization`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_organization, organization_id, params=params
+        )
+
+    async def get_organizations(
+        self, *, params: Optional[dict] = None
+    ) -> "resource_types.Organizations":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_organizations`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_organizations, params=params
+        )
+
+    async def get_repositories(
+        self, *, params: Optional[dict] = None
+    ) -> "resource_types.Repositories":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_repositories`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_repositories, params=params
+        )
+
+    async def get_repositories_from_github_id(
+        self, github_id: Union[str, int], *, params: Optional[dict] = None
+    ) -> "resource_types.Repositories":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_repositories_from_github_id`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_repositories_from_github_id, github_id, params=params
+        )
+
+    async def get_repositories_from_login(
+        self, login: str, *, provider: str = "github", params: Optional[dict] = None
+    ) -> "resource_types.Repositories":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_repositories_from_login`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_repositories_from_login,
+            login,
+            provider=provider,
+            params=params,
+        )
+
+    async def get_repository_from_provider(
+        self,
+        provider: str,
+        repository_id_or_slug: Union[str, int],
+        *,
+        params: Optional[dict] = None,
+    ) -> "resource_types.Repository":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_repository_from_provider`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_repository_from_provider,
+            provider,
+            repository_id_or_slug,
+            params=params,
+        )
+
+    async def get_repository(
+        self, repository_id_or_slug: Union[str, int], *, params: Optional[dict] = None
+    ) -> "resource_types.Repository":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_repository`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_repository, repository_id_or_slug, params=params
+        )
+
+    async def get_user(self, *, params: Optional[dict] = None) -> "resource_types.User":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_user`.
+        """
+
+        return await self.__requester.drive(self.__travis.get_user, params=params)
+
+    async def get_user_from_id(
+        self, user_id: Union[str, int], *, params: Optional[dict] = None
+    ) -> "resource_types.User":
+        """
+        See :meth:`PyTravisCI.travis_ci.TravisCI.get_user_from_id`.
+        """
+
+        return await self.__requester.drive(
+            self.__travis.get_user_from_id, user_id, params=params
+        )
@@ -0,0 +1,164 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tools we use to fetch many resources at once.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Tuple
+
+
+class BatchResult:
+    """
+    Provides the outcome of a batch of lookups.
+
+    The results are given back in the same order as the given keys. When a
+    lookup failed, its result is :code:`None` and the raised exception is
+    kept into :py:attr:`errors` - instead of aborting the whole batch.
+
+    ::
+
+        result = travis.get_builds_by_ids([1, 2, 3])
+
+        for build_id, exception in result.get_errors():
+            print(f"Could not fetch {build_id}: {exception}")
+
+        for build in result.get_successful():
+            print(build.id, build.state)
+
+    :param keys:
+        The keys (IDs, slugs, ...) we looked up.
+    """
+
+    def __init__(self, keys: Iterable[Hashable]) -> None:
+        self.keys: List[Hashable] = list(keys)
+        self.results: List[Any] = [None] * len(self.keys)
+        self.errors: Dict[int, Exception] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} total={len(self)} "
+            f"failed={len(self.errors)} />"
+        )
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.results)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.results[index]
+
+    def has_errors(self) -> bool:
+        """
+        Checks if at least one of the lookups failed.
+        """
+
+        return bool(self.errors)
+
+    def get_errors(self) -> List[Tuple[Hashable, Exception]]:
+        """
+        Provides the keys of the failed lookups along with their exception,
+        in the order of the keys.
+        """
+
+        return [(self.keys[x], self.errors[x]) for x in sorted(self.errors)]
+
+    def get_successful(self) -> List[Any]:
+        """
+        Provides the results of the successful lookups, in the order of the
+        keys.
+        """
+
+        return [y for x, y in enumerate(self.results) if x not in self.errors]
+
+
+def fetch_many(
+    func: Callable[[Hashable], Any], keys: Iterable[Hashable], *, max_workers: int
+) -> BatchResult:
+    """
+    Calls the given function for each of the given keys on a bounded pool of
+    threads.
+
+    A key which is given several times is only looked up once - all its
+    positions share the same result.
+
+    :param func:
+        The function to call with each key.
+    :param keys:
+        The keys to look up.
+    :param max_workers:
+        The maximum number of lookups to run at the same time.
+
+    :raise ValueError:
+        When :code:`max_workers` is lower than :code:`1`.
+    """
+
+    if max_workers < 1:
+        raise ValueError(f"<max_workers> should be >= 1, {max_workers} given.")
+
+    result = BatchResult(keys)
+
+    positions: Dict[Hashable, List[int]] = {}
+
+    for index, key in enumerate(result.keys):
+        positions.setdefault(key, []).append(index)
+
+    if not positions:
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(positions))) as executor:
+        futures = {key: executor.submit(func, key) for key in positions}
+
+        for key, future in futures.items():
+            try:
+                value, exception = future.result(), None
+            except Exception as error:  # pylint: disable=broad-except
+                logging.debug("Lookup of %r failed: %s", key, error)
+
+                value, exception = None, error
+
+            for index in positions[key]:
+                result.results[index] = value
+
+                if exception is not None:
+                    result.errors[index] = exception
+
+    return result
@@ -0,0 +1,336 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the (pluggable) JSON codecs we use to decode the
+responses and to encode the compact representations.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional, Type, Union
+
+import requests
+
+import PyTravisCI.defaults as defaults
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+
+# Maps the digits to "0" and anything else to "1" - so that a run of digits
+# can be found by bytes.find() instead of a (much slower) regular expression.
+DIGITS_TABLE: bytes = bytes(48 if 48 <= x <= 57 else 49 for x in range(256))
+
+
+def may_hold_long_numbers(data: Union[bytes, str]) -> bool:
+    """
+    Checks if the given JSON document may hold numbers beyond the 64-bit
+    range (20 digits or more) - which the 3rd-party backends can't decode
+    losslessly.
+    """
+
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    return data.translate(DIGITS_TABLE).find(b"0" * 20) != -1
+
+
+class CodecBase:
+    """
+    Provides the base of all JSON codecs.
+
+    A codec decodes the (raw) bodies of the responses and encodes the compact
+    JSON representations. Whatever the backend, a body which can't be
+    decoded raises a :py:class:`json.JSONDecodeError`.
+
+    :param lossless:
+        Whether the documents which may hold numbers beyond the 64-bit range
+        should be decoded by the standard library (the 3rd-party backends
+        decode them as :py:class:`float`). Disable it if you don't expect such
+        numbers, the (cheap) check is skipped.
+    """
+
+    name: Optional[str] = None
+
+    def __init__(self, *, lossless: bool = True) -> None:
+        self.lossless = lossless
+
+    @staticmethod
+    def is_available() -> bool:
+        """
+        Checks if the backend of the codec is installed.
+        """
+
+        return True
+
+    @staticmethod
+    def get_default(default: Optional[Callable] = None) -> Callable:
+        """
+        Provides the function which converts the objects the backend can't
+        encode: the datetimes are converted into our standard format, anything
+        else is given to the given function.
+
+        :param default:
+            The function which converts the other objects.
+        """
+
+        def convert(obj: Any) -> Any:
+            if isinstance(obj, datetime):
+                return obj.strftime(defaults.formats.STANDARD_DATE_FORMAT)
+
+            if default is None:
+                raise TypeError(f"{type(obj)} is not JSON serializable.")
+
+            return default(obj)
+
+        return convert
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes the given JSON document.
+
+        :param data:
+            The (UTF-8 encoded) document to decode.
+
+        :raise json.JSONDecodeError:
+            When the given document can't be decoded.
+        """
+
+        raise NotImplementedError()
+
+    def dumps(self, data: Any, *, default: Optional[Callable] = None) -> str:
+        """
+        Encodes the given data into a compact JSON document.
+
+        :param data:
+            The data to encode.
+        :param default:
+            A function which converts the objects the codec can't encode.
+            The datetimes are always encoded in our standard format.
+        """
+
+        raise NotImplementedError()
+
+
+class StdlibCodec(CodecBase):
+    """
+    Provides the codec based on the :py:mod:`json` module of the standard
+    library.
+    """
+
+    name: str = "stdlib"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, data: Any, *, default: Optional[Callable] = None) -> str:
+        return json.dumps(
+            data,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=self.get_default(default),
+        )
+
+
+class OrjsonCodec(CodecBase):
+    """
+    Provides the codec based on :code:`orjson`. The datetimes are encoded
+    natively - in our standard format.
+
+    .. note::
+        :code:`orjson` decodes the integers beyond the 64-bit range as
+        :py:class:`float` and can't encode them: unless :code:`lossless` is
+        disabled, the documents which may hold such integers are handled by
+        the standard library instead.
+    """
+
+    name: str = "orjson"
+
+    @staticmethod
+    def is_available() -> bool:
+        return orjson is not None
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        if self.lossless and may_hold_long_numbers(data):
+            return json.loads(data)
+
+        # orjson.JSONDecodeError is a json.JSONDecodeError.
+        return orjson.loads(data)
+
+    def dumps(self, data: Any, *, default: Optional[Callable] = None) -> str:
+        try:
+            return orjson.dumps(
+                data,
+                default=default,
+                option=orjson.OPT_NAIVE_UTC
+                | orjson.OPT_UTC_Z
+                | orjson.OPT_OMIT_MICROSECONDS
+                | orjson.OPT_NON_STR_KEYS,
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return StdlibCodec().dumps(data, default=default)
+
+
+class UjsonCodec(CodecBase):
+    """
+    Provides the codec based on :code:`ujson`. Like with :class:`OrjsonCodec`,
+    the integers beyond the 64-bit range are handled by the standard library.
+    """
+
+    name: str = "ujson"
+
+    @staticmethod
+    def is_available() -> bool:
+        return ujson is not None
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        if self.lossless and may_hold_long_numbers(data):
+            return json.loads(data)
+
+        try:
+            return ujson.loads(data)
+        except ValueError as exception:
+            if isinstance(data, bytes):
+                data = data.decode("utf-8", errors="replace")
+
+            raise json.JSONDecodeError(str(exception), data, 0) from exception
+
+    def dumps(self, data: Any, *, default: Optional[Callable] = None) -> str:
+        try:
+            return ujson.dumps(
+                data,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+                default=self.get_default(default),
+            )
+        except OverflowError:
+            return StdlibCodec().dumps(data, default=default)
+
+
+CODECS: dict = {x.name: x for x in (OrjsonCodec, UjsonCodec, StdlibCodec)}
+"""
+The known codecs - by order of preference.
+"""
+
+_CODEC: Optional[CodecBase] = None
+
+
+def get_codec() -> CodecBase:
+    """
+    Provides the codec in use. Unless another one was set, it is the first
+    available of :code:`orjson`, :code:`ujson` and the standard library.
+    """
+
+    global _CODEC  # pylint: disable=global-statement
+
+    if _CODEC is None:
+        _CODEC = next(x for x in CODECS.values() if x.is_available())()
+
+    return _CODEC
+
+
+def set_codec(codec: Union[str, CodecBase, Type[CodecBase], None]) -> CodecBase:
+    """
+    Sets the codec to use.
+
+    ::
+
+        from PyTravisCI import codec
+
+        codec.set_codec("stdlib")
+
+    :param codec:
+        The codec (or its name) to use. :code:`None` switches back to the
+        default one.
+
+    :raise ValueError:
+        When the given codec is unknown or not installed.
+    """
+
+    global _CODEC  # pylint: disable=global-statement
+
+    if codec is None:
+        _CODEC = None
+        return get_codec()
+
+    if isinstance(codec, str):
+        if codec not in CODECS:
+            raise ValueError(f"<codec> ({codec!r}) should be one of {list(CODECS)}.")
+
+        codec = CODECS[codec]
+
+    if isinstance(codec, type):
+        if not codec.is_available():
+            raise ValueError(f"<codec> ({codec.name!r}) is not installed.")
+
+        codec = codec()
+
+    if not isinstance(codec, CodecBase):
+        raise TypeError(f"<codec> should be {CodecBase}, {type(codec)} given.")
+
+    _CODEC = codec
+
+    return codec
+
+
+def decode_response(response: requests.Response) -> Any:
+    """
+    Decodes the body of the given response with the codec in use.
+
+    The responses which decode their body by themselves (e.g. the ones served
+    by a :class:`~PyTravisCI.revalidation.RevalidationCache`) are decoded
+    through their own :code:`json()` method.
+
+    :param response:
+        The response to decode.
+
+    :raise json.JSONDecodeError:
+        When the body can't be decoded.
+    """
+
+    if getattr(type(response), "json", None) is requests.Response.json:
+        return get_codec().loads(response.content)
+
+    return response.json()
@@ -39,36 +39,47 @@ License
     SOFTWARE.
 """
 
-# pylint: disable=unused-import
-
-from .active import Active
-from .beta_feature import BetaFeature
-from .beta_features import BetaFeatures
-from .branch import Branch
-from .branches import Branches
-from .broadcasts import Broadcasts
-from .build import Build
-from .builds import Builds
-from .cache import Cache
-from .caches import Caches
-from .cron import Cron
-from .crons import Crons
-from .env_var import EnvVar
-from .env_vars import EnvVars
-from .job import Job
-from .jobs import Jobs
-from .key_pair import KeyPair
-from .key_pair_generated import KeyPairGenerated
-from .lint import Lint
-from .log import Log
-from .messages import Messages
-from .organization import Organization
-from .organizations import Organizations
-from .repositories import Repositories
-from .repository import Repository
-from .request import Request
-from .requests import Requests
-from .setting import Setting
-from .settings import Settings
-from .stages import Stages
-from .user import User
+# The communicators are only imported once they are accessed: most of them are never
+# used by a (short-lived) process.
+
+from typing import Dict
+
+from PyTravisCI._lazy import lazy_exports
+
+MODULES: Dict[str, str] = {
+    "Active": "active",
+    "BetaFeature": "beta_feature",
+    "BetaFeatures": "beta_features",
+    "Branch": "branch",
+    "Branches": "branches",
+    "Broadcasts": "broadcasts",
+    "Build": "build",
+    "Builds": "builds",
+    "Cache": "cache",
+    "Caches": "caches",
+    "Cron": "cron",
+    "Crons": "crons",
+    "EnvVar": "env_var",
+    "EnvVars": "env_vars",
+    "Job": "job",
+    "Jobs": "jobs",
+    "KeyPair": "key_pair",
+    "KeyPairGenerated": "key_pair_generated",
+    "Lint": "lint",
+    "Log": "log",
+    "Messages": "messages",
+    "Organization": "organization",
+    "Organizations": "organizations",
+    "Repositories": "repositories",
+    "Repository": "repository",
+    "Request": "request",
+    "Requests": "requests",
+    "Setting": "setting",
+    "Settings": "settings",
+    "Stages": "stages",
+    "User": "user",
+}
+
+__all__ = list(MODULES)
+
+__getattr__, __dir__ = lazy_exports(globals(), MODULES)
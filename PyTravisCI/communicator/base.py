@@ -39,11 +39,12 @@ License
     SOFTWARE.
 """
 
-import copy
-import inspect
+import logging
+import threading
 import urllib.parse as urllib_parse
+import warnings
 from functools import wraps
-from typing import Any, Optional, Union
+from typing import Any, Optional, Type, Union
 
 import PyTravisCI.exceptions as exceptions
 import PyTravisCI.standardization as standardization
@@ -59,6 +60,31 @@ class CommunicatorBase:
     requester: Optional[Requester] = None
     standardizer: Optional[standardization.Standardization] = None
 
+    standardizer_class: Type[
+        standardization.Standardization
+    ] = standardization.SinglePassStandardization
+    """
+    The standardizer to use in order to standardize the responses of the API.
+
+    The default one (:class:`~PyTravisCI.standardization.SinglePassStandardization`)
+    does the whole standardization in a single traversal. You can switch back
+    to the historical (copying) implementation with:
+
+    ::
+
+        CommunicatorBase.standardizer_class = standardization.Standardization
+    """
+
+    cache_ttl: Optional[float] = None
+    """
+    The number of seconds the responses of this communicator can be served from
+    the response cache (if any) of the requester. :code:`None` means that they
+    are never cached.
+
+    .. seealso::
+        :class:`~PyTravisCI.response_cache.ResponseCacheBase`
+    """
+
     endpoints: dict = dict()
     """
     Should be a :py:class:`dict` in format:
@@ -77,6 +103,39 @@ class CommunicatorBase:
     the system will replace :code:`%(build_id)s` with :code:`4`.
     """
 
+    invalidates: dict = dict()
+    """
+    Should be a :py:class:`dict` in format:
+
+    ::
+
+        {
+            "update": [
+                "/repo/%(repository_id_or_slug)s/env_var/%(env_var_id)s",
+                "/repo/%(repository_id_or_slug)s/env_vars",
+            ]
+        }
+
+    :code:`update` is the name of the (mutating) method and the list
+    contains the endpoints it may change. Once the method succeeded, the
+    cached responses of those endpoints - and of everything under them - are
+    evicted from the response cache of the requester. The variables are
+    filled like in :py:attr:`endpoints`.
+
+    The canonical URL (:code:`@href`) of the response given back by the
+    method is evicted too.
+    """
+
+    contexts: threading.local = threading.local()
+    """
+    Holds (per thread) the context of the response under construction.
+    """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls.bind_endpoints()
+
     def __init__(self, req: Requester) -> None:
         if not isinstance(req, Requester):
             raise TypeError(f"<requester> must be {Requester}. {type(req)} given.")
@@ -86,44 +145,56 @@ class CommunicatorBase:
 
         self.resource_types = resource_types
         self.requester = req
-        self.standardizer = standardization.Standardization()
+        self.standardizer = self.standardizer_class()
 
     def complete_response(func):  # pylint: disable=no-self-argument
         """
         A decorator which complete the responses before giving it back
         to the end-user.
+
+        The internal variables (the requester and the arguments to share) of
+        the response are gathered into a single context which is active while
+        the response is constructed: each resource type created in the
+        meantime keeps a reference to it (see
+        :py:meth:`get_current_context`).
         """
 
         @wraps(func)
         def wrapper(self, **kwargs):  # pragma: no cover
-            response = func(self, **kwargs)  # pylint:disable=not-callable
-
             ignore_sharing = [
                 "parameters",
                 "data",
+                "endpoint",
+                "endpoint_template",
             ]
 
-            if hasattr(response, "_at_type"):
-                to_propagate = {
-                    "_PyTravisCI": {
-                        "com": {},
-                        "shared": {
-                            x: y for x, y in kwargs.items() if x not in ignore_sharing
-                        },
-                    }
+            if isinstance(self, CommunicatorBase):
+                context = {"com": {"requester": self.requester}, "shared": {}}
+            else:
+                # pylint: disable=protected-access
+                context = {
+                    "com": {"requester": self._PyTravisCI["com"]["requester"]},
+                    "shared": dict(self._PyTravisCI["shared"]),
                 }
 
-                try:
-                    to_propagate["_PyTravisCI"]["com"]["requester"] = self.requester
-                except AttributeError:
-                    # pylint: disable=protected-access
-                    to_propagate["_PyTravisCI"]["com"]["requester"] = self._PyTravisCI[
-                        "com"
-                    ]["requester"]
+            context["shared"].update(
+                {x: y for x, y in kwargs.items() if x not in ignore_sharing}
+            )
+
+            previous_context = getattr(CommunicatorBase.contexts, "current", None)
+            CommunicatorBase.contexts.current = context
+
+            try:
+                response = func(self, **kwargs)  # pylint:disable=not-callable
+            finally:
+                CommunicatorBase.contexts.current = previous_context
+
+            if isinstance(self, CommunicatorBase) and func.__name__ in self.invalidates:
+                self.invalidate_cache(func.__name__, kwargs, response)
+
+            if hasattr(response, "_at_type") and "_PyTravisCI" not in vars(response):
+                response.__dict__["_PyTravisCI"] = context
 
-                response = CommunicatorBase.propagate_internal_vars(
-                    to_propagate, response
-                )
             return response
 
         return wrapper
@@ -149,16 +220,49 @@ class CommunicatorBase:
 
         return wrapper
 
+    @classmethod
+    def get_current_context(cls) -> Optional[dict]:
+        """
+        Provides the context of the response under construction - if any.
+
+        .. warning::
+            You are not invited to use this method outside of PyTravis's
+            resource types.
+        """
+
+        return getattr(cls.contexts, "current", None)
+
     @classmethod
     def propagate_internal_vars(cls, variables: dict, start_obj: Any) -> object:
         """
         Propagate the given var to all objects.
 
+        .. deprecated::
+            The responses are not completed through this method anymore:
+            they share a single context instead
+            (see :py:meth:`complete_response`). It will be removed in a
+            future version.
+
         .. warning::
             You are not invited to use this method outside of PyTravis's
             communicators.
         """
 
+        warnings.warn(
+            "propagate_internal_vars() is deprecated: the responses share a "
+            "single context instead (see complete_response()).",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        return cls.__propagate_internal_vars(variables, start_obj)
+
+    @classmethod
+    def __propagate_internal_vars(cls, variables: dict, start_obj: Any) -> object:
+        """
+        Propagate the given var to all objects - without any warning.
+        """
+
         for var_name, var_value in variables.items():
             try:
                 if hasattr(start_obj, var_name):
@@ -174,9 +278,9 @@ class CommunicatorBase:
         try:
             for _, value in start_obj.__dict__.items():
                 if hasattr(value, "_at_type"):
-                    value = cls.propagate_internal_vars(variables, value)
+                    value = cls.__propagate_internal_vars(variables, value)
                 elif isinstance(value, list):
-                    value = [cls.propagate_internal_vars(variables, x) for x in value]
+                    value = [cls.__propagate_internal_vars(variables, x) for x in value]
         except AttributeError:  # pragma: no cover
             pass
         return start_obj
@@ -202,18 +306,6 @@ class CommunicatorBase:
 
         return slug
 
-    @staticmethod
-    def get_method_name() -> str:  # pragma: no cover
-        """
-        Provides the method name.
-
-        .. warning::
-            You are not invited to use this method outside of PyTravisCI's
-            communicators.
-        """
-
-        return inspect.getouterframes(inspect.currentframe(), 2)[2][3]
-
     def get_standardized(self, data: dict) -> Any:  # pragma: no cover
         """
         Provides the standardized version of the given dataset.
@@ -227,10 +319,95 @@ class CommunicatorBase:
 
     def get_response(self, endpoint: str) -> dict:  # pragma: no cover
         """
-        Provides the response from the API.
+        Provides the response from the API - or from the response cache of the
+        requester, if the response of the endpoint is still there.
+        """
+
+        cache = self.requester.get_response_cache()
+
+        if cache is None:
+            return self.requester.get(endpoint)
+
+        ttl = cache.get_ttl(self.__class__.__name__, self.cache_ttl)
+
+        if not ttl:
+            return self.requester.get(endpoint)
+
+        key = self.requester.get_response_cache_key(endpoint)
+        response = cache.get(key)
+
+        if response is None:
+            response = self.requester.get(endpoint)
+            urls = [self.requester.bind_endpoint_to_base_url(endpoint)]
+
+            if isinstance(response, dict) and response.get("@href"):
+                urls.append(self.requester.bind_endpoint_to_base_url(response["@href"]))
+
+            cache.set(key, response, ttl, urls)
+
+        return response
+
+    def get_invalidation_variables(self, kwargs: dict, response: Any) -> dict:
+        """
+        Provides the variables the invalidation rules (:py:attr:`invalidates`)
+        are filled with.
+
+        :param kwargs:
+            The arguments the method was called with.
+        :param response:
+            What the method gave back.
+        """
+
+        # pylint: disable=unused-argument
+        return dict(kwargs)
+
+    def invalidate_cache(self, method_name: str, kwargs: dict, response: Any) -> None:
+        """
+        Applies the invalidation rules (:py:attr:`invalidates`) of the given
+        method to the response cache of the requester.
+
+        :param method_name:
+            The name of the method which was just called.
+        :param kwargs:
+            The arguments the method was called with.
+        :param response:
+            What the method gave back.
         """
 
-        return self.requester.get(endpoint)
+        cache = self.requester.get_response_cache()
+
+        if cache is None or method_name not in self.invalidates:
+            return
+
+        variables = self.get_invalidation_variables(kwargs, response)
+
+        if "repository_id_or_slug" in variables:
+            variables["repository_id_or_slug"] = self.encode_slug(
+                variables["repository_id_or_slug"]
+            )
+
+        prefixes = set()
+
+        for template in self.invalidates[method_name]:
+            try:
+                prefixes.add(
+                    self.requester.bind_endpoint_to_base_url(template % variables)
+                )
+            except KeyError:
+                logging.debug(
+                    "Could not apply %r after %s: missing variable.",
+                    template,
+                    method_name,
+                )
+
+        # The resource may be cached under another (canonical) URL.
+        href = getattr(response, "_at_href", None)
+
+        if isinstance(href, str):
+            prefixes.add(self.requester.bind_endpoint_to_base_url(href))
+
+        for prefix in prefixes:
+            cache.invalidate(prefix)
 
     def post_response(
         self, endpoint: str, data: dict = None
@@ -263,16 +440,69 @@ class CommunicatorBase:
                 return True
             return False
 
-    def get_and_construct_endpoint(self, kwargs: dict) -> str:  # pragma: no cover
+    @classmethod
+    def bind_endpoints(cls) -> None:
+        """
+        Binds each method of :py:attr:`endpoints` to its template.
+
+        The bound methods give their template to
+        :py:meth:`get_and_construct_endpoint` through the
+        :code:`endpoint_template` argument.
         """
-        Provides the endpoint to call from the given method name.
+
+        for method_name, template in cls.endpoints.items():
+            method = getattr(cls, method_name, None)
+
+            if not callable(method):
+                continue
+
+            # An inherited method may already be bound to another template.
+            method = getattr(method, "__unbound_endpoint__", method)
+
+            setattr(cls, method_name, cls.bind_endpoint(method, template))
+
+    @staticmethod
+    def bind_endpoint(func, template: str):
+        """
+        Provides a version of the given method which is bound to the given
+        endpoint template.
+
+        :param func:
+            The method to bind.
+        :param template:
+            The endpoint template of the method.
+        """
+
+        @wraps(func)
+        def wrapper(self, **kwargs):
+            kwargs["endpoint_template"] = template
+
+            return func(self, **kwargs)
+
+        wrapper.endpoint_template = template
+        wrapper.__unbound_endpoint__ = func
+
+        return wrapper
+
+    def get_and_construct_endpoint(self, kwargs: dict) -> str:
+        """
+        Provides the endpoint to call from the given arguments.
+
+        :param kwargs:
+            The arguments of the (bound) method. The template is taken from
+            :code:`endpoint_template` and the query string from
+            :code:`parameters`.
+
+        :raise KeyError:
+            When the method is not bound to an endpoint template.
         """
 
-        if "parameters" in kwargs and kwargs["parameters"]:
-            params = urllib_parse.urlencode(copy.deepcopy(kwargs["parameters"]))
+        template = kwargs.pop("endpoint_template")
+        parameters = kwargs.pop("parameters", None)
 
-            del kwargs["parameters"]
+        if parameters:
+            params = urllib_parse.urlencode(parameters)
 
             if params:
-                return self.endpoints[self.get_method_name()] % kwargs + f"?{params}"
-        return self.endpoints[self.get_method_name()] % kwargs
+                return template % kwargs + f"?{params}"
+        return template % kwargs
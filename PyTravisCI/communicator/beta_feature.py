@@ -57,6 +57,17 @@ class BetaFeature(CommunicatorBase):
         "delete": "/user/%(user_id)s/beta_feature/%(beta_feature_id)s",
     }
 
+    invalidates = {
+        "update": [
+            "/user/%(user_id)s/beta_feature/%(beta_feature_id)s",
+            "/user/%(user_id)s/beta_features",
+        ],
+        "delete": [
+            "/user/%(user_id)s/beta_feature/%(beta_feature_id)s",
+            "/user/%(user_id)s/beta_features",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     def update(self, **kwargs) -> "resource_types.BetaFeature":
         data = None
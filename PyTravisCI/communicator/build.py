@@ -56,6 +56,15 @@ class Build(CommunicatorBase):
         "restart": "/build/%(build_id)s/restart",
     }
 
+    invalidates = {
+        "cancel": [
+            "/build/%(build_id)s",
+        ],
+        "restart": [
+            "/build/%(build_id)s",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     def from_id(self, **kwargs) -> "resource_types.Build":
         return self.resource_types.Build(
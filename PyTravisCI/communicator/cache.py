@@ -56,6 +56,12 @@ class Cache(CommunicatorBase):
         "delete": "/repo/%(repository_id_or_slug)s/caches",
     }
 
+    invalidates = {
+        "delete": [
+            "/repo/%(repository_id_or_slug)s/caches",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     @CommunicatorBase.filter_before_action
     def delete(self, **kwargs) -> Union[bool, "resource_types.Caches"]:
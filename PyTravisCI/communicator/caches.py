@@ -58,6 +58,12 @@ class Caches(CommunicatorBase):
         "delete": "/repo/%(repository_id_or_slug)s/caches",
     }
 
+    invalidates = {
+        "delete": [
+            "/repo/%(repository_id_or_slug)s/caches",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     @CommunicatorBase.filter_before_action
     def from_provider(self, **kwargs) -> "resource_types.Caches":
@@ -60,6 +60,18 @@ class Cron(CommunicatorBase):
         "delete": "/cron/%(cron_id)s",
     }
 
+    invalidates = {
+        "create": [
+            "/repo/%(repository_id_or_slug)s/branch/%(branch_name)s/cron",
+            "/repo/%(repository_id_or_slug)s/crons",
+        ],
+        "delete": [
+            "/cron/%(cron_id)s",
+            "/repo/%(repository_id_or_slug)s/branch/%(branch_name)s/cron",
+            "/repo/%(repository_id_or_slug)s/crons",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     def from_id(self, **kwargs) -> "resource_types.Cron":
         return self.resource_types.Cron(
@@ -59,6 +59,17 @@ class EnvVar(CommunicatorBase):
         "delete": "/repo/%(repository_id_or_slug)s/env_var/%(env_var_id)s",
     }
 
+    invalidates = {
+        "update": [
+            "/repo/%(repository_id_or_slug)s/env_var/%(env_var_id)s",
+            "/repo/%(repository_id_or_slug)s/env_vars",
+        ],
+        "delete": [
+            "/repo/%(repository_id_or_slug)s/env_var/%(env_var_id)s",
+            "/repo/%(repository_id_or_slug)s/env_vars",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     @CommunicatorBase.filter_before_action
     def from_provider(self, **kwargs) -> "resource_types.EnvVar":
@@ -57,6 +57,12 @@ class EnvVars(CommunicatorBase):
         "create": "/repo/%(repository_id_or_slug)s/env_vars",
     }
 
+    invalidates = {
+        "create": [
+            "/repo/%(repository_id_or_slug)s/env_vars",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     @CommunicatorBase.filter_before_action
     def from_provider(self, **kwargs) -> "resource_types.EnvVars":
@@ -57,6 +57,18 @@ class Job(CommunicatorBase):
         "debug": "/job/%(job_id)s/debug",
     }
 
+    invalidates = {
+        "cancel": [
+            "/job/%(job_id)s",
+        ],
+        "restart": [
+            "/job/%(job_id)s",
+        ],
+        "debug": [
+            "/job/%(job_id)s",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     def from_id(self, **kwargs) -> "resource_types.Job":
         return self.resource_types.Job(
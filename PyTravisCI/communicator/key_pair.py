@@ -52,6 +52,8 @@ class KeyPair(CommunicatorBase):
 
     # pylint: disable=missing-function-docstring
 
+    cache_ttl: float = 3600
+
     endpoints = {
         "from_provider": "/repo/%(provider)s/%(repository_id_or_slug)s/key_pair",
         "from_id_or_slug": "/repo/%(repository_id_or_slug)s/key_pair",
@@ -60,6 +62,18 @@ class KeyPair(CommunicatorBase):
         "delete": "/repo/%(repository_id_or_slug)s/key_pair",
     }
 
+    invalidates = {
+        "create": [
+            "/repo/%(repository_id_or_slug)s/key_pair",
+        ],
+        "update": [
+            "/repo/%(repository_id_or_slug)s/key_pair",
+        ],
+        "delete": [
+            "/repo/%(repository_id_or_slug)s/key_pair",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     @CommunicatorBase.filter_before_action
     def from_provider(self, **kwargs) -> "resource_types.KeyPair":
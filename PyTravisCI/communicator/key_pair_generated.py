@@ -56,6 +56,12 @@ class KeyPairGenerated(CommunicatorBase):
         "create": "/repo/%(repository_id_or_slug)s/key_pair/generated",
     }
 
+    invalidates = {
+        "create": [
+            "/repo/%(repository_id_or_slug)s/key_pair",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     @CommunicatorBase.filter_before_action
     def from_provider(self, **kwargs) -> "resource_types.KeyPairGenerated":
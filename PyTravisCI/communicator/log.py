@@ -54,9 +54,16 @@ class Log(CommunicatorBase):
 
     endpoints = {
         "from_id": "/job/%(job_id)s/log",
+        "get_content": "/job/%(job_id)s/log",
         "delete": "/job/%(job_id)s/log",
     }
 
+    invalidates = {
+        "delete": [
+            "/job/%(job_id)s/log",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     def from_id(self, **kwargs) -> "resource_types.Log":
         return self.resource_types.Log(
@@ -65,6 +72,36 @@ class Log(CommunicatorBase):
             )
         )
 
+    def get_content(self, *, offset: int = 0, **kwargs) -> bytes:
+        """
+        Provides the (plain text) content of the log - from the given offset.
+
+        Only the bytes after the given offset are requested (through the
+        :code:`Range` header). If the API ignores it, the bytes before the
+        offset are dropped by us.
+
+        :param offset:
+            The number of bytes we already know.
+        """
+
+        headers = {"Accept": "text/plain"}
+
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        req = self.requester.get_raw(
+            self.get_and_construct_endpoint(kwargs), ok_statuses=(416,), headers=headers
+        )
+
+        if req.status_code == 416:
+            # Nothing after the offset (yet).
+            return b""
+
+        if req.status_code == 206:
+            return req.content
+
+        return req.content[offset:]
+
     @CommunicatorBase.complete_response
     def delete(self, **kwargs) -> Union[bool, "resource_types.Log"]:
         response = self.get_standardized(
@@ -50,6 +50,8 @@ class Organization(CommunicatorBase):
 
     # pylint: disable=missing-function-docstring
 
+    cache_ttl: float = 3600
+
     endpoints = {
         "from_id": "/org/%(organization_id)s",
     }
@@ -39,6 +39,7 @@ License
     SOFTWARE.
 """
 
+from typing import Any
 
 from .base import CommunicatorBase
 
@@ -50,6 +51,8 @@ class Repository(CommunicatorBase):
 
     # pylint: disable=missing-function-docstring
 
+    cache_ttl: float = 3600
+
     endpoints = {
         "from_provider": "/repo/%(provider)s/%(repository_id_or_slug)s",
         "from_id_or_slug": "/repo/%(repository_id_or_slug)s",
@@ -59,6 +62,57 @@ class Repository(CommunicatorBase):
         "unstar": "/repo/%(repository_id_or_slug)s/unstar",
     }
 
+    invalidates = {
+        "activate": [
+            "/repo/%(repository_id_or_slug)s",
+            "/repo/%(repository_id)s",
+            "/repo/%(repository_slug)s",
+            "/repos",
+            "/owner",
+        ],
+        "deactivate": [
+            "/repo/%(repository_id_or_slug)s",
+            "/repo/%(repository_id)s",
+            "/repo/%(repository_slug)s",
+            "/repos",
+            "/owner",
+        ],
+        "star": [
+            "/repo/%(repository_id_or_slug)s",
+            "/repo/%(repository_id)s",
+            "/repo/%(repository_slug)s",
+            "/repos",
+            "/owner",
+        ],
+        "unstar": [
+            "/repo/%(repository_id_or_slug)s",
+            "/repo/%(repository_id)s",
+            "/repo/%(repository_slug)s",
+            "/repos",
+            "/owner",
+        ],
+    }
+
+    def get_invalidation_variables(self, kwargs: dict, response: Any) -> dict:
+        """
+        Provides the variables the invalidation rules are filled with.
+
+        The repository may be cached under its ID and under its slug: both
+        are taken from the response. As the provider and the GitHub ID of the
+        owner can't be told from the repository, all owner collections
+        (:code:`/owner/...`) are invalidated.
+        """
+
+        variables = super().get_invalidation_variables(kwargs, response)
+
+        for name, attribute in (("repository_id", "id"), ("repository_slug", "slug")):
+            value = getattr(response, attribute, None)
+
+            if value is not None:
+                variables[name] = self.encode_slug(value)
+
+        return variables
+
     @CommunicatorBase.complete_response
     @CommunicatorBase.filter_before_action
     def from_provider(self, **kwargs) -> "resource_types.Repository":
@@ -57,6 +57,12 @@ class Requests(CommunicatorBase):
         "create": "/repo/%(repository_id_or_slug)s/requests",
     }
 
+    invalidates = {
+        "create": [
+            "/repo/%(repository_id_or_slug)s/requests",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     @CommunicatorBase.filter_before_action
     def from_provider(self, **kwargs) -> "resource_types.Requests":
@@ -51,12 +51,21 @@ class Setting(CommunicatorBase):
 
     # pylint: disable=missing-function-docstring
 
+    cache_ttl: float = 3600
+
     endpoints = {
         "from_provider": "/repo/%(provider)s/%(repository_id_or_slug)s/setting/%(setting_name)s",
         "from_id_or_slug": "/repo/%(repository_id_or_slug)s/setting/%(setting_name)s",
         "update": "/repo/%(repository_id_or_slug)s/setting/%(setting_name)s",
     }
 
+    invalidates = {
+        "update": [
+            "/repo/%(repository_id_or_slug)s/setting/%(setting_name)s",
+            "/repo/%(repository_id_or_slug)s/settings",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     @CommunicatorBase.filter_before_action
     def from_provider(self, **kwargs) -> "resource_types.Setting":
@@ -50,6 +50,8 @@ class Settings(CommunicatorBase):
 
     # pylint: disable=missing-function-docstring
 
+    cache_ttl: float = 3600
+
     endpoints = {
         "from_provider": "/repo/%(provider)s/%(repository_id_or_slug)s/settings",
         "from_id_or_slug": "/repo/%(repository_id_or_slug)s/settings",
@@ -50,12 +50,21 @@ class User(CommunicatorBase):
 
     # pylint: disable=missing-function-docstring
 
+    cache_ttl: float = 3600
+
     endpoints: dict = {
         "fetch": "/user",
         "from_user_id": "/user/%(user_id)s",
         "synchronize": "/user/%(user_id)s/sync",
     }
 
+    invalidates = {
+        "synchronize": [
+            "/user/%(user_id)s",
+            "/user",
+        ],
+    }
+
     @CommunicatorBase.complete_response
     def fetch(self, **kwargs) -> "resource_types.User":
         return self.resource_types.User(
@@ -46,3 +46,20 @@ API_VERSION = "3"
 USER_AGENT = f"PyTravisCI/{__about__.__version__}"
 
 HEADERS = {"Travis-API-Version": API_VERSION, "User-Agent": USER_AGENT}
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+"""
+The status codes which are considered as transient and therefore retryable
+by our retry policy.
+"""
+
+RETRY_VERBS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+"""
+The (idempotent) HTTP verbs which can safely be retried by our retry policy.
+"""
+
+BATCH_MAX_WORKERS = 10
+"""
+The default number of lookups a batch (e.g.
+:meth:`~PyTravisCI.travis_ci.TravisCI.get_builds_by_ids`) runs at the same time.
+"""
@@ -69,7 +69,29 @@ PASSED = "passed"
 Provides the state which we use to consider a job/build as passed.
 """
 
+RECEIVED = "received"
+"""
+Provides the state which we use to consider a job/build as received.
+"""
+
+QUEUED = "queued"
+"""
+Provides the state which we use to consider a job/build as queued.
+"""
+
 ACTIVE = [CREATED, STARTED]
 """
 Provides the list of states which we use to consider a job/build or job as processing.
 """
+
+WAITING = [CREATED, RECEIVED, QUEUED]
+"""
+Provides the list of states which we use to consider a job/build as waiting
+to be started.
+"""
+
+PENDING = WAITING + [STARTED]
+"""
+Provides the list of states which we use to consider a job/build as not
+finished yet.
+"""
@@ -0,0 +1,162 @@
+"""
+Just another Python API for Travis CI (API).
+
+The encryption of many secrets at once.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import base64
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple, Union
+
+from PyTravisCI.encryption.data import DataEncryption
+
+CHUNK_SIZE: int = 256
+
+
+@functools.lru_cache(maxsize=128)
+def get_data_encryption(public_key: bytes) -> DataEncryption:
+    """
+    Provides the (loaded) given public key - loaded once per process.
+    """
+
+    return DataEncryption(public_key=public_key)
+
+
+def encrypt_chunk(public_key: bytes, secrets: List[bytes], padd: str) -> List[str]:
+    """
+    Encrypts the given secrets with the given public key.
+
+    :return:
+        The (base64 encoded) encrypted secrets - in the same order.
+    """
+
+    encryption_obj = get_data_encryption(public_key)
+
+    return [
+        base64.b64encode(encryption_obj.encrypt_data(x, padd=padd)).decode("ascii")
+        for x in secrets
+    ]
+
+
+def encrypt_many(
+    jobs: Iterable[Tuple[Union[str, bytes], Iterable[Union[str, bytes]]]],
+    *,
+    padd: str = "PKCS1v15",
+    max_workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> List[List[str]]:
+    """
+    Encrypts many secrets - with many public keys - on a pool of processes.
+
+    The secrets are encrypted by chunks of :code:`chunk_size` secrets and each
+    process loads each public key only once.
+
+    ::
+
+        from PyTravisCI.encryption.bulk import encrypt_many
+
+        first, second = encrypt_many(
+            [
+                (first_public_key, ["hello", "world"]),
+                (second_public_key, ["foo", "bar"]),
+            ]
+        )
+
+    :param jobs:
+        The public keys along with the secrets to encrypt with them.
+    :param padd:
+        The padding to use.
+        See :meth:`~PyTravisCI.encryption.data.DataEncryption.encrypt_data`.
+    :param max_workers:
+        The maximum number of processes to run.
+        Defaults to the number of CPUs. When we end up with a single process,
+        everything is encrypted in the current one.
+    :param chunk_size:
+        The number of secrets to give to a process at once.
+
+    :raise ValueError:
+        When :code:`max_workers` or :code:`chunk_size` are lower than
+        :code:`1` or when :code:`padd` is not supported.
+
+    :return:
+        The (base64 encoded) encrypted secrets of each job - in the same
+        order.
+    """
+
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"<max_workers> should be >= 1, {max_workers} given.")
+
+    if chunk_size < 1:
+        raise ValueError(f"<chunk_size> should be >= 1, {chunk_size} given.")
+
+    chunks = []
+    result = []
+
+    for public_key, secrets in jobs:
+        if not isinstance(public_key, bytes):
+            public_key = public_key.encode()
+
+        secrets = [x if isinstance(x, bytes) else x.encode() for x in secrets]
+
+        for start in range(0, len(secrets), chunk_size):
+            chunks.append(
+                (len(result), public_key, secrets[start : start + chunk_size])
+            )
+
+        result.append([])
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(chunks))
+
+    if max_workers <= 1:
+        for index, public_key, secrets in chunks:
+            result[index].extend(encrypt_chunk(public_key, secrets, padd))
+
+        return result
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (index, executor.submit(encrypt_chunk, public_key, secrets, padd))
+            for index, public_key, secrets in chunks
+        ]
+
+        for index, future in futures:
+            result[index].extend(future.result())
+
+    return result
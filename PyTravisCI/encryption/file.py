@@ -40,9 +40,12 @@ License
     SOFTWARE.
 """
 
+import contextlib
+import mmap
+import os
 import secrets
 from io import IOBase
-from typing import IO, Optional, Union
+from typing import IO, Iterator, Optional, Union
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import padding as primitive_padding
@@ -65,6 +68,7 @@ class FileEncryption:
     AES_BLOCK_SIZE: int = 128
     KEY_SIZE: int = 32
     IV_SIZE: int = 16
+    BUFFER_SIZE: int = 64 * 1024
 
     key: Optional[bytes] = None
     iv: Optional[bytes] = None
@@ -210,6 +214,27 @@ class FileEncryption:
             algorithms.AES(self.key), modes.CBC(self.iv), backend=default_backend()
         )
 
+    def __pad(self, data: Union[bytes, memoryview]) -> bytes:
+        """
+        Pads the given (last) data.
+        """
+
+        pad = primitive_padding.PKCS7(self.AES_BLOCK_SIZE).padder()
+
+        return pad.update(data) + pad.finalize()
+
+    def __unpad(self, data: bytes) -> bytes:
+        """
+        Unpads the given (last) data.
+
+        :raise ValueError:
+            When the padding is not valid.
+        """
+
+        unpad = primitive_padding.PKCS7(self.AES_BLOCK_SIZE).unpadder()
+
+        return unpad.update(data) + unpad.finalize()
+
     @encrypt_ensure_keys_exists
     def encrypt_file_content(self, file_content: Union[str, bytes]) -> bytes:
         """
@@ -228,12 +253,21 @@ class FileEncryption:
         if not isinstance(file_content, bytes):
             file_content = file_content.encode()
 
-        pad = primitive_padding.PKCS7(self.AES_BLOCK_SIZE).padder()
-        padded_file_content = pad.update(file_content) + pad.finalize()
+        block_size = self.AES_BLOCK_SIZE // 8
 
-        encryptor = self.__get_cipher().encryptor()
+        with memoryview(file_content) as view:
+            aligned = len(view) - len(view) % block_size
+
+            # The (whole) output is written in place: the only copy is the
+            # final conversion to bytes.
+            result = bytearray(aligned + block_size)
+            encryptor = self.__get_cipher().encryptor()
 
-        return encryptor.update(padded_file_content) + encryptor.finalize()
+            written = encryptor.update_into(view[:aligned], result)
+            result[written:] = encryptor.update(self.__pad(view[aligned:]))
+            encryptor.finalize()
+
+        return bytes(result)
 
     @decrypt_ensure_keys_exists
     def decrypt_file_content(self, encrypted_file_content: bytes) -> bytes:
@@ -257,33 +291,282 @@ class FileEncryption:
                 f"<encrypted_file_content> must be {bytes}, {type(encrypted_file_content)} given."
             )
 
+        block_size = self.AES_BLOCK_SIZE // 8
+        size = len(encrypted_file_content)
+
+        # The (whole) output is written in place: the only copy is the final
+        # conversion to bytes.
+        result = bytearray(size + block_size - 1)
         decryptor = self.__get_cipher().decryptor()
-        decrypted = decryptor.update(encrypted_file_content) + decryptor.finalize()
 
-        unpad = primitive_padding.PKCS7(self.AES_BLOCK_SIZE).unpadder()
+        decryptor.update_into(encrypted_file_content, result)
+        decryptor.finalize()
 
-        return unpad.update(decrypted) + unpad.finalize()
+        # Only the last block holds the padding.
+        last_block = max(size - block_size, 0)
+        size = last_block + len(self.__unpad(bytes(result[last_block:size])))
+
+        with memoryview(result) as view:
+            return bytes(view[:size])
+
+    def __iter_chunks(
+        self, input_file: Union[IO, IOBase], buffer_size: Optional[int]
+    ) -> Iterator[bytes]:
+        """
+        Reads the given file - chunk after chunk.
+
+        :raise ValueError:
+            When the given buffer size is not greater than :code:`0`.
+        """
+
+        if buffer_size is None:
+            buffer_size = self.BUFFER_SIZE
+
+        if buffer_size <= 0:
+            raise ValueError(f"<buffer_size> should be > 0, {buffer_size} given.")
+
+        while True:
+            chunk = input_file.read(buffer_size)
+
+            if not chunk:
+                return
+
+            if not isinstance(chunk, bytes):
+                chunk = chunk.encode()
+
+            yield chunk
 
     @encrypt_ensure_keys_exists
     def encrypt_file(
         self,
         input_file: Union[IO, IOBase],
         output_file: Union[IO, IOBase],
+        *,
+        buffer_size: Optional[int] = None,
     ) -> None:
         """
         Encrypts the content of :code:`input_file` into :code:`output_file`.
+
+        The file is read - padded and encrypted - chunk after chunk. Therefore,
+        the memory we use does not depend on the size of the file. The output
+        is the same as the one of :py:meth:`encrypt_file_content`.
+
+        :param buffer_size:
+            The number of bytes to read at once.
+            Defaults to :py:attr:`BUFFER_SIZE`.
+
+        :raise ValueError:
+            When the given buffer size is not greater than :code:`0`.
         """
 
-        output_file.write(self.encrypt_file_content(input_file.read()))
+        pad = primitive_padding.PKCS7(self.AES_BLOCK_SIZE).padder()
+        encryptor = self.__get_cipher().encryptor()
+
+        for chunk in self.__iter_chunks(input_file, buffer_size):
+            output_file.write(encryptor.update(pad.update(chunk)))
+
+        output_file.write(encryptor.update(pad.finalize()) + encryptor.finalize())
 
     @decrypt_ensure_keys_exists
     def decrypt_file(
         self,
         input_file: Union[IO, IOBase],
         output_file: Union[IO, IOBase],
+        *,
+        buffer_size: Optional[int] = None,
     ) -> None:
         """
         Decrypts the content of :code:`input_file` into :code:`output_file`.
+
+        The file is read - decrypted and unpadded - chunk after chunk.
+        Therefore, the memory we use does not depend on the size of the file.
+
+        .. warning::
+            As the padding is only checked at the end, the (decrypted) content
+            is already written when a wrong padding (e.g. a wrong key) is
+            detected.
+
+        :param buffer_size:
+            The number of bytes to read at once.
+            Defaults to :py:attr:`BUFFER_SIZE`.
+
+        :raise ValueError:
+            When the given buffer size is not greater than :code:`0` or when
+            the padding of the decrypted content is not valid.
         """
 
-        output_file.write(self.decrypt_file_content(input_file.read()))
+        decryptor = self.__get_cipher().decryptor()
+        unpad = primitive_padding.PKCS7(self.AES_BLOCK_SIZE).unpadder()
+
+        for chunk in self.__iter_chunks(input_file, buffer_size):
+            output_file.write(unpad.update(decryptor.update(chunk)))
+
+        output_file.write(unpad.update(decryptor.finalize()) + unpad.finalize())
+
+    @staticmethod
+    @contextlib.contextmanager
+    def __map(path: Union[str, os.PathLike]) -> Iterator[memoryview]:
+        """
+        Maps the given file into memory and provides a view of it.
+
+        .. warning::
+            The slices of the view should be released (:code:`with`) as soon
+            as possible: the mapping can't be closed while one of them is
+            still alive - e.g. in the traceback of an exception.
+        """
+
+        with open(path, "rb") as file_stream:
+            if not os.fstat(file_stream.fileno()).st_size:
+                # An empty file can't be mapped.
+                with memoryview(b"") as view:
+                    yield view
+                return
+
+            with mmap.mmap(file_stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    # We read it only once - from the start to the end.
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+                with memoryview(mapped) as view:
+                    yield view
+
+    @staticmethod
+    @contextlib.contextmanager
+    def __open_output(
+        output_file: Union[IO, IOBase, str, os.PathLike],
+    ) -> Iterator[Union[IO, IOBase]]:
+        """
+        Provides the given output file - opened if a path is given.
+        """
+
+        if isinstance(output_file, (str, os.PathLike)):
+            with open(output_file, "wb") as file_stream:
+                yield file_stream
+        else:
+            yield output_file
+
+    def __get_chunk_size(self, buffer_size: Optional[int]) -> int:
+        """
+        Provides the size of the chunks to work with: the given buffer size
+        rounded down to a multiple of the block size.
+
+        :raise ValueError:
+            When the given buffer size is not greater than :code:`0`.
+        """
+
+        if buffer_size is None:
+            buffer_size = self.BUFFER_SIZE
+
+        if buffer_size <= 0:
+            raise ValueError(f"<buffer_size> should be > 0, {buffer_size} given.")
+
+        block_size = self.AES_BLOCK_SIZE // 8
+
+        return max(buffer_size // block_size, 1) * block_size
+
+    @encrypt_ensure_keys_exists
+    def encrypt_path(
+        self,
+        input_path: Union[str, os.PathLike],
+        output_file: Union[IO, IOBase, str, os.PathLike],
+        *,
+        buffer_size: Optional[int] = None,
+    ) -> None:
+        """
+        Encrypts the content of the file behind :code:`input_path` into
+        :code:`output_file`.
+
+        The file is mapped into memory and its slices are given - without any
+        copy - to the encryptor, which writes into a single preallocated
+        buffer. The output is the same as the one of
+        :py:meth:`encrypt_file_content`.
+
+        :param input_path:
+            The path of the (plain) file to read.
+        :param output_file:
+            The file (or its path) to write into.
+        :param buffer_size:
+            The number of bytes to encrypt at once.
+            Defaults to :py:attr:`BUFFER_SIZE`.
+
+        :raise ValueError:
+            When the given buffer size is not greater than :code:`0`.
+        """
+
+        chunk_size = self.__get_chunk_size(buffer_size)
+        block_size = self.AES_BLOCK_SIZE // 8
+
+        with self.__map(input_path) as view, self.__open_output(
+            output_file
+        ) as output_stream:
+            aligned = len(view) - len(view) % block_size
+            encryptor = self.__get_cipher().encryptor()
+
+            buffer = bytearray(chunk_size + block_size - 1)
+
+            with memoryview(buffer) as buffer_view:
+                for start in range(0, aligned, chunk_size):
+                    with view[start : min(start + chunk_size, aligned)] as chunk:
+                        written = encryptor.update_into(chunk, buffer)
+
+                    output_stream.write(buffer_view[:written])
+
+            with view[aligned:] as chunk:
+                output_stream.write(
+                    encryptor.update(self.__pad(chunk)) + encryptor.finalize()
+                )
+
+    @decrypt_ensure_keys_exists
+    def decrypt_path(
+        self,
+        input_path: Union[str, os.PathLike],
+        output_file: Union[IO, IOBase, str, os.PathLike],
+        *,
+        buffer_size: Optional[int] = None,
+    ) -> None:
+        """
+        Decrypts the content of the file behind :code:`input_path` into
+        :code:`output_file` - the same way as :py:meth:`encrypt_path`.
+
+        :param input_path:
+            The path of the encrypted file to read.
+        :param output_file:
+            The file (or its path) to write into.
+        :param buffer_size:
+            The number of bytes to decrypt at once.
+            Defaults to :py:attr:`BUFFER_SIZE`.
+
+        :raise ValueError:
+            When the given buffer size is not greater than :code:`0`, when the
+            size of the encrypted file is not a multiple of the block size or
+            when the padding of the decrypted content is not valid.
+        """
+
+        chunk_size = self.__get_chunk_size(buffer_size)
+        block_size = self.AES_BLOCK_SIZE // 8
+
+        with self.__map(input_path) as view:
+            if not view or len(view) % block_size:
+                raise ValueError(
+                    "The size of the encrypted file should be a multiple of "
+                    f"{block_size}, {len(view)} given."
+                )
+
+            # The last block - which holds the padding - is decrypted last.
+            last_block = len(view) - block_size
+            decryptor = self.__get_cipher().decryptor()
+
+            with self.__open_output(output_file) as output_stream:
+                buffer = bytearray(chunk_size + block_size - 1)
+
+                with memoryview(buffer) as buffer_view:
+                    for start in range(0, last_block, chunk_size):
+                        with view[start : min(start + chunk_size, last_block)] as chunk:
+                            written = decryptor.update_into(chunk, buffer)
+
+                        output_stream.write(buffer_view[:written])
+
+                with view[last_block:] as chunk:
+                    output_stream.write(
+                        self.__unpad(decryptor.update(chunk) + decryptor.finalize())
+                    )
@@ -0,0 +1,242 @@
+"""
+Just another Python API for Travis CI (API).
+
+The cache of the public keys of the repositories.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import hashlib
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, Hashable, Optional, Tuple, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    # cryptography is only imported once we load a public key.
+    from PyTravisCI.encryption.data import DataEncryption
+
+
+class PublicKeyCache:
+    """
+    A cache of the public keys of the repositories.
+
+    The public keys are trusted for :code:`ttl` seconds - before being fetched
+    again - and each of them is loaded (parsed) only once per fingerprint.
+
+    ::
+
+        from PyTravisCI import TravisCI
+        from PyTravisCI.encryption.public_key_cache import PublicKeyCache
+
+        cache = PublicKeyCache(ttl=3600)
+        travis = TravisCI(access_token="XYZ", public_key_cache=cache)
+
+        repository = travis.get_repository("funilrys/PyTravisCI")
+
+        # Only the first call fetches (and loads) the public key.
+        repository.encrypt_secrets(["hello"])
+        repository.encrypt_secrets(["world"])
+
+        print(cache.get_statistics())
+
+    .. warning::
+        A key pair changed outside of
+        :meth:`~PyTravisCI.resource_types.repository.Repository.create_key_pair`
+        and
+        :meth:`~PyTravisCI.resource_types.repository.Repository.generate_key_pair`
+        is only seen once its public key expired.
+
+    :param ttl:
+        The number of seconds a public key is trusted for.
+
+    :raise ValueError:
+        When :code:`ttl` is lower than :code:`0`.
+    """
+
+    def __init__(self, ttl: float = 3600.0) -> None:
+        if ttl < 0:
+            raise ValueError(f"<ttl> should be >= 0, {ttl} given.")
+
+        self.ttl = ttl
+
+        self.__lock = threading.Lock()
+        self.__entries: Dict[Hashable, Tuple[str, float]] = {}
+        self.__encryptions: Dict[str, "DataEncryption"] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} ttl={self.ttl} entries={len(self)} "
+            f"keys={len(self.__encryptions)} />"
+        )
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @staticmethod
+    def get_time() -> float:
+        """
+        Provides the clock the expiration is computed with.
+        """
+
+        return time.monotonic()
+
+    @staticmethod
+    def get_fingerprint(public_key: Union[str, bytes]) -> str:
+        """
+        Provides the fingerprint of the given public key - when the API does
+        not give it to us.
+        """
+
+        if not isinstance(public_key, bytes):
+            public_key = public_key.encode()
+
+        return hashlib.sha256(public_key).hexdigest()
+
+    def __prune(self) -> None:
+        """
+        Forgets the loaded public keys which are not used anymore.
+        """
+
+        used = {x for x, _ in self.__entries.values()}
+
+        for fingerprint in set(self.__encryptions) - used:
+            del self.__encryptions[fingerprint]
+
+    def get(self, key: Hashable) -> Optional["DataEncryption"]:
+        """
+        Provides the (non-expired) loaded public key of the given repository.
+
+        :param key:
+            The key of the repository.
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is not None and entry[1] <= self.get_time():
+                del self.__entries[key]
+                self.__prune()
+
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return self.__encryptions[entry[0]]
+
+    def set(
+        self,
+        key: Hashable,
+        public_key: Union[str, bytes],
+        *,
+        fingerprint: Optional[str] = None,
+    ) -> "DataEncryption":
+        """
+        Stores the public key of the given repository and provides it - loaded.
+
+        The public key is only loaded if its fingerprint is not known yet.
+
+        :param key:
+            The key of the repository.
+        :param public_key:
+            The (PEM) public key of the repository.
+        :param fingerprint:
+            The fingerprint of the public key.
+            Computed from the public key if not given.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from PyTravisCI.encryption.data import DataEncryption
+
+        if fingerprint is None:
+            fingerprint = self.get_fingerprint(public_key)
+
+        with self.__lock:
+            if fingerprint not in self.__encryptions:
+                self.__encryptions[fingerprint] = DataEncryption(public_key=public_key)
+                self.loads += 1
+
+            self.__entries[key] = (fingerprint, self.get_time() + self.ttl)
+            self.__prune()
+
+            return self.__encryptions[fingerprint]
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Forgets the public key of the given repository.
+
+        :param key:
+            The key of the repository.
+        """
+
+        with self.__lock:
+            if self.__entries.pop(key, None) is not None:
+                self.__prune()
+
+    def clear(self) -> None:
+        """
+        Forgets everything.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__encryptions.clear()
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Provides the statistics of the cache.
+
+        - :code:`hits`: The number of public keys served from the cache.
+        - :code:`misses`: The number of public keys we had to fetch.
+        - :code:`loads`: The number of public keys we had to load (parse).
+        - :code:`entries`: The number of repositories.
+        - :code:`keys`: The number of (loaded) public keys.
+        """
+
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "loads": self.loads,
+                "entries": len(self.__entries),
+                "keys": len(self.__encryptions),
+            }
@@ -0,0 +1,505 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tools we use to export the resource types.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import array
+import io
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import PyTravisCI.codec as codec
+from PyTravisCI.resource_types.base import ComplexJsonEncoder
+
+
+def iter_ndjson(items: Iterable[Any], *, remove_tags: bool = False) -> Iterator[str]:
+    """
+    Provides the NDJSON line (one compact JSON object, ending with a new line)
+    of each of the given resource types.
+
+    :param items:
+        The resource types (or their compact version) to convert.
+    :param remove_tags:
+        Remove all :code:`@tags` and everything
+        related to PyTravisCI.
+    """
+
+    default = ComplexJsonEncoder().default
+
+    for item in items:
+        yield codec.get_codec().dumps(
+            item.to_dict(remove_tags=remove_tags), default=default
+        ) + "\n"
+
+
+def write_ndjson(items: Iterable[Any], stream: IO, *, remove_tags: bool = False) -> int:
+    """
+    Writes the NDJSON line of each of the given resource types into the given
+    (text or binary) stream - as soon as each of them is given.
+
+    :param items:
+        The resource types (or their compact version) to write.
+    :param stream:
+        The stream to write into.
+    :param remove_tags:
+        Remove all :code:`@tags` and everything
+        related to PyTravisCI.
+
+    :return:
+        The number of written lines.
+    """
+
+    binary = isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+    written = 0
+
+    for line in iter_ndjson(items, remove_tags=remove_tags):
+        stream.write(line.encode("utf-8") if binary else line)
+        written += 1
+
+    return written
+
+
+def export_ndjson(
+    items: Iterable[Any],
+    destination: Union[str, os.PathLike, IO],
+    *,
+    remove_tags: bool = False,
+) -> int:
+    """
+    Exports the given resource types as NDJSON (one JSON object per line).
+
+    When a path is given, the export is written into a temporary file which
+    replaces the destination once everything was written. Therefore, readers
+    never see a partial export.
+
+    ::
+
+        from PyTravisCI import TravisCI
+        from PyTravisCI.export import export_ndjson
+
+        travis = TravisCI(access_token="XYZ")
+
+        export_ndjson(
+            travis.iter_builds(params={"limit": 100}), "/tmp/builds.ndjson"
+        )
+
+    :param items:
+        The resource types (or their compact version) to export. They are
+        written as soon as they are given: when given by
+        :meth:`~PyTravisCI.resource_types.base.ResourceTypesBase.iter_all`,
+        only the current page is kept in memory.
+    :param destination:
+        The path of the file, or the (text or binary) stream to write into.
+    :param remove_tags:
+        Remove all :code:`@tags` and everything
+        related to PyTravisCI.
+
+    :return:
+        The number of exported resource types.
+    """
+
+    if not isinstance(destination, (str, os.PathLike)):
+        return write_ndjson(items, destination, remove_tags=remove_tags)
+
+    directory = os.path.dirname(os.path.abspath(destination))
+    file_descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(
+            file_descriptor, "w", encoding="utf-8", newline="\n"
+        ) as file_stream:
+            written = write_ndjson(items, file_stream, remove_tags=remove_tags)
+
+        os.replace(temp_path, destination)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:  # pragma: no cover
+            pass
+        raise
+
+    return written
+
+
+def get_pyarrow() -> Any:
+    """
+    Provides the :code:`pyarrow` module. It is imported on demand because it
+    is heavy to import and only needed by the Arrow export.
+
+    :raise ImportError:
+        When :code:`pyarrow` is not installed.
+    """
+
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+    except ImportError:  # pragma: no cover
+        raise ImportError(
+            "The Arrow export requires pyarrow. Please install PyTravisCI[arrow]."
+        ) from None
+
+    return pyarrow
+
+
+class Column:
+    """
+    Provides a typed column - filled value after value.
+
+    The type of the column is given by its first non-null value:
+
+        - :py:class:`int` are stored as int64.
+        - :py:class:`float` are stored as float64.
+        - :py:class:`bool` are stored as int8.
+        - :py:class:`~datetime.datetime` are stored as int64 - the number of
+          microseconds since the epoch (UTC).
+        - :py:class:`str` are dictionary encoded: each value is stored as the
+          (int32) index of the value in :py:attr:`categories`.
+
+    Anything else - or a column with values of different types - is stored
+    as a :py:class:`list` of the values.
+
+    :param name:
+        The name of the column.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    EPOCH: datetime = datetime(1970, 1, 1)
+    ONE_MICROSECOND: timedelta = timedelta(microseconds=1)
+
+    # kind -> typecode of the array holding the values.
+    TYPECODES: dict = {
+        "int64": "q",
+        "float64": "d",
+        "bool": "b",
+        "timestamp": "q",
+        "dictionary": "i",
+    }
+
+    __slots__ = ("name", "kind", "values", "validity", "categories", "__indexes")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.kind: Optional[str] = None
+        self.values: Union[array.array, list] = []
+        self.validity: bytearray = bytearray()
+        self.categories: List[str] = []
+        self.__indexes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.validity)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name!r} ({self.kind}) {len(self)}>"
+
+    @staticmethod
+    def get_kind(value: Any) -> str:
+        """
+        Provides the kind of column which can store the given value.
+        """
+
+        if isinstance(value, bool):
+            return "bool"
+
+        if isinstance(value, int):
+            return "int64"
+
+        if isinstance(value, float):
+            return "float64"
+
+        if isinstance(value, datetime):
+            return "timestamp"
+
+        if isinstance(value, str):
+            return "dictionary"
+
+        return "object"
+
+    def encode(self, value: Any) -> Any:
+        """
+        Provides the given (non-null) value the way we store it.
+        """
+
+        if self.kind == "timestamp":
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+            return (value - self.EPOCH) // self.ONE_MICROSECOND
+
+        if self.kind == "dictionary":
+            try:
+                return self.__indexes[value]
+            except KeyError:
+                index = self.__indexes[value] = len(self.categories)
+                self.categories.append(value)
+                return index
+
+        return value
+
+    def decode(self, index: int) -> Any:
+        """
+        Provides the value at the given index.
+        """
+
+        if not self.validity[index]:
+            return None
+
+        value = self.values[index]
+
+        if self.kind == "timestamp":
+            return self.EPOCH + value * self.ONE_MICROSECOND
+
+        if self.kind == "dictionary":
+            return self.categories[value]
+
+        if self.kind == "bool":
+            return bool(value)
+
+        return value
+
+    def to_pylist(self) -> list:
+        """
+        Provides the values of the column.
+        """
+
+        return [self.decode(x) for x in range(len(self))]
+
+    def append(self, value: Any) -> None:
+        """
+        Appends the given value.
+        """
+
+        if value is None:
+            self.validity.append(0)
+
+            if self.kind == "object":
+                self.values.append(None)
+            elif self.kind is not None:
+                self.values.append(0)
+            return
+
+        if self.kind is None:
+            self.kind = self.get_kind(value)
+
+            if self.kind == "object":
+                self.values = [None] * len(self)
+            else:
+                self.values = array.array(self.TYPECODES[self.kind], [0]) * len(self)
+
+        if self.kind != "object":
+            if self.get_kind(value) != self.kind:
+                self.to_object()
+            else:
+                try:
+                    self.values.append(self.encode(value))
+                    self.validity.append(1)
+                    return
+                except OverflowError:
+                    self.to_object()
+
+        self.values.append(value)
+        self.validity.append(1)
+
+    def to_object(self) -> None:
+        """
+        Converts the column into a column of (any) objects.
+        """
+
+        self.values = self.to_pylist()
+        self.kind = "object"
+        self.categories = []
+        self.__indexes = {}
+
+    def to_arrow(self) -> Any:
+        """
+        Provides the column as an Arrow array - without copying the numbers.
+        As an Arrow array holds a single type, the values of a column of
+        mixed types are given as strings.
+
+        :raise ImportError:
+            When :code:`pyarrow` is not installed.
+        """
+
+        pyarrow = get_pyarrow()
+        length = len(self)
+
+        if self.kind is None:
+            return pyarrow.nulls(length)
+
+        if self.kind == "object":
+            try:
+                return pyarrow.array(self.values)
+            except (TypeError, ValueError):
+                # Mixed types: Arrow arrays hold a single type.
+                return pyarrow.array(
+                    [None if x is None else str(x) for x in self.values],
+                    pyarrow.string(),
+                )
+
+        null_count = length - sum(self.validity)
+
+        if null_count:
+            validity = (
+                pyarrow.Array.from_buffers(
+                    pyarrow.uint8(), length, [None, pyarrow.py_buffer(self.validity)]
+                )
+                .cast(pyarrow.bool_())
+                .buffers()[1]
+            )
+        else:
+            validity = None
+
+        if self.kind == "bool":
+            return pyarrow.Array.from_buffers(
+                pyarrow.int8(),
+                length,
+                [validity, pyarrow.py_buffer(self.values)],
+                null_count,
+            ).cast(pyarrow.bool_())
+
+        data_type = {
+            "int64": pyarrow.int64(),
+            "float64": pyarrow.float64(),
+            "timestamp": pyarrow.timestamp("us", tz="UTC"),
+            "dictionary": pyarrow.int32(),
+        }[self.kind]
+
+        result = pyarrow.Array.from_buffers(
+            data_type, length, [validity, pyarrow.py_buffer(self.values)], null_count
+        )
+
+        if self.kind == "dictionary":
+            return pyarrow.DictionaryArray.from_arrays(
+                result, pyarrow.array(self.categories, pyarrow.string())
+            )
+
+        return result
+
+
+def get_field(item: Any, field: Union[str, Sequence[str]]) -> Any:
+    """
+    Provides the value of the given (dotted) field of the given item.
+
+    The item may be a resource type, its compact version or its (not yet
+    hydrated) dataset.
+
+    :param item:
+        The item to read.
+    :param field:
+        The name of the field to read. A dot separates the name of a nested
+        resource type from the name of its field - e.g. :code:`branch.name`.
+        The already split name is accepted too.
+    """
+
+    if isinstance(field, str):
+        field = field.split(".")
+
+    for name in field:
+        if item is None:
+            return None
+
+        if isinstance(item, dict):
+            item = item.get(name)
+        else:
+            item = getattr(item, name, None)
+
+    return item
+
+
+def to_columns(items: Iterable[Any], fields: Iterable[str]) -> Dict[str, Column]:
+    """
+    Flattens the given fields of the given items into typed columns - without
+    converting the items into dictionaries.
+
+    ::
+
+        from PyTravisCI import TravisCI
+        from PyTravisCI.export import to_columns
+
+        travis = TravisCI(access_token="XYZ")
+
+        columns = to_columns(
+            travis.iter_builds(params={"limit": 100}),
+            ["id", "state", "started_at", "branch.name"],
+        )
+
+    :param items:
+        The resource types (their compact version or their datasets) to
+        flatten.
+    :param fields:
+        The (dotted) fields to flatten. See :func:`get_field`.
+
+    :return:
+        The columns - by field.
+    """
+
+    columns = {x: Column(x) for x in fields}
+    appenders = [(y.append, tuple(x.split("."))) for x, y in columns.items()]
+
+    for item in items:
+        for append, field in appenders:
+            append(get_field(item, field))
+
+    return columns
+
+
+def columns_to_arrow(columns: Dict[str, Column]) -> Any:
+    """
+    Converts the given columns into an Arrow table.
+
+    ::
+
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(
+            columns_to_arrow(columns), "/tmp/builds.parquet"
+        )
+
+    :param columns:
+        The columns to convert. See :func:`to_columns`.
+
+    :raise ImportError:
+        When :code:`pyarrow` is not installed.
+    """
+
+    pyarrow = get_pyarrow()
+
+    return pyarrow.table({x: y.to_arrow() for x, y in columns.items()})
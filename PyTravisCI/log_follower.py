@@ -0,0 +1,201 @@
+"""
+Just another Python API for Travis CI (API).
+
+This module provides the follower of the log of a (running) job.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import codecs
+import time
+from typing import Iterator, Optional
+
+import PyTravisCI.communicator._all as communicator
+import PyTravisCI.defaults as defaults
+import PyTravisCI.resource_types._all as resource_types
+
+
+class LogFollower:
+    """
+    Follows the log of a (running) job: each fetch only gives what was not
+    seen yet.
+
+    2 modes are provided:
+
+        - The plain text mode (default) requests the raw log - without its
+          JSON wrapping - and only the bytes after the ones we already have
+          (through the :code:`Range` header).
+        - The parts mode requests the JSON representation of the log and
+          only gives the :code:`log_parts` whose number was not seen yet.
+
+    ::
+
+        from PyTravisCI import TravisCI
+        from PyTravisCI.log_follower import LogFollower
+
+        travis = TravisCI(access_token="XYZ")
+
+        for chunk in LogFollower(travis.get_job(4242)).follow():
+            print(chunk, end="")
+
+    :param job:
+        The job to follow the log of.
+    :param plain_text:
+        Use the plain text mode. Otherwise, the parts mode is used.
+    :param interval:
+        The number of seconds between 2 fetches.
+
+    :raise ValueError:
+        When :code:`interval` is negative.
+    """
+
+    def __init__(
+        self,
+        job: "resource_types.Job",
+        *,
+        plain_text: bool = True,
+        interval: float = 5.0,
+    ) -> None:
+        if interval < 0:
+            raise ValueError(f"<interval> should be >= 0, {interval} given.")
+
+        self.job = job
+        self.plain_text = plain_text
+        self.interval = interval
+
+        self.offset: int = 0
+        self.part_number: int = -1
+        self.finished: bool = False
+
+        # A character may be split across 2 fetches.
+        self.__decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} job={self.job.id} "
+            f"offset={self.offset} part_number={self.part_number} />"
+        )
+
+    @staticmethod
+    def get_time() -> float:
+        """
+        Provides the (monotonic) time we measure the timeout with.
+        """
+
+        return time.monotonic()
+
+    def __get_communicator(self) -> "communicator.Log":
+        """
+        Provides the communicator of the log.
+        """
+
+        # pylint: disable=protected-access
+        return communicator.Log(self.job._PyTravisCI["com"]["requester"])
+
+    def fetch(self) -> str:
+        """
+        Provides what was added to the log since the previous fetch.
+        """
+
+        if self.plain_text:
+            data = self.__get_communicator().get_content(
+                job_id=self.job.id, offset=self.offset
+            )
+            self.offset += len(data)
+
+            return self.__decoder.decode(data)
+
+        log = self.__get_communicator().from_id(job_id=self.job.id)
+        parts = sorted(
+            (x for x in log.log_parts or [] if x.get("number", -1) > self.part_number),
+            key=lambda x: x["number"],
+        )
+
+        if parts:
+            self.part_number = parts[-1]["number"]
+            self.finished = self.finished or any(x.get("final") for x in parts)
+
+        return "".join(x.get("content") or "" for x in parts)
+
+    def is_job_finished(self) -> bool:
+        """
+        Checks if the job is finished - through a fresh version of the job.
+        """
+
+        return self.job.sync().state not in defaults.states.PENDING
+
+    def follow(self, *, timeout: Optional[float] = None) -> Iterator[str]:
+        """
+        Fetches - and yields - what is added to the log until the job is
+        finished (or until the given timeout).
+
+        The job itself is only refreshed when a fetch gave nothing new.
+
+        :param timeout:
+            The maximum number of seconds to follow the log. :code:`None`
+            means until the job is finished.
+        """
+
+        deadline = None if timeout is None else self.get_time() + timeout
+
+        while True:
+            chunk = self.fetch()
+
+            if chunk:
+                yield chunk
+
+                if self.finished and not self.plain_text:
+                    # The final part was given.
+                    return
+            elif self.finished:
+                return
+            elif self.is_job_finished():
+                # We still have to fetch what was written before the end.
+                self.finished = True
+
+            if self.finished:
+                continue
+
+            if deadline is None:
+                time.sleep(self.interval)
+                continue
+
+            remaining = deadline - self.get_time()
+
+            if remaining <= 0:
+                return
+
+            time.sleep(min(self.interval, remaining))
@@ -0,0 +1,644 @@
+"""
+Just another Python API for Travis CI (API).
+
+This module provides a local (SQLite) mirror of the builds and jobs.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Iterable, List, Optional, Union
+
+import PyTravisCI.codec as codec
+import PyTravisCI.communicator._all as communicator
+import PyTravisCI.defaults as defaults
+import PyTravisCI.resource_types._all as resource_types
+from PyTravisCI.standardization import SinglePassStandardization
+
+SCHEMA: List[str] = [
+    "CREATE TABLE IF NOT EXISTS repositories ("
+    "id INTEGER PRIMARY KEY, slug TEXT, name TEXT, default_branch TEXT, "
+    "synced_build_id INTEGER, synced_at TEXT, data TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS builds ("
+    "id INTEGER PRIMARY KEY, repository_id INTEGER, number TEXT, state TEXT, "
+    "event_type TEXT, branch TEXT, commit_sha TEXT, duration INTEGER, "
+    "started_at TEXT, finished_at TEXT, updated_at TEXT, data TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS jobs ("
+    "id INTEGER PRIMARY KEY, build_id INTEGER, repository_id INTEGER, "
+    "stage_id INTEGER, number TEXT, state TEXT, queue TEXT, started_at TEXT, "
+    "finished_at TEXT, data TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS stages ("
+    "id INTEGER PRIMARY KEY, build_id INTEGER, number INTEGER, name TEXT, "
+    "state TEXT, started_at TEXT, finished_at TEXT, data TEXT NOT NULL)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS repositories_slug ON repositories (slug)",
+    "CREATE INDEX IF NOT EXISTS builds_repository "
+    "ON builds (repository_id, branch, id)",
+    "CREATE INDEX IF NOT EXISTS builds_state ON builds (repository_id, state, id)",
+    "CREATE INDEX IF NOT EXISTS builds_started_at ON builds (started_at)",
+    "CREATE INDEX IF NOT EXISTS jobs_build ON jobs (build_id)",
+    "CREATE INDEX IF NOT EXISTS jobs_state ON jobs (repository_id, state, id)",
+    "CREATE INDEX IF NOT EXISTS jobs_started_at ON jobs (started_at)",
+    "CREATE INDEX IF NOT EXISTS stages_build ON stages (build_id)",
+]
+
+
+class Mirror:
+    """
+    A local (SQLite) mirror of the repositories and of their builds, jobs and
+    stages.
+
+    The mirror is filled by :py:meth:`sync` and can then be queried offline.
+    Each synchronization only fetches what changed since the previous one:
+    the builds are walked newest-first until an already synchronized (and
+    unchanged) build is reached.
+
+    ::
+
+        from PyTravisCI import TravisCI
+        from PyTravisCI.mirror import Mirror
+
+        travis = TravisCI(access_token="XYZ")
+        mirror = Mirror("/tmp/travis.sqlite")
+
+        mirror.sync(travis.get_repository("funilrys/PyTravisCI"))
+
+        for build in mirror.get_builds(
+            "funilrys/PyTravisCI", state="failed", branch="master"
+        ):
+            print(build.id, build.finished_at)
+
+    :param path:
+        The path to the database.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.__local = threading.local()
+
+        with self.get_connection() as connection:
+            for statement in SCHEMA:
+                connection.execute(statement)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path!r} />"
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Provides the connection of the current thread (and process).
+        """
+
+        connection = getattr(self.__local, "connection", None)
+
+        if connection is None or self.__local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.row_factory = sqlite3.Row
+
+            self.__local.connection = connection
+            self.__local.pid = os.getpid()
+
+        return connection
+
+    @staticmethod
+    def format_datetime(value: Optional[datetime]) -> Optional[str]:
+        """
+        Converts the given date into our standard format - which is sorted like
+        the dates themselves.
+        """
+
+        if value is None or isinstance(value, str):
+            return value
+
+        return value.strftime(defaults.formats.STANDARD_DATE_FORMAT)
+
+    @staticmethod
+    def get_data(resource_type: Any) -> str:
+        """
+        Provides the (JSON encoded) dataset of the given resource type.
+        """
+
+        return codec.get_codec().dumps(resource_type.to_dict())
+
+    @staticmethod
+    def get_resource_type(resource_type: str, data: str) -> Any:
+        """
+        Converts the given (JSON encoded) dataset into the given resource
+        type.
+
+        :param resource_type:
+            The name of the resource type to create.
+        :param data:
+            The dataset to convert.
+        """
+
+        return getattr(resource_types, resource_type)(
+            **SinglePassStandardization(
+                codec.get_codec().loads(data)
+            ).get_standardized()
+        )
+
+    @staticmethod
+    def get_nested(resource_type: Any, name: str, field: str) -> Any:
+        """
+        Provides the given field of the given nested resource type - if any.
+        """
+
+        return getattr(getattr(resource_type, name, None), field, None)
+
+    def store_repository(
+        self, connection: sqlite3.Connection, repository: "resource_types.Repository"
+    ) -> None:
+        """
+        Stores (or updates) the given repository - while keeping its
+        synchronization state.
+        """
+
+        connection.execute(
+            "INSERT INTO repositories (id, slug, name, default_branch, data) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (id) DO UPDATE SET "
+            "slug = excluded.slug, name = excluded.name, "
+            "default_branch = excluded.default_branch, data = excluded.data",
+            (
+                repository.id,
+                repository.slug,
+                repository.name,
+                self.get_nested(repository, "default_branch", "name"),
+                self.get_data(repository),
+            ),
+        )
+
+    def store_build(
+        self,
+        connection: sqlite3.Connection,
+        build: "resource_types.Build",
+        repository_id: int,
+    ) -> None:
+        """
+        Stores (or replaces) the given build and its stages.
+        """
+
+        connection.execute(
+            "INSERT OR REPLACE INTO builds (id, repository_id, number, state, "
+            "event_type, branch, commit_sha, duration, started_at, finished_at, "
+            "updated_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                build.id,
+                repository_id,
+                build.number,
+                build.state,
+                build.event_type,
+                self.get_nested(build, "branch", "name"),
+                self.get_nested(build, "commit", "sha"),
+                build.duration,
+                self.format_datetime(build.started_at),
+                self.format_datetime(build.finished_at),
+                self.format_datetime(build.updated_at),
+                self.get_data(build),
+            ),
+        )
+
+        self.store_stages(connection, build.stages or [], build.id)
+
+    def store_stages(
+        self,
+        connection: sqlite3.Connection,
+        stages: Iterable["resource_types.Stage"],
+        build_id: int,
+    ) -> None:
+        """
+        Stores (or replaces) the given stages.
+        """
+
+        connection.executemany(
+            "INSERT OR REPLACE INTO stages (id, build_id, number, name, state, "
+            "started_at, finished_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    x.id,
+                    build_id,
+                    x.number,
+                    x.name,
+                    x.state,
+                    self.format_datetime(x.started_at),
+                    self.format_datetime(x.finished_at),
+                    self.get_data(x),
+                )
+                for x in stages
+                if x.id is not None
+            ],
+        )
+
+    def store_jobs(
+        self,
+        connection: sqlite3.Connection,
+        jobs: Iterable["resource_types.Job"],
+        build_id: int,
+        repository_id: int,
+    ) -> None:
+        """
+        Stores (or replaces) the given jobs.
+        """
+
+        connection.executemany(
+            "INSERT OR REPLACE INTO jobs (id, build_id, repository_id, stage_id, "
+            "number, state, queue, started_at, finished_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    x.id,
+                    build_id,
+                    repository_id,
+                    self.get_nested(x, "stage", "id"),
+                    x.number,
+                    x.state,
+                    x.queue,
+                    self.format_datetime(x.started_at),
+                    self.format_datetime(x.finished_at),
+                    self.get_data(x),
+                )
+                for x in jobs
+            ],
+        )
+
+    def is_synced(self, build: "resource_types.Build") -> bool:
+        """
+        Checks if the given build was already synchronized - and did not
+        change since then.
+        """
+
+        row = (
+            self.get_connection()
+            .execute("SELECT state, updated_at FROM builds WHERE id = ?", (build.id,))
+            .fetchone()
+        )
+
+        if row is None:
+            return False
+
+        if build.updated_at is not None:
+            return row["updated_at"] == self.format_datetime(build.updated_at)
+
+        return (
+            row["state"] == build.state and row["state"] not in defaults.states.PENDING
+        )
+
+    def sync_build(
+        self,
+        build: "resource_types.Build",
+        repository_id: int,
+        *,
+        with_jobs: bool = True,
+    ) -> int:
+        """
+        Synchronizes the given build - and its jobs.
+
+        :return:
+            The number of synchronized jobs.
+        """
+
+        jobs = list(build.get_jobs().iter_all()) if with_jobs else []
+
+        with self.get_connection() as connection:
+            self.store_build(connection, build, repository_id)
+            self.store_jobs(connection, jobs, build.id, repository_id)
+
+        return len(jobs)
+
+    def sync(
+        self,
+        repository: "resource_types.Repository",
+        *,
+        with_jobs: bool = True,
+        page_size: int = 100,
+        full: bool = False,
+    ) -> dict:
+        """
+        Synchronizes the given repository and its builds, jobs and stages.
+
+        The builds are walked newest-first and the walk stops at the first
+        build which was already synchronized and did not change since then.
+        The (older) builds which were still pending at the previous
+        synchronization are then refreshed one by one.
+
+        An interrupted synchronization is resumed by the next one: the builds
+        are only considered as synchronized once a walk was completed.
+
+        .. note::
+            The older builds which changed after they were finished (e.g.
+            restarted ones) are not seen by the walk. Give :code:`full` to walk
+            through all the builds - only the changed ones are stored.
+
+        :param repository:
+            The repository to synchronize.
+        :param with_jobs:
+            Synchronize the jobs of each build too. It costs a request per
+            (new or changed) build.
+        :param page_size:
+            The number of builds to fetch per request.
+        :param full:
+            Walk through all the builds instead of stopping at the first
+            already synchronized one.
+
+        :return:
+            The number of synchronized builds and jobs.
+        """
+
+        result = {"builds": 0, "jobs": 0}
+
+        with self.get_connection() as connection:
+            self.store_repository(connection, repository)
+
+        row = (
+            self.get_connection()
+            .execute(
+                "SELECT synced_build_id FROM repositories WHERE id = ?",
+                (repository.id,),
+            )
+            .fetchone()
+        )
+        synced_build_id = row["synced_build_id"] or 0
+        newest_build_id = synced_build_id
+        synced = set()
+
+        builds = repository.get_builds(
+            params={"limit": page_size, "sort_by": "id:desc"}
+        )
+
+        for build in builds.iter_all():
+            if self.is_synced(build):
+                if build.id <= synced_build_id and not full:
+                    break
+
+                # Synchronized by an interrupted synchronization.
+                newest_build_id = max(newest_build_id, build.id)
+                continue
+
+            result["jobs"] += self.sync_build(build, repository.id, with_jobs=with_jobs)
+            result["builds"] += 1
+            newest_build_id = max(newest_build_id, build.id)
+            synced.add(build.id)
+
+        pending = [
+            x["id"]
+            for x in self.get_connection().execute(
+                "SELECT id FROM builds WHERE repository_id = ? AND id <= ? AND "
+                f"state IN ({', '.join('?' * len(defaults.states.PENDING))})",
+                (repository.id, synced_build_id, *defaults.states.PENDING),
+            )
+            if x["id"] not in synced
+        ]
+
+        if pending:
+            # pylint: disable=protected-access
+            comm = communicator.Build(repository._PyTravisCI["com"]["requester"])
+
+            for build_id in pending:
+                result["jobs"] += self.sync_build(
+                    comm.from_id(build_id=build_id),
+                    repository.id,
+                    with_jobs=with_jobs,
+                )
+                result["builds"] += 1
+
+        with self.get_connection() as connection:
+            connection.execute(
+                "UPDATE repositories SET synced_build_id = ?, synced_at = ? "
+                "WHERE id = ?",
+                (
+                    newest_build_id,
+                    self.format_datetime(
+                        datetime.now(timezone.utc).replace(tzinfo=None)
+                    ),
+                    repository.id,
+                ),
+            )
+
+        return result
+
+    def get_repository_id(self, repository: Union[int, str]) -> Optional[int]:
+        """
+        Provides the ID of the given repository (ID or slug) - if mirrored.
+        """
+
+        if isinstance(repository, int):
+            return repository
+
+        row = (
+            self.get_connection()
+            .execute("SELECT id FROM repositories WHERE slug = ?", (repository,))
+            .fetchone()
+        )
+
+        return row["id"] if row else None
+
+    def get_repository(
+        self, repository: Union[int, str]
+    ) -> Optional["resource_types.Repository"]:
+        """
+        Provides the given (mirrored) repository.
+
+        :param repository:
+            The ID or slug of the repository.
+        """
+
+        row = (
+            self.get_connection()
+            .execute(
+                "SELECT data FROM repositories WHERE id = ?",
+                (self.get_repository_id(repository),),
+            )
+            .fetchone()
+        )
+
+        return self.get_resource_type("Repository", row["data"]) if row else None
+
+    def __select(
+        self, table: str, resource_type: str, conditions: dict, limit: Optional[int]
+    ) -> list:
+        """
+        Provides the (newest first) resource types of the given table which
+        match all the given conditions.
+
+        :param conditions:
+            The SQL conditions and their value. The conditions with a
+            :code:`None` value are ignored.
+        """
+
+        conditions = {x: y for x, y in conditions.items() if y is not None}
+
+        query = f"SELECT data FROM {table}"
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY id DESC"
+
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+
+        return [
+            self.get_resource_type(resource_type, x["data"])
+            for x in self.get_connection().execute(query, tuple(conditions.values()))
+        ]
+
+    def get_builds(
+        self,
+        repository: Optional[Union[int, str]] = None,
+        *,
+        state: Optional[str] = None,
+        branch: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List["resource_types.Build"]:
+        """
+        Provides the (newest first) mirrored builds which match all the given
+        criteria.
+
+        :param repository:
+            The ID or slug of the repository of the builds.
+        :param state:
+            The state of the builds.
+        :param branch:
+            The name of the branch of the builds.
+        :param since:
+            The builds started at or after the given date (UTC).
+        :param until:
+            The builds started before the given date (UTC).
+        :param limit:
+            The maximum number of builds to provide.
+        """
+
+        repository_id = None
+
+        if repository is not None:
+            repository_id = self.get_repository_id(repository)
+
+            if repository_id is None:
+                # The repository is not mirrored: nothing can match.
+                return []
+
+        return self.__select(
+            "builds",
+            "Build",
+            {
+                "repository_id = ?": repository_id,
+                "state = ?": state,
+                "branch = ?": branch,
+                "started_at >= ?": self.format_datetime(since),
+                "started_at < ?": self.format_datetime(until),
+            },
+            limit,
+        )
+
+    def get_jobs(
+        self,
+        repository: Optional[Union[int, str]] = None,
+        *,
+        build_id: Optional[int] = None,
+        state: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List["resource_types.Job"]:
+        """
+        Provides the (newest first) mirrored jobs which match all the given
+        criteria.
+
+        :param repository:
+            The ID or slug of the repository of the jobs.
+        :param build_id:
+            The ID of the build of the jobs.
+        :param state:
+            The state of the jobs.
+        :param since:
+            The jobs started at or after the given date (UTC).
+        :param until:
+            The jobs started before the given date (UTC).
+        :param limit:
+            The maximum number of jobs to provide.
+        """
+
+        repository_id = None
+
+        if repository is not None:
+            repository_id = self.get_repository_id(repository)
+
+            if repository_id is None:
+                # The repository is not mirrored: nothing can match.
+                return []
+
+        return self.__select(
+            "jobs",
+            "Job",
+            {
+                "repository_id = ?": repository_id,
+                "build_id = ?": build_id,
+                "state = ?": state,
+                "started_at >= ?": self.format_datetime(since),
+                "started_at < ?": self.format_datetime(until),
+            },
+            limit,
+        )
+
+    def get_stages(self, build_id: int) -> List["resource_types.Stage"]:
+        """
+        Provides the mirrored stages of the given build.
+        """
+
+        return sorted(
+            self.__select("stages", "Stage", {"build_id = ?": build_id}, None),
+            key=lambda x: (x.number is None, x.number),
+        )
+
+    def execute(self, query: str, parameters: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        """
+        Runs the given (read) query against the mirror. See the module
+        :code:`SCHEMA` for the tables and their columns.
+
+        ::
+
+            mirror.execute(
+                "SELECT branch, AVG(duration) FROM builds "
+                "WHERE state = ? GROUP BY branch",
+                ("passed",),
+            )
+        """
+
+        return self.get_connection().execute(query, tuple(parameters)).fetchall()
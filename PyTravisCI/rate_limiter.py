@@ -0,0 +1,320 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the client-side rate limiters of our requester.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import contextlib
+import os
+import threading
+import time
+from typing import Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    A token bucket which paces the requests sent to the Travis CI API.
+
+    The bucket is refilled with :code:`rate` tokens per second, up to
+    :code:`capacity` tokens. Every request consumes a token. When the bucket
+    is empty, the caller waits until its token is available.
+
+    The bucket can be shared by as many threads (or requesters) as you want.
+
+    :param rate:
+        The number of requests per second we are allowed to send.
+    :param capacity:
+        The maximum number of requests we are allowed to send in a burst.
+        Defaults to :code:`max(rate, 1)`.
+
+    :raise ValueError:
+        When :code:`rate` or :code:`capacity` is not positive.
+    """
+
+    def __init__(self, rate: float, *, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError(f"<rate> should be > 0, {rate} given.")
+
+        if capacity is None:
+            capacity = max(rate, 1.0)
+        elif capacity <= 0:
+            raise ValueError(f"<capacity> should be > 0, {capacity} given.")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._last_update = self.get_time()
+
+        self._acquisitions = 0
+        self._waited_acquisitions = 0
+        self._total_waited = 0.0
+        self._max_waited = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} rate={self.rate} "
+            f"capacity={self.capacity} />"
+        )
+
+    @staticmethod
+    def get_time() -> float:
+        """
+        Provides the clock the bucket is refilled with.
+        """
+
+        return time.monotonic()
+
+    @contextlib.contextmanager
+    def locked_state(self) -> Iterator[Tuple[float, float]]:
+        """
+        Locks the bucket and provides its state - the number of tokens and the
+        time of its last update.
+
+        .. warning::
+            You are not invited to use this method outside of the rate limiters.
+        """
+
+        with self._lock:
+            yield self._tokens, self._last_update
+
+    def save_state(self, tokens: float, last_update: float) -> None:
+        """
+        Saves the state of the bucket. Called while the bucket is locked.
+
+        .. warning::
+            You are not invited to use this method outside of the rate limiters.
+        """
+
+        self._tokens = tokens
+        self._last_update = last_update
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserves the given number of tokens and provides the number of seconds
+        to wait for before using them.
+
+        Reservations are served in order: once reserved, the tokens belong to
+        the caller - even if it didn't wait yet.
+
+        :param tokens:
+            The number of tokens to reserve.
+        """
+
+        with self.locked_state() as (available, last_update):
+            now = self.get_time()
+            available = min(
+                self.capacity, available + max(now - last_update, 0.0) * self.rate
+            )
+            available -= tokens
+
+            self.save_state(available, now)
+
+        if available >= 0:
+            return 0.0
+        return -available / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Waits until the given number of tokens is available and consumes them.
+
+        :param tokens:
+            The number of tokens to consume.
+
+        :return:
+            The number of seconds we waited for.
+        """
+
+        waited = self.reserve(tokens)
+
+        if waited > 0:
+            time.sleep(waited)
+
+        self.record_wait(waited)
+
+        return waited
+
+    def record_wait(self, waited: float) -> None:
+        """
+        Records the given waiting time into our statistics.
+
+        :param waited:
+            The number of seconds a caller waited for.
+        """
+
+        with self._lock:
+            self._acquisitions += 1
+            self._total_waited += waited
+
+            if waited > 0:
+                self._waited_acquisitions += 1
+                self._max_waited = max(self._max_waited, waited)
+
+    def get_statistics(self) -> dict:
+        """
+        Provides how long the callers waited for their tokens.
+
+        ::
+
+            {
+                "acquisitions": 10,
+                "waited_acquisitions": 4,
+                "total_waited": 1.5,
+                "max_waited": 0.5,
+                "average_waited": 0.15,
+            }
+        """
+
+        with self._lock:
+            return {
+                "acquisitions": self._acquisitions,
+                "waited_acquisitions": self._waited_acquisitions,
+                "total_waited": self._total_waited,
+                "max_waited": self._max_waited,
+                "average_waited": (
+                    self._total_waited / self._acquisitions
+                    if self._acquisitions
+                    else 0.0
+                ),
+            }
+
+    def reset_statistics(self) -> None:
+        """
+        Resets our statistics.
+        """
+
+        with self._lock:
+            self._acquisitions = self._waited_acquisitions = 0
+            self._total_waited = self._max_waited = 0.0
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    A token bucket whose state is stored into a local file, so that it can be
+    shared by several processes of the same host.
+
+    The file is locked (through :code:`flock`) while a process reads or updates
+    the state of the bucket.
+
+    .. note::
+        The statistics are not shared, they only describe the current process.
+
+    :param rate:
+        The number of requests per second we are allowed to send.
+    :param path:
+        The path of the file to store the state of the bucket into.
+        It is created if it does not exist.
+    :param capacity:
+        The maximum number of requests we are allowed to send in a burst.
+        Defaults to :code:`max(rate, 1)`.
+
+    :raise RuntimeError:
+        When file locking is not supported by the current platform.
+    """
+
+    def __init__(
+        self, rate: float, path: str, *, capacity: Optional[float] = None
+    ) -> None:
+        if fcntl is None:  # pragma: no cover
+            raise RuntimeError(
+                f"{self.__class__.__name__} is not supported by the current platform."
+            )
+
+        self.path = path
+        self._file_descriptor: Optional[int] = None
+
+        super().__init__(rate, capacity=capacity)
+
+    @staticmethod
+    def get_time() -> float:
+        """
+        Provides the clock the bucket is refilled with.
+
+        As the clock is shared between processes, we use the wall clock.
+        """
+
+        return time.time()
+
+    @contextlib.contextmanager
+    def locked_state(self) -> Iterator[Tuple[float, float]]:
+        """
+        Locks the bucket (file) and provides its state - the number of tokens
+        and the time of its last update.
+
+        .. warning::
+            You are not invited to use this method outside of the rate limiters.
+        """
+
+        with self._lock:
+            file_descriptor = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+
+            try:
+                fcntl.flock(file_descriptor, fcntl.LOCK_EX)
+
+                try:
+                    tokens, last_update = (
+                        float(x) for x in os.read(file_descriptor, 64).split()
+                    )
+                except ValueError:
+                    tokens, last_update = self.capacity, self.get_time()
+
+                self._file_descriptor = file_descriptor
+
+                yield tokens, last_update
+            finally:
+                self._file_descriptor = None
+                os.close(file_descriptor)
+
+    def save_state(self, tokens: float, last_update: float) -> None:
+        """
+        Saves the state of the bucket into its file. Called while the bucket
+        is locked.
+
+        .. warning::
+            You are not invited to use this method outside of the rate limiters.
+        """
+
+        os.lseek(self._file_descriptor, 0, os.SEEK_SET)
+        os.ftruncate(self._file_descriptor, 0)
+        os.write(self._file_descriptor, f"{tokens!r} {last_update!r}".encode())
@@ -43,12 +43,19 @@ License
 import functools
 import json
 import logging
-from typing import Optional
+import threading
+from typing import Hashable, Iterable, Optional, Tuple
 
 import requests
 
+import PyTravisCI.codec as codec
 import PyTravisCI.defaults as defaults
 import PyTravisCI.exceptions as exceptions
+from PyTravisCI.encryption.public_key_cache import PublicKeyCache
+from PyTravisCI.rate_limiter import TokenBucket
+from PyTravisCI.response_cache import ResponseCacheBase
+from PyTravisCI.retry import NO_RETRY, RetryPolicy
+from PyTravisCI.revalidation import RevalidationCache, RevalidationEntry
 
 
 class Requester:
@@ -63,13 +70,62 @@ class Requester:
     .. warning::
         You are not expected or invited to use this class directly if you
         don't know what it may imply!
+
+    :param retry_policy:
+        The policy to follow when a request fails because of a transient error.
+        If not given, requests are never retried.
+    :param rate_limiter:
+        The rate limiter which paces every request (retries included).
+        If not given, requests are not paced.
+    :param revalidation_cache:
+        The cache of the responses to revalidate (conditional GET).
+        If not given, responses are not cached.
+    :param response_cache:
+        The cache which let the communicators skip the requests of the
+        resources which don't change often. If not given, nothing is skipped.
+    :param public_key_cache:
+        The cache of the public keys of the repositories. If not given, the
+        public keys are fetched (and loaded) every time we encrypt something.
     """
 
-    def __init__(self) -> None:
+    retry_policy: RetryPolicy = NO_RETRY
+    rate_limiter: Optional[TokenBucket] = None
+    revalidation_cache: Optional[RevalidationCache] = None
+    response_cache: Optional[ResponseCacheBase] = None
+    public_key_cache: Optional[PublicKeyCache] = None
+    pool_size: int = requests.adapters.DEFAULT_POOLSIZE
+
+    def __init__(
+        self,
+        *,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        revalidation_cache: Optional[RevalidationCache] = None,
+        response_cache: Optional[ResponseCacheBase] = None,
+        public_key_cache: Optional[PublicKeyCache] = None,
+    ) -> None:
         self.base_url = ""
         self.session = requests.Session()
+        self.__pool_lock = threading.Lock()
+
+        self.session.headers = requests.structures.CaseInsensitiveDict(
+            defaults.requester.HEADERS
+        )
+
+        if retry_policy is not None:
+            self.set_retry_policy(retry_policy)
 
-        self.session.headers = defaults.requester.HEADERS
+        if rate_limiter is not None:
+            self.set_rate_limiter(rate_limiter)
+
+        if revalidation_cache is not None:
+            self.set_revalidation_cache(revalidation_cache)
+
+        if response_cache is not None:
+            self.set_response_cache(response_cache)
+
+        if public_key_cache is not None:
+            self.set_public_key_cache(public_key_cache)
 
     def request_factory(verb: str):  # pylint: disable=no-self-argument
         """
@@ -79,12 +135,12 @@ class Requester:
         def request_method(func):
             @functools.wraps(func)
             def wrapper(self, endpoint, **kwargs):
-                req = getattr(self.session, verb.lower())(  # pylint: disable=no-member
-                    self.bind_endpoint_to_base_url(endpoint), **kwargs
+                req = self.send(
+                    verb, self.bind_endpoint_to_base_url(endpoint), **kwargs
                 )
 
                 try:
-                    response = req.json()
+                    response = codec.decode_response(req)
 
                     self.raise_if_error(req, response)
                 except json.decoder.JSONDecodeError:
@@ -119,6 +175,118 @@ class Requester:
 
         return request_method
 
+    def send(self, verb: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends the request - conditionally, if we already know its response.
+
+        :param verb:
+            The HTTP verb to use.
+        :param url:
+            The URL to communicate with.
+        """
+
+        key, entry, kwargs = self.prepare_revalidation(verb, url, kwargs)
+
+        return self.complete_revalidation(
+            key, entry, self.send_with_retry(verb, url, **kwargs)
+        )
+
+    def prepare_revalidation(
+        self, verb: str, url: str, kwargs: dict
+    ) -> Tuple[Optional[Hashable], Optional[RevalidationEntry], dict]:
+        """
+        Prepares the revalidation of the given request, through our
+        revalidation cache.
+
+        :return:
+            The key of the request, the known response and the keyword
+            arguments to send the request with.
+        """
+
+        if self.revalidation_cache is None:
+            return None, None, kwargs
+
+        key = self.revalidation_cache.get_key(
+            verb, url, kwargs, self.session.headers.get("Authorization")
+        )
+
+        if key is None:
+            return None, None, kwargs
+
+        return (key,) + self.revalidation_cache.prepare(key, kwargs)
+
+    def complete_revalidation(
+        self,
+        key: Optional[Hashable],
+        entry: Optional[RevalidationEntry],
+        response: requests.Response,
+    ) -> requests.Response:
+        """
+        Completes the revalidation of a request prepared by
+        :py:meth:`prepare_revalidation`.
+        """
+
+        if key is None or self.revalidation_cache is None:
+            return response
+
+        return self.revalidation_cache.complete(key, entry, response)
+
+    def send_with_retry(self, verb: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends the request and retries it - as long as our retry policy
+        authorizes it.
+
+        :param verb:
+            The HTTP verb to use.
+        :param url:
+            The URL to communicate with.
+
+        :raise requests.exceptions.RequestException:
+            When the last attempt could not reach the API.
+        """
+
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                req = getattr(self.session, verb.lower())(url, **kwargs)
+            except requests.exceptions.RequestException as exception:
+                if not self.retry_policy.should_retry_exception(
+                    verb, exception, attempt
+                ):
+                    raise
+
+                logging.debug(
+                    "Attempt %d of %s %s failed: %s. Retrying.",
+                    attempt,
+                    verb.upper(),
+                    url,
+                    exception,
+                )
+
+                self.retry_policy.sleep(self.retry_policy.get_delay(attempt))
+                continue
+
+            if not self.retry_policy.should_retry_response(
+                verb, req.status_code, req.headers, attempt
+            ):
+                return req
+
+            logging.debug(
+                "Attempt %d of %s %s got status %s. Retrying.",
+                attempt,
+                verb.upper(),
+                url,
+                req.status_code,
+            )
+
+            self.retry_policy.sleep(self.retry_policy.get_delay(attempt, req.headers))
+
     @staticmethod
     def is_error(api_response: dict) -> bool:
         """
@@ -186,6 +354,156 @@ class Requester:
 
         self.session.headers["Authorization"] = f"token {value}"
 
+    def set_retry_policy(self, value: RetryPolicy) -> None:
+        """
+        Sets the retry policy to follow.
+
+        :raise TypeError:
+            If :code:`value` is not a :class:`~PyTravisCI.retry.RetryPolicy`.
+        """
+
+        if not isinstance(value, RetryPolicy):
+            raise TypeError(f"<value> should be {RetryPolicy}. {type(value)} given.")
+
+        self.retry_policy = value
+
+    def set_rate_limiter(self, value: Optional[TokenBucket]) -> None:
+        """
+        Sets the rate limiter which paces our requests.
+
+        :param value:
+            The rate limiter to use. :code:`None` disables the pacing.
+
+        :raise TypeError:
+            If :code:`value` is not a :class:`~PyTravisCI.rate_limiter.TokenBucket`.
+        """
+
+        if value is not None and not isinstance(value, TokenBucket):
+            raise TypeError(f"<value> should be {TokenBucket}. {type(value)} given.")
+
+        self.rate_limiter = value
+
+    def set_pool_size(self, value: int) -> None:
+        """
+        Sets the number of connections we keep alive (per host). It should be
+        at least the number of threads sharing this requester.
+
+        The pool only grows: a value which is not greater than the current
+        one is ignored. When it grows, the new pool is mounted and the
+        replaced one is closed - the requests it is sending are not
+        interrupted.
+
+        :raise TypeError:
+            If :code:`value` is not an integer.
+        :raise ValueError:
+            If :code:`value` is lower than :code:`1`.
+        """
+
+        if not isinstance(value, int):
+            raise TypeError(f"<value> should be {int}. {type(value)} given.")
+
+        if value < 1:
+            raise ValueError(f"<value> should be >= 1, {value} given.")
+
+        with self.__pool_lock:
+            if value <= self.pool_size:
+                return
+
+            replaced = {
+                id(x): x
+                for x in (
+                    self.session.adapters.get("https://"),
+                    self.session.adapters.get("http://"),
+                )
+                if x is not None
+            }
+
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=value, pool_maxsize=value
+            )
+
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+            self.pool_size = value
+
+        for old_adapter in replaced.values():
+            old_adapter.close()
+
+    def set_revalidation_cache(self, value: Optional[RevalidationCache]) -> None:
+        """
+        Sets the cache of the responses to revalidate.
+
+        :param value:
+            The cache to use. :code:`None` disables the cache.
+
+        :raise TypeError:
+            If :code:`value` is not a
+            :class:`~PyTravisCI.revalidation.RevalidationCache`.
+        """
+
+        if value is not None and not isinstance(value, RevalidationCache):
+            raise TypeError(
+                f"<value> should be {RevalidationCache}. {type(value)} given."
+            )
+
+        self.revalidation_cache = value
+
+    def set_response_cache(self, value: Optional[ResponseCacheBase]) -> None:
+        """
+        Sets the cache which let the communicators skip the requests of the
+        resources which don't change often.
+
+        :param value:
+            The cache to use. :code:`None` disables the cache.
+
+        :raise TypeError:
+            If :code:`value` is not a
+            :class:`~PyTravisCI.response_cache.ResponseCacheBase`.
+        """
+
+        if value is not None and not isinstance(value, ResponseCacheBase):
+            raise TypeError(
+                f"<value> should be {ResponseCacheBase}. {type(value)} given."
+            )
+
+        self.response_cache = value
+
+    def get_response_cache(self) -> Optional[ResponseCacheBase]:
+        """
+        Provides the response cache the communicators should work with.
+        """
+
+        return self.response_cache
+
+    def set_public_key_cache(self, value: Optional[PublicKeyCache]) -> None:
+        """
+        Sets the cache of the public keys of the repositories.
+
+        :param value:
+            The cache to use. :code:`None` disables the cache.
+
+        :raise TypeError:
+            If :code:`value` is not a
+            :class:`~PyTravisCI.encryption.public_key_cache.PublicKeyCache`.
+        """
+
+        if value is not None and not isinstance(value, PublicKeyCache):
+            raise TypeError(f"<value> should be {PublicKeyCache}. {type(value)} given.")
+
+        self.public_key_cache = value
+
+    def get_response_cache_key(self, endpoint: str) -> str:
+        """
+        Provides the key of the response of the given endpoint into our
+        response cache.
+        """
+
+        return ResponseCacheBase.get_key(
+            self.bind_endpoint_to_base_url(endpoint),
+            self.session.headers.get("Authorization"),
+        )
+
     def set_base_url(self, value: str) -> None:
         """
         Sets the base URL we have to communicate with.
@@ -217,6 +535,43 @@ class Requester:
 
         return self.base_url + endpoint
 
+    def get_raw(
+        self, endpoint: str, *, ok_statuses: Iterable[int] = (), **kwargs
+    ) -> requests.Response:
+        """
+        Sends a GET request and returns the (not decoded) response - e.g. for
+        the plain text representations.
+
+        :param endpoint:
+            The endpoint to communicate with.
+        :param ok_statuses:
+            The error statuses which should not be raised.
+
+        :raise TravisCIError:
+            When the API gives us an error.
+        """
+
+        req = self.send("get", self.bind_endpoint_to_base_url(endpoint), **kwargs)
+
+        if req.status_code < 400 or req.status_code in ok_statuses:
+            return req
+
+        try:
+            self.raise_if_error(req, codec.decode_response(req))
+        except json.decoder.JSONDecodeError:
+            pass
+
+        raise exceptions.TravisCIError(
+            req.url,
+            req.text,
+            str(req.status_code),
+            response={
+                "text": req.text,
+                "headers": req.headers,
+                "status_code": req.status_code,
+            },
+        )
+
     @request_factory("get")
     def get(self, endpoint: str, **kwargs) -> dict:
         """
@@ -39,41 +39,52 @@ License
     SOFTWARE.
 """
 
+# The resource types are only imported once they are accessed: most of them are never
+# used by a (short-lived) process.
 
-# pylint: disable=unused-import
-from .active import Active
-from .beta_feature import BetaFeature
-from .beta_features import BetaFeatures
-from .branch import Branch
-from .branches import Branches
-from .broadcast import Broadcast
-from .broadcasts import Broadcasts
-from .build import Build
-from .builds import Builds
-from .cache import Cache
-from .caches import Caches
-from .commit import Commit
-from .cron import Cron
-from .crons import Crons
-from .env_var import EnvVar
-from .env_vars import EnvVars
-from .installation import Installation
-from .job import Job
-from .jobs import Jobs
-from .key_pair import KeyPair
-from .key_pair_generated import KeyPairGenerated
-from .lint import Lint
-from .log import Log
-from .message import Message
-from .messages import Messages
-from .organization import Organization
-from .organizations import Organizations
-from .repositories import Repositories
-from .repository import Repository
-from .request import Request
-from .requests import Requests
-from .setting import Setting
-from .settings import Settings
-from .stage import Stage
-from .stages import Stages
-from .user import User
+from typing import Dict
+
+from PyTravisCI._lazy import lazy_exports
+
+MODULES: Dict[str, str] = {
+    "Active": "active",
+    "BetaFeature": "beta_feature",
+    "BetaFeatures": "beta_features",
+    "Branch": "branch",
+    "Branches": "branches",
+    "Broadcast": "broadcast",
+    "Broadcasts": "broadcasts",
+    "Build": "build",
+    "Builds": "builds",
+    "Cache": "cache",
+    "Caches": "caches",
+    "Commit": "commit",
+    "Cron": "cron",
+    "Crons": "crons",
+    "EnvVar": "env_var",
+    "EnvVars": "env_vars",
+    "Installation": "installation",
+    "Job": "job",
+    "Jobs": "jobs",
+    "KeyPair": "key_pair",
+    "KeyPairGenerated": "key_pair_generated",
+    "Lint": "lint",
+    "Log": "log",
+    "Message": "message",
+    "Messages": "messages",
+    "Organization": "organization",
+    "Organizations": "organizations",
+    "Repositories": "repositories",
+    "Repository": "repository",
+    "Request": "request",
+    "Requests": "requests",
+    "Setting": "setting",
+    "Settings": "settings",
+    "Stage": "stage",
+    "Stages": "stages",
+    "User": "user",
+}
+
+__all__ = list(MODULES)
+
+__getattr__, __dir__ = lazy_exports(globals(), MODULES)
@@ -60,8 +60,6 @@ class Active(ResourceTypesBase):
     __iter_through__: str = "builds"
     builds: Optional[List["resource_types.Build"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "builds" in kwargs:
-            kwargs["builds"] = [resource_types.Build(**x) for x in kwargs["builds"]]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "builds": "Build",
+    }
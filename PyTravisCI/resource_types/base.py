@@ -39,10 +39,15 @@ License
     SOFTWARE.
 """
 
+import collections
 import json
+import os
+import urllib.parse as urllib_parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Optional, Union
+from typing import IO, Any, Iterable, Iterator, Optional, Union
 
+import PyTravisCI.codec as codec
 import PyTravisCI.communicator._all as communicator
 import PyTravisCI.defaults as defaults
 import PyTravisCI.exceptions as exceptions
@@ -70,6 +75,81 @@ class ComplexJsonEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+class NestedResource:
+    """
+    Provides the descriptor of an attribute holding nested resource type(s).
+
+    The (standardized) dataset given by the API is kept as is until the
+    attribute is read for the first time. It is then converted into the
+    resource type(s) described by the given rule.
+
+    :param name:
+        The name of the attribute.
+    :param rule:
+        The name of the resource type to create, or a :py:class:`dict`
+        which maps the :code:`@type` of the dataset to the name of the
+        resource type to create.
+    """
+
+    def __init__(self, name: str, rule: Union[str, dict]) -> None:
+        self.name = name
+        self.rule = rule
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            value = instance.__dict__[self.name]
+        except KeyError:
+            return None
+
+        if isinstance(value, dict) or (
+            isinstance(value, list) and value and isinstance(value[0], dict)
+        ):
+            value = instance.__dict__[self.name] = self.hydrate(
+                value, instance.__dict__.get("_PyTravisCI")
+            )
+
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self.name] = value
+
+    def hydrate(self, data: Any, context: Optional[dict] = None) -> Any:
+        """
+        Converts the given dataset into the resource type(s) to create.
+
+        :param data:
+            The dataset to convert.
+        :param context:
+            The context of the parent resource type - if any.
+        """
+
+        if isinstance(data, list):
+            return [self.hydrate(x, context) for x in data]
+
+        if not isinstance(data, dict):
+            return data
+
+        if isinstance(self.rule, dict):
+            if data.get("_at_type") not in self.rule:
+                return data
+
+            class_name = self.rule[data["_at_type"]]
+        else:
+            class_name = self.rule
+
+        # pylint: disable=protected-access
+        resource_type = getattr(
+            ResourceTypesBase._get_resource_type_module(), class_name
+        )
+
+        if context is not None and "_PyTravisCI" not in data:
+            return resource_type(_PyTravisCI=context, **data)
+        return resource_type(**data)
+
+
 class ResourceTypesBase:
     """
     The base of all ressource types.
@@ -87,9 +167,50 @@ class ResourceTypesBase:
     _at_href: Optional[str] = None
     _at_pagination: Optional[str] = None
 
+    __nested__: dict = dict()
+    """
+    Should be a :py:class:`dict` in format:
+
+    ::
+
+        {
+            "jobs": "Job",
+            "created_by": {
+                "user": "User",
+                "organization": "Organization",
+            },
+        }
+
+    :code:`jobs` is the name of an attribute holding nested resource type(s)
+    and :code:`Job` the name of the resource type to create from its dataset.
+    When the resource type depends on the :code:`@type` of the dataset, a
+    :py:class:`dict` mapping each :code:`@type` to the resource type is given.
+
+    The nested resource types are created when the attribute is read for the
+    first time (see :class:`NestedResource`).
+    """
+
+    __columns__: tuple = ("id",)
+    """
+    The (dotted) fields flattened by :py:meth:`to_columns` when none are
+    given.
+    """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        for name, rule in vars(cls).get("__nested__", {}).items():
+            setattr(cls, name, NestedResource(name, rule))
+
     def __init__(self, **kwargs) -> None:
         self.__dict__.update(kwargs)
 
+        if "_PyTravisCI" not in kwargs:
+            context = CommunicatorBase.get_current_context()
+
+            if context is not None:
+                self.__dict__["_PyTravisCI"] = context
+
     def __getitem__(self, index: Union[str, int]) -> Any:
 
         if isinstance(index, str):
@@ -131,7 +252,12 @@ class ResourceTypesBase:
         raise NotImplementedError()
 
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        self.__hydrate()
+        other.__hydrate()
+
+        return {x: y for x, y in self.__dict__.items() if x != "_PyTravisCI"} == {
+            x: y for x, y in other.__dict__.items() if x != "_PyTravisCI"
+        }
 
     def __lt__(self, other):
         raise NotImplementedError()
@@ -195,6 +321,14 @@ class ResourceTypesBase:
 
         return self._at_href
 
+    def __hydrate(self) -> None:
+        """
+        Creates all the nested resource types which were not created yet.
+        """
+
+        for name in self.__nested__:
+            getattr(self, name)
+
     @staticmethod
     def _get_resource_type_module() -> str:  # pragma: no cover
         """
@@ -206,22 +340,32 @@ class ResourceTypesBase:
 
         return resource_types
 
-    def json(self, *, remove_tags: bool = False) -> str:
+    def json(self, *, remove_tags: bool = False, compact: bool = False) -> str:
         """
         Alias of :code:`to_json`.
         """
 
-        return self.to_json(remove_tags=remove_tags)
+        return self.to_json(remove_tags=remove_tags, compact=compact)
 
-    def to_json(self, *, remove_tags: bool = False) -> str:
+    def to_json(self, *, remove_tags: bool = False, compact: bool = False) -> str:
         """
         Converts the current object to json.
 
         :param remove_tags:
             Remove all :code:`@tags` and everything
             related to PyTravisCI.
+        :param compact:
+            Gives the compact (whitespace-free) representation. It is encoded
+            by the codec in use (see :py:mod:`PyTravisCI.codec`) - which is
+            much faster when :code:`orjson` is installed.
         """
 
+        if compact:
+            return codec.get_codec().dumps(
+                self.to_dict(remove_tags=remove_tags),
+                default=ComplexJsonEncoder().default,
+            )
+
         return json.dumps(
             self.to_dict(remove_tags=remove_tags),
             indent=4,
@@ -230,6 +374,146 @@ class ResourceTypesBase:
             cls=ComplexJsonEncoder,
         )
 
+    def to_ndjson(
+        self,
+        destination: Union[str, os.PathLike, IO],
+        *,
+        remove_tags: bool = False,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> int:
+        """
+        Exports the items of the current page and of all the following ones
+        as NDJSON (one JSON object per line) - while following the pages.
+
+        Each page is written as soon as it is given by the API, and only the
+        current page is kept in memory (see :py:meth:`iter_all`).
+
+        ::
+
+            repository = travis.get_repository("funilrys/PyTravisCI")
+
+            repository.get_builds(params={"limit": 100}).to_ndjson(
+                "/tmp/builds.ndjson"
+            )
+
+        :param destination:
+            The path of the file, or the (text or binary) stream to write
+            into. See :func:`~PyTravisCI.export.export_ndjson`.
+        :param remove_tags:
+            Remove all :code:`@tags` and everything
+            related to PyTravisCI.
+        :param max_items:
+            The maximum number of items to export. :code:`None` means all.
+        :param prefetch:
+            The maximum number of pages to fetch ahead.
+
+        :return:
+            The number of exported items.
+
+        :raise NotImplementedError:
+            When the current object is not a collection.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from PyTravisCI.export import export_ndjson
+
+        return export_ndjson(
+            self.iter_all(max_items=max_items, prefetch=prefetch),
+            destination,
+            remove_tags=remove_tags,
+        )
+
+    def to_columns(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        *,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> dict:
+        """
+        Flattens the given fields of the items of the current page and of all
+        the following ones into typed columns - while following the pages.
+
+        The items are read from their dataset: they are not converted into
+        resource types nor into dictionaries. The timestamps are stored as
+        int64 and the strings (e.g. the states) are dictionary encoded.
+        See :class:`~PyTravisCI.export.Column`.
+
+        ::
+
+            builds = travis.get_builds(params={"limit": 100})
+
+            columns = builds.to_columns(["id", "state", "branch.name"])
+
+            print(columns["state"].categories)
+
+        :param fields:
+            The (dotted) fields to flatten. Defaults to the fields declared
+            by the collection (see :py:attr:`__columns__`).
+        :param max_items:
+            The maximum number of items to flatten. :code:`None` means all.
+        :param prefetch:
+            The maximum number of pages to fetch ahead.
+
+        :return:
+            The :class:`~PyTravisCI.export.Column` of each field.
+
+        :raise NotImplementedError:
+            When the current object is not a collection.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from PyTravisCI.export import to_columns
+
+        return to_columns(
+            self.__iter_items(max_items, prefetch, hydrate=False),
+            self.__columns__ if fields is None else fields,
+        )
+
+    def to_arrow(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        *,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+    ) -> Any:
+        """
+        Provides the given fields of the items of the current page and of all
+        the following ones as an Arrow table (see :py:meth:`to_columns`).
+
+        ::
+
+            import pyarrow.parquet
+
+            table = travis.get_builds(params={"limit": 100}).to_arrow()
+
+            pyarrow.parquet.write_table(table, "/tmp/builds.parquet")
+            data_frame = table.to_pandas()
+
+        :param fields:
+            The (dotted) fields to flatten. Defaults to the fields declared
+            by the collection (see :py:attr:`__columns__`).
+        :param max_items:
+            The maximum number of items to flatten. :code:`None` means all.
+        :param prefetch:
+            The maximum number of pages to fetch ahead.
+
+        :raise NotImplementedError:
+            When the current object is not a collection.
+        :raise ImportError:
+            When :code:`pyarrow` is not installed.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from PyTravisCI.export import columns_to_arrow, get_pyarrow
+
+        get_pyarrow()
+
+        return columns_to_arrow(
+            self.to_columns(fields, max_items=max_items, prefetch=prefetch)
+        )
+
     def dict(self, *, remove_tags: bool = False) -> str:
         """
         Alias of :code:`to_dict`.
@@ -277,6 +561,8 @@ class ResourceTypesBase:
             related to PyTravisCI.
         """
 
+        self.__hydrate()
+
         result = {}
 
         for key, value in self.__format_to_dict(
@@ -296,6 +582,24 @@ class ResourceTypesBase:
 
         return result
 
+    def to_compact(self) -> Any:
+        """
+        Converts the current object - and everything nested - to its compact
+        (slotted) version.
+
+        The compact version uses much less memory. It can be read (and
+        converted with :code:`to_dict`) like the current object, but it can't
+        talk to the API.
+
+        .. seealso::
+            :class:`~PyTravisCI.resource_types.compact.CompactResourceTypesBase`
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from .compact import to_compact
+
+        return to_compact(self)
+
     def has_next_page(self) -> bool:
         """
         Checks if there is a next page to follow.
@@ -474,3 +778,234 @@ class ResourceTypesBase:
                 self.__class__.__name__,
             )(**response)
         raise exceptions.NotIncomplete()
+
+    def iter_all(
+        self,
+        *,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        compact: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Iterates over the items of the current page and of all the following
+        ones - until the last page or :code:`max_items` is reached.
+
+        By default, the following pages are fetched lazily (when the items of
+        the current page are exhausted) and only the current page is kept in
+        memory.
+
+        When :code:`prefetch` is given, the offsets of the following pages are
+        computed from :code:`@pagination.count` and up to :code:`prefetch`
+        pages are fetched concurrently while the current one is consumed.
+        The items are still given in order and no more than
+        :code:`prefetch + 1` pages are kept in memory.
+
+        ::
+
+            for build in travis.get_builds(params={"limit": 100}).iter_all():
+                print(build.id)
+
+            for build in travis.get_builds(params={"limit": 100}).iter_all(
+                prefetch=4
+            ):
+                print(build.id)
+
+        .. note::
+            Like the API, we don't snapshot anything. If items are created
+            while we iterate, some of them may be given twice.
+
+        :param max_items:
+            The maximum number of items to yield. :code:`None` means all.
+        :param prefetch:
+            The maximum number of pages to fetch ahead. :code:`0` means that
+            we follow the pages one after another.
+        :param compact:
+            Yield the compact version of the items (see :py:meth:`to_compact`).
+
+        :raise NotImplementedError:
+            When the current object is not a collection.
+        :raise ValueError:
+            When :code:`max_items` or :code:`prefetch` is negative.
+        """
+
+        items = self.__iter_items(max_items, prefetch, hydrate=True)
+
+        if compact:
+            return (x.to_compact() for x in items)
+        return items
+
+    def __iter_items(
+        self, max_items: Optional[int], prefetch: int, *, hydrate: bool
+    ) -> Iterator[Any]:
+        """
+        Provides the generator behind :py:meth:`iter_all`.
+
+        :param hydrate:
+            Whether the items should be converted into resource types. If not,
+            the items which were not read yet are given as their dataset.
+        """
+
+        if not self.__iter_through__:
+            raise NotImplementedError()
+
+        if max_items is not None and max_items < 0:
+            raise ValueError(f"<max_items> should be >= 0, {max_items} given.")
+
+        if prefetch < 0:
+            raise ValueError(f"<prefetch> should be >= 0, {prefetch} given.")
+
+        if prefetch:
+            endpoints = self.__get_following_endpoints(max_items)
+
+            if endpoints is not None:
+                return self.__iter_all_prefetched(
+                    max_items, prefetch, endpoints, hydrate=hydrate
+                )
+
+        return self.__iter_all(max_items, hydrate=hydrate)
+
+    @staticmethod
+    def __get_items(page: "ResourceTypesBase", hydrate: bool) -> list:
+        """
+        Provides the items of the given page.
+        """
+
+        if hydrate:
+            return getattr(page, page.__iter_through__) or []
+        return page.__dict__.get(page.__iter_through__) or []
+
+    def __iter_all(self, max_items: Optional[int], *, hydrate: bool) -> Iterator[Any]:
+        """
+        Provides the (lazy) generator behind :py:meth:`iter_all`.
+        """
+
+        page = self
+        yielded = 0
+
+        while True:
+            for item in self.__get_items(page, hydrate):
+                if max_items is not None and yielded >= max_items:
+                    return
+
+                yield item
+                yielded += 1
+
+            if (max_items is not None and yielded >= max_items) or (
+                not page.has_next_page()
+            ):
+                return
+
+            page = page.next_page()
+
+    def __get_following_endpoints(self, max_items: Optional[int]) -> Optional[list]:
+        """
+        Provides the endpoints of all the pages following the current one,
+        computed from the offset, limit and count of the current page.
+
+        :return:
+            :code:`None` if the pagination does not let us compute them.
+        """
+
+        if not self.has_next_page():
+            return []
+
+        try:
+            offset = self._at_pagination["offset"]
+            limit = self._at_pagination["limit"]
+            count = self._at_pagination["count"]
+            next_offset = self._at_pagination["next"]["offset"]
+        except (KeyError, TypeError):
+            return None
+
+        if not isinstance(count, int) or not limit or not next_offset:
+            return None
+
+        if max_items is not None:
+            count = min(count, offset + max_items)
+
+        scheme, netloc, path, query, fragment = urllib_parse.urlsplit(
+            self.__get_next_endpoint()
+        )
+        query = [x for x in urllib_parse.parse_qsl(query) if x[0] != "offset"]
+
+        return [
+            urllib_parse.urlunsplit(
+                (
+                    scheme,
+                    netloc,
+                    path,
+                    urllib_parse.urlencode(query + [("offset", x)]),
+                    fragment,
+                )
+            )
+            for x in range(next_offset, count, limit)
+        ]
+
+    @CommunicatorBase.complete_response
+    def __get_page(self, *, endpoint: str) -> "ResourceTypesBase":
+        """
+        Provides the page behind the given endpoint.
+        """
+
+        comm = getattr(communicator, self.__class__.__name__)(
+            self._PyTravisCI["com"]["requester"]
+        )
+
+        response = comm.get_standardized(comm.get_response(endpoint))
+
+        return getattr(
+            self._get_resource_type_module(),
+            self.__class__.__name__,
+        )(**response)
+
+    def __iter_all_prefetched(
+        self,
+        max_items: Optional[int],
+        prefetch: int,
+        endpoints: list,
+        *,
+        hydrate: bool,
+    ) -> Iterator[Any]:
+        """
+        Provides the (prefetching) generator behind :py:meth:`iter_all`.
+        """
+
+        req = self._PyTravisCI["com"]["requester"]
+
+        if req.pool_size < prefetch:
+            req.set_pool_size(prefetch)
+
+        to_fetch = iter(endpoints)
+        in_flight = collections.deque()
+        page = self
+        yielded = 0
+
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            try:
+                while True:
+                    while len(in_flight) < prefetch:
+                        endpoint = next(to_fetch, None)
+
+                        if endpoint is None:
+                            break
+
+                        in_flight.append(
+                            executor.submit(self.__get_page, endpoint=endpoint)
+                        )
+
+                    for item in self.__get_items(page, hydrate):
+                        if max_items is not None and yielded >= max_items:
+                            return
+
+                        yield item
+                        yielded += 1
+
+                    if not in_flight:
+                        return
+
+                    # We release the current page before waiting for the next one.
+                    page = None
+                    page = in_flight.popleft().result()
+            finally:
+                for future in in_flight:
+                    future.cancel()
@@ -59,10 +59,6 @@ class BetaFeatures(ResourceTypesBase):
     __iter_through__: str = "beta_features"
     beta_features: Optional["resource_types.BetaFeature"] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "beta_features" in kwargs:
-            kwargs["beta_features"] = [
-                resource_types.BetaFeature(**x) for x in kwargs["beta_features"]
-            ]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "beta_features": "BetaFeature",
+    }
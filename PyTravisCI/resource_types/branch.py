@@ -78,19 +78,11 @@ class Branch(ResourceTypesBase):
     last_build: Optional["resource_types.Build"] = None
     recent_builds: Optional[List["resource_types.Build"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "repository" in kwargs:
-            kwargs["repository"] = resource_types.Repository(**kwargs["repository"])
-
-        if "last_build" in kwargs and isinstance(kwargs["last_build"], dict):
-            kwargs["last_build"] = resource_types.Build(**kwargs["last_build"])
-
-        if "recent_builds" in kwargs:
-            kwargs["recent_builds"] = [
-                resource_types.Build(**x) for x in kwargs["recent_builds"]
-            ]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "repository": "Repository",
+        "last_build": "Build",
+        "recent_builds": "Build",
+    }
 
     def get_cron(
         self, *, params: Optional[dict] = None
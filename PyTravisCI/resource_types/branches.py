@@ -60,10 +60,6 @@ class Branches(ResourceTypesBase):
     __iter_through__: str = "branches"
     branches: Optional[List["resource_types.Branch"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "branches" in kwargs:
-            kwargs["branches"] = [
-                resource_types.Branch(**x) for x in kwargs["branches"]
-            ]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "branches": "Branch",
+    }
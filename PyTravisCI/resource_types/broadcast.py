@@ -87,13 +87,10 @@ class Broadcast(ResourceTypesBase):
         ]
     ] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "recipient" in kwargs and "_at_type" in kwargs["recipient"]:
-            if kwargs["recipient"]["_at_type"] == "user":
-                kwargs["recipient"] = resource_types.User(**kwargs["recipient"])
-            elif kwargs["recipient"]["_at_type"] == "organization":
-                kwargs["recipient"] = resource_types.Organization(**kwargs["recipient"])
-            elif kwargs["recipient"]["_at_type"] == "repository":
-                kwargs["recipient"] = resource_types.Repository(**kwargs["recipient"])
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "recipient": {
+            "user": "User",
+            "organization": "Organization",
+            "repository": "Repository",
+        },
+    }
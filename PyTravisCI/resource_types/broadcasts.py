@@ -60,10 +60,6 @@ class Broadcasts(ResourceTypesBase):
     __iter_through__: str = "broadcasts"
     broadcasts: Optional[List["resource_types.Broadcast"]]
 
-    def __init__(self, **kwargs) -> None:
-        if "broadcasts" in kwargs:
-            kwargs["broadcasts"] = [
-                resource_types.Broadcast(**x) for x in kwargs["broadcasts"]
-            ]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "broadcasts": "Broadcast",
+    }
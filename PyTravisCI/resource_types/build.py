@@ -133,31 +133,17 @@ class Build(ResourceTypesBase):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "jobs" in kwargs:
-            kwargs["jobs"] = [resource_types.Job(**x) for x in kwargs["jobs"]]
-
-        if "repository" in kwargs:
-            kwargs["repository"] = resource_types.Repository(**kwargs["repository"])
-
-        if "branch" in kwargs:
-            kwargs["branch"] = resource_types.Branch(**kwargs["branch"])
-
-        if "stages" in kwargs:
-            kwargs["stages"] = [resource_types.Stage(**x) for x in kwargs["stages"]]
-
-        if "commit" in kwargs:
-            kwargs["commit"] = resource_types.Commit(**kwargs["commit"])
-
-        if "created_by" in kwargs and "_at_type" in kwargs["created_by"]:
-            if kwargs["created_by"]["_at_type"] == "user":
-                kwargs["created_by"] = resource_types.User(**kwargs["created_by"])
-            elif kwargs["created_by"]["_at_type"] == "organization":
-                kwargs["created_by"] = resource_types.Organization(
-                    **kwargs["created_by"]
-                )
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "jobs": "Job",
+        "repository": "Repository",
+        "branch": "Branch",
+        "stages": "Stage",
+        "commit": "Commit",
+        "created_by": {
+            "user": "User",
+            "organization": "Organization",
+        },
+    }
 
     def sync(self) -> "resource_types.Build":
         """
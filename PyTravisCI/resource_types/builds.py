@@ -58,10 +58,20 @@ class Builds(ResourceTypesBase):
     """
 
     __iter_through__: str = "builds"
+    __columns__: tuple = (
+        "id",
+        "number",
+        "state",
+        "event_type",
+        "duration",
+        "started_at",
+        "finished_at",
+        "branch.name",
+        "repository.slug",
+        "commit.sha",
+    )
     builds: Optional[List["resource_types.Build"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "builds" in kwargs:
-            kwargs["builds"] = [resource_types.Build(**x) for x in kwargs["builds"]]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "builds": "Build",
+    }
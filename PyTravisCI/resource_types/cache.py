@@ -39,7 +39,6 @@ License
     SOFTWARE.
 """
 
-from . import _all as resource_types
 from .base import ResourceTypesBase
 
 
@@ -56,11 +55,9 @@ class Cache(ResourceTypesBase):
         That's the reason we don't document much more.
     """
 
-    def __init__(self, **kwargs) -> None:
-        if "repo" in kwargs:
-            kwargs["repo"] = resource_types.Repository(**kwargs["repo"])
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "repo": "Repository",
+    }
 
     def delete(self) -> bool:
         """
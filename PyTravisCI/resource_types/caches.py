@@ -72,11 +72,9 @@ class Caches(ResourceTypesBase):
     repo: Optional["resource_types.Repository"] = None
     name: Optional[str] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "caches" in kwargs:
-            kwargs["caches"] = [resource_types.Cache(**x) for x in kwargs["caches"]]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "caches": "Cache",
+    }
 
     def delete(self) -> Union[bool, "resource_types.Caches"]:
         """
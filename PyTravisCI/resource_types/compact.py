@@ -0,0 +1,277 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the compact (slotted) version of our resource type
+objects.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import functools
+from typing import Any, Type, Union
+
+from . import _all as resource_types
+from .base import ResourceTypesBase
+
+
+class CompactResourceTypesBase:
+    """
+    The base of all compact resource types.
+
+    A compact resource type holds the data of a resource type into slots
+    (one per annotated field of the resource type) instead of a per-instance
+    :py:class:`dict`. The unknown keys are kept into an overflow
+    :py:class:`dict` which only exists when needed.
+
+    It is meant to keep (many) resource types in memory: reads and
+    :py:meth:`to_dict` behave like the ones of the resource type, but
+    the methods talking to the API are only available on the resource type
+    given back by :py:meth:`to_resource`.
+
+    .. warning::
+        Don't create a compact resource type by yourself, use
+        :py:meth:`~PyTravisCI.resource_types.base.ResourceTypesBase.to_compact`
+        instead.
+    """
+
+    __slots__ = ("_overflow",)
+
+    __resource_type__: Type[ResourceTypesBase] = ResourceTypesBase
+    __fields__: frozenset = frozenset()
+    __iter_through__: Union[str, None] = None
+
+    def __init__(self, **kwargs) -> None:
+        overflow = None
+
+        for key, value in kwargs.items():
+            if key in self.__fields__:
+                object.__setattr__(self, key, value)
+            else:
+                if overflow is None:
+                    overflow = {}
+
+                overflow[key] = value
+
+        object.__setattr__(self, "_overflow", overflow)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when the slot is empty (or not a slot).
+        overflow = object.__getattribute__(self, "_overflow")
+
+        if overflow and name in overflow:
+            return overflow[name]
+
+        if name in self.__fields__:
+            return None
+
+        raise AttributeError(f"{name} not found.")
+
+    def __getitem__(self, index: Union[str, int]) -> Any:
+        if isinstance(index, int) and self.__iter_through__:
+            return getattr(self, self.__iter_through__)[index]
+
+        if isinstance(index, str):
+            index = index.replace("@", "_at_")
+
+        try:
+            return getattr(self, index)
+        except AttributeError:
+            pass
+
+        raise AttributeError(f"{index} (index) not found.")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Assignment of <name> ({name}) not authorized.")
+
+    def __iter__(self):
+        if self.__iter_through__:
+            return iter(getattr(self, self.__iter_through__) or [])
+
+        raise NotImplementedError()
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.get_data() == other.get_data()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self) -> str:
+        return f"<{self.__resource_type__.__name__} {self.to_dict()} />"
+
+    def __reduce__(self):
+        return (restore, (self.__resource_type__.__name__, self.get_data()))
+
+    def get_data(self) -> dict:
+        """
+        Provides the data of the current object.
+        """
+
+        result = {}
+
+        for name in self.__slots__:
+            try:
+                result[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                continue
+
+        overflow = object.__getattribute__(self, "_overflow")
+
+        if overflow:
+            result.update(overflow)
+
+        return result
+
+    def to_resource(self) -> ResourceTypesBase:
+        """
+        Provides the (complete) resource type of the current object.
+        """
+
+        return self.__resource_type__(
+            **{x: from_compact(y) for x, y in self.get_data().items()}
+        )
+
+    def to_dict(self, *, remove_tags: bool = False) -> dict:
+        """
+        Converts the current object to dict.
+
+        :param remove_tags:
+            Remove all :code:`@tags` and everything
+            related to PyTravisCI.
+        """
+
+        return self.to_resource().to_dict(remove_tags=remove_tags)
+
+    def to_json(self, *, remove_tags: bool = False, compact: bool = False) -> str:
+        """
+        Converts the current object to json.
+
+        :param remove_tags:
+            Remove all :code:`@tags` and everything
+            related to PyTravisCI.
+        :param compact:
+            Gives the compact (whitespace-free) representation.
+        """
+
+        return self.to_resource().to_json(remove_tags=remove_tags, compact=compact)
+
+
+@functools.lru_cache(maxsize=None)
+def get_compact_class(
+    resource_type: Type[ResourceTypesBase],
+) -> Type[CompactResourceTypesBase]:
+    """
+    Provides the compact class of the given resource type. The slots are
+    generated from the annotated fields of the resource type.
+
+    :param resource_type:
+        The resource type to work with.
+    """
+
+    fields = ["_at_type", "_at_href", "_at_representation", "_at_permissions"]
+
+    for klass in reversed(resource_type.__mro__):
+        if klass in (object, ResourceTypesBase):
+            continue
+
+        for name in vars(klass).get("__annotations__", {}):
+            if not name.startswith("__") and name not in fields:
+                fields.append(name)
+
+    return type(
+        resource_type.__name__,
+        (CompactResourceTypesBase,),
+        {
+            "__slots__": tuple(fields),
+            "__module__": __name__,
+            "__qualname__": resource_type.__name__,
+            "__doc__": f"The compact version of :class:`{resource_type.__module__}."
+            f"{resource_type.__name__}`.",
+            "__resource_type__": resource_type,
+            "__fields__": frozenset(fields),
+            "__iter_through__": getattr(resource_type, "__iter_through__", None),
+        },
+    )
+
+
+def to_compact(data: Any) -> Any:
+    """
+    Converts the given resource type(s) - and everything nested - into
+    compact resource type(s). Anything else is given back as is.
+    """
+
+    if isinstance(data, list):
+        return [to_compact(x) for x in data]
+
+    if not isinstance(data, ResourceTypesBase):
+        return data
+
+    nested = data.__nested__
+
+    return get_compact_class(type(data))(
+        **{
+            x: to_compact(getattr(data, x) if x in nested else y)
+            for x, y in vars(data).items()
+            if not x.startswith("_") or x.startswith("_at_")
+        }
+    )
+
+
+def from_compact(data: Any) -> Any:
+    """
+    Converts the given compact resource type(s) back into resource type(s).
+    Anything else is given back as is.
+    """
+
+    if isinstance(data, list):
+        return [from_compact(x) for x in data]
+
+    if isinstance(data, CompactResourceTypesBase):
+        return data.to_resource()
+
+    return data
+
+
+def restore(class_name: str, data: dict) -> CompactResourceTypesBase:
+    """
+    Recreates a compact resource type. This is used by :py:mod:`pickle`.
+
+    :param class_name:
+        The name of the resource type.
+    :param data:
+        The data of the compact resource type.
+    """
+
+    return get_compact_class(getattr(resource_types, class_name))(**data)
@@ -91,14 +91,10 @@ class Cron(ResourceTypesBase):
     created_at: Optional[datetime] = None
     active: Optional[bool] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "repository" in kwargs:
-            kwargs["repository"] = resource_types.Repository(**kwargs["repository"])
-
-        if "branch" in kwargs:
-            kwargs["branch"] = resource_types.Branch(**kwargs["branch"])
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "repository": "Repository",
+        "branch": "Branch",
+    }
 
     def delete(self) -> Union[bool, "resource_types.Cron"]:
         """
@@ -109,4 +105,13 @@ class Cron(ResourceTypesBase):
             self._PyTravisCI["com"]["requester"]
         )
 
-        return comm.delete(cron_id=self.id)
+        variables = {"cron_id": self.id}
+
+        # Lets the communicator invalidate the crons of the repository.
+        if self.repository is not None and self.repository.id is not None:
+            variables["repository_id_or_slug"] = self.repository.id
+
+        if self.branch is not None and self.branch.name is not None:
+            variables["branch_name"] = self.branch.name
+
+        return comm.delete(**variables)
@@ -59,8 +59,6 @@ class Crons(ResourceTypesBase):
     __iter_through__ = "crons"
     crons: Optional[List["resource_types.Cron"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "crons" in kwargs:
-            kwargs["crons"] = [resource_types.Cron(**x) for x in kwargs["crons"]]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "crons": "Cron",
+    }
@@ -60,10 +60,6 @@ class EnvVars(ResourceTypesBase):
     __iter_through__: str = "env_vars"
     env_vars: Optional[List["resource_types.EnvVar"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "env_vars" in kwargs:
-            kwargs["env_vars"] = [
-                resource_types.EnvVar(**x) for x in kwargs["env_vars"]
-            ]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "env_vars": "EnvVar",
+    }
@@ -69,11 +69,9 @@ class Installation(ResourceTypesBase):
     github_id: Optional[int] = None
     owner: Optional[Union["resource_types.User", "resource_types.Organization"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "owner" in kwargs and "_at_type" in kwargs["owner"]:
-            if kwargs["owner"]["_at_type"] == "user":
-                kwargs["owner"] = resource_types.User(**kwargs["owner"])
-            elif kwargs["owner"]["_at_type"] == "organization":
-                kwargs["owner"] = resource_types.Organization(**kwargs["owner"])
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "owner": {
+            "user": "User",
+            "organization": "Organization",
+        },
+    }
@@ -40,7 +40,7 @@ License
 """
 
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
 import PyTravisCI.communicator._all as communicator
 import PyTravisCI.defaults as defaults
@@ -116,26 +116,16 @@ class Job(ResourceTypesBase):
     updated_at: Optional[datetime] = None
     private: Optional[bool] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "build" in kwargs:
-            kwargs["build"] = resource_types.Build(**kwargs["build"])
-
-        if "repository" in kwargs:
-            kwargs["repository"] = resource_types.Repository(**kwargs["repository"])
-
-        if "commit" in kwargs:
-            kwargs["commit"] = resource_types.Commit(**kwargs["commit"])
-
-        if "stage" in kwargs and kwargs["stage"]:
-            kwargs["stage"] = resource_types.Stage(**kwargs["stage"])
-
-        if "owner" in kwargs and "_at_type" in kwargs["owner"]:
-            if kwargs["owner"]["_at_type"] == "user":
-                kwargs["owner"] = resource_types.User(**kwargs["owner"])
-            elif kwargs["owner"]["_at_type"] == "organization":
-                kwargs["owner"] = resource_types.Organization(**kwargs["owner"])
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "build": "Build",
+        "repository": "Repository",
+        "commit": "Commit",
+        "stage": "Stage",
+        "owner": {
+            "user": "User",
+            "organization": "Organization",
+        },
+    }
 
     def sync(self) -> "resource_types.Job":
         """
@@ -253,6 +243,42 @@ class Job(ResourceTypesBase):
 
         return comm.from_id(job_id=self.id, parameters=params)
 
+    def follow_log(
+        self,
+        *,
+        plain_text: bool = True,
+        interval: float = 5.0,
+        timeout: Optional[float] = None,
+    ) -> Iterator[str]:
+        """
+        Yields what is added to the log of the current job - until the job is
+        finished (or until the given timeout). Unlike :py:meth:`get_log`, only
+        what was not seen yet is fetched.
+
+        ::
+
+            for chunk in job.follow_log():
+                print(chunk, end="")
+
+        See :class:`~PyTravisCI.log_follower.LogFollower`.
+
+        :param plain_text:
+            Fetch the (plain text) log through byte offsets. Otherwise, the
+            JSON log is fetched and only its new parts are given.
+        :param interval:
+            The number of seconds between 2 fetches.
+        :param timeout:
+            The maximum number of seconds to follow the log. :code:`None`
+            means until the job is finished.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from PyTravisCI.log_follower import LogFollower
+
+        return LogFollower(self, plain_text=plain_text, interval=interval).follow(
+            timeout=timeout
+        )
+
     def cancel(self) -> "resource_types.Job":
         """
         Cancels the current job.
@@ -58,10 +58,19 @@ class Jobs(ResourceTypesBase):
     """
 
     __iter_through__: str = "jobs"
+    __columns__: tuple = (
+        "id",
+        "number",
+        "state",
+        "queue",
+        "started_at",
+        "finished_at",
+        "build.id",
+        "repository.slug",
+        "commit.sha",
+    )
     jobs: Optional[List["resource_types.Job"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "jobs" in kwargs:
-            kwargs["jobs"] = [resource_types.Job(**x) for x in kwargs["jobs"]]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "jobs": "Job",
+    }
@@ -60,10 +60,6 @@ class Messages(ResourceTypesBase):
     __iter_through__ = "messages"
     messages: Optional[List["resource_types.Message"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "messages" in kwargs:
-            kwargs["messages"] = [
-                resource_types.Message(**x) for x in kwargs["messages"]
-            ]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "messages": "Message",
+    }
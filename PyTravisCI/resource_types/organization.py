@@ -92,18 +92,10 @@ class Organization(ResourceTypesBase):
     repositories: Optional[List["resource_types.Repository"]] = None
     installation: Optional["resource_types.Installation"] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "repositories" in kwargs:
-            kwargs["repositories"] = [
-                resource_types.Repository(**x) for x in kwargs["repositories"]
-            ]
-
-        if "installation" in kwargs:
-            kwargs["installation"] = resource_types.Installation(
-                **kwargs["installation"]
-            )
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "repositories": "Repository",
+        "installation": "Installation",
+    }
 
     def get_active(self, *, params: Optional[dict] = None) -> "resource_types.Active":
         """
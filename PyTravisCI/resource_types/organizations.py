@@ -60,10 +60,6 @@ class Organizations(ResourceTypesBase):
     __iter_through__: str = "organizations"
     organizations: Optional[List["resource_types.Organization"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "organizations" in kwargs:
-            kwargs["organizations"] = [
-                resource_types.Organization(**x) for x in kwargs["organizations"]
-            ]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "organizations": "Organization",
+    }
@@ -61,10 +61,6 @@ class Repositories(ResourceTypesBase):
 
     organizations: Optional[List["resource_types.Repository"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "repositories" in kwargs:
-            kwargs["repositories"] = [
-                resource_types.Repository(**x) for x in kwargs["repositories"]
-            ]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "repositories": "Repository",
+    }
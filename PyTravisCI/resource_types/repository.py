@@ -40,21 +40,23 @@ License
 """
 
 import base64
+import hashlib
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from io import IOBase
-from typing import List, Optional, Union
-
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
 
 import PyTravisCI.communicator._all as communicator
-from PyTravisCI.encryption.data import DataEncryption
-from PyTravisCI.encryption.file import FileEncryption
 
 from . import _all as resource_types
 from .base import ResourceTypesBase
 
+if TYPE_CHECKING:  # pragma: no cover
+    # The encryption (thus cryptography) is only imported when we encrypt
+    # something.
+    from PyTravisCI.encryption.data import DataEncryption
+
 
 class Repository(ResourceTypesBase):
     """
@@ -140,17 +142,13 @@ class Repository(ResourceTypesBase):
     config_validation = None
     allow_migration = None
 
-    def __init__(self, **kwargs) -> None:
-        if "default_branch" in kwargs:
-            kwargs["default_branch"] = resource_types.Branch(**kwargs["default_branch"])
-
-        if "owner" in kwargs and "_at_type" in kwargs["owner"]:
-            if kwargs["owner"]["_at_type"] == "user":
-                kwargs["owner"] = resource_types.User(**kwargs["owner"])
-            elif kwargs["owner"]["_at_type"] == "organization":
-                kwargs["owner"] = resource_types.Organization(**kwargs["owner"])
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "default_branch": "Branch",
+        "owner": {
+            "user": "User",
+            "organization": "Organization",
+        },
+    }
 
     def activate(self, *, params: Optional[dict] = None) -> "resource_types.Repository":
         """
@@ -450,8 +448,13 @@ class Repository(ResourceTypesBase):
         }
 
         comm = getattr(communicator, "KeyPair")(self._PyTravisCI["com"]["requester"])
+        result = comm.create(
+            repository_id_or_slug=self.id, data=data, parameters=params
+        )
 
-        return comm.create(repository_id_or_slug=self.id, data=data, parameters=params)
+        self.__discard_public_key()
+
+        return result
 
     def get_key_pair_generated(
         self, *, params: Optional[dict] = None
@@ -484,8 +487,11 @@ class Repository(ResourceTypesBase):
         comm = getattr(communicator, "KeyPairGenerated")(
             self._PyTravisCI["com"]["requester"]
         )
+        result = comm.create(repository_id_or_slug=self.id, parameters=params)
 
-        return comm.create(repository_id_or_slug=self.id, parameters=params)
+        self.__discard_public_key()
+
+        return result
 
     def get_setting(
         self, setting_name: str, *, params: Optional[dict] = None
@@ -610,6 +616,57 @@ class Repository(ResourceTypesBase):
 
         return comm.create(repository_id_or_slug=self.id, data=data, parameters=params)
 
+    def get_public_key_cache_key(self) -> Tuple[str, int]:
+        """
+        Provides the key of the current repository into the public key cache.
+        """
+
+        return self._PyTravisCI["com"]["requester"].base_url, self.id
+
+    def get_data_encryption(self) -> "DataEncryption":
+        """
+        Provides the (loaded) public key of the current repository - from the
+        public key cache, if possible.
+
+        The (custom) key pair is used for private repositories and the
+        generated one for the others.
+        """
+
+        cache = self._PyTravisCI["com"]["requester"].public_key_cache
+
+        if cache is not None:
+            encryption_obj = cache.get(self.get_public_key_cache_key())
+
+            if encryption_obj is not None:
+                return encryption_obj
+
+        if self.private:
+            key_pair = self.get_key_pair()
+        else:
+            key_pair = self.get_key_pair_generated()
+
+        if cache is None:
+            # pylint: disable=import-outside-toplevel
+            from PyTravisCI.encryption.data import DataEncryption
+
+            return DataEncryption(public_key=key_pair.public_key)
+
+        return cache.set(
+            self.get_public_key_cache_key(),
+            key_pair.public_key,
+            fingerprint=key_pair.fingerprint,
+        )
+
+    def __discard_public_key(self) -> None:
+        """
+        Forgets the cached public key of the current repository.
+        """
+
+        cache = self._PyTravisCI["com"]["requester"].public_key_cache
+
+        if cache is not None:
+            cache.discard(self.get_public_key_cache_key())
+
     def encrypt_env_var(
         self, env_vars: dict, padding: Optional[str] = "PKCS1v15"
     ) -> dict:
@@ -673,12 +730,7 @@ class Repository(ResourceTypesBase):
 
         result = []
 
-        if self.private:
-            key_pair = self.get_key_pair()
-        else:
-            key_pair = self.get_key_pair_generated()
-
-        encryption_obj = DataEncryption(public_key=key_pair.public_key)
+        encryption_obj = self.get_data_encryption()
 
         for env_name, value in env_vars.items():
             env_name = re.sub(r"[^\w+]", "_", env_name)
@@ -733,12 +785,7 @@ class Repository(ResourceTypesBase):
 
         result = []
 
-        if self.private:
-            key_pair = self.get_key_pair()
-        else:
-            key_pair = self.get_key_pair_generated()
-
-        encryption_obj = DataEncryption(public_key=key_pair.public_key)
+        encryption_obj = self.get_data_encryption()
 
         for secret in secrets:
             if not isinstance(secret, bytes):
@@ -752,12 +799,51 @@ class Repository(ResourceTypesBase):
 
         return result
 
+    @staticmethod
+    def __get_encryption_var_names(*filenames: str) -> Tuple[str, str]:
+        """
+        Provides the names of the environment variables which hold the key and
+        the IV used to encrypt the given files.
+        """
+
+        var_digest = hashlib.sha1("\n".join(filenames).encode()).hexdigest()
+        var_digest = var_digest[:12].upper()
+
+        return f"ENCRYPTED_{var_digest}_KEY", f"ENCRYPTED_{var_digest}_IV"
+
+    def __save_env_vars(self, env_vars: dict, *, branch: Optional[str] = None) -> None:
+        """
+        Saves the given (private) environment variables - with a single lookup
+        of the existing ones.
+
+        The existing environment variables - of the same name and branch - are
+        updated instead of being duplicated.
+
+        :param env_vars:
+            The environment variables to save - name: value.
+        :param branch:
+            The branch to save them for.
+        """
+
+        existing = {
+            x.name: x
+            for x in self.get_env_vars()
+            if x.name in env_vars and x.branch == branch
+        }
+
+        for name, value in env_vars.items():
+            if name in existing:
+                existing[name].set_value(value)
+            else:
+                self.create_env_var(name, value, branch=branch)
+
     def encrypt_file(
         self,
         input_file: Union[IOBase, str],
         output_file: Union[IOBase, str],
         *,
         branch: Optional[str] = None,
+        buffer_size: Optional[int] = None,
     ) -> dict:
         """
         Encrypts the content of the given :code:`input_file` into :code:`output_file`.
@@ -771,8 +857,9 @@ class Repository(ResourceTypesBase):
         :param input_file:
             The (plain) file to read.
 
-            If a :py:class:`str` is given, this method will open and close the
-            file for you.
+            If a :py:class:`str` is given, this method will map the file into
+            memory - instead of reading it - for you. See
+            :meth:`~PyTravisCI.encryption.file.FileEncryption.encrypt_path`.
 
             If a :py:class:`io.TextIOWrapper` is given, this method expects it to
             be in `rb` mode.
@@ -789,6 +876,10 @@ class Repository(ResourceTypesBase):
         :param branch:
             The branch to save the IV and key for.
 
+        :param buffer_size:
+            The number of bytes to read (and encrypt) at once. See
+            :meth:`~PyTravisCI.encryption.file.FileEncryption.encrypt_file`.
+
         :return:
             A :py:class:`dict` which represents the data which are supposed to
             help the end-user decrypt the encrypted data.
@@ -813,39 +904,42 @@ class Repository(ResourceTypesBase):
 
         """
 
-        input_file_self_opened = output_file_self_opened = False
-
-        if not isinstance(input_file, IOBase):
-            input_file = open(input_file, "rb")
-            input_file_self_opened = True
+        if isinstance(input_file, IOBase):
+            input_filename = os.path.split(input_file.name)[-1]
+        else:
+            input_filename = os.path.split(input_file)[-1]
 
-        if not isinstance(output_file, IOBase):
-            output_file = open(output_file, "wb")
-            output_file_self_opened = True
+        if isinstance(output_file, IOBase):
+            output_filename = os.path.split(output_file.name)[-1]
+        else:
+            output_filename = os.path.split(output_file)[-1]
 
-        input_filename = os.path.split(input_file.name)[-1]
-        output_filename = os.path.split(output_file.name)[-1]
+        # pylint: disable=import-outside-toplevel
+        from PyTravisCI.encryption.file import FileEncryption
 
         encryption_obj = FileEncryption()
-        encryption_obj.encrypt_file(input_file, output_file)
 
-        digest_backend = default_backend()
-        input_digest = hashes.Hash(hashes.SHA1(), backend=digest_backend)
-        input_digest.update(input_filename.encode())
-        input_var_digest = input_digest.finalize().hex()[:12].upper()
+        if not isinstance(input_file, IOBase):
+            # We map the file into memory instead of reading it. The output
+            # (path) is only opened once the input is.
+            encryption_obj.encrypt_path(
+                input_file, output_file, buffer_size=buffer_size
+            )
+        elif isinstance(output_file, IOBase):
+            encryption_obj.encrypt_file(
+                input_file, output_file, buffer_size=buffer_size
+            )
+        else:
+            with open(output_file, "wb") as output_stream:
+                encryption_obj.encrypt_file(
+                    input_file, output_stream, buffer_size=buffer_size
+                )
 
-        key_var_name = f"ENCRYPTED_{input_var_digest}_KEY"
-        iv_var_name = f"ENCRYPTED_{input_var_digest}_IV"
+        key_var_name, iv_var_name = self.__get_encryption_var_names(input_filename)
 
         self.create_env_var(key_var_name, encryption_obj.get_key(), branch=branch)
         self.create_env_var(iv_var_name, encryption_obj.get_iv(), branch=branch)
 
-        if input_file_self_opened:
-            input_file.close()
-
-        if output_file_self_opened:
-            output_file.close()
-
         return {
             "command": f"openssl aes-256-cbc -K ${key_var_name} -iv "
             f"${iv_var_name} -in {output_filename} -out "
@@ -853,3 +947,126 @@ class Repository(ResourceTypesBase):
             "iv": {iv_var_name: encryption_obj.get_iv()},
             "key": {key_var_name: encryption_obj.get_key()},
         }
+
+    def encrypt_files(
+        self,
+        files: Iterable[Union[str, Tuple[str, str]]],
+        *,
+        branch: Optional[str] = None,
+        buffer_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> dict:
+        """
+        Encrypts the given files - on a pool of threads - with a single key
+        and IV, which are then saved into the repository environment
+        variables at once.
+
+        Side Effects:
+            - Generates a new IV key.
+            - Generates a new encryption key.
+            - Save the IV key into a repository environment variable - updated
+              if it already exists.
+            - Save the encryption key into a repository environment variable -
+              updated if it already exists.
+
+        :param files:
+            The (plain) files to encrypt.
+
+            Each of them can either be a path - in which case the encrypted file
+            is written next to it with a :code:`.enc` suffix - or a tuple of an
+            input and an output path.
+
+        :param branch:
+            The branch to save the IV and key for.
+
+        :param buffer_size:
+            The number of bytes to encrypt at once. See
+            :meth:`~PyTravisCI.encryption.file.FileEncryption.encrypt_path`.
+
+        :param max_workers:
+            The maximum number of files to encrypt at the same time.
+            Defaults to the default of
+            :py:class:`concurrent.futures.ThreadPoolExecutor`.
+
+        :raise ValueError:
+            When no file is given.
+
+        :return:
+            A :py:class:`dict` which represents the data which are supposed to
+            help the end-user decrypt the encrypted data.
+
+            Given the input files :code:`hello` and :code:`world`, this method
+            will provides the following:
+
+            ::
+
+                {
+                    "command": "openssl aes-256-cbc -K "
+                    "$ENCRYPTED_7DB827C10AFC_KEY -iv $ENCRYPTED_7DB827C10AFC_IV "
+                    "-in hello.enc -out hello -d && openssl aes-256-cbc -K "
+                    "$ENCRYPTED_7DB827C10AFC_KEY -iv $ENCRYPTED_7DB827C10AFC_IV "
+                    "-in world.enc -out world -d",
+                    "commands": [
+                        "openssl aes-256-cbc -K $ENCRYPTED_7DB827C10AFC_KEY "
+                        "-iv $ENCRYPTED_7DB827C10AFC_IV -in hello.enc -out "
+                        "hello -d",
+                        "openssl aes-256-cbc -K $ENCRYPTED_7DB827C10AFC_KEY "
+                        "-iv $ENCRYPTED_7DB827C10AFC_IV -in world.enc -out "
+                        "world -d",
+                    ],
+                    "iv": {
+                        "ENCRYPTED_7DB827C10AFC_IV": "hexadecimal representation of the IV."
+                    },
+                    "key": {
+                        "ENCRYPTED_7DB827C10AFC_KEY": "hexadecimal representation of the key."
+                    },
+                }
+        """
+
+        files = [x if isinstance(x, tuple) else (x, f"{x}.enc") for x in files]
+
+        if not files:
+            raise ValueError("<files> should not be empty.")
+
+        # pylint: disable=import-outside-toplevel
+        from PyTravisCI.encryption.file import FileEncryption
+
+        encryption_obj = FileEncryption()
+        encryption_obj.generate_key()
+        encryption_obj.generate_iv()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # The encryption (done by OpenSSL) releases the GIL.
+            list(
+                executor.map(
+                    lambda x: encryption_obj.encrypt_path(
+                        x[0], x[1], buffer_size=buffer_size
+                    ),
+                    files,
+                )
+            )
+
+        key_var_name, iv_var_name = self.__get_encryption_var_names(
+            *sorted(os.path.split(x)[-1] for x, _ in files)
+        )
+
+        self.__save_env_vars(
+            {
+                key_var_name: encryption_obj.get_key(),
+                iv_var_name: encryption_obj.get_iv(),
+            },
+            branch=branch,
+        )
+
+        commands = [
+            f"openssl aes-256-cbc -K ${key_var_name} -iv ${iv_var_name} "
+            f"-in {os.path.split(y)[-1]} -out {os.path.split(x)[-1]} -d"
+            for x, y in files
+        ]
+
+        return {
+            "command": " && ".join(commands),
+            "commands": commands,
+            "iv": {iv_var_name: encryption_obj.get_iv()},
+            "key": {key_var_name: encryption_obj.get_key()},
+        }
@@ -118,20 +118,12 @@ class Request(ResourceTypesBase):
     config = None
     raw_configs = None
 
-    def __init__(self, **kwargs) -> None:
-        if "repository" in kwargs:
-            kwargs["repository"] = resource_types.Repository(**kwargs["repository"])
-
-        if "commit" in kwargs:
-            kwargs["commit"] = resource_types.Commit(**kwargs["commit"])
-
-        if "builds" in kwargs:
-            kwargs["builds"] = [resource_types.Build(**x) for x in kwargs["builds"]]
-
-        if "owner" in kwargs and "_at_type" in kwargs["owner"]:
-            if kwargs["owner"]["_at_type"] == "user":
-                kwargs["owner"] = resource_types.User(**kwargs["owner"])
-            elif kwargs["owner"]["_at_type"] == "organization":
-                kwargs["owner"] = resource_types.Organization(**kwargs["owner"])
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "repository": "Repository",
+        "commit": "Commit",
+        "builds": "Build",
+        "owner": {
+            "user": "User",
+            "organization": "Organization",
+        },
+    }
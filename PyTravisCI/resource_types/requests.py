@@ -60,10 +60,6 @@ class Requests(ResourceTypesBase):
     __iter_through__: str = "requests"
     requests: Optional[List["resource_types.Request"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "requests" in kwargs:
-            kwargs["requests"] = [
-                resource_types.Request(**x) for x in kwargs["requests"]
-            ]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "requests": "Request",
+    }
@@ -60,10 +60,6 @@ class Settings(ResourceTypesBase):
     __iter_through__: str = "settings"
     settings: Optional[List["resource_types.Setting"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "settings" in kwargs:
-            kwargs["settings"] = [
-                resource_types.Setting(**x) for x in kwargs["settings"]
-            ]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "settings": "Setting",
+    }
@@ -80,8 +80,6 @@ class Stage(ResourceTypesBase):
     finished_at: Optional[datetime] = None
     jobs: Optional[List["resource_types.Job"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "jobs" in kwargs:
-            kwargs["jobs"] = [resource_types.Job(**x) for x in kwargs["jobs"]]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "jobs": "Job",
+    }
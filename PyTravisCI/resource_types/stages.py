@@ -60,8 +60,6 @@ class Stages(ResourceTypesBase):
     __iter_through__: str = "stages"
     stages: Optional[List["resource_types.Stage"]] = None
 
-    def __init__(self, **kwargs) -> None:
-        if "stages" in kwargs:
-            kwargs["stages"] = [resource_types.Stage(**x) for x in kwargs["stages"]]
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "stages": "Stage",
+    }
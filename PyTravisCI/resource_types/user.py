@@ -113,18 +113,10 @@ class User(ResourceTypesBase):
     installation: Optional["resource_types.Installation"] = None
     email = None
 
-    def __init__(self, **kwargs) -> None:
-        if "repositories" in kwargs:
-            kwargs["repositories"] = [
-                resource_types.Repository(**x) for x in kwargs["repositories"]
-            ]
-
-        if "installation" in kwargs:
-            kwargs["installation"] = resource_types.Installation(
-                **kwargs["installation"]
-            )
-
-        super().__init__(**kwargs)
+    __nested__: dict = {
+        "repositories": "Repository",
+        "installation": "Installation",
+    }
 
     def synchronize(self, *, params: Optional[dict] = None) -> bool:
         """
@@ -0,0 +1,595 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the caches which let us skip the requests of the
+resources which don't change often.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import collections
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import PyTravisCI.codec as codec
+
+
+class ResponseCacheBase:
+    """
+    The base of all response caches.
+
+    A response cache keeps the (raw) responses of the API for a while - so that
+    the same request is not sent again until the response expires.
+
+    Only the communicators which have a :code:`cache_ttl`
+    (e.g. :class:`~PyTravisCI.communicator.repository.Repository`) are cached.
+    Their TTL can be overwritten through :code:`ttls`:
+
+    ::
+
+        cache = MemoryResponseCache(ttls={"Repository": 86400, "User": None})
+
+    :param ttls:
+        The TTLs (in seconds) to use instead of the :code:`cache_ttl` of the
+        communicators - indexed by the name of the communicator class.
+        :code:`None` (or :code:`0`) disables the caching of a communicator.
+    """
+
+    def __init__(self, *, ttls: Optional[Dict[str, Optional[float]]] = None) -> None:
+        self.ttls = dict(ttls or {})
+
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} ttls={self.ttls} />"
+
+    def get_ttl(
+        self, communicator_name: str, default: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Provides the TTL of the responses of the given communicator.
+
+        :param communicator_name:
+            The name of the communicator class.
+        :param default:
+            The TTL of the communicator (its :code:`cache_ttl`).
+        """
+
+        return self.ttls.get(communicator_name, default)
+
+    @staticmethod
+    def get_key(url: str, authorization: Optional[str]) -> str:
+        """
+        Provides the key of the response of the given URL.
+
+        The authorization is part of the key - as a digest, so that the token
+        is never written down.
+        """
+
+        if authorization:
+            digest = hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:32]
+        else:
+            digest = "anonymous"
+
+        return f"{url} {digest}"
+
+    @staticmethod
+    def is_under(url: str, prefix: str) -> bool:
+        """
+        Checks if the given URL is the given prefix or one of its children -
+        at a path boundary: :code:`/repo/1` is under :code:`/repo/1` and
+        :code:`/repo/1/builds` but not :code:`/repo/12`.
+        """
+
+        return url.startswith(prefix) and url[len(prefix) : len(prefix) + 1] in (
+            "",
+            "/",
+            "?",
+        )
+
+    @staticmethod
+    def get_time() -> float:
+        """
+        Provides the clock the expiration is computed with.
+
+        It is the wall clock, so that it can be shared between processes.
+        """
+
+        return time.time()
+
+    def load(self, key: str) -> Optional[Any]:
+        """
+        Provides the (non-expired) response of the given key.
+
+        .. warning::
+            This method should be implemented by the backends.
+        """
+
+        raise NotImplementedError()
+
+    def store(
+        self, key: str, value: Any, expires_at: float, urls: Tuple[str, ...]
+    ) -> None:
+        """
+        Stores the given response until the given time.
+
+        :param urls:
+            The URLs the response is known as (see :py:meth:`set`).
+
+        .. warning::
+            This method should be implemented by the backends.
+        """
+
+        raise NotImplementedError()
+
+    def delete_prefix(self, prefix: str) -> int:
+        """
+        Forgets the responses known by an URL under the given prefix
+        (see :py:meth:`is_under`).
+
+        :return:
+            The number of forgotten responses.
+
+        .. warning::
+            This method should be implemented by the backends.
+        """
+
+        raise NotImplementedError()
+
+    def delete(self, key: str) -> None:
+        """
+        Forgets the response of the given key.
+
+        .. warning::
+            This method should be implemented by the backends.
+        """
+
+        raise NotImplementedError()
+
+    def clear(self) -> None:
+        """
+        Forgets all responses.
+
+        .. warning::
+            This method should be implemented by the backends.
+        """
+
+        raise NotImplementedError()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Provides the response of the given key - if it did not expire.
+        """
+
+        value = self.load(key)
+
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return value
+
+    def set(self, key: str, value: Any, ttl: float, urls: Iterable[str] = ()) -> None:
+        """
+        Stores the given response for the given number of seconds.
+
+        :param urls:
+            The URLs the response is known as - usually the URL it was
+            requested through and its canonical one (:code:`@href`). They are
+            what :py:meth:`invalidate` works with.
+        """
+
+        self.store(key, value, self.get_time() + ttl, tuple(urls))
+
+        with self._stats_lock:
+            self.stores += 1
+
+    def invalidate(self, prefix: str) -> int:
+        """
+        Forgets the responses of the given URL and of everything under it.
+
+        :param prefix:
+            The URL to invalidate. Its query string is ignored.
+
+        :return:
+            The number of forgotten responses.
+        """
+
+        deleted = self.delete_prefix(prefix.split("?", 1)[0])
+
+        with self._stats_lock:
+            self.invalidations += deleted
+
+        return deleted
+
+    def get_statistics(self) -> dict:
+        """
+        Provides the statistics of the cache.
+
+        - :code:`hits`: The number of responses served from the cache.
+        - :code:`misses`: The number of cacheable requests we had to send.
+        - :code:`stores`: The number of stored responses.
+        - :code:`invalidations`: The number of invalidated responses.
+        """
+
+        with self._stats_lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "invalidations": self.invalidations,
+            }
+
+    def reset_statistics(self) -> None:
+        """
+        Resets the statistics of the cache.
+        """
+
+        with self._stats_lock:
+            self.hits = self.misses = self.stores = self.invalidations = 0
+
+
+class MemoryResponseCache(ResponseCacheBase):
+    """
+    A bounded (LRU) response cache which lives in memory.
+
+    The responses are given back as they were stored. They should therefore
+    not be modified - which our communicators never do.
+
+    :param max_entries:
+        The maximum number of responses to keep.
+    :param ttls:
+        See :class:`ResponseCacheBase`.
+
+    :raise ValueError:
+        When :code:`max_entries` is lower than :code:`1`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        *,
+        ttls: Optional[Dict[str, Optional[float]]] = None,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"<max_entries> should be >= 1, {max_entries} given.")
+
+        super().__init__(ttls=ttls)
+
+        self.max_entries = max_entries
+
+        self.__lock = threading.Lock()
+        self.__entries: (
+            "collections.OrderedDict[str, Tuple[float, Any, Tuple[str, ...]]]"
+        ) = collections.OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def load(self, key: str) -> Optional[Any]:
+        with self.__lock:
+            try:
+                expires_at, value, _ = self.__entries[key]
+            except KeyError:
+                return None
+
+            if expires_at <= self.get_time():
+                del self.__entries[key]
+                return None
+
+            self.__entries.move_to_end(key)
+
+            return value
+
+    def store(
+        self, key: str, value: Any, expires_at: float, urls: Tuple[str, ...]
+    ) -> None:
+        with self.__lock:
+            self.__entries[key] = (expires_at, value, urls)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self.__lock:
+            to_delete = [
+                key
+                for key, (_, _, urls) in self.__entries.items()
+                if any(self.is_under(x, prefix) for x in urls)
+            ]
+
+            for key in to_delete:
+                del self.__entries[key]
+
+        return len(to_delete)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+
+class SQLiteResponseCache(ResponseCacheBase):
+    """
+    A response cache which lives in a SQLite database. It can be shared by
+    all the processes of a host.
+
+    :param path:
+        The path to the database.
+    :param ttls:
+        See :class:`ResponseCacheBase`.
+    """
+
+    def __init__(
+        self, path: str, *, ttls: Optional[Dict[str, Optional[float]]] = None
+    ) -> None:
+        super().__init__(ttls=ttls)
+
+        self.path = path
+        self.__local = threading.local()
+
+        with self.get_connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS response_urls ("
+                "url TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (url, key))"
+            )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path!r} ttls={self.ttls} />"
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Provides the connection of the current thread (and process).
+        """
+
+        connection = getattr(self.__local, "connection", None)
+
+        if connection is None or self.__local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+
+            self.__local.connection = connection
+            self.__local.pid = os.getpid()
+
+        return connection
+
+    def load(self, key: str) -> Optional[Any]:
+        row = (
+            self.get_connection()
+            .execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                (key, self.get_time()),
+            )
+            .fetchone()
+        )
+
+        if row is None:
+            return None
+
+        return codec.get_codec().loads(row[0])
+
+    def store(
+        self, key: str, value: Any, expires_at: float, urls: Tuple[str, ...]
+    ) -> None:
+        with self.get_connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, codec.get_codec().dumps(value), expires_at),
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO response_urls (url, key) VALUES (?, ?)",
+                [(x, key) for x in urls],
+            )
+
+    def delete(self, key: str) -> None:
+        with self.get_connection() as connection:
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            connection.execute("DELETE FROM response_urls WHERE key = ?", (key,))
+
+    def delete_prefix(self, prefix: str) -> int:
+        # The URLs are sorted, so the ones which start with the prefix are
+        # found through the index. The boundary is then checked by us.
+        with self.get_connection() as connection:
+            keys = {
+                key
+                for url, key in connection.execute(
+                    "SELECT url, key FROM response_urls WHERE url >= ? AND url < ?",
+                    (prefix, prefix + "\U0010ffff"),
+                )
+                if self.is_under(url, prefix)
+            }
+
+            connection.executemany(
+                "DELETE FROM responses WHERE key = ?", [(x,) for x in keys]
+            )
+            connection.executemany(
+                "DELETE FROM response_urls WHERE key = ?", [(x,) for x in keys]
+            )
+
+        return len(keys)
+
+    def clear(self) -> None:
+        with self.get_connection() as connection:
+            connection.execute("DELETE FROM responses")
+            connection.execute("DELETE FROM response_urls")
+
+    def purge_expired(self) -> None:
+        """
+        Deletes the expired responses.
+        """
+
+        with self.get_connection() as connection:
+            connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (self.get_time(),)
+            )
+            connection.execute(
+                "DELETE FROM response_urls WHERE key NOT IN (SELECT key FROM responses)"
+            )
+
+
+class DirectoryResponseCache(ResponseCacheBase):
+    """
+    A response cache which lives in a directory - one file per response.
+    It can be shared by all the processes of a host.
+
+    :param path:
+        The path to the directory. It is created if needed.
+    :param ttls:
+        See :class:`ResponseCacheBase`.
+    """
+
+    def __init__(
+        self, path: str, *, ttls: Optional[Dict[str, Optional[float]]] = None
+    ) -> None:
+        super().__init__(ttls=ttls)
+
+        self.path = path
+
+        os.makedirs(self.path, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={self.path!r} ttls={self.ttls} />"
+
+    def get_path(self, key: str) -> str:
+        """
+        Provides the path of the file of the given key.
+        """
+
+        return os.path.join(
+            self.path, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+        )
+
+    def load(self, key: str) -> Optional[Any]:
+        path = self.get_path(key)
+
+        try:
+            with open(path, "r", encoding="utf-8") as file_stream:
+                file_stream.readline()
+                content = codec.get_codec().loads(file_stream.read())
+        except (OSError, ValueError):
+            return None
+
+        if content["key"] != key:  # pragma: no cover
+            return None
+
+        if content["expires_at"] <= self.get_time():
+            self.delete(key)
+            return None
+
+        return content["value"]
+
+    def store(
+        self, key: str, value: Any, expires_at: float, urls: Tuple[str, ...]
+    ) -> None:
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file_stream:
+                # The URLs come first so that an invalidation does not have to
+                # decode the whole response.
+                file_stream.write(codec.get_codec().dumps(list(urls)) + "\n")
+                file_stream.write(
+                    codec.get_codec().dumps(
+                        {"key": key, "expires_at": expires_at, "value": value}
+                    )
+                )
+
+            # The replacement is atomic, readers never see a partial file.
+            os.replace(temp_path, self.get_path(key))
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:  # pragma: no cover
+                pass
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self.get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def delete_prefix(self, prefix: str) -> int:
+        deleted = 0
+
+        for file_name in os.listdir(self.path):
+            if not file_name.endswith(".json"):
+                continue
+
+            path = os.path.join(self.path, file_name)
+
+            try:
+                with open(path, "r", encoding="utf-8") as file_stream:
+                    urls = codec.get_codec().loads(file_stream.readline())
+            except (OSError, ValueError):  # pragma: no cover
+                continue
+
+            if any(self.is_under(x, prefix) for x in urls):
+                try:
+                    os.remove(path)
+                    deleted += 1
+                except FileNotFoundError:  # pragma: no cover
+                    pass
+
+        return deleted
+
+    def clear(self) -> None:
+        for file_name in os.listdir(self.path):
+            if file_name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.path, file_name))
+                except FileNotFoundError:  # pragma: no cover
+                    pass
@@ -0,0 +1,267 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the retry policy of our requester.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import email.utils
+import random
+import time
+from datetime import datetime, timezone
+from typing import Iterable, Mapping, Optional
+
+import requests
+
+import PyTravisCI.defaults as defaults
+
+
+class RetryPolicy:
+    """
+    Describes if, when and how a request to the Travis CI API should be
+    retried.
+
+    The delay between two attempts grows exponentially
+    (:code:`backoff_factor * 2 ** (attempt - 1)`) until :code:`max_backoff`.
+    When jitter is allowed, a random delay between :code:`0` and the computed
+    delay is used instead - so that concurrent workers don't retry all at once.
+
+    When the API gives us a :code:`Retry-After` header, it is honored - as long
+    as it does not exceed :code:`max_retry_after`.
+
+    :param max_attempts:
+        The maximum number of attempts (the first one included).
+        :code:`1` means that we never retry.
+    :param backoff_factor:
+        The base delay (in seconds) of the exponential backoff.
+    :param max_backoff:
+        The maximum delay (in seconds) between two attempts.
+    :param jitter:
+        Whether we should randomize the delay between two attempts.
+    :param status_codes:
+        The status codes to retry.
+    :param verbs:
+        The HTTP verbs to retry.
+    :param respect_retry_after:
+        Whether we should honor the :code:`Retry-After` header.
+    :param max_retry_after:
+        The maximum :code:`Retry-After` (in seconds) we accept to wait for.
+        If the API asks us to wait longer, we give up.
+
+    :raise ValueError:
+        When :code:`max_attempts` is lower than :code:`1`.
+    """
+
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        status_codes: Optional[Iterable[int]] = None,
+        verbs: Optional[Iterable[str]] = None,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(f"<max_attempts> should be >= 1, {max_attempts} given.")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+        if status_codes is None:
+            self.status_codes = defaults.requester.RETRY_STATUS_CODES
+        else:
+            self.status_codes = frozenset(status_codes)
+
+        if verbs is None:
+            self.verbs = defaults.requester.RETRY_VERBS
+        else:
+            self.verbs = frozenset(x.upper() for x in verbs)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} max_attempts={self.max_attempts} "
+            f"backoff_factor={self.backoff_factor} max_backoff={self.max_backoff} />"
+        )
+
+    def can_retry(self, verb: str, attempt: int) -> bool:
+        """
+        Checks if the given verb can still be retried after the given attempt.
+
+        :param verb:
+            The HTTP verb of the request.
+        :param attempt:
+            The number of the attempt which just happened (starting from 1).
+        """
+
+        return attempt < self.max_attempts and verb.upper() in self.verbs
+
+    def should_retry_response(
+        self, verb: str, status_code: int, headers: Mapping, attempt: int
+    ) -> bool:
+        """
+        Checks if a request which ended with the given status code should be
+        retried.
+
+        :param verb:
+            The HTTP verb of the request.
+        :param status_code:
+            The status code of the response.
+        :param headers:
+            The headers of the response.
+        :param attempt:
+            The number of the attempt which just happened (starting from 1).
+        """
+
+        if not self.can_retry(verb, attempt) or status_code not in self.status_codes:
+            return False
+
+        retry_after = self.get_retry_after(headers)
+
+        return retry_after is None or retry_after <= self.max_retry_after
+
+    def should_retry_exception(
+        self, verb: str, exception: Exception, attempt: int
+    ) -> bool:
+        """
+        Checks if a request which ended with the given exception should be
+        retried.
+
+        Only connection errors and timeouts are retried.
+
+        :param verb:
+            The HTTP verb of the request.
+        :param exception:
+            The exception which was raised.
+        :param attempt:
+            The number of the attempt which just happened (starting from 1).
+        """
+
+        return self.can_retry(verb, attempt) and isinstance(
+            exception,
+            (requests.exceptions.ConnectionError, requests.exceptions.Timeout),
+        )
+
+    def get_retry_after(self, headers: Optional[Mapping]) -> Optional[float]:
+        """
+        Provides the number of seconds the API asked us to wait for, through the
+        :code:`Retry-After` header.
+
+        :param headers:
+            The headers of the response.
+
+        :return:
+            :code:`None` if we should not (or can't) use the header.
+        """
+
+        if not self.respect_retry_after or not headers:
+            return None
+
+        value = headers.get("Retry-After")
+
+        if not value:
+            return None
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_date.tzinfo is None:
+            retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+        return max((retry_date - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Provides the delay to wait for, after the given attempt.
+
+        :param attempt:
+            The number of the attempt which just happened (starting from 1).
+        """
+
+        delay = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+
+        if self.jitter:
+            return random.uniform(0, delay)
+        return delay
+
+    def get_delay(self, attempt: int, headers: Optional[Mapping] = None) -> float:
+        """
+        Provides the delay to wait for before the next attempt.
+
+        The :code:`Retry-After` header takes precedence over our backoff.
+
+        :param attempt:
+            The number of the attempt which just happened (starting from 1).
+        :param headers:
+            The headers of the response (if any).
+        """
+
+        retry_after = self.get_retry_after(headers)
+
+        if retry_after is not None:
+            return retry_after
+        return self.get_backoff(attempt)
+
+    @staticmethod
+    def sleep(seconds: float) -> None:
+        """
+        Waits for the given number of seconds.
+        """
+
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+"""
+A policy which never retries.
+"""
@@ -0,0 +1,352 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the cache we use to revalidate (conditional GET) the
+responses of the API.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import collections
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import requests
+
+import PyTravisCI.codec as codec
+
+
+class RevalidationEntry:
+    """
+    Holds a response of the API along with its validators
+    (:code:`ETag` and :code:`Last-Modified`).
+
+    The body is decoded at most once - when it is first read.
+
+    :param response:
+        The response to hold.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __missing = object()
+
+    def __init__(self, response: requests.Response) -> None:
+        self.response = response
+        self.etag: Optional[str] = response.headers.get("ETag")
+        self.last_modified: Optional[str] = response.headers.get("Last-Modified")
+
+        self.__data = self.__missing
+        self.__lock = threading.Lock()
+
+    def get_conditional_headers(self) -> Dict[str, str]:
+        """
+        Provides the headers which let the API tell us that the response did
+        not change.
+        """
+
+        result = {}
+
+        if self.etag:
+            result["If-None-Match"] = self.etag
+
+        if self.last_modified:
+            result["If-Modified-Since"] = self.last_modified
+
+        return result
+
+    def get_data(self) -> Any:
+        """
+        Provides the decoded body of the response.
+        """
+
+        if self.__data is self.__missing:
+            with self.__lock:
+                if self.__data is self.__missing:
+                    self.__data = codec.decode_response(self.response)
+
+        return self.__data
+
+
+class RevalidatedResponse(requests.Response):
+    """
+    A response which is served from a :class:`RevalidationEntry`. Its body is
+    only decoded once for all the responses of the same entry.
+
+    :param entry:
+        The entry to serve.
+    :param revalidated:
+        Whether the API just told us (:code:`304`) that the entry is still
+        valid.
+    """
+
+    def __init__(self, entry: RevalidationEntry, *, revalidated: bool) -> None:
+        super().__init__()
+
+        self.entry = entry
+        self.revalidated = revalidated
+
+        self.status_code = entry.response.status_code
+        self.reason = entry.response.reason
+        self.url = entry.response.url
+        self.headers = entry.response.headers
+        self.encoding = entry.response.encoding
+        self._content = entry.response.content
+
+    def json(self, **kwargs) -> Any:
+        # pylint: disable=unused-argument
+        return self.entry.get_data()
+
+
+class RevalidationCache:
+    """
+    A bounded (LRU) cache of the responses of the API which carry a validator
+    (:code:`ETag` or :code:`Last-Modified`).
+
+    When a cached URL is requested again (with the same authorization), we
+    send :code:`If-None-Match` / :code:`If-Modified-Since` and a :code:`304`
+    is served from the cache - without being decoded again.
+
+    ::
+
+        from PyTravisCI import TravisCI
+        from PyTravisCI.revalidation import RevalidationCache
+
+        cache = RevalidationCache(max_entries=512)
+        travis = TravisCI(access_token="XYZ", revalidation_cache=cache)
+
+        build = travis.get_build(4)
+
+        while build.is_active():
+            build = build.sync()  # Unchanged builds are served from the cache.
+
+        print(cache.get_statistics())
+
+    :param max_entries:
+        The maximum number of responses to keep.
+
+    :raise ValueError:
+        When :code:`max_entries` is lower than :code:`1`.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        if max_entries < 1:
+            raise ValueError(f"<max_entries> should be >= 1, {max_entries} given.")
+
+        self.max_entries = max_entries
+
+        self.__lock = threading.Lock()
+        self.__entries: "collections.OrderedDict[Hashable, RevalidationEntry]" = (
+            collections.OrderedDict()
+        )
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} max_entries={self.max_entries} "
+            f"entries={len(self)} />"
+        )
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @staticmethod
+    def get_key(
+        verb: str, url: str, kwargs: dict, authorization: Optional[str]
+    ) -> Optional[Hashable]:
+        """
+        Provides the key of the given request.
+
+        :param verb:
+            The HTTP verb of the request.
+        :param url:
+            The URL of the request.
+        :param kwargs:
+            The keyword arguments given to the session.
+        :param authorization:
+            The authorization header of the request.
+
+        :return:
+            :code:`None` if the request can't be revalidated.
+        """
+
+        if verb.upper() != "GET" or set(kwargs) - {"params", "headers"}:
+            return None
+
+        # A partial (or other) representation of the resource.
+        if {x.lower() for x in kwargs.get("headers") or {}} & {"accept", "range"}:
+            return None
+
+        if kwargs.get("params"):
+            url = requests.Request("GET", url, params=kwargs["params"]).prepare().url
+
+        return (url, authorization)
+
+    def get(self, key: Hashable) -> Optional[RevalidationEntry]:
+        """
+        Provides the entry of the given key.
+        """
+
+        with self.__lock:
+            try:
+                self.__entries.move_to_end(key)
+            except KeyError:
+                return None
+
+            return self.__entries[key]
+
+    def set(self, key: Hashable, entry: RevalidationEntry) -> None:
+        """
+        Stores the given entry, evicting the least recently used ones if
+        needed.
+        """
+
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Forgets the entry of the given key.
+        """
+
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Forgets all entries.
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+
+    def prepare(
+        self, key: Hashable, kwargs: dict
+    ) -> Tuple[Optional[RevalidationEntry], dict]:
+        """
+        Prepares a request: if we know the response of the given key, the
+        conditional headers are added to the given keyword arguments.
+
+        :return:
+            The entry (if any) and the keyword arguments to give to the session.
+        """
+
+        entry = self.get(key)
+
+        if entry is None:
+            with self.__lock:
+                self.misses += 1
+
+            return entry, kwargs
+
+        with self.__lock:
+            self.revalidations += 1
+
+        headers = dict(kwargs.get("headers") or {})
+        headers.update(entry.get_conditional_headers())
+
+        return entry, dict(kwargs, headers=headers)
+
+    def complete(
+        self,
+        key: Hashable,
+        entry: Optional[RevalidationEntry],
+        response: requests.Response,
+    ) -> requests.Response:
+        """
+        Completes a request prepared by :py:meth:`prepare`.
+
+        :return:
+            The response to give back: the cached one if the API told us that
+            it did not change.
+        """
+
+        if entry is not None and response.status_code == 304:
+            with self.__lock:
+                self.hits += 1
+
+            return RevalidatedResponse(entry, revalidated=True)
+
+        if response.status_code == 200 and (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        ):
+            entry = RevalidationEntry(response)
+            self.set(key, entry)
+
+            return RevalidatedResponse(entry, revalidated=False)
+
+        if entry is not None:
+            self.delete(key)
+
+        return response
+
+    def get_statistics(self) -> dict:
+        """
+        Provides the statistics of the cache.
+
+        - :code:`hits`: The number of responses served from the cache (after
+          a :code:`304`).
+        - :code:`misses`: The number of requests we could not revalidate.
+        - :code:`revalidations`: The number of conditional requests we sent.
+        - :code:`evictions`: The number of evicted entries.
+        - :code:`entries`: The number of entries.
+        """
+
+        with self.__lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "entries": len(self.__entries),
+            }
+
+    def reset_statistics(self) -> None:
+        """
+        Resets the statistics of the cache.
+        """
+
+        with self.__lock:
+            self.hits = self.misses = self.revalidations = self.evictions = 0
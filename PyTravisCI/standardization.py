@@ -43,7 +43,7 @@ License
 import copy
 from datetime import datetime
 from functools import wraps
-from typing import Any, Optional
+from typing import Any, FrozenSet, List, Optional
 
 import PyTravisCI.defaults as defaults
 
@@ -54,6 +54,18 @@ class Standardization:
     something useful (for later usage and distribution).
     """
 
+    DATE_TIME_INDEXES: List[str] = [
+        "committed_at",
+        "created_at",
+        "finished_at",
+        "last_modified",
+        "last_run",
+        "next_run",
+        "started_at",
+        "synced_at",
+        "updated_at",
+    ]
+
     data: Optional[Any] = None
 
     def __init__(self, data: Optional[Any] = None) -> None:
@@ -97,41 +109,37 @@ class Standardization:
         Provides the standardized version.
         """
 
+    @staticmethod
+    def parse_datetime(value: str) -> datetime:
+        """
+        Converts the given date (as given by the API) into a
+        :py:class:`~datetime.datetime`.
+
+        :raise ValueError:
+            When none of our known formats matches.
+        """
+
+        try:
+            return datetime.strptime(value, defaults.formats.STANDARD_DATE_FORMAT)
+        except ValueError:
+            return datetime.strptime(value, defaults.formats.ALTERNATIVE_DATE_FORMAT)
+
     def standardize_datetime(self, data: dict) -> dict:
         """
         Provides a way to unify/convert the dates to something more
         Python friendly.
         """
 
-        date_time_indexes = [
-            "committed_at",
-            "created_at",
-            "finished_at",
-            "last_modified",
-            "last_run",
-            "next_run",
-            "started_at",
-            "synced_at",
-            "updated_at",
-        ]
-
         if isinstance(data, dict):
             result = dict()
 
             for key, value in copy.deepcopy(data).items():
                 if (
                     value
-                    and key in date_time_indexes
+                    and key in self.DATE_TIME_INDEXES
                     and not isinstance(value, datetime)
                 ):
-                    try:
-                        result[key] = datetime.strptime(
-                            value, defaults.formats.STANDARD_DATE_FORMAT
-                        )
-                    except ValueError:
-                        result[key] = datetime.strptime(
-                            value, defaults.formats.ALTERNATIVE_DATE_FORMAT
-                        )
+                    result[key] = self.parse_datetime(value)
                 else:
                     if isinstance(value, dict):
                         result[key] = self.standardize_datetime(value)
@@ -163,3 +171,90 @@ class Standardization:
             result = data
 
         return result
+
+
+class SinglePassStandardization(Standardization):
+    """
+    A standardizer which provides the same result as
+    :class:`~PyTravisCI.standardization.Standardization` but in a single
+    traversal of the dataset.
+
+    Instead of (deep) copying the whole dataset before each standardization
+    step, every container is rebuilt while we walk through it. Therefore, the
+    given dataset is never modified and nothing is copied twice.
+    """
+
+    __date_time_indexes: FrozenSet[str] = frozenset(Standardization.DATE_TIME_INDEXES)
+
+    def get_standardized(self) -> Any:
+        """
+        Provides the standardized version.
+        """
+
+        return self.standardize(self.data)
+
+    @staticmethod
+    def parse_datetime(value: str) -> datetime:
+        """
+        Converts the given date (as given by the API) into a
+        :py:class:`~datetime.datetime`.
+
+        Dates in our standard format are sliced directly, everything else is
+        given to :py:meth:`~datetime.datetime.strptime`.
+
+        :raise ValueError:
+            When none of our known formats matches.
+        """
+
+        if (
+            len(value) == 20
+            and value[4] == value[7] == "-"
+            and value[10] == "T"
+            and value[13] == value[16] == ":"
+            and value[19] == "Z"
+        ):
+            try:
+                return datetime(
+                    int(value[0:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(value[11:13]),
+                    int(value[14:16]),
+                    int(value[17:19]),
+                )
+            except ValueError:
+                pass
+
+        return Standardization.parse_datetime(value)
+
+    def standardize(self, data: Any) -> Any:
+        """
+        Converts the :code:`@tags` and the dates of the given dataset in a
+        single pass.
+
+        :param data:
+            The data to work with.
+        """
+
+        if isinstance(data, dict):
+            result = dict()
+
+            for key, value in data.items():
+                if "@" in key:
+                    key = key.replace("@", "_at_")
+
+                if isinstance(value, (dict, list)):
+                    result[key] = self.standardize(value)
+                elif (
+                    value and isinstance(value, str) and key in self.__date_time_indexes
+                ):
+                    result[key] = self.parse_datetime(value)
+                else:
+                    result[key] = value
+
+            return result
+
+        if isinstance(data, list):
+            return [self.standardize(x) for x in data]
+
+        return data
@@ -41,12 +41,18 @@ License
 """
 
 from io import TextIOWrapper
-from typing import Optional, Union
+from typing import Dict, Iterable, Iterator, Optional, Union
 
+import PyTravisCI.batch as batch
 import PyTravisCI.communicator._all as communicator
 import PyTravisCI.defaults as defaults
 import PyTravisCI.requester as requester
 import PyTravisCI.resource_types._all as resource_types  # pylint: disable=unused-import
+from PyTravisCI.encryption.public_key_cache import PublicKeyCache
+from PyTravisCI.rate_limiter import TokenBucket
+from PyTravisCI.response_cache import ResponseCacheBase
+from PyTravisCI.retry import RetryPolicy
+from PyTravisCI.revalidation import RevalidationCache
 
 
 class TravisCI:
@@ -57,6 +63,22 @@ class TravisCI:
         The access token to use to authenticate ourselves.
     :param str access_point:
         The access point to communicate with.
+    :param retry_policy:
+        The policy to follow when a request fails because of a transient error
+        (e.g. :code:`429` or :code:`502`). If not given, requests are never
+        retried.
+    :param rate_limiter:
+        The rate limiter which paces every request sent to the API. Share it
+        between several instances to pace all of them together.
+    :param revalidation_cache:
+        The cache of the responses to revalidate. Unchanged responses are then
+        served from it (after a :code:`304`).
+    :param response_cache:
+        The cache which let us skip the requests of the resources which don't
+        change often (e.g. repositories or users).
+    :param public_key_cache:
+        The cache of the public keys of the repositories. Cached public keys
+        are neither fetched nor loaded again when we encrypt something.
     """
 
     # pylint: disable=too-many-public-methods
@@ -66,14 +88,43 @@ class TravisCI:
         *,
         access_token: Optional[str] = None,
         access_point: Optional[str] = defaults.access_points.OPEN,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        revalidation_cache: Optional[RevalidationCache] = None,
+        response_cache: Optional[ResponseCacheBase] = None,
+        public_key_cache: Optional[PublicKeyCache] = None,
     ) -> None:
-        self.__requester = requester.Requester()
+        self.__requester = requester.Requester(
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            revalidation_cache=revalidation_cache,
+            response_cache=response_cache,
+            public_key_cache=public_key_cache,
+        )
 
         self.set_access_point(access_point)
 
         if access_token:
             self.set_access_token(access_token)
 
+    @classmethod
+    def from_requester(cls, req: requester.Requester) -> "TravisCI":
+        """
+        Provides an instance which communicates through the given (already
+        configured) requester.
+
+        :raise TypeError:
+            When :code:`req` is not a :class:`~PyTravisCI.requester.Requester`.
+        """
+
+        if not isinstance(req, requester.Requester):
+            raise TypeError(f"<req> must be {requester.Requester}. {type(req)} given.")
+
+        result = cls.__new__(cls)
+        result.__requester = req  # pylint: disable=unused-private-member
+
+        return result
+
     def set_access_token(self, value: str) -> None:
         """
         Sets the access token.
@@ -95,6 +146,83 @@ class TravisCI:
 
         self.__requester.set_base_url(value)
 
+    def set_retry_policy(self, value: RetryPolicy) -> None:
+        """
+        Sets the retry policy to follow.
+        """
+
+        self.__requester.set_retry_policy(value)
+
+    def set_rate_limiter(self, value: Optional[TokenBucket]) -> None:
+        """
+        Sets the rate limiter which paces every request sent to the API.
+        """
+
+        self.__requester.set_rate_limiter(value)
+
+    def get_rate_limiter(self) -> Optional[TokenBucket]:
+        """
+        Provides the currently set rate limiter. Its statistics tell you how
+        long we waited for it.
+        """
+
+        return self.__requester.rate_limiter
+
+    def set_revalidation_cache(self, value: Optional[RevalidationCache]) -> None:
+        """
+        Sets the cache of the responses to revalidate.
+        """
+
+        self.__requester.set_revalidation_cache(value)
+
+    def get_revalidation_cache(self) -> Optional[RevalidationCache]:
+        """
+        Provides the currently set revalidation cache. Its statistics tell you
+        how many responses were served from it.
+        """
+
+        return self.__requester.revalidation_cache
+
+    def set_response_cache(self, value: Optional[ResponseCacheBase]) -> None:
+        """
+        Sets the cache which let us skip the requests of the resources which
+        don't change often.
+        """
+
+        self.__requester.set_response_cache(value)
+
+    def get_response_cache(self) -> Optional[ResponseCacheBase]:
+        """
+        Provides the currently set response cache.
+        """
+
+        return self.__requester.response_cache
+
+    def set_public_key_cache(self, value: Optional[PublicKeyCache]) -> None:
+        """
+        Sets the cache of the public keys of the repositories.
+        """
+
+        self.__requester.set_public_key_cache(value)
+
+    def get_public_key_cache(self) -> Optional[PublicKeyCache]:
+        """
+        Provides the currently set public key cache.
+        """
+
+        return self.__requester.public_key_cache
+
+    def __fetch_many(self, func, keys: Iterable, max_workers: int) -> batch.BatchResult:
+        """
+        Looks up all given keys with the given function on a bounded pool of
+        threads which share our requester.
+        """
+
+        if self.__requester.pool_size < max_workers:
+            self.__requester.set_pool_size(max_workers)
+
+        return batch.fetch_many(func, keys, max_workers=max_workers)
+
     def get_active_from_github_id(
         self, github_id: Union[str, int], *, params: Optional[dict] = None
     ) -> "resource_types.Active":
@@ -185,6 +313,66 @@ class TravisCI:
 
         return communicator.Builds(self.__requester).fetch(parameters=params)
 
+    def iter_builds(
+        self,
+        *,
+        params: Optional[dict] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        compact: bool = False,
+    ) -> Iterator["resource_types.Build"]:
+        """
+        Iterates over the builds of the current user, page after page.
+
+        Unless pages are prefetched, only the current page is kept in memory.
+        Use the :code:`limit` parameter to control the size of the pages.
+
+        Official Travis CI API documentation:
+            - https://developer.travis-ci.org/resource/builds
+
+        :param params:
+            The query parameters to append to the URL.
+        :param max_items:
+            The maximum number of builds to yield. :code:`None` means all.
+        :param prefetch:
+            The maximum number of pages to fetch ahead (concurrently).
+        :param compact:
+            Yield the compact (slotted) version of the builds.
+        """
+
+        return self.get_builds(params=params).iter_all(
+            max_items=max_items, prefetch=prefetch, compact=compact
+        )
+
+    def get_builds_by_ids(
+        self,
+        build_ids: Iterable[Union[int, str]],
+        *,
+        params: Optional[dict] = None,
+        max_workers: int = defaults.requester.BATCH_MAX_WORKERS,
+    ) -> batch.BatchResult:
+        """
+        Provides the builds of all given IDs. The lookups are run concurrently.
+
+        Official Travis CI API documentation:
+            - https://developer.travis-ci.org/resource/build
+
+        :param build_ids:
+            The values uniquely identifying the builds.
+        :param params:
+            The query parameters to append to the URL.
+        :param max_workers:
+            The maximum number of lookups to run at the same time.
+
+        :return:
+            The builds, in the order of the given IDs. A failed lookup doesn't
+            abort the others, it is reported by the result instead.
+        """
+
+        return self.__fetch_many(
+            lambda x: self.get_build(x, params=params), build_ids, max_workers
+        )
+
     def get_cron(
         self, cron_id: Union[str, int], *, params: Optional[dict] = None
     ) -> "resource_types.Cron":
@@ -236,6 +424,66 @@ class TravisCI:
 
         return communicator.Jobs(self.__requester).fetch(parameters=params)
 
+    def iter_jobs(
+        self,
+        *,
+        params: Optional[dict] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        compact: bool = False,
+    ) -> Iterator["resource_types.Job"]:
+        """
+        Iterates over the jobs of the current user, page after page.
+
+        Unless pages are prefetched, only the current page is kept in memory.
+        Use the :code:`limit` parameter to control the size of the pages.
+
+        Official Travis CI API documentation:
+            - https://developer.travis-ci.org/resource/jobs
+
+        :param params:
+            The query parameters to append to the URL.
+        :param max_items:
+            The maximum number of jobs to yield. :code:`None` means all.
+        :param prefetch:
+            The maximum number of pages to fetch ahead (concurrently).
+        :param compact:
+            Yield the compact (slotted) version of the jobs.
+        """
+
+        return self.get_jobs(params=params).iter_all(
+            max_items=max_items, prefetch=prefetch, compact=compact
+        )
+
+    def get_jobs_by_ids(
+        self,
+        job_ids: Iterable[Union[int, str]],
+        *,
+        params: Optional[dict] = None,
+        max_workers: int = defaults.requester.BATCH_MAX_WORKERS,
+    ) -> batch.BatchResult:
+        """
+        Provides the jobs of all given IDs. The lookups are run concurrently.
+
+        Official Travis CI API documentation:
+            - https://developer.travis-ci.org/resource/job
+
+        :param job_ids:
+            The values uniquely identifying the jobs.
+        :param params:
+            The query parameters to append to the URL.
+        :param max_workers:
+            The maximum number of lookups to run at the same time.
+
+        :return:
+            The jobs, in the order of the given IDs. A failed lookup doesn't
+            abort the others, it is reported by the result instead.
+        """
+
+        return self.__fetch_many(
+            lambda x: self.get_job(x, params=params), job_ids, max_workers
+        )
+
     def lint(self, subject: Union[TextIOWrapper, bytes, str]) -> "resource_types.Lint":
         """
         Lints the given subject.
@@ -295,6 +543,37 @@ class TravisCI:
 
         return communicator.Organizations(self.__requester).fetch(parameters=params)
 
+    def iter_organizations(
+        self,
+        *,
+        params: Optional[dict] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        compact: bool = False,
+    ) -> Iterator["resource_types.Organization"]:
+        """
+        Iterates over the organizations of the current user, page after page.
+
+        Unless pages are prefetched, only the current page is kept in memory.
+        Use the :code:`limit` parameter to control the size of the pages.
+
+        Official Travis CI API documentation:
+            - https://developer.travis-ci.org/resource/organizations
+
+        :param params:
+            The query parameters to append to the URL.
+        :param max_items:
+            The maximum number of organizations to yield. :code:`None` means all.
+        :param prefetch:
+            The maximum number of pages to fetch ahead (concurrently).
+        :param compact:
+            Yield the compact (slotted) version of the organizations.
+        """
+
+        return self.get_organizations(params=params).iter_all(
+            max_items=max_items, prefetch=prefetch, compact=compact
+        )
+
     def get_repositories(
         self, *, params: Optional[dict] = None
     ) -> "resource_types.Repositories":
@@ -310,6 +589,37 @@ class TravisCI:
 
         return communicator.Repositories(self.__requester).fetch(parameters=params)
 
+    def iter_repositories(
+        self,
+        *,
+        params: Optional[dict] = None,
+        max_items: Optional[int] = None,
+        prefetch: int = 0,
+        compact: bool = False,
+    ) -> Iterator["resource_types.Repository"]:
+        """
+        Iterates over the repositories of the current user, page after page.
+
+        Unless pages are prefetched, only the current page is kept in memory.
+        Use the :code:`limit` parameter to control the size of the pages.
+
+        Official Travis CI API documentation:
+            - https://developer.travis-ci.org/resource/repositories
+
+        :param params:
+            The query parameters to append to the URL.
+        :param max_items:
+            The maximum number of repositories to yield. :code:`None` means all.
+        :param prefetch:
+            The maximum number of pages to fetch ahead (concurrently).
+        :param compact:
+            Yield the compact (slotted) version of the repositories.
+        """
+
+        return self.get_repositories(params=params).iter_all(
+            max_items=max_items, prefetch=prefetch, compact=compact
+        )
+
     def get_repositories_from_github_id(
         self, github_id: Union[str, int], *, params: Optional[dict] = None
     ) -> "resource_types.Repositories":
@@ -400,6 +710,108 @@ class TravisCI:
             repository_id_or_slug=repository_id_or_slug, parameters=params
         )
 
+    def get_repositories_by_slugs(
+        self,
+        repository_ids_or_slugs: Iterable[Union[str, int]],
+        *,
+        params: Optional[dict] = None,
+        max_workers: int = defaults.requester.BATCH_MAX_WORKERS,
+    ) -> batch.BatchResult:
+        """
+        Provides the repositories of all given slugs (or IDs). The lookups are
+        run concurrently.
+
+        Official Travis CI API documentation:
+            - https://developer.travis-ci.org/resource/repository
+
+        :param repository_ids_or_slugs:
+            The values uniquely identifying the repositories.
+        :param params:
+            The query parameters to append to the URL.
+        :param max_workers:
+            The maximum number of lookups to run at the same time.
+
+        :return:
+            The repositories, in the order of the given slugs. A failed lookup
+            doesn't abort the others, it is reported by the result instead.
+        """
+
+        return self.__fetch_many(
+            lambda x: self.get_repository(x, params=params),
+            repository_ids_or_slugs,
+            max_workers,
+        )
+
+    def encrypt_secrets_many(
+        self,
+        secrets: Dict[Union[str, int], Iterable[Union[str, bytes]]],
+        *,
+        padding: str = "PKCS1v15",
+        max_workers: int = defaults.requester.BATCH_MAX_WORKERS,
+        max_processes: Optional[int] = None,
+    ) -> batch.BatchResult:
+        """
+        Encrypts the given secrets of many repositories at once.
+
+        The public keys of the repositories are fetched concurrently - or
+        served by our public key cache - and the secrets are then encrypted on
+        a pool of processes.
+
+        ::
+
+            from PyTravisCI import TravisCI
+
+            travis = TravisCI(access_token="XYZ")
+
+            result = travis.encrypt_secrets_many(
+                {
+                    "funilrys/PyTravisCI": ["hello", 'WORLD="hello"'],
+                    "funilrys/PyFunceble": ["world"],
+                }
+            )
+
+            for slug, encrypted in zip(result.keys, result):
+                print(slug, encrypted)
+
+        :param secrets:
+            The secrets to encrypt - per repository ID or slug.
+        :param padding:
+            The padding to use. See
+            :meth:`~PyTravisCI.resource_types.repository.Repository.encrypt_secrets`.
+        :param max_workers:
+            The maximum number of public keys to fetch at the same time.
+        :param max_processes:
+            The maximum number of processes to encrypt with.
+            See :func:`~PyTravisCI.encryption.bulk.encrypt_many`.
+
+        :return:
+            The (base64 encoded) encrypted secrets, in the order of the given
+            repositories. A repository whose public key could not be fetched
+            doesn't abort the others, it is reported by the result instead.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        from PyTravisCI.encryption import bulk
+
+        result = self.__fetch_many(
+            lambda x: self.get_repository(x).get_data_encryption().get_public_key(),
+            list(secrets),
+            max_workers,
+        )
+
+        fetched = [x for x in range(len(result)) if x not in result.errors]
+
+        encrypted = bulk.encrypt_many(
+            [(result[x], secrets[result.keys[x]]) for x in fetched],
+            padd=padding,
+            max_workers=max_processes,
+        )
+
+        for index, value in zip(fetched, encrypted):
+            result.results[index] = value
+
+        return result
+
     def get_user(self, *, params: Optional[dict] = None) -> "resource_types.User":
         """
         Provides the information of the current user.
@@ -0,0 +1,516 @@
+"""
+Just another Python API for Travis CI (API).
+
+This module provides the watcher of many builds and jobs.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import requests
+
+import PyTravisCI.defaults as defaults
+import PyTravisCI.exceptions as exceptions
+import PyTravisCI.resource_types._all as resource_types
+from PyTravisCI import batch
+
+
+class Transition:
+    """
+    Provides the change of state of a watched build or job.
+
+    :param resource:
+        The build or job - which already holds its new state.
+    :param previous_state:
+        The state of the build or job before the transition.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("resource", "previous_state", "state")
+
+    def __init__(self, resource: Any, previous_state: Optional[str]) -> None:
+        self.resource = resource
+        self.previous_state = previous_state
+        self.state: Optional[str] = resource.state
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} {self.resource.__class__.__name__} "
+            f"{self.resource.id}: {self.previous_state} -> {self.state} />"
+        )
+
+    def is_finished(self) -> bool:
+        """
+        Checks if the build or job is finished.
+        """
+
+        return self.state not in defaults.states.PENDING
+
+
+class WatchedItem:
+    """
+    Provides a build or job under watch - and its schedule.
+
+    :param resource:
+        The build or job to watch.
+    :param expected_duration:
+        The number of seconds the build or job is expected to run.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("resource", "expected_duration", "next_poll")
+
+    def __init__(self, resource: Any, expected_duration: Optional[float]) -> None:
+        self.resource = resource
+        self.expected_duration = expected_duration
+        self.next_poll: float = 0.0
+
+    def get_key(self) -> Tuple[str, int]:
+        """
+        Provides the key which identifies the build or job.
+        """
+
+        return self.resource.__class__.__name__, self.resource.id
+
+    def get_owner(self) -> Optional[str]:
+        """
+        Provides the login of the owner of the repository of the build or job
+        - if known.
+        """
+
+        slug = getattr(getattr(self.resource, "repository", None), "slug", None)
+
+        if not slug or "/" not in slug:
+            return None
+
+        return slug.split("/", 1)[0]
+
+
+class Watcher:
+    """
+    Watches many builds and jobs until they are finished - with a single
+    (multiplexed) polling loop.
+
+    Each build or job is polled on its own schedule: the waiting ones are
+    polled slowly, the started ones more often - and even more often when
+    they get close to their expected end. At each poll, the due builds (and
+    jobs) of a same owner are refreshed by a single request to the
+    :code:`/owner/{provider}/{login}/active` endpoint. Only the ones which
+    left it (because they are finished) - or whose owner is unknown - are
+    fetched one by one.
+
+    ::
+
+        from PyTravisCI import TravisCI
+        from PyTravisCI.watcher import Watcher
+
+        travis = TravisCI(access_token="XYZ")
+        watcher = Watcher(travis)
+
+        for build in travis.get_repository("funilrys/PyTravisCI").get_builds():
+            watcher.add(build)
+
+        for transition in watcher.watch(timeout=3600):
+            print(transition.resource.id, transition.previous_state, "->",
+                  transition.state)
+
+    :param travis:
+        The gateway to use to fetch the builds and jobs.
+    :param on_transition:
+        A function to call with each :class:`Transition`.
+    :param provider:
+        The provider of the owners of the watched builds and jobs.
+    :param interval:
+        The number of seconds between 2 polls of a started build or job
+        whose duration is not known.
+    :param min_interval:
+        The minimum number of seconds between 2 polls of a build or job.
+    :param max_interval:
+        The maximum number of seconds between 2 polls of a build or job.
+    :param waiting_interval:
+        The number of seconds between 2 polls of a build or job which was not
+        started yet.
+    :param max_workers:
+        The maximum number of builds or jobs to fetch at the same time.
+    :param use_active:
+        Refresh the builds and jobs through the active builds of their owner.
+
+    :raise ValueError:
+        When an interval is not positive or when :code:`min_interval` is
+        greater than :code:`max_interval`.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        travis: Any,
+        *,
+        on_transition: Optional[Callable[[Transition], Any]] = None,
+        provider: str = "github",
+        interval: float = 30.0,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        waiting_interval: float = 60.0,
+        max_workers: int = 8,
+        use_active: bool = True,
+    ) -> None:
+        if min(interval, min_interval, max_interval, waiting_interval) <= 0:
+            raise ValueError("The intervals should be > 0.")
+
+        if min_interval > max_interval:
+            raise ValueError(
+                f"<min_interval> ({min_interval}) should be <= "
+                f"<max_interval> ({max_interval})."
+            )
+
+        self.travis = travis
+        self.on_transition = on_transition
+        self.provider = provider
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.waiting_interval = waiting_interval
+        self.max_workers = max_workers
+        self.use_active = use_active
+
+        self.__items: Dict[Tuple[str, int], WatchedItem] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} watched={len(self)} />"
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, resource: Any) -> bool:
+        return (resource.__class__.__name__, resource.id) in self.__items
+
+    @staticmethod
+    def get_time() -> float:
+        """
+        Provides the (monotonic) time we schedule the polls with.
+        """
+
+        return time.monotonic()
+
+    @staticmethod
+    def get_now() -> datetime:
+        """
+        Provides the current (naive, UTC) date - to compare with the dates
+        given by the API.
+        """
+
+        return datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def add(self, resource: Any, *, expected_duration: Optional[float] = None) -> bool:
+        """
+        Starts to watch the given build or job.
+
+        :param resource:
+            The build or job to watch.
+        :param expected_duration:
+            The number of seconds the build or job is expected to run
+            (e.g. the duration of the previous build). The polls get closer
+            as the expected end approaches.
+
+        :return:
+            :code:`False` if the build or job is finished - or already
+            watched.
+
+        :raise TypeError:
+            When the given resource is not a build or a job.
+        """
+
+        if not isinstance(resource, (resource_types.Build, resource_types.Job)):
+            raise TypeError(
+                f"<resource> should be {resource_types.Build} or "
+                f"{resource_types.Job}, {type(resource)} given."
+            )
+
+        item = WatchedItem(resource, expected_duration)
+
+        if item.get_key() in self.__items or (
+            resource.state is not None and resource.state not in defaults.states.PENDING
+        ):
+            return False
+
+        item.next_poll = self.get_time() + self.get_interval(item)
+        self.__items[item.get_key()] = item
+
+        return True
+
+    def add_many(self, resources: Iterable[Any]) -> int:
+        """
+        Starts to watch the given builds and jobs.
+
+        :return:
+            The number of builds and jobs which were not watched yet.
+        """
+
+        return len([x for x in resources if self.add(x)])
+
+    def discard(self, resource: Any) -> None:
+        """
+        Stops to watch the given build or job.
+        """
+
+        self.__items.pop((resource.__class__.__name__, resource.id), None)
+
+    def get_interval(self, item: WatchedItem) -> float:
+        """
+        Provides the number of seconds to wait before the next poll of the
+        given item.
+        """
+
+        resource = item.resource
+
+        if resource.state in defaults.states.WAITING or not resource.started_at:
+            interval = self.waiting_interval
+        elif item.expected_duration:
+            elapsed = (self.get_now() - resource.started_at).total_seconds()
+
+            # Half of the remaining time: the closer to the end, the more often.
+            interval = (item.expected_duration - elapsed) / 2
+        else:
+            interval = self.interval
+
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def get_next_poll(self) -> Optional[float]:
+        """
+        Provides the time (see :py:meth:`get_time`) of the next poll.
+        """
+
+        return min((x.next_poll for x in self.__items.values()), default=None)
+
+    def __fetch_active(self, owner: str) -> Dict[Tuple[str, int], Any]:
+        """
+        Provides the active builds - and their jobs - of the given owner.
+        """
+
+        result = {}
+
+        for build in self.travis.get_active_from_login(
+            owner, provider=self.provider
+        ).iter_all():
+            result["Build", build.id] = build
+
+            for job in build.jobs or []:
+                # The jobs are not always given with their state.
+                if isinstance(job, resource_types.Job) and job.state is not None:
+                    result["Job", job.id] = job
+
+        return result
+
+    def __fetch(self, key: Tuple[str, int]) -> Any:
+        """
+        Provides the latest version of the given build or job.
+        """
+
+        if key[0] == "Build":
+            return self.travis.get_build(key[1])
+        return self.travis.get_job(key[1])
+
+    def poll(self) -> List[Transition]:
+        """
+        Refreshes the builds and jobs which are due, and provides their
+        transitions. The finished builds and jobs are not watched anymore.
+        """
+
+        now = self.get_time()
+        due = [x for x in self.__items.values() if x.next_poll <= now]
+        fresh = {}
+
+        if self.use_active:
+            owners = {x.get_owner() for x in due} - {None}
+
+            for owner in sorted(owners):
+                try:
+                    active = self.__fetch_active(owner)
+                except (
+                    exceptions.TravisCIError,
+                    requests.RequestException,
+                ) as exception:
+                    logging.debug("Active builds of %r failed: %s", owner, exception)
+                    continue
+
+                fresh.update(
+                    (x.get_key(), active[x.get_key()])
+                    for x in due
+                    if x.get_owner() == owner and x.get_key() in active
+                )
+
+        to_fetch = [x.get_key() for x in due if x.get_key() not in fresh]
+
+        if to_fetch:
+            fetched = batch.fetch_many(
+                self.__fetch, to_fetch, max_workers=self.max_workers
+            )
+
+            fresh.update((x, y) for x, y in zip(to_fetch, fetched) if y is not None)
+
+        result = []
+
+        for item in due:
+            resource = fresh.get(item.get_key())
+
+            if resource is not None:
+                previous_state = item.resource.state
+                item.resource.__dict__.update(resource.__dict__)
+
+                if resource.state != previous_state:
+                    result.append(Transition(item.resource, previous_state))
+
+                if resource.state not in defaults.states.PENDING:
+                    del self.__items[item.get_key()]
+                    continue
+
+            item.next_poll = self.get_time() + self.get_interval(item)
+
+        if self.on_transition is not None:
+            for transition in result:
+                self.on_transition(transition)
+
+        return result
+
+    def __get_delay(self, deadline: Optional[float]) -> Optional[float]:
+        """
+        Provides the number of seconds to wait before the next poll.
+
+        :return:
+            :code:`None` when there is nothing left to wait for.
+        """
+
+        next_poll = self.get_next_poll()
+
+        if next_poll is None:
+            return None
+
+        if deadline is not None:
+            if self.get_time() >= deadline:
+                return None
+
+            next_poll = min(next_poll, deadline)
+
+        return max(next_poll - self.get_time(), 0.0)
+
+    def watch(self, *, timeout: Optional[float] = None) -> Iterator[Transition]:
+        """
+        Polls the builds and jobs until they are all finished (or until the
+        given timeout), and yields their transitions.
+
+        :param timeout:
+            The maximum number of seconds to watch. :code:`None` means until
+            all builds and jobs are finished.
+        """
+
+        deadline = None if timeout is None else self.get_time() + timeout
+
+        while True:
+            delay = self.__get_delay(deadline)
+
+            if delay is None:
+                return
+
+            time.sleep(delay)
+
+            yield from self.poll()
+
+    async def watch_async(
+        self, *, timeout: Optional[float] = None
+    ) -> AsyncIterator[Transition]:
+        """
+        The asynchronous version of :py:meth:`watch`. The (blocking) polls are
+        run into the default executor of the running loop.
+
+        ::
+
+            async for transition in watcher.watch_async(timeout=3600):
+                print(transition)
+
+        :param timeout:
+            The maximum number of seconds to watch. :code:`None` means until
+            all builds and jobs are finished.
+        """
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else self.get_time() + timeout
+
+        while True:
+            delay = self.__get_delay(deadline)
+
+            if delay is None:
+                return
+
+            await asyncio.sleep(delay)
+
+            for transition in await loop.run_in_executor(None, self.poll):
+                yield transition
+
+    def wait(self, *, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Waits until all the builds and jobs are finished (or until the given
+        timeout).
+
+        :param timeout:
+            The maximum number of seconds to wait. :code:`None` means until
+            all builds and jobs are finished.
+
+        :return:
+            The builds and jobs which are still not finished.
+        """
+
+        for _ in self.watch(timeout=timeout):
+            pass
+
+        return [x.resource for x in self.__items.values()]
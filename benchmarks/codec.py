@@ -0,0 +1,100 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which benchmarks our JSON codecs against a large page of builds.
+
+::
+
+    $ python -m benchmarks.codec
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+import timeit
+
+import PyTravisCI.codec as codec
+from PyTravisCI.resource_types._all import Builds
+from PyTravisCI.standardization import SinglePassStandardization
+
+from .payloads import get_builds
+
+
+def run(*, number: int = 50) -> dict:
+    """
+    Runs the benchmark and provides the average time (in seconds) spent by
+    each available codec to decode a page of 100 builds, and to encode it
+    (:code:`to_json`).
+    """
+
+    payload = json.dumps(get_builds(100)).encode("utf-8")
+
+    standardizer = SinglePassStandardization()
+    standardizer.set_data(json.loads(payload))
+    page = Builds(**standardizer.get_standardized())
+
+    result = {"encode: to_json()": timeit.timeit(page.to_json, number=number) / number}
+
+    for name, codec_class in codec.CODECS.items():
+        if not codec_class.is_available():
+            continue
+
+        current = codec.set_codec(name)
+
+        result[f"decode: {name}"] = (
+            timeit.timeit(lambda: current.loads(payload), number=number) / number
+        )
+        if name != "stdlib":
+            current = codec.set_codec(codec_class(lossless=False))
+
+            result[f"decode: {name} (lossless=False)"] = (
+                timeit.timeit(lambda: current.loads(payload), number=number) / number
+            )
+
+        result[f"encode: to_json(compact=True) - {name}"] = (
+            timeit.timeit(lambda: page.to_json(compact=True), number=number) / number
+        )
+
+    codec.set_codec(None)
+
+    return result
+
+
+if __name__ == "__main__":
+    timings = run()
+
+    for name, timing in sorted(timings.items()):
+        print(f"{name:45} {timing * 1000:10.2f} ms / page of 100 builds")
@@ -0,0 +1,122 @@
+"""
+Just another Python API for Travis CI (API).
+
+A benchmark of the columnar export of the collections.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+import timeit
+
+from PyTravisCI.resource_types._all import Builds
+from PyTravisCI.standardization import SinglePassStandardization
+
+from .compact import get_memory
+from .payloads import get_builds
+
+
+def get_page(count: int) -> Builds:
+    """
+    Provides a (freshly standardized) page of the given number of builds.
+    """
+
+    standardizer = SinglePassStandardization()
+    standardizer.set_data(json.loads(json.dumps(get_builds(count))))
+
+    return Builds(**standardizer.get_standardized())
+
+
+def to_rows(page: Builds) -> list:
+    """
+    Flattens the default columns of the given page the way we used to: through
+    the dictionary of each build.
+    """
+
+    result = []
+
+    for build in page:
+        data = build.to_dict()
+        result.append(
+            {
+                x: (
+                    data.get(x)
+                    if "." not in x
+                    else (data.get(x.split(".")[0]) or {}).get(x.split(".")[1])
+                )
+                for x in page.__columns__
+            }
+        )
+
+    return result
+
+
+def run(*, count: int = 1000, number: int = 5) -> dict:
+    """
+    Runs the benchmark and provides the average time (in seconds) spent - and
+    the memory (in bytes) held - to flatten the default columns of a page of
+    builds through :code:`to_dict()` and through :code:`to_columns()`.
+    """
+
+    result = {}
+
+    for name, func in (
+        ("to_dict() rows", to_rows),
+        ("to_columns()", lambda x: x.to_columns()),
+    ):
+        result[f"time: {name}"] = (
+            timeit.timeit(
+                "func(page)",
+                setup="page = get_page(count)",
+                globals={"func": func, "get_page": get_page, "count": count},
+                number=number,
+            )
+            / number
+        )
+        page = get_page(count)
+        result[f"memory: {name}"] = get_memory(lambda: func(page))
+
+    return result
+
+
+if __name__ == "__main__":
+    results = run()
+
+    for name, value in results.items():
+        if name.startswith("time"):
+            print(f"{name:30} {value * 1000:10.2f} ms / 1000 builds")
+        else:
+            print(f"{name:30} {value:10.0f} bytes / 1000 builds")
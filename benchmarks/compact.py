@@ -0,0 +1,120 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which benchmarks the memory held by our resource types and by their
+compact version.
+
+::
+
+    $ python -m benchmarks.compact
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import gc
+import json
+import tracemalloc
+
+from PyTravisCI.resource_types._all import Builds
+from PyTravisCI.standardization import SinglePassStandardization
+
+from .hydration import hydrate_all
+from .payloads import get_builds
+
+
+def get_builds_objects(count: int, jobs_per_build: int) -> list:
+    """
+    Provides the given number of (completely created) builds.
+    """
+
+    standardizer = SinglePassStandardization()
+    standardizer.set_data(
+        json.loads(json.dumps(get_builds(count, jobs_per_build=jobs_per_build)))
+    )
+
+    return list(hydrate_all(Builds(**standardizer.get_standardized())))
+
+
+def get_memory(func) -> int:
+    """
+    Provides the memory (in bytes) held by what the given function gives back.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = func()  # pylint: disable=unused-variable
+        gc.collect()
+
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run(*, count: int = 2000) -> dict:
+    """
+    Runs the benchmark and provides the memory (in bytes) held per build - with
+    and without embedded jobs - by the resource types and their compact
+    version.
+    """
+
+    result = {}
+
+    for jobs_per_build in (0, 5):
+        name = f"{jobs_per_build} jobs/build"
+
+        result[f"resource types ({name})"] = (
+            get_memory(lambda: get_builds_objects(count, jobs_per_build)) / count
+        )
+        result[f"compact ({name})"] = (
+            get_memory(
+                lambda: [
+                    x.to_compact() for x in get_builds_objects(count, jobs_per_build)
+                ]
+            )
+            / count
+        )
+
+    return result
+
+
+if __name__ == "__main__":
+    sizes = run()
+
+    for name, size in sizes.items():
+        print(f"{name:40} {size:10.0f} bytes / build")
@@ -0,0 +1,172 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which benchmarks the construction of the endpoints of all our
+communicators.
+
+::
+
+    $ python -m benchmarks.endpoint_dispatch
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import copy
+import inspect
+import re
+import timeit
+import urllib.parse as urllib_parse
+from unittest.mock import patch
+
+import PyTravisCI.communicator._all as communicators
+from PyTravisCI.communicator.base import CommunicatorBase
+from PyTravisCI.requester import Requester
+
+
+class Captured(Exception):
+    """
+    Raised (instead of sending anything) once the endpoint is constructed.
+    """
+
+
+def get_method_name() -> str:
+    """
+    The historical way of providing the name of the method: the name of the
+    caller of our caller.
+    """
+
+    return inspect.getouterframes(inspect.currentframe(), 2)[2][3]
+
+
+def get_and_construct_endpoint_legacy(self, kwargs: dict) -> str:
+    """
+    The historical implementation: the name of the method is read from
+    the stack.
+    """
+
+    if "parameters" in kwargs and kwargs["parameters"]:
+        params = urllib_parse.urlencode(copy.deepcopy(kwargs["parameters"]))
+
+        del kwargs["parameters"]
+
+        if params:
+            return self.endpoints[get_method_name()] % kwargs + f"?{params}"
+    return self.endpoints[get_method_name()] % kwargs
+
+
+def capture(self, endpoint: str, data: dict = None, **kwargs) -> dict:
+    """
+    Replaces the methods which would send the request.
+    """
+
+    # pylint: disable=unused-argument
+    raise Captured(endpoint)
+
+
+def get_calls() -> list:
+    """
+    Provides a call of each method of each communicator.
+    """
+
+    requester = Requester()
+    result = []
+
+    for name in dir(communicators):
+        communicator = getattr(communicators, name)
+
+        if not isinstance(communicator, type):
+            continue
+
+        for method_name, template in communicator.endpoints.items():
+            kwargs = {x: "1" for x in re.findall(r"%\((\w+)\)s", template)}
+            kwargs["parameters"] = {"limit": 10}
+
+            result.append(
+                (getattr(communicator(requester), method_name), kwargs, template)
+            )
+
+    return result
+
+
+def run(*, number: int = 200) -> dict:
+    """
+    Runs the benchmark and provides the average time (in seconds) spent to
+    call every method of every communicator - up to the construction of its
+    endpoint.
+    """
+
+    calls = get_calls()
+    result = {}
+
+    def call_all():
+        for method, kwargs, _ in calls:
+            try:
+                method(**kwargs)
+            except Captured:
+                pass
+
+    with patch.multiple(
+        CommunicatorBase,
+        get_response=capture,
+        post_response=capture,
+        patch_response=capture,
+        delete_response=capture,
+    ), patch.object(Requester, "get_raw", capture):
+        for name, implementation in (
+            ("inspect (legacy)", get_and_construct_endpoint_legacy),
+            ("bound template", CommunicatorBase.get_and_construct_endpoint),
+        ):
+            with patch.object(
+                CommunicatorBase, "get_and_construct_endpoint", implementation
+            ):
+                result[name] = timeit.timeit(call_all, number=number) / number
+
+    result["calls"] = len(calls)
+
+    return result
+
+
+if __name__ == "__main__":
+    timings = run()
+    calls = timings.pop("calls")
+
+    for name, timing in timings.items():
+        print(f"{name:30} {timing * 1000:10.2f} ms / {calls} calls")
+
+    print(
+        f"{'Speedup':30} "
+        f"{timings['inspect (legacy)'] / timings['bound template']:10.2f}x"
+    )
@@ -0,0 +1,200 @@
+"""
+Just another Python API for Travis CI (API).
+
+A benchmark of the encryption of (large) files.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import io
+import multiprocessing
+import os
+import resource
+import tempfile
+import timeit
+import tracemalloc
+
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from PyTravisCI.encryption.file import FileEncryption
+
+
+def encrypt_read(encryptor: FileEncryption, path: str) -> bytes:
+    """
+    Encrypts the given file the way we used to: by reading it, padding it
+    and encrypting it - as a whole.
+    """
+
+    with open(path, "rb") as file_stream:
+        content = file_stream.read()
+
+    pad = padding.PKCS7(encryptor.AES_BLOCK_SIZE).padder()
+    padded_content = pad.update(content) + pad.finalize()
+
+    cipher = Cipher(algorithms.AES(encryptor.key), modes.CBC(encryptor.iv))
+    cipher_encryptor = cipher.encryptor()
+
+    return cipher_encryptor.update(padded_content) + cipher_encryptor.finalize()
+
+
+def encrypt_content(encryptor: FileEncryption, path: str) -> bytes:
+    """
+    Encrypts the given file by reading it and giving it to
+    :code:`encrypt_file_content()`.
+    """
+
+    with open(path, "rb") as file_stream:
+        return encryptor.encrypt_file_content(file_stream.read())
+
+
+def encrypt_stream(encryptor: FileEncryption, path: str) -> None:
+    """
+    Encrypts the given file through :code:`encrypt_file()`.
+    """
+
+    with open(path, "rb") as file_stream, open(os.devnull, "wb") as output:
+        encryptor.encrypt_file(file_stream, output)
+
+
+def encrypt_mapped(encryptor: FileEncryption, path: str) -> None:
+    """
+    Encrypts the given file through :code:`encrypt_path()`.
+    """
+
+    with open(os.devnull, "wb") as output:
+        encryptor.encrypt_path(path, output)
+
+
+def get_peak_memory(func) -> int:
+    """
+    Provides the peak of memory (in bytes) allocated while running the given
+    function.
+    """
+
+    tracemalloc.start()
+
+    try:
+        func()
+
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def get_rss_growth(func, encryptor: FileEncryption, path: str) -> int:
+    """
+    Provides the growth of the peak resident set size (in bytes) of a fresh
+    process while running the given function - which includes the pages of
+    the mapped file.
+    """
+
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(_rss_growth, (func, encryptor.key, encryptor.iv, path))
+
+
+def _rss_growth(func, key: bytes, iv: bytes, path: str) -> int:
+    """
+    Runs the given function and provides the growth of the peak resident set
+    size (in bytes) of the current process.
+    """
+
+    encryptor = FileEncryption()
+    encryptor.set_key(key)
+    encryptor.set_iv(iv)
+
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    func(encryptor, path)
+
+    # Linux provides kilobytes.
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before) * 1024
+
+
+def run(*, size: int = 64 * 1024 * 1024, number: int = 3) -> dict:
+    """
+    Runs the benchmark and provides the throughput (in bytes per second) - and
+    the peak of memory (in bytes) allocated and resident - of the encryption
+    of a file of the given size.
+    """
+
+    result = {}
+
+    encryptor = FileEncryption()
+    encryptor.generate_key()
+    encryptor.generate_iv()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "plain")
+
+        with open(path, "wb") as file_stream:
+            chunk = os.urandom(io.DEFAULT_BUFFER_SIZE)
+
+            for _ in range(size // len(chunk)):
+                file_stream.write(chunk)
+
+        variants = (
+            ("read() + whole", encrypt_read),
+            ("encrypt_file_content()", encrypt_content),
+            ("encrypt_file()", encrypt_stream),
+            ("encrypt_path()", encrypt_mapped),
+        )
+
+        # The children inherit the peak resident set size of their parent, so
+        # we measure it before running anything here.
+        for name, func in variants:
+            result[f"rss: {name}"] = get_rss_growth(func, encryptor, path)
+
+        for name, func in variants:
+            result[f"throughput: {name}"] = size / (
+                timeit.timeit(lambda f=func: f(encryptor, path), number=number) / number
+            )
+            result[f"memory: {name}"] = get_peak_memory(
+                lambda f=func: f(encryptor, path)
+            )
+
+    return result
+
+
+if __name__ == "__main__":
+    results = run()
+
+    for name, value in results.items():
+        if name.startswith("throughput"):
+            print(f"{name:35} {value / 1024 / 1024:10.2f} MiB/s")
+        elif name.startswith("memory"):
+            print(f"{name:35} {value / 1024 / 1024:10.2f} MiB (peak allocated)")
+        else:
+            print(f"{name:35} {value / 1024 / 1024:10.2f} MiB (peak RSS growth)")
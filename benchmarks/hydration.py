@@ -0,0 +1,160 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which benchmarks the (lazy) creation of the nested resource types
+of a page of builds.
+
+::
+
+    $ python -m benchmarks.hydration
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+import timeit
+import tracemalloc
+from typing import Any
+
+from PyTravisCI.resource_types._all import Builds
+from PyTravisCI.resource_types.base import ResourceTypesBase
+from PyTravisCI.standardization import SinglePassStandardization
+
+from .payloads import get_builds
+
+
+def hydrate_all(resource: Any) -> Any:
+    """
+    Creates every nested resource type of the given one - like it was done
+    before they were created lazily.
+    """
+
+    if isinstance(resource, list):
+        for item in resource:
+            hydrate_all(item)
+    elif isinstance(resource, ResourceTypesBase):
+        for name in resource.__nested__:
+            hydrate_all(getattr(resource, name))
+
+    return resource
+
+
+def parse(payload: str) -> dict:
+    """
+    Reads and standardizes the given payload.
+    """
+
+    standardizer = SinglePassStandardization()
+    standardizer.set_data(json.loads(payload))
+
+    return standardizer.get_standardized()
+
+
+def read(payload: str) -> Builds:
+    """
+    Creates the page and reads what we usually read.
+    """
+
+    page = Builds(**parse(payload))
+
+    for build in page:
+        _ = (build.id, build.state, build.finished_at)
+
+    return page
+
+
+def read_hydrated(payload: str) -> Builds:
+    """
+    Creates the page with all its nested resource types and reads what we
+    usually read.
+    """
+
+    page = hydrate_all(Builds(**parse(payload)))
+
+    for build in page:
+        _ = (build.id, build.state, build.finished_at)
+
+    return page
+
+
+def get_memory(func, payload: str) -> int:
+    """
+    Provides the memory (in bytes) held by what the given function creates.
+    """
+
+    tracemalloc.start()
+
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = func(payload)  # pylint: disable=unused-variable
+
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run(*, number: int = 20) -> dict:
+    """
+    Runs the benchmark and provides, for a page of 100 builds, the average
+    time (in seconds) and the memory (in bytes) spent to read the JSON, and to
+    create the page (with and without creating the nested resource types).
+    """
+
+    payload = json.dumps(get_builds(100))
+    result = {}
+
+    for name, func in (
+        ("JSON only", parse),
+        ("lazy", lambda x: Builds(**parse(x))),
+        ("lazy + read", read),
+        ("hydrated + read", read_hydrated),
+    ):
+        result[name] = (
+            timeit.timeit(lambda: func(payload), number=number) / number,
+            get_memory(func, payload),
+        )
+
+    return result
+
+
+if __name__ == "__main__":
+    timings = run()
+
+    for name, (timing, memory) in timings.items():
+        print(
+            f"{name:30} {timing * 1000:10.2f} ms {memory / 1024:10.0f} KiB "
+            "/ page of 100 builds"
+        )
@@ -0,0 +1,110 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which benchmarks the walk through all the pages of a collection.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+import time
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from PyTravisCI.requester import Requester
+from PyTravisCI.travis_ci import TravisCI
+
+from .payloads import get_builds
+
+
+def run(
+    *, total: int = 1000, limit: int = 50, latency: float = 0.05, prefetch: int = 4
+) -> dict:
+    """
+    Runs the benchmark and provides the time (in seconds) spent to walk
+    through all pages - one after another and with prefetching.
+
+    :param latency:
+        The (simulated) latency of the API.
+    """
+
+    payloads = {
+        x: json.dumps(get_builds(limit, jobs_per_build=1, offset=x, total=total))
+        for x in range(0, total, limit)
+    }
+
+    def fake_send_with_retry(requester, verb, url, **kwargs):
+        # pylint: disable=unused-argument
+        time.sleep(latency)
+
+        offset = int(parse_qs(urlparse(url).query).get("offset", ["0"])[0])
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = payloads[
+            offset
+        ].encode()  # pylint: disable=protected-access
+
+        return response
+
+    result = {}
+
+    with patch.object(Requester, "send_with_retry", fake_send_with_retry):
+        travis = TravisCI(access_point="https://example.org/api")
+
+        for name, value in (("sequential", 0), (f"prefetch={prefetch}", prefetch)):
+            start = time.perf_counter()
+
+            walked = sum(
+                1 for _ in travis.iter_builds(params={"limit": limit}, prefetch=value)
+            )
+
+            result[name] = time.perf_counter() - start
+
+            assert walked == total
+
+    return result
+
+
+if __name__ == "__main__":
+    timings = run()
+
+    for name, timing in timings.items():
+        print(f"{name:30} {timing:10.2f} s / 1000 builds (50ms latency)")
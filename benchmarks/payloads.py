@@ -0,0 +1,239 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the (synthetic) API responses our benchmarks work with.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import copy
+from datetime import datetime, timedelta
+from typing import Optional
+
+DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def get_user(user_id: int) -> dict:
+    """
+    Provides a minimal user as embedded by the API.
+    """
+
+    return {
+        "@type": "user",
+        "@href": f"/user/{user_id}",
+        "@representation": "minimal",
+        "id": user_id,
+        "login": f"user-{user_id}",
+    }
+
+
+def get_job(job_id: int, build_id: int, started_at: datetime) -> dict:
+    """
+    Provides a job as embedded in a build.
+    """
+
+    return {
+        "@type": "job",
+        "@href": f"/job/{job_id}",
+        "@representation": "standard",
+        "@permissions": {"read": True, "cancel": False, "restart": False},
+        "id": job_id,
+        "allow_failure": False,
+        "number": f"{build_id}.{job_id % 10}",
+        "state": "passed",
+        "started_at": started_at.strftime(DATE_FORMAT),
+        "finished_at": (started_at + timedelta(minutes=5)).strftime(DATE_FORMAT),
+        "build": {
+            "@type": "build",
+            "@href": f"/build/{build_id}",
+            "@representation": "minimal",
+            "id": build_id,
+        },
+        "queue": "builds.gce",
+        "repository": {
+            "@type": "repository",
+            "@href": "/repo/891",
+            "@representation": "minimal",
+            "id": 891,
+            "name": "hello",
+            "slug": "world/hello",
+        },
+        "commit": {
+            "@type": "commit",
+            "@representation": "minimal",
+            "id": build_id * 10,
+            "sha": "a" * 40,
+        },
+        "owner": get_user(1),
+        "stage": None,
+        "created_at": started_at.strftime(DATE_FORMAT),
+        "updated_at": started_at.strftime(DATE_FORMAT),
+    }
+
+
+def get_build(build_id: int, *, jobs_per_build: int = 5) -> dict:
+    """
+    Provides a build as given by the :code:`/builds` endpoint.
+    """
+
+    started_at = datetime(2020, 10, 15, 20, 30) + timedelta(minutes=build_id)
+
+    return {
+        "@type": "build",
+        "@href": f"/build/{build_id}",
+        "@representation": "standard",
+        "@permissions": {"read": True, "cancel": False, "restart": True},
+        "id": build_id,
+        "number": str(build_id),
+        "state": "passed",
+        "duration": 300,
+        "event_type": "push",
+        "previous_state": "passed",
+        "pull_request_title": None,
+        "pull_request_number": None,
+        "started_at": started_at.strftime(DATE_FORMAT),
+        "finished_at": (started_at + timedelta(minutes=5)).strftime(DATE_FORMAT),
+        "private": False,
+        "repository": {
+            "@type": "repository",
+            "@href": "/repo/891",
+            "@representation": "minimal",
+            "id": 891,
+            "name": "hello",
+            "slug": "world/hello",
+        },
+        "branch": {
+            "@type": "branch",
+            "@href": "/repo/891/branch/master",
+            "@representation": "minimal",
+            "name": "master",
+        },
+        "tag": None,
+        "commit": {
+            "@type": "commit",
+            "@representation": "minimal",
+            "id": build_id * 10,
+            "sha": "a" * 40,
+            "ref": "refs/heads/master",
+            "message": "Hello, World!",
+            "compare_url": "https://github.com/world/hello/compare/a...b",
+            "committed_at": started_at.strftime(DATE_FORMAT),
+        },
+        "jobs": [
+            get_job(build_id * 100 + x, build_id, started_at)
+            for x in range(jobs_per_build)
+        ],
+        "stages": [
+            {
+                "@type": "stage",
+                "@representation": "minimal",
+                "id": build_id * 10 + x,
+                "number": x,
+                "name": f"Stage {x}",
+                "state": "passed",
+                "started_at": started_at.strftime(DATE_FORMAT),
+                "finished_at": None,
+            }
+            for x in range(2)
+        ],
+        "created_by": get_user(1),
+        "updated_at": started_at.strftime(DATE_FORMAT),
+    }
+
+
+def get_builds(
+    count: int = 100,
+    *,
+    jobs_per_build: int = 5,
+    offset: int = 0,
+    total: Optional[int] = None,
+) -> dict:
+    """
+    Provides a page of builds as given by the :code:`/builds` endpoint.
+
+    :param count:
+        The number of builds in the page.
+    :param jobs_per_build:
+        The number of jobs to embed into each build.
+    :param offset:
+        The offset of the page.
+    :param total:
+        The total number of builds. Defaults to :code:`count`.
+    """
+
+    if total is None:
+        total = count
+
+    is_last = offset + count >= total
+
+    return copy.deepcopy(
+        {
+            "@type": "builds",
+            "@href": f"/builds?limit={count}&offset={offset}",
+            "@representation": "standard",
+            "@pagination": {
+                "limit": count,
+                "offset": offset,
+                "count": total,
+                "is_first": offset == 0,
+                "is_last": is_last,
+                "next": (
+                    None
+                    if is_last
+                    else {
+                        "@href": f"/builds?limit={count}&offset={offset + count}",
+                        "offset": offset + count,
+                        "limit": count,
+                    }
+                ),
+                "prev": None,
+                "first": {
+                    "@href": f"/builds?limit={count}",
+                    "offset": 0,
+                    "limit": count,
+                },
+                "last": {
+                    "@href": f"/builds?limit={count}&offset={max(total - count, 0)}",
+                    "offset": max(total - count, 0),
+                    "limit": count,
+                },
+            },
+            "builds": [
+                get_build(total - offset - x, jobs_per_build=jobs_per_build)
+                for x in range(min(count, total - offset))
+            ],
+        }
+    )
@@ -0,0 +1,119 @@
+"""
+Just another Python API for Travis CI (API).
+
+A benchmark of the encryption of many secrets.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import base64
+import os
+import timeit
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from PyTravisCI.encryption.bulk import encrypt_many
+from PyTravisCI.encryption.data import DataEncryption
+
+
+def get_public_keys(count: int) -> list:
+    """
+    Provides the given number of (PEM) public keys - like the ones Travis CI
+    gives us.
+    """
+
+    return [
+        rsa.generate_private_key(
+            backend=default_backend(), public_exponent=65537, key_size=4096
+        )
+        .public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.PKCS1)
+        for _ in range(count)
+    ]
+
+
+def encrypt_one_by_one(jobs: list) -> list:
+    """
+    Encrypts the given secrets the way we used to: one call - thus one load of
+    the public key - per secret.
+    """
+
+    return [
+        [
+            base64.b64encode(
+                DataEncryption(public_key=public_key).encrypt_data(x)
+            ).decode("ascii")
+            for x in secrets
+        ]
+        for public_key, secrets in jobs
+    ]
+
+
+def run(*, repositories: int = 10, secrets: int = 200, number: int = 3) -> dict:
+    """
+    Runs the benchmark and provides the time (in seconds) spent to encrypt the
+    given number of secrets for the given number of repositories.
+
+    The fetching of the public keys is not part of it.
+    """
+
+    jobs = [
+        (x, [f"SECRET_{y}=value-{y}" for y in range(secrets)])
+        for x in get_public_keys(repositories)
+    ]
+
+    result = {}
+
+    for name, func in (
+        ("one by one", encrypt_one_by_one),
+        ("encrypt_many() 1 process", lambda x: encrypt_many(x, max_workers=1)),
+        (
+            f"encrypt_many() {os.cpu_count()} processes",
+            lambda x: encrypt_many(x, max_workers=os.cpu_count()),
+        ),
+    ):
+        result[name] = timeit.timeit(lambda f=func: f(jobs), number=number) / number
+
+    return result
+
+
+if __name__ == "__main__":
+    results = run()
+
+    for name, value in results.items():
+        print(f"{name:35} {value * 1000:10.2f} ms / 2000 secrets")
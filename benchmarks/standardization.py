@@ -0,0 +1,85 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which benchmarks our standardizers against a large list of builds.
+
+::
+
+    $ python -m benchmarks.standardization
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import timeit
+
+from PyTravisCI.standardization import SinglePassStandardization, Standardization
+
+from .payloads import get_builds
+
+
+def run(*, number: int = 10) -> dict:
+    """
+    Runs the benchmark and provides the average time (in seconds) spent by
+    each standardizer to standardize a page of 100 builds.
+    """
+
+    payload = get_builds(100)
+    result = {}
+
+    for standardizer in (Standardization, SinglePassStandardization):
+        instance = standardizer(payload)
+
+        assert (
+            instance.get_standardized() == Standardization(payload).get_standardized()
+        )
+
+        result[standardizer.__name__] = (
+            timeit.timeit(instance.get_standardized, number=number) / number
+        )
+
+    return result
+
+
+if __name__ == "__main__":
+    timings = run()
+
+    for name, timing in timings.items():
+        print(f"{name:30} {timing * 1000:10.2f} ms / page of 100 builds")
+
+    print(
+        f"{'Speedup':30} "
+        f"{timings['Standardization'] / timings['SinglePassStandardization']:10.2f}x"
+    )
@@ -90,6 +90,11 @@ if __name__ == "__main__":
         version=get_version(),
         python_requires=">=3.6, <4",
         install_requires=get_requirements(),
+        extras_require={
+            "async": ["aiohttp"],
+            "orjson": ["orjson"],
+            "arrow": ["pyarrow"],
+        },
         description="Just another Python API for Travis CI (API).",
         long_description=get_long_description(),
         author="funilrys",
@@ -97,7 +102,9 @@ if __name__ == "__main__":
         license="MIT",
         url="https://github.com/funilrys/PyTravisCI",
         platforms=["any"],
-        packages=find_packages(exclude=("*.tests", "*.tests.*", "tests.*", "tests")),
+        packages=find_packages(
+            exclude=("*.tests", "*.tests.*", "tests.*", "tests", "benchmarks*")
+        ),
         keywords=["Travis CI", "Travis", "CI", "API"],
         classifiers=[
             "Environment :: Console",
@@ -0,0 +1,455 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our asynchronous gateway.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import asyncio
+import json
+import threading
+from unittest import TestCase, skipIf
+from unittest import main as launch_tests
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from PyTravisCI.exceptions import TravisCIError
+from PyTravisCI.response_cache import MemoryResponseCache
+from PyTravisCI.retry import RetryPolicy
+
+try:
+    import aiohttp
+
+    from PyTravisCI.async_requester import AsyncRequester
+    from PyTravisCI.async_travis_ci import AsyncTravisCI
+except ImportError:  # pragma: no cover
+    AsyncTravisCI = None
+
+
+def get_fake_response(url: str, data: dict, status_code: int = 200):
+    """
+    Provides a fake response of the API.
+    """
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+    response.encoding = "utf-8"
+    response._content = json.dumps(data).encode()  # pylint: disable=protected-access
+
+    return response
+
+
+def get_build(build_id: int) -> dict:
+    """
+    Provides a build as given by the API.
+    """
+
+    return {
+        "@type": "build",
+        "@href": f"/build/{build_id}",
+        "@representation": "standard",
+        "id": build_id,
+        "state": "started",
+        "started_at": "2020-10-15T20:30:00Z",
+        "jobs": [{"@type": "job", "@representation": "minimal", "id": build_id * 10}],
+    }
+
+
+def get_builds(offset: int) -> dict:
+    """
+    Provides a page of builds as given by the API.
+    """
+
+    return {
+        "@type": "builds",
+        "@href": f"/builds?limit=2&offset={offset}",
+        "@pagination": {
+            "next": (
+                None
+                if offset
+                else {"@href": "/builds?limit=2&offset=2", "offset": 2, "limit": 2}
+            )
+        },
+        "builds": [get_build(offset + 1), get_build(offset + 2)],
+    }
+
+
+@skipIf(AsyncTravisCI is None, "aiohttp is not installed.")
+class TestAsyncTravisCI(TestCase):
+    """
+    Provides the tests of the asynchronous gateway.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.sent_requests = []
+
+        async def fake_send_once(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            self.sent_requests.append((verb.upper(), url))
+
+            await asyncio.sleep(0)
+
+            endpoint = url[len("https://example.org/api") :]
+
+            if endpoint.startswith("/builds"):
+                offset = parse_qs(urlparse(url).query).get("offset", ["0"])[0]
+                return get_fake_response(url, get_builds(int(offset)))
+
+            if endpoint.startswith("/build/"):
+                return get_fake_response(url, get_build(int(endpoint.split("/")[2])))
+
+            return get_fake_response(
+                url,
+                {
+                    "@type": "error",
+                    "error_type": "not_found",
+                    "error_message": "not found",
+                },
+                404,
+            )
+
+        self.send_patcher = patch.object(AsyncRequester, "send_once", fake_send_once)
+        self.send_patcher.start()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.send_patcher.stop()
+
+    @staticmethod
+    def get_travis() -> "AsyncTravisCI":
+        """
+        Provides the gateway to test.
+        """
+
+        return AsyncTravisCI(access_point="https://example.org/api")
+
+    def test_get_build(self) -> None:
+        """
+        Tests that a resource type is given back.
+        """
+
+        async def run():
+            async with self.get_travis() as travis:
+                return await travis.get_build(3)
+
+        build = asyncio.run(run())
+
+        self.assertEqual(3, build.id)
+        self.assertEqual(30, build.jobs[0].id)
+        self.assertEqual(
+            [("GET", "https://example.org/api/build/3")], self.sent_requests
+        )
+
+    def test_concurrent_calls(self) -> None:
+        """
+        Tests that concurrent calls are all answered with their own response.
+        """
+
+        async def run():
+            async with self.get_travis() as travis:
+                return await asyncio.gather(*(travis.get_build(x) for x in range(1, 6)))
+
+        builds = asyncio.run(run())
+
+        self.assertEqual([1, 2, 3, 4, 5], [x.id for x in builds])
+        self.assertEqual(5, len(self.sent_requests))
+
+    def test_resource_methods(self) -> None:
+        """
+        Tests that the methods of the resource types can be awaited.
+        """
+
+        async def run():
+            async with self.get_travis() as travis:
+                builds = await travis.get_builds(params={"limit": 2})
+                next_builds = await travis.next_page(builds)
+                build = await travis.sync(next_builds.builds[0])
+
+                return builds, next_builds, build
+
+        builds, next_builds, build = asyncio.run(run())
+
+        self.assertEqual([1, 2], [x.id for x in builds])
+        self.assertEqual([3, 4], [x.id for x in next_builds])
+        self.assertEqual(3, build.id)
+        self.assertEqual(
+            [
+                ("GET", "https://example.org/api/builds?limit=2"),
+                ("GET", "https://example.org/api/builds?limit=2&offset=2"),
+                ("GET", "https://example.org/api/build/3"),
+            ],
+            self.sent_requests,
+        )
+
+    def test_iter_all(self) -> None:
+        """
+        Tests that the pages of a collection can be walked asynchronously.
+        """
+
+        async def run():
+            async with self.get_travis() as travis:
+                builds = await travis.get_builds(params={"limit": 2})
+
+                return [x.id async for x in travis.iter_all(builds, max_items=3)]
+
+        self.assertEqual([1, 2, 3], asyncio.run(run()))
+        self.assertEqual(2, len(self.sent_requests))
+
+    def test_response_cache(self) -> None:
+        """
+        Tests that the response cache is used by the driven methods.
+        """
+
+        cache = MemoryResponseCache(ttls={"Build": 60})
+
+        async def run():
+            async with AsyncTravisCI(
+                access_point="https://example.org/api", response_cache=cache
+            ) as travis:
+                first = await travis.get_build(1)
+
+                cache.clear()
+
+                def sync_twice():
+                    return first.sync(), first.get_jobs(), first.sync()
+
+                second, _, third = await travis.call(sync_twice)
+
+                return first, second, third
+
+        first, second, third = asyncio.run(run())
+
+        self.assertEqual(first, second)
+        self.assertEqual(second, third)
+        self.assertEqual(3, len(self.sent_requests))
+        self.assertEqual(2, cache.get_statistics()["stores"])
+
+    def test_error(self) -> None:
+        """
+        Tests that the errors of the API are raised as usual.
+        """
+
+        async def run():
+            async with self.get_travis() as travis:
+                return await travis.get_job(3)
+
+        self.assertRaises(TravisCIError, lambda: asyncio.run(run()))
+
+    @patch("asyncio.sleep")
+    def test_retry(self, mock_sleep) -> None:
+        """
+        Tests that the transient errors are retried.
+        """
+
+        responses = [
+            get_fake_response("https://example.org/api/build/3", {}, 502),
+            get_fake_response("https://example.org/api/build/3", get_build(3)),
+        ]
+
+        async def fake_send_once(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            return responses.pop(0)
+
+        async def fake_sleep(seconds):
+            # pylint: disable=unused-argument
+            return None
+
+        mock_sleep.side_effect = fake_sleep
+
+        async def run():
+            async with AsyncTravisCI(
+                access_point="https://example.org/api",
+                retry_policy=RetryPolicy(max_attempts=2),
+            ) as travis:
+                return await travis.get_build(3)
+
+        with patch.object(AsyncRequester, "send_once", fake_send_once):
+            build = asyncio.run(run())
+
+        self.assertEqual(3, build.id)
+        self.assertEqual(1, mock_sleep.call_count)
+
+    def test_non_deterministic_call(self) -> None:
+        """
+        Tests that the called method is run once - outside of the event loop -
+        even if it does not send the same requests on each run.
+        """
+
+        build_ids = [1, 2]
+        threads = []
+
+        async def run():
+            async with self.get_travis() as travis:
+                build = await travis.get_build(1)
+
+                def non_deterministic():
+                    threads.append(threading.get_ident())
+
+                    build.sync()
+                    return build.get_jobs(params={"id": build_ids.pop(0)})
+
+                await travis.call(non_deterministic)
+
+                return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+
+        self.assertEqual([2], build_ids)
+        self.assertEqual(1, len(threads))
+        self.assertNotEqual(loop_thread, threads[0])
+        self.assertEqual(
+            [
+                ("GET", "https://example.org/api/build/1"),
+                ("GET", "https://example.org/api/build/1"),
+                ("GET", "https://example.org/api/build/1/jobs?id=1"),
+            ],
+            self.sent_requests,
+        )
+
+
+@skipIf(AsyncTravisCI is None, "aiohttp is not installed.")
+class TestAsyncRequester(TestCase):
+    """
+    Provides the tests of the asynchronous requester.
+    """
+
+    def test_get_client_kwargs(self) -> None:
+        """
+        Tests the conversion of the arguments of requests into the ones of
+        aiohttp.
+        """
+
+        actual = AsyncRequester.get_client_kwargs(
+            {
+                "timeout": 5,
+                "params": {"limit": 2, "offset": None, "id": [1, None, 3]},
+                "verify": False,
+                "data": "hello",
+            }
+        )
+
+        self.assertEqual(
+            aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=5),
+            actual["timeout"],
+        )
+        self.assertEqual([("limit", "2"), ("id", "1"), ("id", "3")], actual["params"])
+        self.assertIs(False, actual["ssl"])
+        self.assertEqual("hello", actual["data"])
+        self.assertNotIn("verify", actual)
+
+        actual = AsyncRequester.get_client_kwargs(
+            {"timeout": (1, 10), "params": "a=b", "verify": True}
+        )
+
+        self.assertEqual(
+            aiohttp.ClientTimeout(total=None, sock_connect=1, sock_read=10),
+            actual["timeout"],
+        )
+        self.assertEqual("a=b", actual["params"])
+        self.assertEqual({"timeout", "params"}, set(actual))
+
+        self.assertEqual({}, AsyncRequester.get_client_kwargs({}))
+
+    @patch("asyncio.sleep")
+    def test_send_errors(self, mock_sleep) -> None:
+        """
+        Tests that the errors of aiohttp are raised as the ones of requests -
+        once retried.
+        """
+
+        async def fake_sleep(seconds):
+            # pylint: disable=unused-argument
+            return None
+
+        mock_sleep.side_effect = fake_sleep
+        attempts = []
+
+        class FakeSession:
+            """
+            A session which never reaches the API.
+            """
+
+            closed = False
+
+            def __init__(self, exception: Exception) -> None:
+                self.exception = exception
+
+            def request(self, *args, **kwargs):
+                # pylint: disable=unused-argument
+                attempts.append(kwargs)
+                raise self.exception
+
+            async def close(self):
+                self.closed = True
+
+        requester = AsyncRequester(retry_policy=RetryPolicy(max_attempts=2))
+
+        for exception, expected in (
+            (asyncio.TimeoutError(), requests.exceptions.Timeout),
+            (aiohttp.ServerDisconnectedError(), requests.exceptions.ConnectionError),
+            (aiohttp.ClientPayloadError("oops"), requests.exceptions.RequestException),
+        ):
+            attempts.clear()
+            requester.client_session = FakeSession(exception)
+
+            with self.assertRaises(expected) as context:
+                asyncio.run(
+                    requester.fetch("get", "https://example.org/api", timeout=3)
+                )
+
+            self.assertIs(exception, context.exception.__cause__)
+            self.assertEqual(
+                1 if expected is requests.exceptions.RequestException else 2,
+                len(attempts),
+            )
+            self.assertIsInstance(attempts[0]["timeout"], aiohttp.ClientTimeout)
+
+
+if __name__ == "__main__":
+    launch_tests()
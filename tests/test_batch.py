@@ -0,0 +1,272 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our batch tools.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+import threading
+import time
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import MagicMock, patch
+
+from PyTravisCI.batch import BatchResult, fetch_many
+from PyTravisCI.exceptions import TravisCIError
+from PyTravisCI.requester import Requester
+from PyTravisCI.travis_ci import TravisCI
+
+
+class TestBatchResult(TestCase):
+    """
+    Provides the tests of the batch result.
+    """
+
+    def test_accessors(self) -> None:
+        """
+        Tests the accessors of the result.
+        """
+
+        error = ValueError("hello")
+
+        result = BatchResult(["a", "b", "c"])
+        result.results = [1, None, 3]
+        result.errors = {1: error}
+
+        self.assertEqual(3, len(result))
+        self.assertEqual([1, None, 3], list(result))
+        self.assertEqual(3, result[2])
+        self.assertTrue(result.has_errors())
+        self.assertEqual([("b", error)], result.get_errors())
+        self.assertEqual([1, 3], result.get_successful())
+
+    def test_no_errors(self) -> None:
+        """
+        Tests the accessors of the result for the case that nothing failed.
+        """
+
+        result = BatchResult([])
+
+        self.assertFalse(result.has_errors())
+        self.assertEqual([], result.get_errors())
+        self.assertEqual([], result.get_successful())
+
+
+class TestFetchMany(TestCase):
+    """
+    Provides the tests of the function which fetches many keys at once.
+    """
+
+    def test_order(self) -> None:
+        """
+        Tests that the results are given back in the order of the keys - even
+        if they don't complete in that order.
+        """
+
+        def func(key):
+            time.sleep(0.01 * (5 - key))
+            return key * 10
+
+        result = fetch_many(func, [1, 2, 3, 4], max_workers=4)
+
+        self.assertEqual([10, 20, 30, 40], result.results)
+        self.assertFalse(result.has_errors())
+
+    def test_errors_collected(self) -> None:
+        """
+        Tests that a failed lookup does not abort the others.
+        """
+
+        def func(key):
+            if key % 2:
+                raise ValueError(key)
+            return key
+
+        result = fetch_many(func, [1, 2, 3, 4], max_workers=2)
+
+        self.assertEqual([None, 2, None, 4], result.results)
+        self.assertEqual([1, 3], [x for x, _ in result.get_errors()])
+        self.assertIsInstance(result.errors[0], ValueError)
+
+    def test_bounded(self) -> None:
+        """
+        Tests that we never run more than the given number of lookups at the
+        same time.
+        """
+
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def func(key):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+
+            time.sleep(0.01)
+
+            with lock:
+                running[0] -= 1
+
+            return key
+
+        result = fetch_many(func, range(20), max_workers=3)
+
+        self.assertEqual(list(range(20)), result.results)
+        self.assertLessEqual(peak[0], 3)
+
+    def test_duplicates(self) -> None:
+        """
+        Tests that a key which is given several times is only looked up once.
+        """
+
+        func = MagicMock(side_effect=lambda x: x)
+
+        result = fetch_many(func, [1, 2, 1, 1], max_workers=2)
+
+        self.assertEqual([1, 2, 1, 1], result.results)
+        self.assertEqual(2, func.call_count)
+
+    def test_not_valid_max_workers(self) -> None:
+        """
+        Tests that a non-valid number of workers is rejected.
+        """
+
+        self.assertRaises(
+            ValueError, lambda: fetch_many(lambda x: x, [1], max_workers=0)
+        )
+
+
+class TestTravisCIBatch(TestCase):
+    """
+    Provides the tests of the batch methods of the gateway.
+    """
+
+    @staticmethod
+    def fake_send_with_retry(requester, verb, url, **kwargs):
+        """
+        Provides the response of the API for the given URL.
+        """
+
+        # pylint: disable=unused-argument
+
+        _, resource, resource_id = url.rsplit("/", 2)
+
+        if resource_id == "404":
+            data = {
+                "@type": "error",
+                "error_type": "not_found",
+                "error_message": f"{resource} not found (or insufficient access)",
+            }
+        else:
+            data = {"@type": resource, "@href": f"/{resource}/{resource_id}"}
+
+            if resource == "repo":
+                data["slug"] = resource_id.replace("%2F", "/")
+            else:
+                data["id"] = int(resource_id)
+
+        result = MagicMock()
+        result.url = url
+        result.text = json.dumps(data)
+        result.json.return_value = data
+
+        return result
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.send_patcher = patch.object(
+            Requester, "send_with_retry", self.fake_send_with_retry
+        )
+        self.send_patcher.start()
+
+        self.travis = TravisCI(access_point="https://example.org/api")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.send_patcher.stop()
+
+    def test_get_builds_by_ids(self) -> None:
+        """
+        Tests of the method which let us fetch many builds at once.
+        """
+
+        result = self.travis.get_builds_by_ids([3, 404, 1, 2], max_workers=2)
+
+        self.assertEqual([3, None, 1, 2], [x.id if x else x for x in result])
+        self.assertEqual(404, result.get_errors()[0][0])
+        self.assertIsInstance(result.get_errors()[0][1], TravisCIError)
+
+    def test_get_jobs_by_ids(self) -> None:
+        """
+        Tests of the method which let us fetch many jobs at once.
+        """
+
+        result = self.travis.get_jobs_by_ids([4, 5])
+
+        self.assertEqual([4, 5], [x.id for x in result])
+        self.assertFalse(result.has_errors())
+
+    def test_get_repositories_by_slugs(self) -> None:
+        """
+        Tests of the method which let us fetch many repositories at once.
+        """
+
+        result = self.travis.get_repositories_by_slugs(["foo/bar", "bar/foo"])
+
+        self.assertEqual(["foo/bar", "bar/foo"], [x.slug for x in result])
+
+    def test_pool_size(self) -> None:
+        """
+        Tests that the connection pool grows with the number of workers.
+        """
+
+        self.travis.get_jobs_by_ids([4, 5], max_workers=24)
+
+        # pylint: disable=protected-access
+        self.assertEqual(24, self.travis._TravisCI__requester.pool_size)
+
+
+if __name__ == "__main__":
+    launch_tests()
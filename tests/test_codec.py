@@ -0,0 +1,246 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our JSON codecs.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+from datetime import datetime
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import MagicMock
+
+import requests
+
+import PyTravisCI.codec as codec
+from PyTravisCI.resource_types._all import Build
+from PyTravisCI.revalidation import RevalidatedResponse, RevalidationEntry
+
+
+class CodecTestMixin:
+    """
+    Provides the tests shared by all codecs.
+    """
+
+    # pylint: disable=no-member
+
+    codec_class = None
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        if not self.codec_class.is_available():  # pragma: no cover
+            self.skipTest(f"{self.codec_class.name} is not installed.")
+
+        self.codec = self.codec_class()
+
+    def test_loads(self) -> None:
+        """
+        Tests the decoding of bytes and strings.
+        """
+
+        expected = {"@type": "build", "id": 4, "name": "héllo", "jobs": [1, None]}
+
+        self.assertEqual(expected, self.codec.loads(json.dumps(expected).encode()))
+        self.assertEqual(expected, self.codec.loads(json.dumps(expected)))
+
+    def test_loads_long_number(self) -> None:
+        """
+        Tests that the numbers beyond the 64-bit range are decoded losslessly.
+        """
+
+        expected = {"github_id": 1148942198798789784897949849484523106}
+
+        self.assertEqual(expected, self.codec.loads(json.dumps(expected).encode()))
+        self.assertEqual(expected, json.loads(self.codec.dumps(expected)))
+
+    def test_loads_error(self) -> None:
+        """
+        Tests that a document which can't be decoded raises the standard
+        exception.
+        """
+
+        for given in (b"", b"Hello, World!", "{"):
+            with self.assertRaises(json.JSONDecodeError):
+                self.codec.loads(given)
+
+    def test_dumps(self) -> None:
+        """
+        Tests the (compact) encoding.
+        """
+
+        given = {"@type": "build", "id": 4, "name": "héllo/wörld", "jobs": [1, None]}
+
+        self.assertEqual(
+            json.dumps(given, ensure_ascii=False, separators=(",", ":")),
+            self.codec.dumps(given),
+        )
+
+    def test_dumps_default(self) -> None:
+        """
+        Tests that the datetimes are encoded in our standard format and that
+        the unknown objects are given to the default function.
+        """
+
+        given = {
+            "finished_at": datetime(2020, 10, 15, 20, 35),
+            "hello": {1, 2},
+        }
+
+        actual = json.loads(self.codec.dumps(given, default=sorted))
+
+        self.assertEqual("2020-10-15T20:35:00Z", actual["finished_at"])
+        self.assertEqual([1, 2], actual["hello"])
+
+    def test_to_json_compact(self) -> None:
+        """
+        Tests that the compact representation of a resource type holds the
+        same data than the default one.
+        """
+
+        codec.set_codec(self.codec)
+
+        try:
+            build = Build(
+                _at_type="build",
+                id=4,
+                finished_at=datetime(2020, 10, 15, 20, 35),
+                jobs=[{"_at_type": "job", "id": 5}],
+            )
+
+            actual = build.to_json(compact=True)
+
+            self.assertNotIn("\n", actual)
+            self.assertEqual(json.loads(build.to_json()), json.loads(actual))
+        finally:
+            codec.set_codec(None)
+
+
+class TestStdlibCodec(CodecTestMixin, TestCase):
+    """
+    Provides the tests of the standard library codec.
+    """
+
+    codec_class = codec.StdlibCodec
+
+
+class TestOrjsonCodec(CodecTestMixin, TestCase):
+    """
+    Provides the tests of the orjson codec.
+    """
+
+    codec_class = codec.OrjsonCodec
+
+
+class TestUjsonCodec(CodecTestMixin, TestCase):
+    """
+    Provides the tests of the ujson codec.
+    """
+
+    codec_class = codec.UjsonCodec
+
+
+class TestCodecSelection(TestCase):
+    """
+    Provides the tests of the selection of the codec.
+    """
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the tests.
+        """
+
+        codec.set_codec(None)
+
+    def test_default(self) -> None:
+        """
+        Tests that the first available codec is used by default.
+        """
+
+        expected = next(x for x in codec.CODECS.values() if x.is_available())
+
+        self.assertIsInstance(codec.get_codec(), expected)
+        self.assertIs(codec.get_codec(), codec.get_codec())
+
+    def test_set_codec(self) -> None:
+        """
+        Tests the switch to another codec.
+        """
+
+        self.assertIsInstance(codec.set_codec("stdlib"), codec.StdlibCodec)
+        self.assertIsInstance(codec.get_codec(), codec.StdlibCodec)
+
+        given = codec.StdlibCodec()
+
+        self.assertIs(given, codec.set_codec(given))
+        self.assertIs(given, codec.get_codec())
+
+        self.assertRaises(ValueError, lambda: codec.set_codec("hello"))
+        self.assertRaises(TypeError, lambda: codec.set_codec(object()))
+
+    def test_decode_response(self) -> None:
+        """
+        Tests that only the plain responses are decoded by the codec.
+        """
+
+        response = requests.Response()
+        response._content = b'{"id": 4}'  # pylint: disable=protected-access
+
+        given = MagicMock()
+        given.loads.return_value = {"id": 5}
+        codec.set_codec(codec.StdlibCodec())
+        codec.get_codec().loads = given.loads
+
+        self.assertEqual({"id": 5}, codec.decode_response(response))
+
+        revalidated = RevalidatedResponse(RevalidationEntry(response), revalidated=True)
+        self.assertEqual({"id": 5}, codec.decode_response(revalidated))
+        self.assertEqual({"id": 5}, codec.decode_response(revalidated))
+        # Once for the plain response, once for the entry.
+        self.assertEqual(2, given.loads.call_count)
+
+        mocked = MagicMock()
+        mocked.json.return_value = {"id": 6}
+
+        self.assertEqual({"id": 6}, codec.decode_response(mocked))
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -39,11 +39,12 @@ License
     SOFTWARE.
 """
 
-
 from unittest import TestCase
 from unittest import main as launch_tests
 
+import PyTravisCI.communicator._all as communicators
 from PyTravisCI.communicator.base import CommunicatorBase
+from PyTravisCI.requester import Requester
 from PyTravisCI.resource_types.base import ResourceTypesBase
 
 
@@ -92,7 +93,10 @@ class TestCommunicatorBase(TestCase):
             "_PyTravisCI_secret": "ThIsAsEcReTdOoR",
         }
 
-        actual = CommunicatorBase.propagate_internal_vars(to_propagate, given_resource)
+        with self.assertWarns(DeprecationWarning):
+            actual = CommunicatorBase.propagate_internal_vars(
+                to_propagate, given_resource
+            )
 
         self.assertDictContainsSubset(
             to_propagate["_PyTravisCI"], actual["_PyTravisCI"]
@@ -186,6 +190,164 @@ class TestCommunicatorBase(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_bind_endpoints(self) -> None:
+        """
+        Tests that each method of the endpoints of the communicators is bound
+        to its template.
+        """
+
+        for name in dir(communicators):
+            communicator = getattr(communicators, name)
+
+            if not isinstance(communicator, type):
+                continue
+
+            for method_name, template in communicator.endpoints.items():
+                self.assertEqual(
+                    template,
+                    getattr(communicator, method_name).endpoint_template,
+                    f"{name}.{method_name}",
+                )
+
+    def test_get_and_construct_endpoint(self) -> None:
+        """
+        Tests of the method which let us construct the endpoint of the
+        method which calls it.
+        """
+
+        class Communicator(CommunicatorBase):
+            """
+            A communicator with a decorated and an undecorated method.
+            """
+
+            endpoints = {
+                "from_id": "/build/%(build_id)s",
+                "jobs": "/build/%(build_id)s/jobs",
+            }
+
+            @CommunicatorBase.filter_before_action
+            def from_id(self, **kwargs):
+                return self.get_and_construct_endpoint(kwargs)
+
+            def jobs(self, **kwargs):
+                return self.get_and_construct_endpoint(kwargs)
+
+        communicator = Communicator(Requester())
+
+        self.assertEqual("/build/4", communicator.from_id(build_id=4))
+        self.assertEqual(
+            "/build/4?limit=2&offset=10",
+            communicator.from_id(build_id=4, parameters={"limit": 2, "offset": 10}),
+        )
+        self.assertEqual("/build/4", communicator.from_id(build_id=4, parameters={}))
+        self.assertEqual(
+            "/build/4/jobs?limit=2",
+            communicator.jobs(build_id=4, parameters={"limit": 2}),
+        )
+
+        # The template is given by the method which is bound to it.
+        self.assertEqual(
+            "/build/5/jobs",
+            communicator.get_and_construct_endpoint(
+                {"build_id": 5, "endpoint_template": "/build/%(build_id)s/jobs"}
+            ),
+        )
+
+        # Inherited methods are bound to the template of the subclass.
+        class Child(Communicator):
+            """
+            A communicator which overwrites an inherited endpoint.
+            """
+
+            endpoints = {"from_id": "/v2/build/%(build_id)s"}
+
+        self.assertEqual("/v2/build/4", Child(Requester()).from_id(build_id=4))
+        self.assertEqual("/build/4", communicator.from_id(build_id=4))
+
+        with self.assertRaises(KeyError):
+            communicator.get_and_construct_endpoint({"build_id": 5})
+
+    def test_complete_response_context(self) -> None:
+        """
+        Tests that every resource of a response shares the context of the
+        response - and only that one.
+        """
+
+        class Communicator(CommunicatorBase):
+            """
+            A communicator which gives back a build with some children.
+            """
+
+            endpoints = {"from_id": "/build/%(build_id)s"}
+
+            @CommunicatorBase.complete_response
+            def from_id(self, **kwargs):
+                return ResourceTypesBase(
+                    _at_type="build",
+                    id=kwargs["build_id"],
+                    commit=ResourceTypesBase(_at_type="commit", id=1),
+                    jobs=[ResourceTypesBase(_at_type="job", id=x) for x in range(3)],
+                )
+
+        first_requester, second_requester = Requester(), Requester()
+
+        first = Communicator(first_requester).from_id(build_id=1, parameters={})
+        second = Communicator(second_requester).from_id(build_id=2)
+
+        self.assertEqual(
+            {"com": {"requester": first_requester}, "shared": {"build_id": 1}},
+            first._PyTravisCI,
+        )
+        self.assertEqual(
+            {"com": {"requester": second_requester}, "shared": {"build_id": 2}},
+            second._PyTravisCI,
+        )
+
+        self.assertIs(first._PyTravisCI, first.commit._PyTravisCI)
+
+        for job in first.jobs:
+            self.assertIs(first._PyTravisCI, job._PyTravisCI)
+
+        for job in second.jobs:
+            self.assertIs(second._PyTravisCI, job._PyTravisCI)
+
+        # The context is not part of the data.
+        self.assertEqual(ResourceTypesBase(_at_type="commit", id=1), first.commit)
+
+        self.assertIsNone(CommunicatorBase.get_current_context())
+        self.assertNotIn("_PyTravisCI", vars(ResourceTypesBase(id=1)))
+
+    def test_complete_response_context_inherited(self) -> None:
+        """
+        Tests that the responses given by the resource types inherit the
+        shared variables of the resource type.
+        """
+
+        class Resource(ResourceTypesBase):
+            """
+            A resource type which gives back another one.
+            """
+
+            @CommunicatorBase.complete_response
+            def get_next(self, *, offset: int):
+                return ResourceTypesBase(_at_type="jobs", offset=offset)
+
+        requester = Requester()
+        resource = Resource(
+            _PyTravisCI={
+                "com": {"requester": requester},
+                "shared": {"build_id": 1},
+            }
+        )
+
+        actual = resource.get_next(offset=25)
+
+        self.assertEqual(
+            {"com": {"requester": requester}, "shared": {"build_id": 1, "offset": 25}},
+            actual._PyTravisCI,
+        )
+        self.assertEqual({"build_id": 1}, resource._PyTravisCI["shared"])
+
 
 if __name__ == "__main__":
     launch_tests()
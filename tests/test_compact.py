@@ -0,0 +1,194 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our compact resource types.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import copy
+import pickle
+import sys
+from datetime import datetime
+from unittest import TestCase
+from unittest import main as launch_tests
+
+from PyTravisCI.resource_types._all import Build, Builds, Job, Organization
+from PyTravisCI.resource_types.compact import (
+    CompactResourceTypesBase,
+    get_compact_class,
+)
+
+
+class TestCompact(TestCase):
+    """
+    Provides the tests of the compact resource types.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.given = {
+            "_at_type": "build",
+            "_at_href": "/build/1",
+            "_at_representation": "standard",
+            "_at_permissions": {"read": True, "restart": False},
+            "id": 1,
+            "state": "passed",
+            "finished_at": datetime(2020, 10, 15, 20, 35),
+            "jobs": [{"_at_type": "job", "id": 3}, {"_at_type": "job", "id": 4}],
+            "created_by": {"_at_type": "organization", "id": 5, "login": "foo"},
+            "hello": "world",
+        }
+
+    def test_get_compact_class(self) -> None:
+        """
+        Tests that the compact class is generated (once) from the annotated
+        fields of the resource type.
+        """
+
+        compact_class = get_compact_class(Build)
+
+        self.assertIs(compact_class, get_compact_class(Build))
+        self.assertTrue(issubclass(compact_class, CompactResourceTypesBase))
+        self.assertEqual("Build", compact_class.__name__)
+
+        for field in ("_at_type", "id", "state", "jobs", "created_by", "updated_at"):
+            self.assertIn(field, compact_class.__slots__)
+
+        self.assertFalse(hasattr(compact_class(id=1), "__dict__"))
+
+    def test_read(self) -> None:
+        """
+        Tests that a compact resource type can be read like the resource type.
+        """
+
+        compact = Build(**copy.deepcopy(self.given)).to_compact()
+
+        self.assertIsInstance(compact, get_compact_class(Build))
+        self.assertEqual(1, compact.id)
+        self.assertEqual("passed", compact["state"])
+        self.assertEqual("build", compact["@type"])
+        self.assertEqual(datetime(2020, 10, 15, 20, 35), compact.finished_at)
+        self.assertIsNone(compact.started_at)
+
+        # Unknown keys go into the overflow.
+        self.assertEqual("world", compact.hello)
+
+        self.assertEqual([3, 4], [x.id for x in compact.jobs])
+        self.assertIsInstance(compact.jobs[0], get_compact_class(Job))
+        self.assertIsInstance(compact.created_by, get_compact_class(Organization))
+
+        self.assertRaises(AttributeError, lambda: compact.world)
+
+    def test_read_only(self) -> None:
+        """
+        Tests that a compact resource type can't be modified.
+        """
+
+        compact = Build(**self.given).to_compact()
+
+        with self.assertRaises(AttributeError):
+            compact.id = 2
+
+    def test_to_dict(self) -> None:
+        """
+        Tests that the conversions give what the resource type gives.
+        """
+
+        resource = Build(**copy.deepcopy(self.given))
+        compact = resource.to_compact()
+
+        self.assertEqual(resource.to_dict(), compact.to_dict())
+        self.assertEqual(
+            resource.to_dict(remove_tags=True), compact.to_dict(remove_tags=True)
+        )
+        self.assertEqual(resource.to_json(), Build(**compact.to_dict()).to_json())
+
+    def test_to_resource(self) -> None:
+        """
+        Tests that a compact resource type can be converted back.
+        """
+
+        resource = Build(**copy.deepcopy(self.given))
+        actual = resource.to_compact().to_resource()
+
+        self.assertIsInstance(actual, Build)
+        self.assertIsInstance(actual.jobs[0], Job)
+        self.assertEqual(resource, actual)
+
+    def test_eq_pickle(self) -> None:
+        """
+        Tests the comparison and the serialization of compact resource types.
+        """
+
+        compact = Build(**copy.deepcopy(self.given)).to_compact()
+
+        self.assertEqual(Build(**copy.deepcopy(self.given)).to_compact(), compact)
+        self.assertNotEqual(Build(id=2).to_compact(), compact)
+        self.assertEqual(compact, pickle.loads(pickle.dumps(compact)))
+        self.assertEqual(compact, copy.deepcopy(compact))
+
+    def test_collection(self) -> None:
+        """
+        Tests that a compact collection can be iterated.
+        """
+
+        compact = Builds(
+            _at_type="builds", builds=[copy.deepcopy(self.given), {"id": 2}]
+        ).to_compact()
+
+        self.assertEqual([1, 2], [x.id for x in compact])
+        self.assertEqual(2, compact[1].id)
+
+    def test_smaller(self) -> None:
+        """
+        Tests that a compact resource type is smaller than the resource type.
+        """
+
+        resource = Build(**self.given)
+        compact = resource.to_compact()
+
+        self.assertLess(
+            sys.getsizeof(compact),
+            sys.getsizeof(resource) + sys.getsizeof(vars(resource)),
+        )
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,149 @@
+"""
+Just another Python API for Travis CI (API).
+
+Tests of the encryption of many secrets at once.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import base64
+from unittest import TestCase
+from unittest import main as launch_tests
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from PyTravisCI.encryption.bulk import encrypt_many
+from PyTravisCI.encryption.data import DataEncryption
+
+
+class TestEncryptMany(TestCase):
+    """
+    Provides the tests of the encryption of many secrets at once.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.decryptors = []
+        self.public_keys = []
+
+        for _ in range(2):
+            private_key = rsa.generate_private_key(
+                backend=default_backend(), public_exponent=65537, key_size=2048
+            )
+
+            self.decryptors.append(
+                DataEncryption(
+                    private_key=private_key.private_bytes(
+                        serialization.Encoding.PEM,
+                        serialization.PrivateFormat.PKCS8,
+                        serialization.NoEncryption(),
+                    )
+                )
+            )
+            self.public_keys.append(
+                private_key.public_key().public_bytes(
+                    serialization.Encoding.PEM, serialization.PublicFormat.PKCS1
+                )
+            )
+
+    def decrypt(self, index: int, encrypted: list) -> list:
+        """
+        Decrypts the given encrypted secrets with the given private key.
+        """
+
+        return [
+            self.decryptors[index].decrypt_data(base64.b64decode(x)).decode()
+            for x in encrypted
+        ]
+
+    def test_encrypt_many(self) -> None:
+        """
+        Tests the encryption of many secrets - with many public keys - in the
+        current process and on a pool of processes.
+        """
+
+        first = [f"HELLO_{x}=world" for x in range(7)]
+        second = [b"foo", "bar"]
+
+        for max_workers in (1, 2):
+            result = encrypt_many(
+                [
+                    (self.public_keys[0], first),
+                    (self.public_keys[1].decode(), second),
+                    (self.public_keys[0], []),
+                ],
+                max_workers=max_workers,
+                chunk_size=3,
+            )
+
+            self.assertEqual(3, len(result))
+            self.assertEqual(first, self.decrypt(0, result[0]))
+            self.assertEqual(["foo", "bar"], self.decrypt(1, result[1]))
+            self.assertEqual([], result[2])
+
+    def test_encrypt_many_nothing(self) -> None:
+        """
+        Tests the encryption of nothing.
+        """
+
+        self.assertEqual([], encrypt_many([]))
+
+    def test_encrypt_many_not_valid(self) -> None:
+        """
+        Tests the encryption with invalid arguments.
+        """
+
+        jobs = [(self.public_keys[0], ["hello"])]
+
+        self.assertRaises(ValueError, encrypt_many, jobs, max_workers=0)
+        self.assertRaises(ValueError, encrypt_many, jobs, chunk_size=0)
+        self.assertRaises(ValueError, encrypt_many, jobs, padd="hello")
+        self.assertRaises(
+            ValueError,
+            encrypt_many,
+            jobs + [(self.public_keys[1], ["world"])],
+            padd="hello",
+            max_workers=2,
+        )
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -39,11 +39,18 @@ License
     SOFTWARE.
 """
 
+import io
 import os
 import secrets
-from tempfile import NamedTemporaryFile
-from unittest import TestCase
+import shutil
+import subprocess
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from unittest import TestCase, skipIf
 from unittest import main as launch_tests
+from unittest.mock import patch
+
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 from PyTravisCI.encryption.file import FileEncryption
 
@@ -418,6 +425,353 @@ class TestFileEncryption(TestCase):
 
         self.assertEqual(expected, decrypted_file.read())
 
+    def test_file_encryption_streamed(self):
+        """
+        Tests that the (chunked) file encryption gives the same output as the
+        encryption of the whole content - whatever the size of the file and of
+        the buffer.
+        """
+
+        encryptor = FileEncryption()
+        encryptor.set_key(self.encryption_key)
+        encryptor.set_iv(self.iv_key)
+
+        for size in (0, 1, 15, 16, 17, 31, 32, 33, 1000):
+            given = secrets.token_bytes(size)
+            expected = encryptor.encrypt_file_content(given)
+
+            for buffer_size in (1, 7, 16, 64, 10000):
+                output_file = io.BytesIO()
+
+                encryptor.encrypt_file(
+                    io.BytesIO(given), output_file, buffer_size=buffer_size
+                )
+
+                self.assertEqual(expected, output_file.getvalue())
+
+                decrypted_file = io.BytesIO()
+
+                encryptor.decrypt_file(
+                    io.BytesIO(expected), decrypted_file, buffer_size=buffer_size
+                )
+
+                self.assertEqual(given, decrypted_file.getvalue())
+
+    def test_file_encryption_constant_memory(self):
+        """
+        Tests that we never read nor write more than a buffer (and a block) at
+        once.
+        """
+
+        sizes = {"read": [], "write": []}
+
+        class Input(io.BytesIO):
+            """
+            Records the size of the reads.
+            """
+
+            def read(self, size=-1):
+                sizes["read"].append(size)
+                return super().read(size)
+
+        class Output(io.BytesIO):
+            """
+            Records the size of the writes.
+            """
+
+            def write(self, data):
+                sizes["write"].append(len(data))
+                return super().write(data)
+
+        encryptor = FileEncryption()
+        encryptor.set_key(self.encryption_key)
+        encryptor.set_iv(self.iv_key)
+
+        given = secrets.token_bytes(10000)
+
+        encryptor.encrypt_file(Input(given), Output(), buffer_size=256)
+
+        self.assertEqual({256}, set(sizes["read"]))
+        self.assertLessEqual(max(sizes["write"]), 256 + 16)
+        self.assertEqual(10016, sum(sizes["write"]))
+
+        sizes["read"].clear()
+        sizes["write"].clear()
+
+        encryptor.decrypt_file(
+            Input(encryptor.encrypt_file_content(given)), Output(), buffer_size=256
+        )
+
+        self.assertEqual({256}, set(sizes["read"]))
+        self.assertLessEqual(max(sizes["write"]), 256 + 16)
+        self.assertEqual(10000, sum(sizes["write"]))
+
+    def test_file_encryption_not_valid_buffer_size(self):
+        """
+        Tests the file encryption with a buffer size which is not valid.
+        """
+
+        encryptor = FileEncryption()
+        output_file = io.BytesIO()
+
+        self.assertRaises(
+            ValueError,
+            lambda: encryptor.encrypt_file(
+                io.BytesIO(b"Hello, World!"), output_file, buffer_size=0
+            ),
+        )
+        self.assertEqual(b"", output_file.getvalue())
+
+    def test_text_file_encryption(self):
+        """
+        Tests the encryption of a file opened in text mode.
+        """
+
+        encryptor = FileEncryption()
+        output_file = io.BytesIO()
+
+        encryptor.encrypt_file(io.StringIO("Hello, Wörld!"), output_file, buffer_size=3)
+
+        self.assertEqual(
+            encryptor.encrypt_file_content("Hello, Wörld!"), output_file.getvalue()
+        )
+
+    @skipIf(shutil.which("openssl") is None, "openssl is not installed.")
+    def test_file_encryption_openssl(self):
+        """
+        Tests that the encrypted file can be decrypted by openssl.
+        """
+
+        given = secrets.token_bytes(100000)
+
+        encryptor = FileEncryption()
+
+        with TemporaryDirectory() as temp_dir:
+            encrypted = os.path.join(temp_dir, "hello.enc")
+            decrypted = os.path.join(temp_dir, "hello")
+
+            with open(encrypted, "wb") as output_file:
+                encryptor.encrypt_file(io.BytesIO(given), output_file, buffer_size=4096)
+
+            subprocess.run(
+                [
+                    "openssl",
+                    "aes-256-cbc",
+                    "-K",
+                    encryptor.get_key(),
+                    "-iv",
+                    encryptor.get_iv(),
+                    "-in",
+                    encrypted,
+                    "-out",
+                    decrypted,
+                    "-d",
+                ],
+                check=True,
+                capture_output=True,
+            )
+
+            with open(decrypted, "rb") as file_stream:
+                self.assertEqual(given, file_stream.read())
+
+    def test_file_content_encryption_reference(self):
+        """
+        Tests that the (in place) encryption and decryption of a content gives
+        the same output as a plain padding and encryption.
+        """
+
+        encryptor = FileEncryption()
+        encryptor.set_key(self.encryption_key)
+        encryptor.set_iv(self.iv_key)
+
+        for size in (0, 1, 15, 16, 17, 31, 32, 33, 1000):
+            given = secrets.token_bytes(size)
+
+            pad = padding.PKCS7(128).padder()
+            cipher = Cipher(
+                algorithms.AES(encryptor.key), modes.CBC(encryptor.iv)
+            ).encryptor()
+            expected = cipher.update(pad.update(given) + pad.finalize())
+            expected += cipher.finalize()
+
+            self.assertEqual(expected, encryptor.encrypt_file_content(given))
+            self.assertEqual(given, encryptor.decrypt_file_content(expected))
+
+    def test_file_content_decryption_not_valid(self):
+        """
+        Tests the decryption of a content which is not a valid one.
+        """
+
+        encryptor = FileEncryption()
+        encryptor.set_key(self.encryption_key)
+        encryptor.set_iv(self.iv_key)
+
+        for given in (b"", b"Hello", secrets.token_bytes(17)):
+            self.assertRaises(ValueError, encryptor.decrypt_file_content, given)
+
+    def test_path_encryption(self):
+        """
+        Tests that the (mapped) path encryption gives the same output as the
+        encryption of the whole content - whatever the size of the file and of
+        the buffer.
+        """
+
+        encryptor = FileEncryption()
+        encryptor.set_key(self.encryption_key)
+        encryptor.set_iv(self.iv_key)
+
+        with TemporaryDirectory() as temp_dir:
+            plain = os.path.join(temp_dir, "hello")
+            encrypted = os.path.join(temp_dir, "hello.enc")
+
+            for size in (0, 1, 15, 16, 17, 31, 32, 33, 1000):
+                given = secrets.token_bytes(size)
+                expected = encryptor.encrypt_file_content(given)
+
+                with open(plain, "wb") as file_stream:
+                    file_stream.write(given)
+
+                with open(encrypted, "wb") as file_stream:
+                    file_stream.write(expected)
+
+                for buffer_size in (1, 7, 16, 64, 10000):
+                    output_file = io.BytesIO()
+
+                    encryptor.encrypt_path(plain, output_file, buffer_size=buffer_size)
+
+                    self.assertEqual(expected, output_file.getvalue())
+
+                    decrypted_file = io.BytesIO()
+
+                    encryptor.decrypt_path(
+                        encrypted, decrypted_file, buffer_size=buffer_size
+                    )
+
+                    self.assertEqual(given, decrypted_file.getvalue())
+
+    def test_path_encryption_to_path(self):
+        """
+        Tests the (mapped) path encryption and decryption into a path.
+        """
+
+        given = secrets.token_bytes(100000)
+
+        encryptor = FileEncryption()
+
+        with TemporaryDirectory() as temp_dir:
+            plain = os.path.join(temp_dir, "hello")
+            encrypted = os.path.join(temp_dir, "hello.enc")
+            decrypted = os.path.join(temp_dir, "hello.dec")
+
+            with open(plain, "wb") as file_stream:
+                file_stream.write(given)
+
+            encryptor.encrypt_path(plain, encrypted)
+            encryptor.decrypt_path(encrypted, decrypted)
+
+            with open(encrypted, "rb") as file_stream:
+                self.assertEqual(
+                    encryptor.encrypt_file_content(given), file_stream.read()
+                )
+
+            with open(decrypted, "rb") as file_stream:
+                self.assertEqual(given, file_stream.read())
+
+    def test_path_decryption_not_valid(self):
+        """
+        Tests the (mapped) path decryption of a file which is not a valid
+        encrypted one.
+        """
+
+        encryptor = FileEncryption()
+        encryptor.set_key(self.encryption_key)
+        encryptor.set_iv(self.iv_key)
+
+        with TemporaryDirectory() as temp_dir:
+            encrypted = os.path.join(temp_dir, "hello.enc")
+
+            for given in (b"", b"Hello", secrets.token_bytes(17)):
+                with open(encrypted, "wb") as file_stream:
+                    file_stream.write(given)
+
+                self.assertRaises(
+                    ValueError, encryptor.decrypt_path, encrypted, io.BytesIO()
+                )
+
+            self.assertRaises(
+                ValueError,
+                encryptor.encrypt_path,
+                encrypted,
+                io.BytesIO(),
+                buffer_size=0,
+            )
+
+    def test_path_encryption_error(self):
+        """
+        Tests that an error raised while a slice of the mapped file is alive
+        is given back as is.
+        """
+
+        encryptor = FileEncryption()
+
+        with TemporaryDirectory() as temp_dir:
+            plain = os.path.join(temp_dir, "hello")
+
+            with open(plain, "wb") as file_stream:
+                file_stream.write(secrets.token_bytes(100))
+
+            # The mock keeps a reference to the (last) slice it is given.
+            with patch(
+                "PyTravisCI.encryption.file.primitive_padding.PKCS7"
+            ) as mocked_padding:
+                mocked_padding.return_value.padder.return_value.update.side_effect = (
+                    KeyError("oops")
+                )
+
+                self.assertRaises(KeyError, encryptor.encrypt_path, plain, io.BytesIO())
+
+    @skipIf(shutil.which("openssl") is None, "openssl is not installed.")
+    def test_path_encryption_openssl(self):
+        """
+        Tests that the (mapped) path encryption decrypts what openssl
+        encrypted.
+        """
+
+        given = secrets.token_bytes(100000)
+
+        encryptor = FileEncryption()
+        encryptor.generate_key()
+        encryptor.generate_iv()
+
+        with TemporaryDirectory() as temp_dir:
+            plain = os.path.join(temp_dir, "hello")
+            encrypted = os.path.join(temp_dir, "hello.enc")
+
+            with open(plain, "wb") as file_stream:
+                file_stream.write(given)
+
+            subprocess.run(
+                [
+                    "openssl",
+                    "aes-256-cbc",
+                    "-K",
+                    encryptor.get_key(),
+                    "-iv",
+                    encryptor.get_iv(),
+                    "-in",
+                    plain,
+                    "-out",
+                    encrypted,
+                ],
+                check=True,
+                capture_output=True,
+            )
+
+            decrypted_file = io.BytesIO()
+            encryptor.decrypt_path(encrypted, decrypted_file, buffer_size=4096)
+
+            self.assertEqual(given, decrypted_file.getvalue())
+
 
 if __name__ == "__main__":
     launch_tests()
@@ -0,0 +1,180 @@
+"""
+Just another Python API for Travis CI (API).
+
+Tests of the public key cache.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from PyTravisCI.encryption.public_key_cache import PublicKeyCache
+
+
+def get_new_public_key() -> bytes:
+    """
+    Provides a new (PEM) public key to work with.
+    """
+
+    return (
+        rsa.generate_private_key(
+            backend=default_backend(), public_exponent=65537, key_size=2048
+        )
+        .public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.PKCS1)
+    )
+
+
+class TestPublicKeyCache(TestCase):
+    """
+    Provides the tests of the public key cache.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.now = 1000.0
+        self.time_patcher = patch.object(
+            PublicKeyCache, "get_time", side_effect=lambda: self.now
+        )
+        self.time_patcher.start()
+
+        self.public_key = get_new_public_key()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.time_patcher.stop()
+
+    def test_not_valid_ttl(self) -> None:
+        """
+        Tests the initialization with a negative TTL.
+        """
+
+        self.assertRaises(ValueError, PublicKeyCache, -1)
+
+    def test_set_get(self) -> None:
+        """
+        Tests that a stored public key is served - loaded - until it expires.
+        """
+
+        cache = PublicKeyCache(ttl=60)
+
+        self.assertIsNone(cache.get("foo/bar"))
+
+        given = cache.set("foo/bar", self.public_key, fingerprint="abc")
+
+        self.assertEqual(self.public_key, given.get_public_key())
+        self.assertIs(given, cache.get("foo/bar"))
+
+        self.now += 59
+        self.assertIs(given, cache.get("foo/bar"))
+
+        self.now += 1
+        self.assertIsNone(cache.get("foo/bar"))
+
+        self.assertEqual(
+            {"hits": 2, "misses": 2, "loads": 1, "entries": 0, "keys": 0},
+            cache.get_statistics(),
+        )
+
+    def test_loaded_once_per_fingerprint(self) -> None:
+        """
+        Tests that a public key is only loaded once per fingerprint.
+        """
+
+        cache = PublicKeyCache(ttl=60)
+
+        first = cache.set("foo/bar", self.public_key)
+        second = cache.set("foo/baz", self.public_key.decode())
+
+        self.assertIs(first, second)
+
+        # After its expiration, the same key is fetched again - but not loaded.
+        self.now += 60
+        self.assertIsNone(cache.get("foo/bar"))
+        self.assertIs(first, cache.set("foo/bar", self.public_key))
+
+        self.assertEqual(1, cache.get_statistics()["loads"])
+
+        # A new key is loaded - and the previous one is forgotten once unused.
+        other = get_new_public_key()
+
+        cache.set("foo/bar", other, fingerprint="other")
+        self.assertEqual(2, cache.get_statistics()["keys"])
+
+        cache.set("foo/baz", other, fingerprint="other")
+        self.assertEqual(1, cache.get_statistics()["keys"])
+
+        self.assertEqual(other, cache.get("foo/baz").get_public_key())
+        self.assertEqual(2, cache.get_statistics()["loads"])
+
+    def test_discard_clear(self) -> None:
+        """
+        Tests that discarded public keys are forgotten.
+        """
+
+        cache = PublicKeyCache()
+
+        cache.set("foo/bar", self.public_key)
+        cache.set("foo/baz", self.public_key)
+
+        cache.discard("foo/bar")
+        cache.discard("foo/unknown")
+
+        self.assertIsNone(cache.get("foo/bar"))
+        self.assertIsNotNone(cache.get("foo/baz"))
+        self.assertEqual(1, len(cache))
+
+        cache.clear()
+
+        self.assertIsNone(cache.get("foo/baz"))
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.get_statistics()["keys"])
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,511 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our export tools.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import io
+import json
+import os
+import tempfile
+import importlib.util
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, skipIf
+from unittest import main as launch_tests
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+from PyTravisCI.export import Column, export_ndjson, get_field, iter_ndjson, to_columns
+from PyTravisCI.requester import Requester
+from PyTravisCI.resource_types._all import Build, Builds
+from PyTravisCI.travis_ci import TravisCI
+
+
+class TestIterNdjson(TestCase):
+    """
+    Provides the tests of the conversion to NDJSON.
+    """
+
+    def test_iter_ndjson(self) -> None:
+        """
+        Tests that each resource type gives a single line.
+        """
+
+        builds = [
+            Build(
+                _at_type="build",
+                id=1,
+                finished_at=datetime(2020, 10, 15, 20, 35),
+                jobs=[{"_at_type": "job", "id": 2, "name": "hello\nworld"}],
+            ),
+            Build(_at_type="build", id=3).to_compact(),
+        ]
+
+        actual = list(iter_ndjson(builds))
+
+        self.assertEqual(2, len(actual))
+
+        for line, build in zip(actual, builds):
+            self.assertTrue(line.endswith("\n"))
+            self.assertEqual(1, line.count("\n"))
+            self.assertEqual(build.to_dict(), json.loads(line))
+
+        self.assertEqual(
+            {"id": 3},
+            json.loads(list(iter_ndjson(builds, remove_tags=True))[1]),
+        )
+
+
+class TestExportNdjson(TestCase):
+    """
+    Provides the tests of the NDJSON export of the collections.
+    """
+
+    total: int = 7
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.events = []
+
+        def fake_send_with_retry(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            query = parse_qs(urlparse(url).query)
+            limit = int(query["limit"][0])
+            offset = int(query.get("offset", ["0"])[0])
+
+            self.events.append(f"page {offset}")
+
+            if offset + limit < self.total:
+                next_page = {
+                    "@href": f"/builds?limit={limit}&offset={offset + limit}",
+                    "offset": offset + limit,
+                    "limit": limit,
+                }
+            else:
+                next_page = None
+
+            data = {
+                "@type": "builds",
+                "@href": f"/builds?limit={limit}&offset={offset}",
+                "@pagination": {
+                    "limit": limit,
+                    "offset": offset,
+                    "count": self.total,
+                    "next": next_page,
+                },
+                "builds": [
+                    {"@type": "build", "id": x, "state": "passed"}
+                    for x in range(offset, min(offset + limit, self.total))
+                ],
+            }
+
+            result = MagicMock()
+            result.url = url
+            result.text = json.dumps(data)
+            result.json.return_value = data
+
+            return result
+
+        self.send_patcher = patch.object(
+            Requester, "send_with_retry", fake_send_with_retry
+        )
+        self.send_patcher.start()
+
+        self.travis = TravisCI(access_point="https://example.org/api")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.send_patcher.stop()
+
+    def test_stream(self) -> None:
+        """
+        Tests that the items are written while the pages are followed.
+        """
+
+        events = self.events
+
+        class Stream(io.StringIO):
+            """
+            A stream which records when something is written.
+            """
+
+            def write(self, data: str) -> int:
+                events.append(f"write {json.loads(data)['id']}")
+                return super().write(data)
+
+        stream = Stream()
+
+        actual = self.travis.get_builds(params={"limit": 3}).to_ndjson(stream)
+
+        self.assertEqual(self.total, actual)
+        self.assertEqual(
+            [
+                "page 0",
+                "write 0",
+                "write 1",
+                "write 2",
+                "page 3",
+                "write 3",
+                "write 4",
+                "write 5",
+                "page 6",
+                "write 6",
+            ],
+            self.events,
+        )
+        self.assertEqual(
+            list(range(self.total)),
+            [json.loads(x)["id"] for x in stream.getvalue().splitlines()],
+        )
+
+    def test_binary_stream(self) -> None:
+        """
+        Tests the export into a binary stream.
+        """
+
+        stream = io.BytesIO()
+
+        actual = self.travis.get_builds(params={"limit": 3}).to_ndjson(
+            stream, max_items=4, remove_tags=True
+        )
+
+        self.assertEqual(4, actual)
+        self.assertEqual(
+            [{"id": x, "state": "passed"} for x in range(4)],
+            [json.loads(x) for x in stream.getvalue().splitlines()],
+        )
+
+    def test_path(self) -> None:
+        """
+        Tests the export into a file.
+        """
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "builds.ndjson")
+
+            actual = export_ndjson(
+                self.travis.iter_builds(params={"limit": 3}, prefetch=2), path
+            )
+
+            self.assertEqual(self.total, actual)
+            self.assertEqual(["builds.ndjson"], os.listdir(temp_dir))
+
+            with open(path, "r", encoding="utf-8") as file_stream:
+                self.assertEqual(
+                    list(range(self.total)),
+                    [json.loads(x)["id"] for x in file_stream],
+                )
+
+    def test_path_error(self) -> None:
+        """
+        Tests that a failed export does not leave anything behind.
+        """
+
+        def items():
+            yield Build(_at_type="build", id=1)
+            raise RuntimeError("Hello, World!")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "builds.ndjson")
+
+            with self.assertRaises(RuntimeError):
+                export_ndjson(items(), path)
+
+            self.assertEqual([], os.listdir(temp_dir))
+
+    def test_not_collection(self) -> None:
+        """
+        Tests that only the collections can be exported.
+        """
+
+        self.assertRaises(
+            NotImplementedError, lambda: Build(id=1).to_ndjson(io.StringIO())
+        )
+
+
+class TestColumn(TestCase):
+    """
+    Provides the tests of the typed columns.
+    """
+
+    def test_int(self) -> None:
+        """
+        Tests a column of integers - with some leading nulls.
+        """
+
+        column = Column("id")
+
+        for value in (None, None, 1, None, 3):
+            column.append(value)
+
+        self.assertEqual("int64", column.kind)
+        self.assertEqual("q", column.values.typecode)
+        self.assertEqual(bytearray([0, 0, 1, 0, 1]), column.validity)
+        self.assertEqual([None, None, 1, None, 3], column.to_pylist())
+
+    def test_timestamp(self) -> None:
+        """
+        Tests that the datetimes are stored as microseconds since the epoch.
+        """
+
+        column = Column("started_at")
+
+        column.append(datetime(1970, 1, 1, 0, 0, 1))
+        column.append(
+            datetime(1970, 1, 1, 1, 0, 2, tzinfo=timezone(timedelta(hours=1)))
+        )
+        column.append(None)
+
+        self.assertEqual("timestamp", column.kind)
+        self.assertEqual([1000000, 2000000, 0], column.values.tolist())
+        self.assertEqual(
+            [datetime(1970, 1, 1, 0, 0, 1), datetime(1970, 1, 1, 0, 0, 2), None],
+            column.to_pylist(),
+        )
+
+    def test_dictionary(self) -> None:
+        """
+        Tests that the strings are dictionary encoded.
+        """
+
+        column = Column("state")
+
+        for value in ("passed", "failed", None, "passed", "passed"):
+            column.append(value)
+
+        self.assertEqual("dictionary", column.kind)
+        self.assertEqual(["passed", "failed"], column.categories)
+        self.assertEqual([0, 1, 0, 0, 0], column.values.tolist())
+        self.assertEqual(
+            ["passed", "failed", None, "passed", "passed"], column.to_pylist()
+        )
+
+    def test_bool_and_float(self) -> None:
+        """
+        Tests the columns of booleans and floats.
+        """
+
+        column = Column("private")
+        column.append(True)
+        column.append(False)
+
+        self.assertEqual("bool", column.kind)
+        self.assertEqual([True, False], column.to_pylist())
+
+        column = Column("ratio")
+        column.append(0.5)
+
+        self.assertEqual("float64", column.kind)
+        self.assertEqual([0.5], column.to_pylist())
+
+    def test_object(self) -> None:
+        """
+        Tests that the columns of mixed types fall back to a list of objects.
+        """
+
+        column = Column("mixed")
+
+        for value in ("hello", None, 2, 2**70):
+            column.append(value)
+
+        self.assertEqual("object", column.kind)
+        self.assertEqual(["hello", None, 2, 2**70], column.values)
+        self.assertEqual([], column.categories)
+
+        column = Column("big")
+        column.append(1)
+        column.append(2**70)
+
+        self.assertEqual("object", column.kind)
+        self.assertEqual([1, 2**70], column.to_pylist())
+
+
+class TestToColumns(TestCase):
+    """
+    Provides the tests of the flattening of the collections.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.builds = Builds(
+            _at_type="builds",
+            builds=[
+                {
+                    "_at_type": "build",
+                    "id": 1,
+                    "state": "passed",
+                    "duration": 42,
+                    "started_at": datetime(2020, 10, 15, 20, 35),
+                    "branch": {"_at_type": "branch", "name": "master"},
+                },
+                {"_at_type": "build", "id": 2, "state": "failed"},
+            ],
+        )
+
+    def test_get_field(self) -> None:
+        """
+        Tests the reading of the (dotted) fields.
+        """
+
+        data = {"branch": {"name": "master"}, "id": 1}
+
+        self.assertEqual("master", get_field(data, "branch.name"))
+        self.assertEqual("master", get_field(data, ("branch", "name")))
+        self.assertEqual(1, get_field(Build(**data), "id"))
+        self.assertEqual("master", get_field(Build(**data), "branch.name"))
+        self.assertIsNone(get_field(data, "repository.slug"))
+        self.assertIsNone(get_field(Build(id=1), "repository.slug"))
+
+    def test_to_columns(self) -> None:
+        """
+        Tests the flattening of the default fields - without creating the
+        builds.
+        """
+
+        actual = self.builds.to_columns()
+
+        self.assertEqual(list(Builds.__columns__), list(actual))
+        self.assertEqual([1, 2], actual["id"].to_pylist())
+        self.assertEqual(["passed", "failed"], actual["state"].to_pylist())
+        self.assertEqual([42, None], actual["duration"].to_pylist())
+        self.assertEqual(
+            [datetime(2020, 10, 15, 20, 35), None], actual["started_at"].to_pylist()
+        )
+        self.assertEqual(["master", None], actual["branch.name"].to_pylist())
+        self.assertEqual([None, None], actual["commit.sha"].to_pylist())
+
+        self.assertIsInstance(self.builds.__dict__["builds"][0], dict)
+
+    def test_to_columns_hydrated(self) -> None:
+        """
+        Tests the flattening of the already created (or compact) builds.
+        """
+
+        expected = self.builds.to_columns(["id", "branch.name"])
+
+        actual = to_columns(
+            [x.to_compact() for x in self.builds], ["id", "branch.name"]
+        )
+
+        self.assertIsInstance(self.builds.__dict__["builds"][0], Build)
+
+        for name, column in expected.items():
+            self.assertEqual(column.to_pylist(), actual[name].to_pylist())
+            self.assertEqual(
+                column.to_pylist(),
+                self.builds.to_columns([name])[name].to_pylist(),
+            )
+
+    def test_not_collection(self) -> None:
+        """
+        Tests that only the collections can be flattened.
+        """
+
+        self.assertRaises(NotImplementedError, lambda: Build(id=1).to_columns())
+
+    @skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed.")
+    def test_to_arrow(self) -> None:
+        """
+        Tests the conversion into an Arrow table.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+
+        actual = self.builds.to_arrow(
+            ["id", "state", "duration", "started_at", "branch.name", "commit.sha"]
+        )
+
+        self.assertEqual(pyarrow.int64(), actual.schema.field("id").type)
+        self.assertEqual(
+            pyarrow.dictionary(pyarrow.int32(), pyarrow.string()),
+            actual.schema.field("state").type,
+        )
+        self.assertEqual(
+            pyarrow.timestamp("us", tz="UTC"), actual.schema.field("started_at").type
+        )
+        self.assertEqual(
+            {
+                "id": [1, 2],
+                "state": ["passed", "failed"],
+                "duration": [42, None],
+                "started_at": [
+                    datetime(2020, 10, 15, 20, 35, tzinfo=timezone.utc),
+                    None,
+                ],
+                "branch.name": ["master", None],
+                "commit.sha": [None, None],
+            },
+            actual.to_pydict(),
+        )
+
+    @skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed.")
+    def test_to_arrow_bool(self) -> None:
+        """
+        Tests the conversion of the booleans and the objects into Arrow arrays.
+        """
+
+        column = Column("private")
+
+        for value in (True, None, False):
+            column.append(value)
+
+        self.assertEqual([True, None, False], column.to_arrow().to_pylist())
+
+        column = Column("mixed")
+
+        for value in ("hello", None, "world"):
+            column.append(value)
+        column.append(1)
+
+        self.assertEqual(
+            ["hello", None, "world", "1"], column.to_arrow().cast("string").to_pylist()
+        )
+
+
+if __name__ == "__main__":
+    launch_tests()
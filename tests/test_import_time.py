@@ -0,0 +1,200 @@
+"""
+Just another Python API for Travis CI (API).
+
+Tests of the time spent to import our modules.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict
+from unittest import TestCase, skipUnless
+from unittest import main as launch_tests
+
+
+def get_import_times(code: str) -> Dict[str, int]:
+    """
+    Runs the given code into a fresh interpreter - with :code:`-X importtime`
+    - and provides the (self) time (in microseconds) spent to import each
+    module.
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    result = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_time, _, name = line[len("import time:") :].split("|")
+        result[name.strip()] = int(self_time)
+
+    return result
+
+
+def get_own_import_time(code: str, *, runs: int = 3) -> float:
+    """
+    Provides the median time (in milliseconds) spent to import our own
+    modules while running the given code.
+    """
+
+    return statistics.median(
+        sum(y for x, y in get_import_times(code).items() if x.startswith("PyTravisCI"))
+        / 1000
+        for _ in range(runs)
+    )
+
+
+class TestImportTime(TestCase):
+    """
+    Provides the tests of what is imported - and when.
+
+    The (wall-clock) budgets depend on the machine: they are only checked
+    when the :code:`PYTRAVISCI_IMPORT_BUDGETS` environment variable is set.
+    """
+
+    PACKAGE_BUDGET: float = 50.0
+    GATEWAY_BUDGET: float = 200.0
+
+    def test_import_package(self) -> None:
+        """
+        Tests that importing the package alone imports (almost) nothing.
+        """
+
+        imported = get_import_times("import PyTravisCI")
+
+        self.assertIn("PyTravisCI", imported)
+
+        for module in ("requests", "cryptography", "PyTravisCI.travis_ci"):
+            self.assertNotIn(module, imported)
+
+    def test_import_gateway(self) -> None:
+        """
+        Tests that creating our gateway imports neither the encryption stack
+        nor the communicators or resource types.
+        """
+
+        code = "from PyTravisCI import TravisCI; TravisCI()"
+        imported = get_import_times(code)
+
+        self.assertIn("PyTravisCI.travis_ci", imported)
+
+        for module in imported:
+            self.assertFalse(module.startswith("cryptography"), module)
+            self.assertFalse(module.startswith("PyTravisCI.encryption.data"), module)
+            self.assertFalse(module.startswith("PyTravisCI.encryption.file"), module)
+
+        self.assertEqual(
+            {"PyTravisCI.communicator._all"},
+            {x for x in imported if x.startswith("PyTravisCI.communicator.")},
+        )
+        self.assertEqual(
+            {"PyTravisCI.resource_types._all"},
+            {x for x in imported if x.startswith("PyTravisCI.resource_types.")},
+        )
+
+    @skipUnless(
+        os.environ.get("PYTRAVISCI_IMPORT_BUDGETS"),
+        "PYTRAVISCI_IMPORT_BUDGETS is not set.",
+    )
+    def test_import_budgets(self) -> None:
+        """
+        Tests that importing the package and creating our gateway stay within
+        their (generous) budgets.
+        """
+
+        self.assertLess(get_own_import_time("import PyTravisCI"), self.PACKAGE_BUDGET)
+        self.assertLess(
+            get_own_import_time("from PyTravisCI import TravisCI; TravisCI()"),
+            self.GATEWAY_BUDGET,
+        )
+
+    def test_import_on_access(self) -> None:
+        """
+        Tests that the lazily imported modules are imported once accessed.
+        """
+
+        imported = get_import_times(
+            "import PyTravisCI.resource_types._all as resource_types; "
+            "resource_types.Repository"
+        )
+
+        self.assertIn("PyTravisCI.resource_types.repository", imported)
+        self.assertNotIn("PyTravisCI.resource_types.build", imported)
+        self.assertNotIn("cryptography", imported)
+
+        imported = get_import_times(
+            "from PyTravisCI.encryption.file import FileEncryption"
+        )
+
+        self.assertIn("cryptography", imported)
+
+    def test_lazy_exports(self) -> None:
+        """
+        Tests the lazily exported names.
+        """
+
+        # pylint: disable=import-outside-toplevel
+        import PyTravisCI
+        import PyTravisCI.communicator._all as communicators
+        import PyTravisCI.resource_types._all as resource_types
+        from PyTravisCI.async_travis_ci import AsyncTravisCI
+        from PyTravisCI.travis_ci import TravisCI
+
+        self.assertIs(TravisCI, PyTravisCI.TravisCI)
+        self.assertIs(AsyncTravisCI, PyTravisCI.AsyncTravisCI)
+        self.assertIn("TravisCI", dir(PyTravisCI))
+
+        self.assertEqual("Build", resource_types.Build.__name__)
+        self.assertEqual("Build", communicators.Build.__name__)
+        self.assertIn("Repository", dir(resource_types))
+
+        for module in (PyTravisCI, communicators, resource_types):
+            self.assertRaises(AttributeError, getattr, module, "HelloWorld")
+            self.assertFalse(hasattr(module, "HelloWorld"))
+
+
+if __name__ == "__main__":
+    launch_tests()
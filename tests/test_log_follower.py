@@ -0,0 +1,278 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our log follower.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import MagicMock, patch
+from urllib.parse import urlparse
+
+from PyTravisCI.exceptions import TravisCIError
+from PyTravisCI.log_follower import LogFollower
+from PyTravisCI.requester import Requester
+from PyTravisCI.travis_ci import TravisCI
+
+
+class TestLogFollower(TestCase):
+    """
+    Provides the tests of the log follower.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.log = "Hello, Wörld!\n".encode("utf-8")
+        self.parts = [{"number": 0, "content": "Hello, ", "final": False}]
+        self.state = "started"
+        self.honor_range = True
+        self.sent = []
+        self.sleeps = []
+
+        def fake_send_with_retry(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            path = urlparse(url).path
+            headers = kwargs.get("headers") or {}
+
+            self.sent.append((path, headers.get("Range")))
+
+            result = MagicMock()
+            result.url = url
+            result.status_code = 200
+            result.headers = {}
+
+            if path.endswith("/log") and headers.get("Accept") == "text/plain":
+                offset = 0
+
+                if headers.get("Range") and self.honor_range:
+                    offset = int(headers["Range"][6:-1])
+
+                    if offset >= len(self.log):
+                        result.status_code = 416
+                        result.content = b""
+                        result.text = ""
+                        return result
+
+                    result.status_code = 206
+
+                result.content = self.log[offset:]
+                result.text = result.content.decode("utf-8", errors="replace")
+                return result
+
+            if path.endswith("/log"):
+                data = {"@type": "log", "id": 1, "log_parts": self.parts}
+            elif path.endswith("/job/1"):
+                data = {"@type": "job", "id": 1, "state": self.state}
+            else:  # pragma: no cover
+                raise AssertionError(f"Unexpected request: {path}")
+
+            result.text = json.dumps(data)
+            result.json.return_value = data
+
+            return result
+
+        self.patchers = [
+            patch.object(Requester, "send_with_retry", fake_send_with_retry),
+            patch("PyTravisCI.log_follower.time.sleep", self.sleeps.append),
+        ]
+
+        for patcher in self.patchers:
+            patcher.start()
+
+        self.travis = TravisCI(access_point="https://example.org/api")
+        self.job = self.travis.get_job(1)
+        self.sent.clear()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_fetch_plain_text(self) -> None:
+        """
+        Tests that only the new bytes are requested.
+        """
+
+        follower = LogFollower(self.job)
+
+        # "ö" is split across 2 fetches.
+        self.log = "Hello, Wö".encode("utf-8")[:-1]
+
+        self.assertEqual("Hello, W", follower.fetch())
+
+        self.log = "Hello, Wörld!\n".encode("utf-8")
+
+        self.assertEqual("örld!\n", follower.fetch())
+        self.assertEqual("", follower.fetch())
+        self.assertEqual(len(self.log), follower.offset)
+        self.assertEqual(
+            [
+                ("/api/job/1/log", None),
+                ("/api/job/1/log", "bytes=9-"),
+                ("/api/job/1/log", f"bytes={len(self.log)}-"),
+            ],
+            self.sent,
+        )
+
+    def test_fetch_range_ignored(self) -> None:
+        """
+        Tests that we drop what we already have when the API ignores the
+        range.
+        """
+
+        self.honor_range = False
+
+        follower = LogFollower(self.job)
+
+        self.assertEqual("Hello, Wörld!\n", follower.fetch())
+
+        self.log += b"Bye!\n"
+
+        self.assertEqual("Bye!\n", follower.fetch())
+        self.assertEqual("", follower.fetch())
+
+    def test_fetch_parts(self) -> None:
+        """
+        Tests that only the new parts are given.
+        """
+
+        follower = LogFollower(self.job, plain_text=False)
+
+        self.assertEqual("Hello, ", follower.fetch())
+        self.assertEqual("", follower.fetch())
+
+        self.parts = self.parts + [
+            {"number": 2, "content": "!\\n", "final": True},
+            {"number": 1, "content": "World", "final": False},
+        ]
+
+        self.assertEqual("World!\\n", follower.fetch())
+        self.assertEqual(2, follower.part_number)
+        self.assertTrue(follower.finished)
+
+    def test_follow(self) -> None:
+        """
+        Tests that the log is followed until the job is finished.
+        """
+
+        chunks = []
+        self.log = b"Hello"
+
+        for chunk in self.job.follow_log(interval=3):
+            chunks.append(chunk)
+
+            if len(chunks) == 1:
+                self.log += b", World"
+            elif len(chunks) == 2:
+                # Written right before the end of the job.
+                self.log += b"!\n"
+                self.state = "passed"
+
+        self.assertEqual(["Hello", ", World", "!\n"], chunks)
+        self.assertEqual([3, 3, 3], self.sleeps)
+        self.assertEqual(
+            ["/api/job/1/log"] * 4 + ["/api/job/1", "/api/job/1/log"],
+            [x for x, _ in self.sent],
+        )
+
+    def test_follow_parts(self) -> None:
+        """
+        Tests that the log is followed until its final part.
+        """
+
+        chunks = []
+
+        for chunk in self.job.follow_log(plain_text=False):
+            chunks.append(chunk)
+            self.parts = self.parts + [
+                {"number": 1, "content": "World!", "final": True}
+            ]
+
+        self.assertEqual(["Hello, ", "World!"], chunks)
+        self.assertNotIn("/api/job/1", [x for x, _ in self.sent])
+
+    def test_follow_timeout(self) -> None:
+        """
+        Tests that we stop to follow the log after the given timeout.
+        """
+
+        clock = [0.0]
+
+        def fake_sleep(seconds):
+            self.sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch.object(LogFollower, "get_time", lambda _: clock[0]), patch(
+            "PyTravisCI.log_follower.time.sleep", fake_sleep
+        ):
+            chunks = list(LogFollower(self.job, interval=4).follow(timeout=10))
+
+        self.assertEqual(["Hello, Wörld!\n"], chunks)
+        self.assertEqual([4, 4, 2], self.sleeps)
+
+    def test_errors(self) -> None:
+        """
+        Tests the errors.
+        """
+
+        self.assertRaises(ValueError, lambda: LogFollower(self.job, interval=-1))
+
+        def fake_send_with_retry(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            result = MagicMock()
+            result.url = url
+            result.status_code = 404
+            result.headers = {}
+            result.text = "Not Found"
+            result.json.side_effect = json.JSONDecodeError("Hello", "World", 0)
+
+            return result
+
+        with patch.object(Requester, "send_with_retry", fake_send_with_retry):
+            self.assertRaises(TravisCIError, LogFollower(self.job).fetch)
+
+
+if __name__ == "__main__":
+    launch_tests()
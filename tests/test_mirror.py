@@ -0,0 +1,398 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our local mirror.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+import os
+import re
+import tempfile
+from datetime import datetime
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+from PyTravisCI.mirror import Mirror
+from PyTravisCI.requester import Requester
+from PyTravisCI.resource_types._all import Build, Job, Repository
+from PyTravisCI.travis_ci import TravisCI
+
+
+class TestMirror(TestCase):
+    """
+    Provides the tests of the local mirror.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.mirror = Mirror(os.path.join(self.temp_dir.name, "mirror.sqlite"))
+
+        self.builds = {}
+        self.requested = []
+
+        for build_id in range(1, 8):
+            self.add_build(build_id)
+
+        def fake_send_with_retry(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            parsed = urlparse(url)
+            self.requested.append(parsed.path)
+
+            result = MagicMock()
+            result.url = url
+
+            data = self.get_response(parsed.path, parse_qs(parsed.query))
+
+            result.text = json.dumps(data)
+            result.json.return_value = data
+
+            return result
+
+        self.send_patcher = patch.object(
+            Requester, "send_with_retry", fake_send_with_retry
+        )
+        self.send_patcher.start()
+
+        self.travis = TravisCI(access_point="https://example.org/api")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.send_patcher.stop()
+        self.temp_dir.cleanup()
+
+    def add_build(
+        self, build_id: int, *, state: str = "passed", updated_at: int = 0
+    ) -> None:
+        """
+        Adds (or replaces) a build - with 2 jobs - to the fake API.
+        """
+
+        self.builds[build_id] = {
+            "@type": "build",
+            "@href": f"/build/{build_id}",
+            "@representation": "standard",
+            "id": build_id,
+            "number": str(build_id),
+            "state": state,
+            "duration": build_id * 10,
+            "event_type": "push",
+            "started_at": f"2020-10-{build_id:02d}T20:35:00Z",
+            "finished_at": f"2020-10-{build_id:02d}T20:45:00Z",
+            "updated_at": f"2020-10-{build_id:02d}T20:45:{updated_at:02d}Z",
+            "branch": {
+                "@type": "branch",
+                "name": "master" if build_id % 2 else "dev",
+            },
+            "commit": {"@type": "commit", "id": build_id, "sha": f"sha{build_id}"},
+            "stages": [
+                {
+                    "@type": "stage",
+                    "id": build_id * 100,
+                    "number": 1,
+                    "name": "test",
+                    "state": state,
+                }
+            ],
+            "jobs": [{"@type": "job", "id": build_id * 10 + x} for x in range(2)],
+        }
+
+    def get_response(self, path: str, query: dict) -> dict:
+        """
+        Provides the response of the fake API.
+        """
+
+        if path.endswith("/repo/funilrys%2FPyTravisCI") or path.endswith("/repo/1"):
+            return {
+                "@type": "repository",
+                "@href": "/repo/1",
+                "id": 1,
+                "name": "PyTravisCI",
+                "slug": "funilrys/PyTravisCI",
+                "default_branch": {"@type": "branch", "name": "master"},
+            }
+
+        if path.endswith("/repo/1/builds"):
+            self.assertEqual(["id:desc"], query["sort_by"])
+
+            limit = int(query["limit"][0])
+            offset = int(query.get("offset", ["0"])[0])
+            builds = sorted(self.builds.values(), key=lambda x: -x["id"])
+
+            return {
+                "@type": "builds",
+                "@href": f"/repo/1/builds?limit={limit}&offset={offset}",
+                "@pagination": {
+                    "limit": limit,
+                    "offset": offset,
+                    "count": len(builds),
+                    "next": (
+                        {
+                            "@href": f"/repo/1/builds?limit={limit}"
+                            f"&offset={offset + limit}&sort_by=id%3Adesc",
+                            "offset": offset + limit,
+                            "limit": limit,
+                        }
+                        if offset + limit < len(builds)
+                        else None
+                    ),
+                },
+                "builds": builds[offset : offset + limit],
+            }
+
+        match = re.search(r"/build/(\d+)(/jobs)?$", path)
+
+        if match and match.group(2):
+            build = self.builds[int(match.group(1))]
+
+            return {
+                "@type": "jobs",
+                "@href": f"/build/{build['id']}/jobs",
+                "jobs": [
+                    {
+                        "@type": "job",
+                        "id": x["id"],
+                        "number": f"{build['id']}.{x['id'] % 10 + 1}",
+                        "state": build["state"],
+                        "queue": "builds.gce",
+                        "started_at": build["started_at"],
+                        "finished_at": build["finished_at"],
+                        "build": {"@type": "build", "id": build["id"]},
+                        "stage": {"@type": "stage", "id": build["id"] * 100},
+                    }
+                    for x in build["jobs"]
+                ],
+            }
+
+        if match:
+            return self.builds[int(match.group(1))]
+
+        raise AssertionError(f"Unexpected request: {path}")  # pragma: no cover
+
+    def count_requests(self, suffix: str) -> int:
+        """
+        Provides the number of requests of the paths ending with the given
+        suffix.
+        """
+
+        return len([x for x in self.requested if x.endswith(suffix)])
+
+    def test_sync(self) -> None:
+        """
+        Tests the first synchronization and the offline queries.
+        """
+
+        actual = self.mirror.sync(
+            self.travis.get_repository("funilrys/PyTravisCI"), page_size=3
+        )
+
+        self.assertEqual({"builds": 7, "jobs": 14}, actual)
+
+        repository = self.mirror.get_repository("funilrys/PyTravisCI")
+
+        self.assertIsInstance(repository, Repository)
+        self.assertEqual(1, repository.id)
+        self.assertEqual("master", repository.default_branch.name)
+        self.assertIsNone(self.mirror.get_repository("funilrys/unknown"))
+
+        builds = self.mirror.get_builds("funilrys/PyTravisCI")
+
+        self.assertEqual([7, 6, 5, 4, 3, 2, 1], [x.id for x in builds])
+        self.assertIsInstance(builds[0], Build)
+        self.assertEqual(datetime(2020, 10, 7, 20, 35), builds[0].started_at)
+        self.assertEqual("sha7", builds[0].commit.sha)
+
+        self.assertEqual(
+            [7, 5, 3, 1], [x.id for x in self.mirror.get_builds(branch="master")]
+        )
+        self.assertEqual(
+            [4, 3],
+            [
+                x.id
+                for x in self.mirror.get_builds(
+                    1, since=datetime(2020, 10, 3), until=datetime(2020, 10, 5)
+                )
+            ],
+        )
+        self.assertEqual([7, 6], [x.id for x in self.mirror.get_builds(limit=2)])
+        self.assertEqual([], self.mirror.get_builds(state="failed"))
+
+        jobs = self.mirror.get_jobs(build_id=3)
+
+        self.assertEqual([31, 30], [x.id for x in jobs])
+        self.assertIsInstance(jobs[0], Job)
+        self.assertEqual(14, len(self.mirror.get_jobs("funilrys/PyTravisCI")))
+
+        self.assertEqual(["test"], [x.name for x in self.mirror.get_stages(3)])
+        self.assertEqual(
+            [("dev", 3), ("master", 4)],
+            [
+                tuple(x)
+                for x in self.mirror.execute(
+                    "SELECT branch, COUNT(*) FROM builds GROUP BY branch "
+                    "ORDER BY branch"
+                )
+            ],
+        )
+
+    def test_sync_incremental(self) -> None:
+        """
+        Tests that a resynchronization only fetches the new (or changed)
+        builds.
+        """
+
+        repository = self.travis.get_repository("funilrys/PyTravisCI")
+
+        self.mirror.sync(repository, page_size=3)
+        self.requested.clear()
+
+        self.assertEqual({"builds": 0, "jobs": 0}, self.mirror.sync(repository))
+        self.assertEqual(1, self.count_requests("/builds"))
+        self.assertEqual(0, self.count_requests("/jobs"))
+
+        self.add_build(8, state="started")
+        self.add_build(9)
+        self.add_build(7, state="errored", updated_at=1)
+        # Behind the last synchronized build: not seen by the walk.
+        self.add_build(5, state="errored", updated_at=1)
+        self.requested.clear()
+
+        self.assertEqual(
+            {"builds": 3, "jobs": 6}, self.mirror.sync(repository, page_size=2)
+        )
+        self.assertEqual(2, self.count_requests("/builds"))
+        self.assertEqual([7], [x.id for x in self.mirror.get_builds(state="errored")])
+
+        # The (older) pending build is refreshed even if the walk stops
+        # before it.
+        self.add_build(8, state="passed", updated_at=1)
+        self.add_build(10)
+        self.requested.clear()
+
+        self.assertEqual({"builds": 2, "jobs": 4}, self.mirror.sync(repository))
+        self.assertEqual(1, self.count_requests("/build/8"))
+        self.assertEqual("passed", self.mirror.get_builds(limit=3)[2].state)
+        self.assertEqual(
+            ["passed"], list({x.state for x in self.mirror.get_jobs(build_id=8)})
+        )
+
+    def test_sync_interrupted(self) -> None:
+        """
+        Tests that an interrupted synchronization is resumed by the next one.
+        """
+
+        repository = self.travis.get_repository("funilrys/PyTravisCI")
+
+        self.mirror.sync(repository)
+
+        for build_id in range(8, 12):
+            self.add_build(build_id)
+
+        original = Mirror.sync_build
+
+        def fake_sync_build(mirror, build, *args, **kwargs):
+            if build.id == 9:
+                raise RuntimeError("Hello, World!")
+            return original(mirror, build, *args, **kwargs)
+
+        with patch.object(Mirror, "sync_build", fake_sync_build):
+            self.assertRaises(RuntimeError, lambda: self.mirror.sync(repository))
+
+        self.assertEqual([11, 10], [x.id for x in self.mirror.get_builds(limit=2)])
+
+        self.assertEqual({"builds": 2, "jobs": 4}, self.mirror.sync(repository))
+        self.assertEqual(11, len(self.mirror.get_builds()))
+
+    def test_sync_full(self) -> None:
+        """
+        Tests that a full synchronization walks through all the builds but
+        only stores the changed ones.
+        """
+
+        repository = self.travis.get_repository("funilrys/PyTravisCI")
+
+        self.mirror.sync(repository)
+
+        self.add_build(2, state="errored", updated_at=1)
+        self.requested.clear()
+
+        self.assertEqual({"builds": 0, "jobs": 0}, self.mirror.sync(repository))
+        self.assertEqual(
+            {"builds": 1, "jobs": 2}, self.mirror.sync(repository, full=True)
+        )
+        self.assertEqual([2], [x.id for x in self.mirror.get_builds(state="errored")])
+
+    def test_sync_without_jobs(self) -> None:
+        """
+        Tests the synchronization of the builds only.
+        """
+
+        actual = self.mirror.sync(
+            self.travis.get_repository("funilrys/PyTravisCI"), with_jobs=False
+        )
+
+        self.assertEqual({"builds": 7, "jobs": 0}, actual)
+        self.assertEqual(0, self.count_requests("/jobs"))
+        self.assertEqual([], self.mirror.get_jobs())
+        self.assertEqual(["test"], [x.name for x in self.mirror.get_stages(7)])
+
+    def test_unknown_repository(self) -> None:
+        """
+        Tests that nothing matches a repository which is not mirrored.
+        """
+
+        self.mirror.sync(self.travis.get_repository("funilrys/PyTravisCI"))
+
+        self.assertEqual(7, len(self.mirror.get_builds()))
+        self.assertEqual([], self.mirror.get_builds("funilrys/unknown"))
+        self.assertEqual([], self.mirror.get_builds("funilrys/unknown", state="passed"))
+        self.assertEqual([], self.mirror.get_jobs("funilrys/unknown"))
+        self.assertEqual([], self.mirror.get_jobs("funilrys/unknown", build_id=3))
+        self.assertEqual([], self.mirror.get_builds(2))
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,195 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our rate limiters.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import os
+import tempfile
+import threading
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+from PyTravisCI.rate_limiter import FileTokenBucket, TokenBucket
+
+
+class TestTokenBucket(TestCase):
+    """
+    Provides the tests of the token bucket.
+    """
+
+    def test_invalid_rate(self) -> None:
+        """
+        Tests that a bucket without a positive rate can't be created.
+        """
+
+        self.assertRaises(ValueError, lambda: TokenBucket(0))
+        self.assertRaises(ValueError, lambda: TokenBucket(1, capacity=0))
+
+    @patch.object(TokenBucket, "get_time")
+    def test_reserve(self, mock_time) -> None:
+        """
+        Tests of the method which let us reserve tokens.
+        """
+
+        mock_time.return_value = 100.0
+
+        bucket = TokenBucket(2, capacity=2)
+
+        # The burst.
+        self.assertEqual(0.0, bucket.reserve())
+        self.assertEqual(0.0, bucket.reserve())
+
+        # The bucket is empty, the next tokens are served in order.
+        self.assertEqual(0.5, bucket.reserve())
+        self.assertEqual(1.0, bucket.reserve())
+
+        # 2 seconds later, the 2 reserved tokens are refilled.
+        mock_time.return_value = 102.0
+
+        self.assertEqual(0.0, bucket.reserve())
+
+    @patch.object(TokenBucket, "get_time")
+    def test_refill_capped(self, mock_time) -> None:
+        """
+        Tests that the bucket is never refilled over its capacity.
+        """
+
+        mock_time.return_value = 100.0
+
+        bucket = TokenBucket(1, capacity=1)
+
+        mock_time.return_value = 1000.0
+
+        self.assertEqual(0.0, bucket.reserve())
+        self.assertEqual(1.0, bucket.reserve())
+
+    @patch("time.sleep")
+    @patch.object(TokenBucket, "get_time")
+    def test_acquire_statistics(self, mock_time, mock_sleep) -> None:
+        """
+        Tests that the time we waited for is recorded.
+        """
+
+        mock_time.return_value = 100.0
+
+        bucket = TokenBucket(4, capacity=1)
+
+        self.assertEqual(0.0, bucket.acquire())
+        self.assertEqual(0.25, bucket.acquire())
+        self.assertEqual(0.5, bucket.acquire())
+
+        mock_sleep.assert_called_with(0.5)
+
+        expected = {
+            "acquisitions": 3,
+            "waited_acquisitions": 2,
+            "total_waited": 0.75,
+            "max_waited": 0.5,
+            "average_waited": 0.25,
+        }
+
+        self.assertEqual(expected, bucket.get_statistics())
+
+        bucket.reset_statistics()
+
+        self.assertEqual(0, bucket.get_statistics()["acquisitions"])
+
+    def test_shared_between_threads(self) -> None:
+        """
+        Tests that the reservations of several threads are all accounted.
+        """
+
+        bucket = TokenBucket(1000, capacity=1000)
+
+        threads = [
+            threading.Thread(target=lambda: [bucket.acquire() for _ in range(50)])
+            for _ in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(200, bucket.get_statistics()["acquisitions"])
+
+
+class TestFileTokenBucket(TestCase):
+    """
+    Provides the tests of the file token bucket.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "bucket")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.temp_dir.cleanup()
+
+    @patch.object(FileTokenBucket, "get_time")
+    def test_state_shared(self, mock_time) -> None:
+        """
+        Tests that two buckets working with the same file share their state.
+        """
+
+        mock_time.return_value = 100.0
+
+        first_bucket = FileTokenBucket(1, self.path, capacity=2)
+        second_bucket = FileTokenBucket(1, self.path, capacity=2)
+
+        self.assertEqual(0.0, first_bucket.reserve())
+        self.assertEqual(0.0, second_bucket.reserve())
+        self.assertEqual(1.0, first_bucket.reserve())
+        self.assertEqual(2.0, second_bucket.reserve())
+
+        self.assertTrue(os.path.isfile(self.path))
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -43,13 +43,15 @@ import json
 import secrets
 from unittest import TestCase
 from unittest import main as launch_tests
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import requests
 
 from PyTravisCI.__about__ import __version__
 from PyTravisCI.exceptions import TravisCIError
+from PyTravisCI.rate_limiter import TokenBucket
 from PyTravisCI.requester import Requester
+from PyTravisCI.retry import RetryPolicy
 
 
 class RequesterTest(TestCase):
@@ -92,6 +94,17 @@ class RequesterTest(TestCase):
 
         self.assertDictContainsSubset(expected, actual)
 
+    def test_authorization_header_not_shared(self) -> None:
+        """
+        Tests that the authorization header of a requester is not given to
+        the others.
+        """
+
+        requester = Requester()
+        requester.set_authorization(secrets.token_urlsafe(16))
+
+        self.assertNotIn("Authorization", Requester().session.headers)
+
     def test_authorization_header_non_string(self) -> None:
         """
         Tests that the method which let us communicate the token
@@ -605,6 +618,196 @@ class RequesterTest(TestCase):
 
         self.assertRaises(TravisCIError, lambda: requester.get(given_endpoint))
 
+    @staticmethod
+    def get_fake_response(
+        status_code: int, response: dict, headers: dict = None
+    ) -> MagicMock:
+        """
+        Provides a fake response of the session.
+        """
+
+        result = MagicMock()
+        result.status_code = status_code
+        result.headers = headers or dict()
+        result.url = "https://example.org/api/hello/world"
+        result.text = json.dumps(response)
+        result.json.return_value = response
+
+        return result
+
+    @patch.object(RetryPolicy, "sleep")
+    @patch.object(requests.Session, "get")
+    def test_request_factory_retry(self, mock_session_get, mock_sleep):
+        """
+        Tests of the request factory for the case that a transient error is
+        given before the actual response.
+        """
+
+        response = {"@type": "user", "id": 4549848944894848948949}
+        error = {
+            "@type": "error",
+            "error_type": "rate_limited",
+            "error_message": "rate limited",
+        }
+
+        mock_session_get.side_effect = [
+            self.get_fake_response(429, error, {"Retry-After": "3"}),
+            requests.exceptions.ConnectionError(),
+            self.get_fake_response(200, response),
+        ]
+
+        requester = Requester(
+            retry_policy=RetryPolicy(max_attempts=3, backoff_factor=1, jitter=False)
+        )
+        requester.set_base_url("https://example.org/api/")
+
+        expected = response
+        actual = requester.get("hello/world")
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(3, mock_session_get.call_count)
+        self.assertEqual(
+            [((3.0,),), ((2,),)], [x[:1] for x in mock_sleep.call_args_list]
+        )
+
+    @patch.object(RetryPolicy, "sleep")
+    @patch.object(requests.Session, "get")
+    def test_request_factory_retry_exhausted(self, mock_session_get, mock_sleep):
+        """
+        Tests of the request factory for the case that the transient error
+        is given until we run out of attempts.
+        """
+
+        error = {
+            "@type": "error",
+            "error_type": "rate_limited",
+            "error_message": "rate limited",
+        }
+
+        mock_session_get.return_value = self.get_fake_response(502, error)
+
+        requester = Requester(retry_policy=RetryPolicy(max_attempts=2))
+        requester.set_base_url("https://example.org/api/")
+
+        self.assertRaises(TravisCIError, lambda: requester.get("hello/world"))
+        self.assertEqual(2, mock_session_get.call_count)
+        self.assertEqual(1, mock_sleep.call_count)
+
+    @patch.object(RetryPolicy, "sleep")
+    @patch.object(requests.Session, "post")
+    def test_request_factory_no_retry_of_post(self, mock_session_post, mock_sleep):
+        """
+        Tests of the request factory for the case that a non-idempotent request
+        fails with a transient error.
+        """
+
+        mock_session_post.side_effect = requests.exceptions.ConnectionError()
+
+        requester = Requester(retry_policy=RetryPolicy(max_attempts=5))
+        requester.set_base_url("https://example.org/api/")
+
+        self.assertRaises(
+            requests.exceptions.ConnectionError,
+            lambda: requester.post("hello/world"),
+        )
+        self.assertEqual(1, mock_session_post.call_count)
+        mock_sleep.assert_not_called()
+
+    def test_set_retry_policy_not_policy(self) -> None:
+        """
+        Tests of the method which let us set the retry policy for the case that
+        a non-policy is given.
+        """
+
+        requester = Requester()
+
+        self.assertRaises(TypeError, lambda: requester.set_retry_policy(3))
+
+    @patch.object(TokenBucket, "acquire")
+    @patch.object(requests.Session, "get")
+    def test_request_factory_rate_limited(self, mock_session_get, mock_acquire):
+        """
+        Tests that every request goes through the rate limiter.
+        """
+
+        response = {"@type": "user", "id": 4549848944894848948949}
+
+        mock_session_get.return_value = self.get_fake_response(200, response)
+
+        requester = Requester(rate_limiter=TokenBucket(10))
+        requester.set_base_url("https://example.org/api/")
+
+        requester.get("hello/world")
+        requester.get("world/hello")
+
+        self.assertEqual(2, mock_acquire.call_count)
+
+    def test_set_rate_limiter_not_rate_limiter(self) -> None:
+        """
+        Tests of the method which let us set the rate limiter for the case that
+        a non-rate limiter is given.
+        """
+
+        requester = Requester()
+
+        self.assertRaises(TypeError, lambda: requester.set_rate_limiter(3))
+
+    def test_set_pool_size(self) -> None:
+        """
+        Tests of the method which let us set the number of connections to keep
+        alive.
+        """
+
+        requester = Requester()
+        requester.set_pool_size(32)
+
+        self.assertEqual(32, requester.pool_size)
+        # pylint: disable=protected-access
+        self.assertEqual(
+            32, requester.session.get_adapter("https://example.org")._pool_maxsize
+        )
+
+    def test_set_pool_size_grows_only(self) -> None:
+        """
+        Tests that the pool is only replaced when it grows - and that the
+        replaced one is closed.
+        """
+
+        requester = Requester()
+        adapter = requester.session.get_adapter("https://example.org")
+
+        with patch.object(adapter, "close") as mocked_close:
+            requester.set_pool_size(requester.pool_size)
+            requester.set_pool_size(1)
+
+            self.assertIs(adapter, requester.session.get_adapter("https://example.org"))
+            mocked_close.assert_not_called()
+
+            requester.set_pool_size(32)
+
+            mocked_close.assert_called_once_with()
+
+        adapter = requester.session.get_adapter("https://example.org")
+
+        self.assertIs(adapter, requester.session.get_adapter("http://example.org"))
+        self.assertEqual(32, requester.pool_size)
+
+        requester.set_pool_size(16)
+
+        self.assertIs(adapter, requester.session.get_adapter("https://example.org"))
+        self.assertEqual(32, requester.pool_size)
+
+    def test_set_pool_size_not_valid(self) -> None:
+        """
+        Tests of the method which let us set the number of connections to keep
+        alive for the case that a non-valid value is given.
+        """
+
+        requester = Requester()
+
+        self.assertRaises(TypeError, lambda: requester.set_pool_size("3"))
+        self.assertRaises(ValueError, lambda: requester.set_pool_size(0))
+
 
 if __name__ == "__main__":
     launch_tests()
@@ -44,8 +44,14 @@ import json
 from datetime import datetime
 from unittest import TestCase
 from unittest import main as launch_tests
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
 
+from PyTravisCI.requester import Requester
+from PyTravisCI.resource_types._all import Build, Organization, Repository
 from PyTravisCI.resource_types.base import ResourceTypesBase
+from PyTravisCI.resource_types.compact import CompactResourceTypesBase
+from PyTravisCI.travis_ci import TravisCI
 
 
 class TestResourceTypesBase(TestCase):
@@ -759,5 +765,303 @@ class TestResourceTypesBase(TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestIterAll(TestCase):
+    """
+    Provides the tests of the auto-paginating iterator.
+    """
+
+    total: int = 7
+    with_count: bool = True
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.sent_urls = []
+
+        def fake_send_with_retry(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            self.sent_urls.append(url)
+
+            query = parse_qs(urlparse(url).query)
+            limit = int(query["limit"][0])
+            offset = int(query.get("offset", ["0"])[0])
+
+            if offset + limit < self.total:
+                next_page = {
+                    "@href": f"/builds?limit={limit}&offset={offset + limit}",
+                    "offset": offset + limit,
+                    "limit": limit,
+                }
+            else:
+                next_page = None
+
+            pagination = {"limit": limit, "offset": offset, "next": next_page}
+
+            if self.with_count:
+                pagination["count"] = self.total
+
+            data = {
+                "@type": "builds",
+                "@href": f"/builds?limit={limit}&offset={offset}",
+                "@pagination": pagination,
+                "builds": [
+                    {"@type": "build", "id": x}
+                    for x in range(offset, min(offset + limit, self.total))
+                ],
+            }
+
+            result = MagicMock()
+            result.url = url
+            result.text = json.dumps(data)
+            result.json.return_value = data
+
+            return result
+
+        self.send_patcher = patch.object(
+            Requester, "send_with_retry", fake_send_with_retry
+        )
+        self.send_patcher.start()
+
+        self.travis = TravisCI(access_point="https://example.org/api")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.send_patcher.stop()
+
+    def test_iter_all(self) -> None:
+        """
+        Tests that all pages are followed.
+        """
+
+        builds = self.travis.get_builds(params={"limit": 3})
+
+        actual = [x.id for x in builds.iter_all()]
+
+        self.assertEqual(list(range(self.total)), actual)
+        self.assertEqual(3, len(self.sent_urls))
+
+    def test_iter_all_compact(self) -> None:
+        """
+        Tests that the compact version of the items can be given.
+        """
+
+        actual = list(self.travis.iter_builds(params={"limit": 3}, compact=True))
+
+        self.assertEqual(list(range(self.total)), [x.id for x in actual])
+
+        for build in actual:
+            self.assertIsInstance(build, CompactResourceTypesBase)
+
+    def test_iter_all_lazy(self) -> None:
+        """
+        Tests that the next pages are only fetched when needed.
+        """
+
+        iterator = self.travis.iter_builds(params={"limit": 3})
+
+        self.assertEqual(1, len(self.sent_urls))
+
+        for _ in range(3):
+            next(iterator)
+
+        self.assertEqual(1, len(self.sent_urls))
+
+        next(iterator)
+
+        self.assertEqual(2, len(self.sent_urls))
+
+    def test_iter_all_max_items(self) -> None:
+        """
+        Tests that we stop once the maximum number of items is reached.
+        """
+
+        actual = [
+            x.id for x in self.travis.iter_builds(params={"limit": 3}, max_items=4)
+        ]
+
+        self.assertEqual([0, 1, 2, 3], actual)
+        self.assertEqual(2, len(self.sent_urls))
+
+    def test_iter_all_max_items_page_boundary(self) -> None:
+        """
+        Tests that we don't fetch the next page when the maximum number of
+        items is reached at the end of a page.
+        """
+
+        actual = [
+            x.id for x in self.travis.iter_builds(params={"limit": 3}, max_items=3)
+        ]
+
+        self.assertEqual([0, 1, 2], actual)
+        self.assertEqual(1, len(self.sent_urls))
+
+    def test_iter_all_not_valid(self) -> None:
+        """
+        Tests that non-valid uses are rejected.
+        """
+
+        builds = self.travis.get_builds(params={"limit": 3})
+
+        self.assertRaises(ValueError, lambda: builds.iter_all(max_items=-1))
+        self.assertRaises(ValueError, lambda: builds.iter_all(prefetch=-1))
+        self.assertRaises(NotImplementedError, lambda: builds.builds[0].iter_all())
+
+    def test_iter_all_prefetch(self) -> None:
+        """
+        Tests that the prefetched pages are given in order.
+        """
+
+        actual = [
+            x.id for x in self.travis.iter_builds(params={"limit": 2}, prefetch=2)
+        ]
+
+        self.assertEqual(list(range(self.total)), actual)
+        self.assertEqual(
+            {
+                "https://example.org/api/builds?limit=2",
+                "https://example.org/api/builds?limit=2&offset=2",
+                "https://example.org/api/builds?limit=2&offset=4",
+                "https://example.org/api/builds?limit=2&offset=6",
+            },
+            set(self.sent_urls),
+        )
+        self.assertEqual(4, len(self.sent_urls))
+
+    def test_iter_all_prefetch_max_items(self) -> None:
+        """
+        Tests that we don't prefetch the pages we don't need.
+        """
+
+        actual = [
+            x.id
+            for x in self.travis.iter_builds(
+                params={"limit": 2}, prefetch=4, max_items=3
+            )
+        ]
+
+        self.assertEqual([0, 1, 2], actual)
+        self.assertEqual(2, len(self.sent_urls))
+
+    def test_iter_all_prefetch_early_stop(self) -> None:
+        """
+        Tests that an early stop does not leave anything behind.
+        """
+
+        iterator = self.travis.iter_builds(params={"limit": 1}, prefetch=2)
+
+        self.assertEqual(0, next(iterator).id)
+
+        iterator.close()
+
+        self.assertLessEqual(len(self.sent_urls), 3)
+
+    def test_iter_all_prefetch_without_count(self) -> None:
+        """
+        Tests that we follow the pages one after another when the count is not
+        given.
+        """
+
+        self.with_count = False
+
+        actual = [
+            x.id for x in self.travis.iter_builds(params={"limit": 3}, prefetch=2)
+        ]
+
+        self.assertEqual(list(range(self.total)), actual)
+        self.assertEqual(3, len(self.sent_urls))
+
+
+class TestNestedResource(TestCase):
+    """
+    Provides the tests of the (lazy) creation of the nested resource types.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.given = {
+            "_at_type": "build",
+            "id": 1,
+            "state": "passed",
+            "repository": {"_at_type": "repository", "id": 2, "slug": "foo/bar"},
+            "jobs": [{"_at_type": "job", "id": 3}, {"_at_type": "job", "id": 4}],
+            "created_by": {"_at_type": "organization", "id": 5},
+            "commit": None,
+            "stages": [],
+        }
+
+    def test_lazy(self) -> None:
+        """
+        Tests that the nested resource types are created when they are read
+        for the first time.
+        """
+
+        build = Build(**copy.deepcopy(self.given))
+
+        self.assertIsInstance(vars(build)["repository"], dict)
+        self.assertIsInstance(vars(build)["jobs"][0], dict)
+
+        self.assertIsInstance(build.repository, Repository)
+        self.assertEqual("foo/bar", build.repository.slug)
+        self.assertIs(build.repository, build.repository)
+        self.assertIs(build.repository, vars(build)["repository"])
+
+        self.assertEqual([3, 4], [x.id for x in build.jobs])
+        self.assertIsInstance(build.created_by, Organization)
+
+        self.assertIsNone(build.commit)
+        self.assertEqual([], build.stages)
+        self.assertIsNone(build.branch)
+
+    def test_unknown_type(self) -> None:
+        """
+        Tests that a dataset with an unknown :code:`@type` is kept as is.
+        """
+
+        self.given["created_by"] = {"_at_type": "team", "id": 5}
+
+        build = Build(**self.given)
+
+        self.assertEqual({"_at_type": "team", "id": 5}, build.created_by)
+
+    def test_context(self) -> None:
+        """
+        Tests that the nested resource types share the context of their
+        parent.
+        """
+
+        context = {"com": {"requester": Requester()}, "shared": {"build_id": 1}}
+
+        build = Build(_PyTravisCI=context, **self.given)
+
+        self.assertIs(context, build.repository._PyTravisCI)
+        self.assertIs(context, build.jobs[1]._PyTravisCI)
+
+    def test_to_dict_eq(self) -> None:
+        """
+        Tests that the conversion and the comparison don't depend on what was
+        already created.
+        """
+
+        build = Build(**copy.deepcopy(self.given))
+        untouched = Build(**copy.deepcopy(self.given))
+
+        _ = build.repository, build.jobs
+
+        self.assertEqual(build, untouched)
+        self.assertEqual(build.to_dict(), Build(**self.given).to_dict())
+        self.assertEqual(
+            {"@type": "repository", "id": 2, "slug": "foo/bar"},
+            Build(**self.given).to_dict()["repository"],
+        )
+
+
 if __name__ == "__main__":
     launch_tests()
@@ -0,0 +1,554 @@
+"""
+Just another Python API for Travis CI (API).
+
+Tests of the repository resource type.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import base64
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import MagicMock, patch
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from PyTravisCI.encryption.data import DataEncryption
+from PyTravisCI.encryption.file import FileEncryption
+from PyTravisCI.encryption.public_key_cache import PublicKeyCache
+from PyTravisCI.requester import Requester
+from PyTravisCI.exceptions import TravisCIError
+from PyTravisCI.travis_ci import TravisCI
+
+
+class TestRepositoryFilesEncryption(TestCase):
+    """
+    Provides the tests of the encryption of (many) files for a repository.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.sent_requests = []
+        self.env_vars = [
+            {
+                "@type": "env_var",
+                "@href": "/repo/1/env_var/a",
+                "@representation": "standard",
+                "id": "a",
+                "name": "HELLO",
+                "public": True,
+                "value": "world",
+                "branch": None,
+            }
+        ]
+
+        def fake_send_with_retry(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            endpoint = url[len("https://example.org/api") :]
+            data = kwargs.get("data")
+
+            if isinstance(data, (str, bytes)):
+                data = json.loads(data)
+
+            self.sent_requests.append((verb.upper(), endpoint, data))
+
+            if endpoint.endswith("/env_vars") and verb.upper() == "POST":
+                response = {
+                    "@type": "env_var",
+                    "@href": f"/repo/1/env_var/{len(self.env_vars)}",
+                    "@representation": "standard",
+                    "id": str(len(self.env_vars)),
+                    "name": data["env_var.name"],
+                    "public": data["env_var.public"],
+                    "value": None,
+                    "branch": data.get("env_var.branch"),
+                }
+                self.env_vars.append(response)
+            elif endpoint.endswith("/env_vars"):
+                response = {
+                    "@type": "env_vars",
+                    "@href": "/repo/1/env_vars",
+                    "env_vars": self.env_vars,
+                }
+            elif "/env_var/" in endpoint:
+                response = dict(
+                    next(x for x in self.env_vars if endpoint.endswith(x["@href"]))
+                )
+            else:
+                response = {
+                    "@type": "repository",
+                    "@href": "/repo/1",
+                    "@representation": "standard",
+                    "id": 1,
+                    "slug": "foo/bar",
+                }
+
+            result = MagicMock()
+            result.url = url
+            result.text = json.dumps(response)
+            result.json.return_value = response
+
+            return result
+
+        self.send_patcher = patch.object(
+            Requester, "send_with_retry", fake_send_with_retry
+        )
+        self.send_patcher.start()
+
+        self.travis = TravisCI(access_point="https://example.org/api")
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+        self.given = {}
+
+        for name in ("hello", "world", "foo"):
+            self.given[name] = os.urandom(1000 + len(self.given))
+
+            with open(os.path.join(self.temp_dir.name, name), "wb") as file_stream:
+                file_stream.write(self.given[name])
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.send_patcher.stop()
+        self.temp_dir.cleanup()
+
+    def get_path(self, name: str) -> str:
+        """
+        Provides the path of the given (temporary) file.
+        """
+
+        return os.path.join(self.temp_dir.name, name)
+
+    def decrypt(self, information: dict, name: str) -> bytes:
+        """
+        Decrypts the given encrypted file with the given information.
+        """
+
+        encryptor = FileEncryption()
+        encryptor.set_key(bytes.fromhex(next(iter(information["key"].values()))))
+        encryptor.set_iv(bytes.fromhex(next(iter(information["iv"].values()))))
+
+        with open(self.get_path(name), "rb") as file_stream:
+            return encryptor.decrypt_file_content(file_stream.read())
+
+    def test_encrypt_files(self) -> None:
+        """
+        Tests the encryption of many files with a single key and IV.
+        """
+
+        repository = self.travis.get_repository("foo/bar")
+
+        information = repository.encrypt_files(
+            [
+                self.get_path("hello"),
+                self.get_path("world"),
+                (self.get_path("foo"), self.get_path("bar.enc")),
+            ],
+            max_workers=3,
+        )
+
+        for name, output in (
+            ("hello", "hello.enc"),
+            ("world", "world.enc"),
+            ("foo", "bar.enc"),
+        ):
+            self.assertEqual(self.given[name], self.decrypt(information, output))
+
+        self.assertEqual({"ENCRYPTED_F44780A83EAA_KEY"}, set(information["key"].keys()))
+        self.assertEqual({"ENCRYPTED_F44780A83EAA_IV"}, set(information["iv"].keys()))
+
+        expected_commands = [
+            "openssl aes-256-cbc -K $ENCRYPTED_F44780A83EAA_KEY -iv "
+            f"$ENCRYPTED_F44780A83EAA_IV -in {x} -out {y} -d"
+            for x, y in (
+                ("hello.enc", "hello"),
+                ("world.enc", "world"),
+                ("bar.enc", "foo"),
+            )
+        ]
+
+        self.assertEqual(expected_commands, information["commands"])
+        self.assertEqual(" && ".join(expected_commands), information["command"])
+
+        self.assertEqual(
+            [
+                ("GET", "/repo/foo%2Fbar", None),
+                ("GET", "/repo/1/env_vars", None),
+                (
+                    "POST",
+                    "/repo/1/env_vars",
+                    {
+                        "env_var.name": "ENCRYPTED_F44780A83EAA_KEY",
+                        "env_var.value": information["key"][
+                            "ENCRYPTED_F44780A83EAA_KEY"
+                        ],
+                        "env_var.public": False,
+                    },
+                ),
+                (
+                    "POST",
+                    "/repo/1/env_vars",
+                    {
+                        "env_var.name": "ENCRYPTED_F44780A83EAA_IV",
+                        "env_var.value": information["iv"]["ENCRYPTED_F44780A83EAA_IV"],
+                        "env_var.public": False,
+                    },
+                ),
+            ],
+            self.sent_requests,
+        )
+
+    def test_encrypt_files_existing_env_vars(self) -> None:
+        """
+        Tests that the existing environment variables are updated instead of
+        being duplicated.
+        """
+
+        repository = self.travis.get_repository("foo/bar")
+
+        first = repository.encrypt_files([self.get_path("hello")])
+        self.sent_requests.clear()
+
+        second = repository.encrypt_files([self.get_path("hello")])
+
+        self.assertEqual(first["key"].keys(), second["key"].keys())
+        self.assertNotEqual(first["key"], second["key"])
+        self.assertEqual(self.given["hello"], self.decrypt(second, "hello.enc"))
+
+        self.assertEqual(["GET", "PATCH", "PATCH"], [x[0] for x in self.sent_requests])
+        self.assertEqual(3, len(self.env_vars))
+
+    def test_encrypt_files_same_names_as_encrypt_file(self) -> None:
+        """
+        Tests that the encryption of a single file uses the same environment
+        variables as :code:`encrypt_file()`.
+        """
+
+        repository = self.travis.get_repository("foo/bar")
+
+        information = repository.encrypt_file(
+            self.get_path("hello"), self.get_path("hello.enc")
+        )
+
+        self.assertEqual(self.given["hello"], self.decrypt(information, "hello.enc"))
+
+        self.assertEqual(
+            information["key"].keys(),
+            repository.encrypt_files([self.get_path("hello")])["key"].keys(),
+        )
+
+    def test_encrypt_file_missing_input(self) -> None:
+        """
+        Tests that the encryption of a file which does not exist leaves the
+        existing output untouched - and nothing behind.
+        """
+
+        repository = self.travis.get_repository("foo/bar")
+        self.sent_requests.clear()
+
+        with open(self.get_path("hello.enc"), "wb") as file_stream:
+            file_stream.write(b"previous")
+
+        self.assertRaises(
+            FileNotFoundError,
+            repository.encrypt_file,
+            self.get_path("missing"),
+            self.get_path("hello.enc"),
+        )
+        self.assertRaises(
+            FileNotFoundError,
+            repository.encrypt_file,
+            self.get_path("missing"),
+            self.get_path("missing.enc"),
+        )
+
+        with open(self.get_path("hello.enc"), "rb") as file_stream:
+            self.assertEqual(b"previous", file_stream.read())
+
+        self.assertFalse(os.path.exists(self.get_path("missing.enc")))
+        self.assertEqual([], self.sent_requests)
+
+    def test_encrypt_file_stream(self) -> None:
+        """
+        Tests the encryption of an opened file into a path.
+        """
+
+        repository = self.travis.get_repository("foo/bar")
+
+        with open(self.get_path("hello"), "rb") as file_stream:
+            information = repository.encrypt_file(
+                file_stream, self.get_path("hello.enc")
+            )
+
+        self.assertEqual(self.given["hello"], self.decrypt(information, "hello.enc"))
+        self.assertIn("-in hello.enc -out hello -d", information["command"])
+
+    def test_encrypt_files_not_valid(self) -> None:
+        """
+        Tests the encryption of no file - or of a file which does not exist.
+        """
+
+        repository = self.travis.get_repository("foo/bar")
+
+        self.assertRaises(ValueError, repository.encrypt_files, [])
+        self.assertRaises(
+            FileNotFoundError,
+            repository.encrypt_files,
+            [self.get_path("hello"), self.get_path("not-found")],
+        )
+
+
+class TestRepositorySecretsEncryption(TestCase):
+    """
+    Provides the tests of the encryption of secrets for (many) repositories.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.sent_requests = []
+        self.private_keys = {}
+
+        for repository_id in (1, 2):
+            self.private_keys[repository_id] = self.get_new_key()
+
+        def fake_send_with_retry(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            endpoint = url[len("https://example.org/api") :]
+            self.sent_requests.append((verb.upper(), endpoint))
+
+            slug = endpoint.split("/")[2].replace("%2F", "/")
+            repository_id = {"1": 1, "foo/bar": 1, "2": 2, "foo/baz": 2}.get(slug)
+
+            if repository_id is None:
+                response = {
+                    "@type": "error",
+                    "error_type": "not_found",
+                    "error_message": "repository not found (or insufficient access)",
+                }
+            elif endpoint.endswith("/key_pair/generated"):
+                if verb.upper() == "POST":
+                    self.private_keys[repository_id] = self.get_new_key()
+
+                public_key = (
+                    self.private_keys[repository_id]
+                    .public_key()
+                    .public_bytes(
+                        serialization.Encoding.PEM,
+                        serialization.PublicFormat.PKCS1,
+                    )
+                    .decode()
+                )
+
+                response = {
+                    "@type": "key_pair_generated",
+                    "@href": f"/repo/{repository_id}/key_pair/generated",
+                    "@representation": "standard",
+                    "description": "",
+                    "public_key": public_key,
+                    "fingerprint": str(hash(public_key)),
+                }
+            else:
+                response = {
+                    "@type": "repository",
+                    "@href": f"/repo/{repository_id}",
+                    "@representation": "standard",
+                    "id": repository_id,
+                    "slug": ("foo/bar", "foo/baz")[repository_id - 1],
+                    "private": False,
+                }
+
+            result = MagicMock()
+            result.url = url
+            result.status_code = 404 if repository_id is None else 200
+            result.text = json.dumps(response)
+            result.json.return_value = response
+
+            return result
+
+        self.send_patcher = patch.object(
+            Requester, "send_with_retry", fake_send_with_retry
+        )
+        self.send_patcher.start()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.send_patcher.stop()
+
+    @staticmethod
+    def get_new_key() -> rsa.RSAPrivateKeyWithSerialization:
+        """
+        Provides a new key to work with.
+        """
+
+        return rsa.generate_private_key(
+            backend=default_backend(), public_exponent=65537, key_size=2048
+        )
+
+    def decrypt(self, repository_id: int, encrypted: list) -> list:
+        """
+        Decrypts the given secrets with the private key of the given
+        repository.
+        """
+
+        decryptor = DataEncryption(
+            private_key=self.private_keys[repository_id].private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            )
+        )
+
+        return [decryptor.decrypt_data(base64.b64decode(x)).decode() for x in encrypted]
+
+    def get_key_pair_requests(self) -> list:
+        """
+        Provides the requests of key pairs we sent.
+        """
+
+        return [x for x in self.sent_requests if "/key_pair" in x[1]]
+
+    def test_encrypt_secrets_no_cache(self) -> None:
+        """
+        Tests that the public key is fetched every time without a cache.
+        """
+
+        repository = TravisCI(access_point="https://example.org/api").get_repository(
+            "foo/bar"
+        )
+
+        self.assertEqual(
+            ["hello"], self.decrypt(1, repository.encrypt_secrets(["hello"]))
+        )
+        self.assertEqual(
+            ["world"], self.decrypt(1, repository.encrypt_secrets(["world"]))
+        )
+
+        self.assertEqual(2, len(self.get_key_pair_requests()))
+
+    def test_encrypt_secrets_cache(self) -> None:
+        """
+        Tests that the cached public key is not fetched again - until a new key
+        pair is generated.
+        """
+
+        cache = PublicKeyCache()
+        travis = TravisCI(
+            access_point="https://example.org/api", public_key_cache=cache
+        )
+
+        repository = travis.get_repository("foo/bar")
+
+        self.assertEqual(
+            ["hello"], self.decrypt(1, repository.encrypt_secrets(["hello"]))
+        )
+        self.assertEqual(
+            ['WORLD="hello"'],
+            self.decrypt(
+                1, [x["secure"] for x in repository.encrypt_env_var({"WORLD": "hello"})]
+            ),
+        )
+        self.assertEqual(
+            ["hello"],
+            self.decrypt(1, travis.get_repository(1).encrypt_secrets(["hello"])),
+        )
+
+        self.assertEqual(
+            [("GET", "/repo/1/key_pair/generated")], self.get_key_pair_requests()
+        )
+
+        repository.generate_key_pair()
+
+        self.assertEqual(
+            ["world"], self.decrypt(1, repository.encrypt_secrets(["world"]))
+        )
+
+        self.assertEqual(
+            [
+                ("GET", "/repo/1/key_pair/generated"),
+                ("POST", "/repo/1/key_pair/generated"),
+                ("GET", "/repo/1/key_pair/generated"),
+            ],
+            self.get_key_pair_requests(),
+        )
+        self.assertEqual(2, cache.get_statistics()["loads"])
+
+    def test_encrypt_secrets_many(self) -> None:
+        """
+        Tests the encryption of the secrets of many repositories at once.
+        """
+
+        travis = TravisCI(
+            access_point="https://example.org/api", public_key_cache=PublicKeyCache()
+        )
+
+        secrets = {
+            "foo/bar": [f"HELLO_{x}=world" for x in range(5)],
+            "foo/missing": ["hello"],
+            2: [b"foo"],
+        }
+
+        for _ in range(2):
+            result = travis.encrypt_secrets_many(secrets, max_processes=1)
+
+            self.assertEqual(["foo/bar", "foo/missing", 2], result.keys)
+            self.assertEqual(secrets["foo/bar"], self.decrypt(1, result[0]))
+            self.assertEqual(["foo"], self.decrypt(2, result[2]))
+
+            self.assertIsNone(result[1])
+            self.assertEqual(["foo/missing"], [x for x, _ in result.get_errors()])
+            self.assertIsInstance(result.get_errors()[0][1], TravisCIError)
+
+        self.assertEqual(2, len(self.get_key_pair_requests()))
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,674 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our response caches.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import MagicMock, patch
+
+from PyTravisCI.requester import Requester
+from PyTravisCI.response_cache import (
+    DirectoryResponseCache,
+    MemoryResponseCache,
+    ResponseCacheBase,
+    SQLiteResponseCache,
+)
+from PyTravisCI.travis_ci import TravisCI
+
+
+class ResponseCacheTestMixin:
+    """
+    Provides the tests every response cache should pass.
+    """
+
+    # pylint: disable=no-member
+
+    def get_cache(self, **kwargs) -> ResponseCacheBase:
+        """
+        Provides the cache to test.
+        """
+
+        raise NotImplementedError()
+
+    def test_get_set(self) -> None:
+        """
+        Tests that a stored response is given back.
+        """
+
+        cache = self.get_cache()
+        given = {"@type": "repository", "id": 4549848944894848948949, "a": [1, None]}
+
+        self.assertIsNone(cache.get("a"))
+
+        cache.set("a", given, 60)
+
+        self.assertEqual(given, cache.get("a"))
+        self.assertEqual(
+            {"hits": 1, "misses": 1, "stores": 1, "invalidations": 0},
+            cache.get_statistics(),
+        )
+
+        cache.reset_statistics()
+
+        self.assertEqual(
+            {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0},
+            cache.get_statistics(),
+        )
+
+    def test_expiration(self) -> None:
+        """
+        Tests that an expired response is not given back.
+        """
+
+        cache = self.get_cache()
+
+        with patch.object(ResponseCacheBase, "get_time", return_value=1000.0):
+            cache.set("a", {"id": 1}, 60)
+
+        with patch.object(ResponseCacheBase, "get_time", return_value=1059.0):
+            self.assertEqual({"id": 1}, cache.get("a"))
+
+        with patch.object(ResponseCacheBase, "get_time", return_value=1060.0):
+            self.assertIsNone(cache.get("a"))
+
+    def test_invalidate(self) -> None:
+        """
+        Tests that the responses under an URL can be invalidated.
+        """
+
+        cache = self.get_cache()
+        base = "https://example.org/api"
+
+        cache.set("a", {"id": 1}, 60, [f"{base}/repo/foo%2Fbar", f"{base}/repo/1"])
+        cache.set("b", {"id": 2}, 60, [f"{base}/repo/1/env_vars?limit=5"])
+        cache.set("c", {"id": 3}, 60, [f"{base}/repo/12"])
+        cache.set("d", {"id": 4}, 60)
+
+        self.assertEqual(2, cache.invalidate(f"{base}/repo/1?include=repo.owner"))
+
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual({"id": 3}, cache.get("c"))
+        self.assertEqual({"id": 4}, cache.get("d"))
+        self.assertEqual(2, cache.get_statistics()["invalidations"])
+
+    def test_delete_clear(self) -> None:
+        """
+        Tests that the responses can be forgotten.
+        """
+
+        cache = self.get_cache()
+        cache.set("a", {"id": 1}, 60)
+        cache.set("b", {"id": 2}, 60)
+
+        cache.delete("a")
+        cache.delete("c")
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual({"id": 2}, cache.get("b"))
+
+        cache.clear()
+
+        self.assertIsNone(cache.get("b"))
+
+
+class TestMemoryResponseCache(ResponseCacheTestMixin, TestCase):
+    """
+    Provides the tests of the memory response cache.
+    """
+
+    def get_cache(self, **kwargs) -> ResponseCacheBase:
+        return MemoryResponseCache(**kwargs)
+
+    def test_lru(self) -> None:
+        """
+        Tests that the least recently used responses are evicted.
+        """
+
+        cache = MemoryResponseCache(2)
+        cache.set("a", {"id": 1}, 60)
+        cache.set("b", {"id": 2}, 60)
+        cache.get("a")
+        cache.set("c", {"id": 3}, 60)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(2, len(cache))
+
+    def test_not_valid_max_entries(self) -> None:
+        """
+        Tests that a non-valid size is rejected.
+        """
+
+        self.assertRaises(ValueError, lambda: MemoryResponseCache(0))
+
+
+class TestSQLiteResponseCache(ResponseCacheTestMixin, TestCase):
+    """
+    Provides the tests of the SQLite response cache.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = (
+            tempfile.TemporaryDirectory()
+        )  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.temp_dir.name, "cache.sqlite")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.temp_dir.cleanup()
+
+    def get_cache(self, **kwargs) -> ResponseCacheBase:
+        return SQLiteResponseCache(self.path, **kwargs)
+
+    def test_shared(self) -> None:
+        """
+        Tests that two caches of the same database share their responses.
+        """
+
+        self.get_cache().set("a", {"id": 1}, 60)
+
+        self.assertEqual({"id": 1}, self.get_cache().get("a"))
+
+    def test_purge_expired(self) -> None:
+        """
+        Tests that the expired responses can be purged.
+        """
+
+        cache = self.get_cache()
+        cache.set("a", {"id": 1}, -1)
+        cache.set("b", {"id": 2}, 60)
+        cache.purge_expired()
+
+        rows = cache.get_connection().execute("SELECT key FROM responses").fetchall()
+
+        self.assertEqual([("b",)], rows)
+
+
+class TestDirectoryResponseCache(ResponseCacheTestMixin, TestCase):
+    """
+    Provides the tests of the directory response cache.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.temp_dir = (
+            tempfile.TemporaryDirectory()
+        )  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.temp_dir.name, "cache")
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.temp_dir.cleanup()
+
+    def get_cache(self, **kwargs) -> ResponseCacheBase:
+        return DirectoryResponseCache(self.path, **kwargs)
+
+    def test_shared(self) -> None:
+        """
+        Tests that two caches of the same directory share their responses.
+        """
+
+        self.get_cache().set("a", {"id": 1}, 60)
+
+        self.assertEqual({"id": 1}, self.get_cache().get("a"))
+
+    def test_no_partial_file(self) -> None:
+        """
+        Tests that nothing but the responses are left in the directory.
+        """
+
+        cache = self.get_cache()
+        cache.set("a", {"id": 1}, 60)
+
+        self.assertEqual([os.path.basename(cache.get_path("a"))], os.listdir(self.path))
+
+
+class TestResponseCacheBase(TestCase):
+    """
+    Provides the tests of the base of the response caches.
+    """
+
+    def test_get_key(self) -> None:
+        """
+        Tests that the token is not part of the key but that it makes a
+        difference.
+        """
+
+        url = "https://example.org/api/repo/1"
+
+        key = ResponseCacheBase.get_key(url, "token hello")
+
+        self.assertTrue(key.startswith(url))
+        self.assertNotIn("hello", key)
+        self.assertNotEqual(key, ResponseCacheBase.get_key(url, "token world"))
+        self.assertNotEqual(key, ResponseCacheBase.get_key(url, None))
+
+    def test_is_under(self) -> None:
+        """
+        Tests that the prefixes are matched at a path boundary.
+        """
+
+        self.assertTrue(ResponseCacheBase.is_under("/repo/1", "/repo/1"))
+        self.assertTrue(ResponseCacheBase.is_under("/repo/1/builds", "/repo/1"))
+        self.assertTrue(ResponseCacheBase.is_under("/repo/1?limit=2", "/repo/1"))
+        self.assertFalse(ResponseCacheBase.is_under("/repo/12", "/repo/1"))
+        self.assertFalse(ResponseCacheBase.is_under("/repo", "/repo/1"))
+
+    def test_get_ttl(self) -> None:
+        """
+        Tests that the TTLs can be overwritten.
+        """
+
+        cache = MemoryResponseCache(ttls={"Repository": 10, "User": None})
+
+        self.assertEqual(10, cache.get_ttl("Repository", 3600))
+        self.assertIsNone(cache.get_ttl("User", 3600))
+        self.assertEqual(3600, cache.get_ttl("Organization", 3600))
+
+
+class TestCommunicatorResponseCache(TestCase):
+    """
+    Provides the tests of the response cache through the communicators.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.sent_urls = []
+
+        def fake_send_with_retry(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            self.sent_urls.append(url)
+
+            resource, resource_id = url.rsplit("/", 2)[1:]
+            data = {"@type": resource, "@href": f"/{resource}/{resource_id}", "id": 1}
+
+            result = MagicMock()
+            result.url = url
+            result.text = json.dumps(data)
+            result.json.return_value = data
+
+            return result
+
+        self.send_patcher = patch.object(
+            Requester, "send_with_retry", fake_send_with_retry
+        )
+        self.send_patcher.start()
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.send_patcher.stop()
+
+    def test_cached_communicator(self) -> None:
+        """
+        Tests that the responses of a communicator with a TTL are cached.
+        """
+
+        cache = MemoryResponseCache()
+        travis = TravisCI(access_point="https://example.org/api", response_cache=cache)
+
+        first = travis.get_repository(1)
+        second = travis.get_repository(1)
+
+        self.assertEqual(first, second)
+        self.assertEqual(["https://example.org/api/repo/1"], self.sent_urls)
+        self.assertEqual(1, cache.get_statistics()["hits"])
+
+    def test_not_cached_communicator(self) -> None:
+        """
+        Tests that the responses of a communicator without TTL are not cached.
+        """
+
+        travis = TravisCI(
+            access_point="https://example.org/api",
+            response_cache=MemoryResponseCache(),
+        )
+
+        travis.get_build(1)
+        travis.get_build(1)
+
+        self.assertEqual(2, len(self.sent_urls))
+
+    def test_ttl_overwritten(self) -> None:
+        """
+        Tests that the TTLs of the communicators can be overwritten.
+        """
+
+        travis = TravisCI(
+            access_point="https://example.org/api",
+            response_cache=MemoryResponseCache(ttls={"Repository": None, "Build": 60}),
+        )
+
+        travis.get_repository(1)
+        travis.get_repository(1)
+        travis.get_build(1)
+        travis.get_build(1)
+
+        self.assertEqual(3, len(self.sent_urls))
+
+    def test_authorization(self) -> None:
+        """
+        Tests that the responses are not shared between tokens.
+        """
+
+        cache = MemoryResponseCache()
+
+        TravisCI(
+            access_point="https://example.org/api",
+            access_token="hello",
+            response_cache=cache,
+        ).get_repository(1)
+        TravisCI(
+            access_point="https://example.org/api",
+            access_token="world",
+            response_cache=cache,
+        ).get_repository(1)
+
+        self.assertEqual(2, len(self.sent_urls))
+
+    def test_set_response_cache_not_valid(self) -> None:
+        """
+        Tests that a non-valid cache is rejected.
+        """
+
+        self.assertRaises(TypeError, lambda: Requester().set_response_cache(3))
+
+
+class TestCommunicatorInvalidation(TestCase):
+    """
+    Provides the tests of the invalidation of the response cache by the
+    mutating communicators.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.sent_requests = []
+        state = {"active": False}
+
+        def fake_send_with_retry(requester, verb, url, **kwargs):
+            # pylint: disable=unused-argument
+            self.sent_requests.append((verb.upper(), url))
+
+            endpoint = url[len("https://example.org/api") :]
+
+            if endpoint.endswith("/activate"):
+                state["active"] = True
+
+            repository = {
+                "@type": "repository",
+                "@href": "/repo/1",
+                "@representation": "standard",
+                "id": 1,
+                "slug": "foo/bar",
+                "active": state["active"],
+            }
+            env_var = {
+                "@type": "env_var",
+                "@href": "/repo/1/env_var/a",
+                "@representation": "standard",
+                "id": "a",
+                "name": "HELLO",
+                "public": True,
+                "value": "world",
+            }
+
+            cron = {
+                "@type": "cron",
+                "@href": "/cron/7",
+                "@representation": "standard",
+                "id": 7,
+                "repository": {
+                    "@type": "repository",
+                    "@representation": "minimal",
+                    "id": 1,
+                    "slug": "foo/bar",
+                },
+                "branch": {
+                    "@type": "branch",
+                    "@representation": "minimal",
+                    "name": "master",
+                    "repository": {
+                        "@type": "repository",
+                        "@representation": "minimal",
+                        "id": 1,
+                        "slug": "foo/bar",
+                    },
+                },
+                "interval": "daily",
+            }
+
+            if endpoint.endswith("/repos"):
+                data = {
+                    "@type": "repositories",
+                    "@href": endpoint,
+                    "repositories": [repository],
+                }
+            elif endpoint.endswith("/crons"):
+                data = {"@type": "crons", "@href": "/repo/1/crons", "crons": [cron]}
+            elif endpoint.endswith("/cron") or "/cron/" in endpoint:
+                data = cron
+            elif endpoint.endswith("/env_vars"):
+                data = {
+                    "@type": "env_vars",
+                    "@href": "/repo/1/env_vars",
+                    "env_vars": [env_var],
+                }
+            elif "/env_var/" in endpoint:
+                data = env_var
+            else:
+                data = repository
+
+            result = MagicMock()
+            result.url = url
+            result.text = json.dumps(data)
+            result.json.return_value = data
+
+            return result
+
+        self.send_patcher = patch.object(
+            Requester, "send_with_retry", fake_send_with_retry
+        )
+        self.send_patcher.start()
+
+        self.cache = MemoryResponseCache(
+            ttls={
+                "EnvVars": 60,
+                "EnvVar": 60,
+                "Crons": 60,
+                "Cron": 60,
+                "Repositories": 60,
+            }
+        )
+        self.travis = TravisCI(
+            access_point="https://example.org/api", response_cache=self.cache
+        )
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        self.send_patcher.stop()
+
+    def test_canonical_url(self) -> None:
+        """
+        Tests that a resource cached under its slug is invalidated by a
+        mutation through its ID.
+        """
+
+        repository = self.travis.get_repository("foo/bar")
+
+        self.assertFalse(repository.active)
+
+        repository.activate()
+
+        self.assertTrue(self.travis.get_repository("foo/bar").active)
+        self.assertEqual(
+            [
+                ("GET", "https://example.org/api/repo/foo%2Fbar"),
+                ("POST", "https://example.org/api/repo/1/activate"),
+                ("GET", "https://example.org/api/repo/foo%2Fbar"),
+            ],
+            self.sent_requests,
+        )
+
+    def test_parent_collection(self) -> None:
+        """
+        Tests that the parent collection of a mutated item is invalidated.
+        """
+
+        env_vars = self.travis.get_repository("foo/bar").get_env_vars()
+        env_var = self.travis.get_repository("foo/bar").get_env_var("a")
+
+        self.travis.get_repository("foo/bar").get_env_vars()
+
+        self.assertEqual(3, len(self.sent_requests))
+
+        env_var.set_value("hello")
+
+        self.travis.get_repository("foo/bar").get_env_vars()
+        self.travis.get_repository("foo/bar").get_env_var("a")
+
+        self.assertEqual(
+            [
+                ("PATCH", "https://example.org/api/repo/1/env_var/a"),
+                ("GET", "https://example.org/api/repo/1/env_vars"),
+                ("GET", "https://example.org/api/repo/1/env_var/a"),
+            ],
+            self.sent_requests[3:],
+        )
+        self.assertEqual(env_vars, self.travis.get_repository(1).get_env_vars())
+
+    def test_repository_forms(self) -> None:
+        """
+        Tests that a mutation of a repository invalidates its ID, its slug and
+        the collections of its owner.
+        """
+
+        self.travis.get_repository("foo/bar")
+        self.travis.get_repositories_from_login("foo")
+        repository = self.travis.get_repository(1)
+
+        self.travis.get_repository("foo/bar")
+        self.travis.get_repositories_from_login("foo")
+        self.travis.get_repository(1)
+
+        self.assertEqual(3, len(self.sent_requests))
+
+        repository.activate()
+
+        self.assertTrue(self.travis.get_repository("foo/bar").active)
+        self.assertTrue(self.travis.get_repository(1).active)
+        self.assertTrue(
+            self.travis.get_repositories_from_login("foo").repositories[0].active
+        )
+        self.assertEqual(
+            [
+                ("POST", "https://example.org/api/repo/1/activate"),
+                ("GET", "https://example.org/api/repo/foo%2Fbar"),
+                ("GET", "https://example.org/api/repo/1"),
+                ("GET", "https://example.org/api/owner/github/foo/repos"),
+            ],
+            self.sent_requests[3:],
+        )
+
+    def test_cron_delete(self) -> None:
+        """
+        Tests that the crons of the repository and of the branch are
+        invalidated by the deletion of a cron.
+        """
+
+        repository = self.travis.get_repository(1)
+        cron = repository.get_crons().crons[0]
+
+        repository.get_crons()
+        cron.branch.get_cron()
+        cron.branch.get_cron()
+
+        self.assertEqual(
+            [
+                ("GET", "https://example.org/api/repo/1"),
+                ("GET", "https://example.org/api/repo/1/crons"),
+                ("GET", "https://example.org/api/repo/1/branch/master/cron"),
+            ],
+            self.sent_requests,
+        )
+
+        cron.delete()
+
+        repository.get_crons()
+        cron.branch.get_cron()
+
+        self.assertEqual(
+            [
+                ("DELETE", "https://example.org/api/cron/7"),
+                ("GET", "https://example.org/api/repo/1/crons"),
+                ("GET", "https://example.org/api/repo/1/branch/master/cron"),
+            ],
+            self.sent_requests[3:],
+        )
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,191 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our retry policy.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import requests
+
+from PyTravisCI.retry import RetryPolicy
+
+
+class TestRetryPolicy(TestCase):
+    """
+    Provides the tests of the retry policy.
+    """
+
+    def test_max_attempts_too_low(self) -> None:
+        """
+        Tests that a policy without any attempt can't be created.
+        """
+
+        self.assertRaises(ValueError, lambda: RetryPolicy(max_attempts=0))
+
+    def test_should_retry_response(self) -> None:
+        """
+        Tests of the method which let us know if a response should be retried.
+        """
+
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertTrue(policy.should_retry_response("get", 502, {}, 1))
+        self.assertTrue(policy.should_retry_response("GET", 429, {}, 2))
+
+    def test_should_not_retry_response(self) -> None:
+        """
+        Tests of the method which let us know if a response should be retried
+        for the case that it should not.
+        """
+
+        policy = RetryPolicy(max_attempts=3)
+
+        # Not a transient error.
+        self.assertFalse(policy.should_retry_response("GET", 404, {}, 1))
+        # Not an idempotent verb.
+        self.assertFalse(policy.should_retry_response("POST", 502, {}, 1))
+        # No attempt left.
+        self.assertFalse(policy.should_retry_response("GET", 502, {}, 3))
+        # The API wants us to wait too long.
+        self.assertFalse(
+            policy.should_retry_response("GET", 429, {"Retry-After": "3600"}, 1)
+        )
+
+    def test_should_retry_custom_verbs_and_status_codes(self) -> None:
+        """
+        Tests that the given verbs and status codes are the one we retry.
+        """
+
+        policy = RetryPolicy(status_codes=[418], verbs=["post"])
+
+        self.assertTrue(policy.should_retry_response("POST", 418, {}, 1))
+        self.assertFalse(policy.should_retry_response("GET", 418, {}, 1))
+        self.assertFalse(policy.should_retry_response("POST", 502, {}, 1))
+
+    def test_should_retry_exception(self) -> None:
+        """
+        Tests of the method which let us know if an exception should be retried.
+        """
+
+        policy = RetryPolicy(max_attempts=2)
+
+        self.assertTrue(
+            policy.should_retry_exception(
+                "GET", requests.exceptions.ConnectionError(), 1
+            )
+        )
+        self.assertTrue(
+            policy.should_retry_exception("GET", requests.exceptions.Timeout(), 1)
+        )
+        self.assertFalse(
+            policy.should_retry_exception(
+                "GET", requests.exceptions.ConnectionError(), 2
+            )
+        )
+        self.assertFalse(
+            policy.should_retry_exception("GET", requests.exceptions.InvalidURL(), 1)
+        )
+
+    def test_get_backoff(self) -> None:
+        """
+        Tests of the method which provides the exponential backoff.
+        """
+
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        self.assertEqual([1, 2, 4, 5, 5], [policy.get_backoff(x) for x in range(1, 6)])
+
+    def test_get_backoff_with_jitter(self) -> None:
+        """
+        Tests of the method which provides the exponential backoff for the
+        case that the jitter is allowed.
+        """
+
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=True)
+
+        for attempt in range(1, 6):
+            self.assertTrue(
+                0 <= policy.get_backoff(attempt) <= min(2 ** (attempt - 1), 5)
+            )
+
+    def test_get_retry_after_seconds(self) -> None:
+        """
+        Tests of the method which reads the Retry-After header for the case
+        that a number of seconds is given.
+        """
+
+        policy = RetryPolicy(jitter=False)
+
+        self.assertEqual(7.0, policy.get_retry_after({"Retry-After": "7"}))
+        self.assertEqual(7.0, policy.get_delay(1, {"Retry-After": "7"}))
+        self.assertEqual(0.5, policy.get_delay(1, {}))
+
+    def test_get_retry_after_date(self) -> None:
+        """
+        Tests of the method which reads the Retry-After header for the case
+        that a date is given.
+        """
+
+        policy = RetryPolicy()
+        given = format_datetime(
+            datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True
+        )
+
+        actual = policy.get_retry_after({"Retry-After": given})
+
+        self.assertTrue(25 <= actual <= 30)
+
+    def test_get_retry_after_ignored(self) -> None:
+        """
+        Tests of the method which reads the Retry-After header for the case
+        that we should not (or can't) use it.
+        """
+
+        self.assertIsNone(RetryPolicy().get_retry_after({"Retry-After": "hello"}))
+        self.assertIsNone(RetryPolicy().get_retry_after(None))
+        self.assertIsNone(
+            RetryPolicy(respect_retry_after=False).get_retry_after({"Retry-After": "3"})
+        )
+
+
+if __name__ == "__main__":
+    launch_tests()
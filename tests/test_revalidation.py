@@ -0,0 +1,320 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our revalidation cache.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import json
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import PyTravisCI.codec as codec
+from PyTravisCI.requester import Requester
+from PyTravisCI.revalidation import (
+    RevalidatedResponse,
+    RevalidationCache,
+    RevalidationEntry,
+)
+
+
+def get_response(
+    status_code: int = 200, data: dict = None, headers: dict = None
+) -> requests.Response:
+    """
+    Provides a response of the API.
+    """
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "https://example.org/api/build/4"
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.encoding = "utf-8"
+    # pylint: disable=protected-access
+    response._content = json.dumps(data).encode() if data is not None else b""
+
+    return response
+
+
+class TestRevalidationEntry(TestCase):
+    """
+    Provides the tests of the revalidation entry.
+    """
+
+    def test_conditional_headers(self) -> None:
+        """
+        Tests that the conditional headers follow the validators.
+        """
+
+        entry = RevalidationEntry(
+            get_response(
+                data={},
+                headers={
+                    "ETag": '"hello"',
+                    "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+                },
+            )
+        )
+
+        expected = {
+            "If-None-Match": '"hello"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+
+        self.assertEqual(expected, entry.get_conditional_headers())
+
+        entry = RevalidationEntry(get_response(data={}, headers={"ETag": '"hello"'}))
+
+        self.assertEqual({"If-None-Match": '"hello"'}, entry.get_conditional_headers())
+
+    def test_get_data_decoded_once(self) -> None:
+        """
+        Tests that the body is only decoded once.
+        """
+
+        entry = RevalidationEntry(get_response(data={"id": 4}))
+
+        with patch.object(
+            codec.get_codec(), "loads", return_value={"id": 4}
+        ) as mock_json:
+            self.assertEqual({"id": 4}, entry.get_data())
+            self.assertEqual(
+                {"id": 4}, RevalidatedResponse(entry, revalidated=True).json()
+            )
+
+        self.assertEqual(1, mock_json.call_count)
+
+
+class TestRevalidationCache(TestCase):
+    """
+    Provides the tests of the revalidation cache.
+    """
+
+    def test_not_valid_max_entries(self) -> None:
+        """
+        Tests that a non-valid size is rejected.
+        """
+
+        self.assertRaises(ValueError, lambda: RevalidationCache(0))
+
+    def test_get_key(self) -> None:
+        """
+        Tests of the method which provides the key of a request.
+        """
+
+        url = "https://example.org/api/build/4"
+
+        self.assertEqual(
+            (url, "token a"), RevalidationCache.get_key("get", url, {}, "token a")
+        )
+        self.assertEqual(
+            (f"{url}?include=build.jobs", None),
+            RevalidationCache.get_key(
+                "GET", url, {"params": {"include": "build.jobs"}}, None
+            ),
+        )
+        self.assertIsNone(RevalidationCache.get_key("POST", url, {}, None))
+        self.assertIsNone(RevalidationCache.get_key("GET", url, {"data": "a"}, None))
+        self.assertIsNone(
+            RevalidationCache.get_key(
+                "GET", url, {"headers": {"Range": "bytes=42-"}}, None
+            )
+        )
+        self.assertIsNone(
+            RevalidationCache.get_key(
+                "GET", url, {"headers": {"accept": "text/plain"}}, None
+            )
+        )
+
+    def test_lru(self) -> None:
+        """
+        Tests that the least recently used entries are evicted.
+        """
+
+        cache = RevalidationCache(2)
+        entries = [RevalidationEntry(get_response(data={"id": x})) for x in range(3)]
+
+        cache.set("a", entries[0])
+        cache.set("b", entries[1])
+
+        self.assertIs(entries[0], cache.get("a"))
+
+        cache.set("c", entries[2])
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIs(entries[0], cache.get("a"))
+        self.assertIs(entries[2], cache.get("c"))
+        self.assertEqual(1, cache.get_statistics()["evictions"])
+        self.assertEqual(2, len(cache))
+
+    def test_prepare_and_complete(self) -> None:
+        """
+        Tests a full revalidation cycle.
+        """
+
+        cache = RevalidationCache()
+        data = {"id": 4}
+
+        entry, kwargs = cache.prepare("a", {})
+
+        self.assertIsNone(entry)
+        self.assertEqual({}, kwargs)
+
+        response = cache.complete(
+            "a", entry, get_response(data=data, headers={"ETag": '"hello"'})
+        )
+
+        self.assertIsInstance(response, RevalidatedResponse)
+        self.assertFalse(response.revalidated)
+        self.assertEqual(data, response.json())
+
+        entry, kwargs = cache.prepare("a", {"headers": {"X-Hello": "world"}})
+
+        self.assertIsNotNone(entry)
+        self.assertEqual(
+            {"headers": {"X-Hello": "world", "If-None-Match": '"hello"'}}, kwargs
+        )
+
+        response = cache.complete("a", entry, get_response(304))
+
+        self.assertTrue(response.revalidated)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(data, response.json())
+
+        expected = {
+            "hits": 1,
+            "misses": 1,
+            "revalidations": 1,
+            "evictions": 0,
+            "entries": 1,
+        }
+
+        self.assertEqual(expected, cache.get_statistics())
+
+        cache.reset_statistics()
+
+        self.assertEqual(0, cache.get_statistics()["hits"])
+
+    def test_complete_without_validator(self) -> None:
+        """
+        Tests that a response without validator is not cached and that it
+        replaces the previously known one.
+        """
+
+        cache = RevalidationCache()
+        cache.complete("a", None, get_response(data={}, headers={"ETag": '"a"'}))
+
+        entry, _ = cache.prepare("a", {})
+        response = get_response(data={"id": 4})
+
+        self.assertIs(response, cache.complete("a", entry, response))
+        self.assertIsNone(cache.get("a"))
+
+
+class TestRequesterRevalidation(TestCase):
+    """
+    Provides the tests of the revalidation through the requester.
+    """
+
+    @patch.object(requests.Session, "get")
+    def test_conditional_get(self, mock_session_get) -> None:
+        """
+        Tests that an unchanged response is served from the cache.
+        """
+
+        data = {"@type": "build", "id": 4}
+
+        mock_session_get.side_effect = [
+            get_response(data=data, headers={"ETag": '"hello"'}),
+            get_response(304),
+        ]
+
+        cache = RevalidationCache()
+
+        requester = Requester(revalidation_cache=cache)
+        requester.set_base_url("https://example.org/api")
+
+        self.assertEqual(data, requester.get("/build/4"))
+        self.assertEqual(data, requester.get("/build/4"))
+
+        self.assertEqual(
+            {"If-None-Match": '"hello"'},
+            mock_session_get.call_args_list[1][1]["headers"],
+        )
+        self.assertEqual(1, cache.get_statistics()["hits"])
+
+    @patch.object(requests.Session, "get")
+    def test_authorization_in_key(self, mock_session_get) -> None:
+        """
+        Tests that a response is not revalidated with another authorization.
+        """
+
+        data = {"@type": "build", "id": 4}
+
+        mock_session_get.side_effect = [
+            get_response(data=data, headers={"ETag": '"hello"'}),
+            get_response(data=data, headers={"ETag": '"hello"'}),
+        ]
+
+        cache = RevalidationCache()
+
+        requester = Requester(revalidation_cache=cache)
+        requester.set_base_url("https://example.org/api")
+        requester.get("/build/4")
+
+        other_requester = Requester(revalidation_cache=cache)
+        other_requester.set_base_url("https://example.org/api")
+        other_requester.set_authorization("hello")
+        other_requester.get("/build/4")
+
+        self.assertNotIn("headers", mock_session_get.call_args_list[1][1])
+        self.assertEqual(2, len(cache))
+
+    def test_set_revalidation_cache_not_valid(self) -> None:
+        """
+        Tests that a non-valid cache is rejected.
+        """
+
+        self.assertRaises(TypeError, lambda: Requester().set_revalidation_cache(3))
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -44,7 +44,7 @@ from typing import List
 from unittest import TestCase
 from unittest import main as launch_tests
 
-from PyTravisCI.standardization import Standardization
+from PyTravisCI.standardization import SinglePassStandardization, Standardization
 
 
 class TestStandardization(TestCase):
@@ -186,5 +186,101 @@ class TestStandardization(TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestSinglePassStandardization(TestCase):
+    """
+    Tests of the single pass standardization class.
+    """
+
+    STANDARD_DATE_FORMAT: str = "%Y-%m-%dT%H:%M:%SZ"
+    ALTERNATIVE_DATE_FORMAT: str = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+    def get_api_response(self) -> dict:
+        """
+        Provides a (nested) API response to work with.
+        """
+
+        our_datetime = datetime(2020, 10, 15, 20, 30)
+
+        job = {
+            "@type": "job",
+            "@representation": "minimal",
+            "id": 4,
+            "started_at": our_datetime.strftime(self.STANDARD_DATE_FORMAT),
+            "finished_at": None,
+        }
+
+        build = {
+            "@type": "build",
+            "@href": "/build/3",
+            "id": 3,
+            "started_at": our_datetime.strftime(self.ALTERNATIVE_DATE_FORMAT),
+            "jobs": [job, job],
+            "commit": {
+                "@type": "commit",
+                "committed_at": our_datetime.strftime(self.STANDARD_DATE_FORMAT),
+                "tags": ["hello", "world"],
+            },
+        }
+
+        return {
+            "@type": "builds",
+            "@pagination": {"next": {"@href": "/builds?offset=2"}},
+            "builds": [build, build],
+        }
+
+    def test_same_as_standardization(self) -> None:
+        """
+        Tests that the single pass standardization provides the same result as
+        the historical standardization.
+        """
+
+        standardization = Standardization()
+        standardization.set_data(self.get_api_response())
+
+        expected = standardization.get_standardized()
+
+        standardization = SinglePassStandardization()
+        standardization.set_data(self.get_api_response())
+
+        actual = standardization.get_standardized()
+
+        self.assertEqual(expected, actual)
+
+    def test_nested_conversion(self) -> None:
+        """
+        Tests that the nested @tags and dates are converted.
+        """
+
+        standardization = SinglePassStandardization(self.get_api_response())
+
+        actual = standardization.get_standardized()
+
+        self.assertEqual(
+            "/builds?offset=2", actual["_at_pagination"]["next"]["_at_href"]
+        )
+        self.assertEqual("job", actual["builds"][1]["jobs"][1]["_at_type"])
+        self.assertEqual(
+            datetime(2020, 10, 15, 20, 30), actual["builds"][0]["started_at"]
+        )
+        self.assertEqual(
+            datetime(2020, 10, 15, 20, 30),
+            actual["builds"][0]["commit"]["committed_at"],
+        )
+        self.assertIsNone(actual["builds"][0]["jobs"][0]["finished_at"])
+
+    def test_given_data_not_modified(self) -> None:
+        """
+        Tests that the given dataset is not modified by the standardization.
+        """
+
+        given = self.get_api_response()
+        expected = self.get_api_response()
+
+        standardization = SinglePassStandardization(given)
+        standardization.get_standardized()
+
+        self.assertEqual(expected, given)
+
+
 if __name__ == "__main__":
     launch_tests()
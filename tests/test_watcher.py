@@ -0,0 +1,401 @@
+"""
+Just another Python API for Travis CI (API).
+
+A module which provides the tests of our watcher.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Project link:
+    https://github.com/funilrys/PyTravisCI
+
+Project documentation:
+    https://pytravisci.readthedocs.io/en/latest/
+
+License
+::
+
+
+    MIT License
+
+    Copyright (c) 2019, 2020, 2021, 2022 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+from PyTravisCI.exceptions import TravisCIError
+from PyTravisCI.resource_types._all import Active, Build, Job, Repository
+from PyTravisCI.watcher import Transition, WatchedItem, Watcher
+
+
+class FakeTravisCI:
+    """
+    A gateway which gives the builds and jobs of the given states.
+    """
+
+    def __init__(self) -> None:
+        self.states = {}
+        self.requests = []
+
+    def get_data(self, kind: str, resource_id: int) -> dict:
+        """
+        Provides the dataset of the given build or job.
+        """
+
+        return {
+            "_at_type": kind.lower(),
+            "id": resource_id,
+            "state": self.states[kind, resource_id],
+            "started_at": datetime(2020, 10, 15, 20, 35),
+            "repository": {
+                "_at_type": "repository",
+                "slug": "funilrys/PyTravisCI" if resource_id < 100 else None,
+            },
+        }
+
+    def get_build(self, build_id: int) -> Build:
+        self.requests.append(("build", build_id))
+        return Build(**self.get_data("Build", build_id))
+
+    def get_job(self, job_id: int) -> Job:
+        self.requests.append(("job", job_id))
+        return Job(**self.get_data("Job", job_id))
+
+    def get_active_from_login(self, login: str, *, provider: str) -> Active:
+        self.requests.append(("active", login, provider))
+
+        builds = []
+
+        for (kind, resource_id), state in self.states.items():
+            if (
+                kind == "Build"
+                and resource_id < 100
+                and state in ("created", "started")
+            ):
+                data = self.get_data("Build", resource_id)
+                data["jobs"] = [
+                    {
+                        "_at_type": "job",
+                        "id": resource_id * 10,
+                        "state": self.states.get(("Job", resource_id * 10), state),
+                    },
+                    {"_at_type": "job", "id": resource_id * 10 + 1},
+                ]
+                builds.append(data)
+
+        return Active(_at_type="active", builds=builds)
+
+
+class TestWatcher(TestCase):
+    """
+    Provides the tests of the watcher.
+    """
+
+    def setUp(self) -> None:
+        """
+        Setups everything needed by the tests.
+        """
+
+        self.clock = [1000.0]
+        self.now = [datetime(2020, 10, 15, 20, 35)]
+        self.travis = FakeTravisCI()
+        self.transitions = []
+        self.timeline = []
+
+        self.patchers = [
+            patch.object(Watcher, "get_time", staticmethod(lambda: self.clock[0])),
+            patch.object(Watcher, "get_now", staticmethod(lambda: self.now[0])),
+            patch("PyTravisCI.watcher.time.sleep", self.sleep),
+        ]
+
+        for patcher in self.patchers:
+            patcher.start()
+
+        self.watcher = Watcher(
+            self.travis,
+            on_transition=self.transitions.append,
+            interval=10,
+            min_interval=2,
+            max_interval=100,
+            waiting_interval=60,
+        )
+
+    def tearDown(self) -> None:
+        """
+        Destroys everything set by the setup method.
+        """
+
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Moves our clocks forward.
+        """
+
+        self.clock[0] += seconds
+        self.now[0] += timedelta(seconds=seconds)
+
+        for clock, kind, resource_id, state in self.timeline:
+            if clock <= self.clock[0]:
+                self.travis.states[kind, resource_id] = state
+
+    def get_resource(self, kind: str, resource_id: int, state: str):
+        """
+        Provides a build or job in the given state - known by the fake API.
+        """
+
+        self.travis.states[kind, resource_id] = state
+
+        return {"Build": self.travis.get_build, "Job": self.travis.get_job}[kind](
+            resource_id
+        )
+
+    def test_add(self) -> None:
+        """
+        Tests that the watched builds and jobs are deduplicated.
+        """
+
+        build = self.get_resource("Build", 1, "started")
+
+        self.assertTrue(self.watcher.add(build))
+        self.assertFalse(self.watcher.add(self.get_resource("Build", 1, "started")))
+        self.assertTrue(self.watcher.add(self.get_resource("Job", 1, "created")))
+        self.assertFalse(self.watcher.add(self.get_resource("Build", 2, "passed")))
+        self.assertEqual(
+            1, self.watcher.add_many([build, self.get_resource("Build", 3, "queued")])
+        )
+
+        self.assertEqual(3, len(self.watcher))
+        self.assertIn(build, self.watcher)
+
+        self.watcher.discard(build)
+
+        self.assertNotIn(build, self.watcher)
+        self.assertRaises(TypeError, lambda: self.watcher.add(Repository(id=1)))
+
+    def test_init_error(self) -> None:
+        """
+        Tests the validation of the intervals.
+        """
+
+        self.assertRaises(ValueError, lambda: Watcher(self.travis, interval=0))
+        self.assertRaises(
+            ValueError, lambda: Watcher(self.travis, min_interval=10, max_interval=5)
+        )
+
+    def test_get_interval(self) -> None:
+        """
+        Tests that the polls are adaptive.
+        """
+
+        self.assertEqual(
+            [60, 10, 100],
+            [
+                self.watcher.get_interval(WatchedItem(x, y))
+                for x, y in (
+                    (self.get_resource("Build", 1, "created"), 600),
+                    (self.get_resource("Build", 2, "started"), None),
+                    (self.get_resource("Build", 3, "started"), 600),
+                )
+            ],
+        )
+
+        item = WatchedItem(self.get_resource("Build", 3, "started"), 600)
+
+        # 40 seconds before the expected end.
+        self.now[0] += timedelta(seconds=560)
+
+        self.assertEqual(20, self.watcher.get_interval(item))
+
+        # After the expected end.
+        self.now[0] += timedelta(seconds=100)
+
+        self.assertEqual(2, self.watcher.get_interval(item))
+
+    def test_poll_active(self) -> None:
+        """
+        Tests that the builds and jobs of a same owner are refreshed through a
+        single request.
+        """
+
+        builds = [self.get_resource("Build", x, "started") for x in range(1, 6)]
+        jobs = [
+            self.get_resource("Job", 10, "started"),
+            self.get_resource("Job", 11, "started"),
+        ]
+
+        self.watcher.add_many(builds + jobs)
+        self.travis.requests.clear()
+
+        self.assertEqual([], self.watcher.poll())
+        self.assertEqual([], self.travis.requests)
+
+        self.travis.states["Build", 2] = "passed"
+        self.travis.states["Job", 10] = "passed"
+        self.travis.states["Job", 11] = "failed"
+        self.sleep(10)
+
+        actual = self.watcher.poll()
+
+        # One request for the owner, one per item which left the active ones
+        # (or whose state is not given there).
+        self.assertEqual(
+            [("active", "funilrys", "github"), ("build", 2), ("job", 11)],
+            self.travis.requests,
+        )
+        self.assertEqual(
+            [("Build", 2, "passed"), ("Job", 10, "passed"), ("Job", 11, "failed")],
+            [(x.resource.__class__.__name__, x.resource.id, x.state) for x in actual],
+        )
+        self.assertEqual(actual, self.transitions)
+        self.assertTrue(all(x.is_finished() for x in actual))
+        self.assertEqual("started", actual[0].previous_state)
+
+        self.assertIs(builds[1], actual[0].resource)
+        self.assertEqual("passed", builds[1].state)
+        self.assertEqual(4, len(self.watcher))
+
+        # The watched resources don't share their attributes with the fresh
+        # ones.
+        fetched = []
+        get_build = self.travis.get_build
+        self.travis.get_build = lambda x: fetched.append(get_build(x)) or fetched[-1]
+
+        self.travis.states["Build", 3] = "passed"
+        self.sleep(100)
+
+        self.assertIs(builds[2], self.watcher.poll()[0].resource)
+        self.assertEqual(["passed"], [x.state for x in fetched])
+
+        vars(fetched[0])["state"] = "errored"
+
+        self.assertEqual("passed", builds[2].state)
+
+    def test_poll_active_error(self) -> None:
+        """
+        Tests that the builds are fetched one by one when the active ones can't
+        be fetched - and that only the errors of the API are swallowed.
+        """
+
+        self.watcher.add(self.get_resource("Build", 1, "started"))
+        self.travis.states["Build", 1] = "passed"
+        self.travis.requests.clear()
+        self.sleep(10)
+
+        with patch.object(
+            FakeTravisCI,
+            "get_active_from_login",
+            side_effect=TravisCIError("https://example.org", "not found", "not_found"),
+        ):
+            actual = self.watcher.poll()
+
+        self.assertEqual([("build", 1)], self.travis.requests)
+        self.assertEqual(["passed"], [x.state for x in actual])
+
+        self.watcher.add(self.get_resource("Build", 2, "started"))
+        self.sleep(10)
+
+        with patch.object(
+            FakeTravisCI, "get_active_from_login", side_effect=KeyError("oops")
+        ):
+            self.assertRaises(KeyError, self.watcher.poll)
+
+    def test_poll_without_owner(self) -> None:
+        """
+        Tests that the builds whose owner is unknown are fetched one by one.
+        """
+
+        self.watcher.add(self.get_resource("Build", 100, "created"))
+        self.watcher.add(self.get_resource("Build", 101, "created"))
+        self.travis.states["Build", 100] = "started"
+        self.travis.requests.clear()
+        self.sleep(60)
+
+        actual = self.watcher.poll()
+
+        self.assertEqual([("build", 100), ("build", 101)], self.travis.requests)
+        self.assertEqual(
+            ["created -> started"], [f"{x.previous_state} -> {x.state}" for x in actual]
+        )
+        self.assertEqual(2, len(self.watcher))
+        self.assertEqual(1070, self.watcher.get_next_poll())
+
+    def test_watch(self) -> None:
+        """
+        Tests the (blocking) watch until every build is finished.
+        """
+
+        self.watcher.add(self.get_resource("Build", 1, "created"))
+        self.watcher.add(self.get_resource("Build", 2, "started"))
+
+        self.timeline = [
+            (1010, "Build", 2, "passed"),
+            (1060, "Build", 1, "started"),
+            (1070, "Build", 1, "failed"),
+        ]
+
+        actual = [(self.clock[0], x.resource.id, x.state) for x in self.watcher.watch()]
+
+        self.assertEqual(
+            [(1010, 2, "passed"), (1060, 1, "started"), (1070, 1, "failed")], actual
+        )
+        self.assertEqual(0, len(self.watcher))
+
+    def test_wait_timeout(self) -> None:
+        """
+        Tests that we stop to wait after the given timeout.
+        """
+
+        build = self.get_resource("Build", 1, "started")
+        self.watcher.add(build)
+
+        self.assertEqual([build], self.watcher.wait(timeout=25))
+        self.assertEqual(1025, self.clock[0])
+
+    def test_watch_async(self) -> None:
+        """
+        Tests the asynchronous watch.
+        """
+
+        self.watcher.add(self.get_resource("Build", 1, "started"))
+        self.travis.states["Build", 1] = "passed"
+
+        async def fake_sleep(seconds):
+            self.sleep(seconds)
+
+        async def main():
+            return [x async for x in self.watcher.watch_async()]
+
+        with patch("PyTravisCI.watcher.asyncio.sleep", fake_sleep):
+            actual = asyncio.run(main())
+
+        self.assertEqual(["passed"], [x.state for x in actual])
+        self.assertIsInstance(actual[0], Transition)
+        self.assertEqual(0, len(self.watcher))
+
+
+if __name__ == "__main__":
+    launch_tests()